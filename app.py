@@ -14,12 +14,15 @@
 # IMPORTS
 # ============================================================================
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import numpy as np
 from datetime import datetime
 
+from gob.data import calculate_key_metrics, load_financial_data, load_snapshot
+from gob.formatting import CURRENCY_FORMATS, format_currency
+from gob.metrics import count_cache_data_call, count_session, start_metrics_server
+from gob.profiling import developer_panel, start_profiler
+from gob.tracing import finish_trace, start_trace
+from gob.views import VIEW_MODULES, ViewContext, render_view
+
 # ============================================================================
 # PAGE CONFIGURATION
 # ============================================================================
@@ -30,6 +33,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# ?profile=1 runs this rerun under cProfile; the stats are offered by developer_panel
+profiler = start_profiler()
+# GOB_METRICS_PORT=<port> serves Prometheus metrics from this process (gob.metrics)
+start_metrics_server()
+count_session()
+# GOB_TRACE_FILE=<path> writes a JSON-lines record of every rerun (gob.tracing)
+trace = start_trace()
+
 # ============================================================================
 # CUSTOM CSS STYLING
 # ============================================================================
@@ -254,440 +265,14 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# ============================================================================
-# DATA LOADING FUNCTIONS - WITH CORRECTED NUMBERS AND ERROR DATA
-# ============================================================================
-@st.cache_data
-def load_financial_data():
-    """
-    Load and prepare financial data from the PDF report.
-    
-    Returns:
-        dict: Dictionary containing all financial data as DataFrames
-    """
-    # Financial Performance Data - CORRECTED
-    financial_performance = pd.DataFrame({
-        'Category': [
-            'Taxation', 'Goods and Services', 'Income and Profits', 
-            'Property Taxes', 'International Trade', 'Other Taxes',
-            'Levies, Fees and Fines', 'Special Receipts', 'Other Revenue', 'Grants'
-        ],
-        'Revised_Budget_2023': [
-            2977381493, 1463856504, 1024520055, 227384934, 241200000,
-            20420000, 69614799, 2312561, 164208584, 25700000
-        ],
-        'Actual_2023': [
-            3209934907, 1628078161, 1068849288, 240517833, 250253724,
-            22235902, 83376897, 1905632, 170882782, 20000000
-        ],
-        'Actual_2022': [
-            2587338338, 1257284226, 861692875, 223959932, 231008360,
-            13392945, -39531402, -90224420, 153071264, 0
-        ]
-    })
-    
-    # Calculate variances
-    financial_performance['Variance_2023'] = (
-        financial_performance['Actual_2023'] - financial_performance['Revised_Budget_2023']
-    )
-    financial_performance['Variance_Pct_2023'] = (
-        financial_performance['Variance_2023'] / financial_performance['Revised_Budget_2023']
-    ) * 100
-    financial_performance['YoY_Growth'] = (
-        financial_performance['Actual_2023'] - financial_performance['Actual_2022']
-    )
-    
-    # FIXED: Proper YoY percentage calculation handling zero values
-    def calculate_yoy_pct(current, previous):
-        if abs(previous) < 1:  # If previous is 0 or very close to 0
-            return None  # Can't calculate percentage change from 0
-        return (current - previous) / abs(previous) * 100
-    
-    financial_performance['YoY_Growth_Pct'] = financial_performance.apply(
-        lambda row: calculate_yoy_pct(row['Actual_2023'], row['Actual_2022']), 
-        axis=1
-    )
-    
-    # For display purposes, format the YoY percentage properly
-    def format_yoy_pct(value):
-        if value is None:
-            return "N/A"  # For cases where previous year was 0
-        elif abs(value) > 10000:  # Very large percentage changes
-            return f"{value:,.0f}%"
-        else:
-            return f"{value:+.1f}%"
-    
-    financial_performance['YoY_Growth_Pct_Display'] = financial_performance['YoY_Growth_Pct'].apply(format_yoy_pct)
-    
-    # Expenditure Data - CORRECTED
-    expenditure_data = pd.DataFrame({
-        'Category': [
-            'Payroll and Employee Benefits', 'Goods and Services', 'Depreciation',
-            'Bad Debt Expense', 'Retiring Benefits and Allowances',
-            'Grants and Other Current Transfers', 'Other Statutory Expenditure',
-            'Capital Transfers', 'Debt Service'
-        ],
-        'Revised_Budget_2023': [
-            915064501, 655380977, 54000000, 989555, 387655291,
-            675353637, 1970000, 281518344, 691711905
-        ],
-        'Actual_2023': [
-            863924381, 545212668, 49826566, 68281611, 333644842,
-            910661649, 4554557, 241950953, 568277615
-        ],
-        'Actual_2022': [
-            828005895, 653615712, 43277406, 9880606, 340245554,
-            831432691, 7489232, 268894435, 391453035
-        ]
-    })
-    
-    # Calculate expenditure variances
-    expenditure_data['Variance_2023'] = (
-        expenditure_data['Actual_2023'] - expenditure_data['Revised_Budget_2023']
-    )
-    expenditure_data['Variance_Pct_2023'] = (
-        expenditure_data['Variance_2023'] / expenditure_data['Revised_Budget_2023']
-    ) * 100
-    
-    # Statement of Financial Position Data - CORRECTED
-    balance_sheet = pd.DataFrame({
-        'Category': [
-            'Current Assets', 'Financial Assets', 'Cash on Hand', 'Bank',
-            'Tax Receivables (Net)', 'Other Receivables (Net)', 'Restricted cash',
-            'Non-Current Assets', 'Financial Assets', 'Sinking Fund Assets',
-            'Investments', 'Non Financial Assets', 'Land', 'Other capital assets (Net)'
-        ],
-        'Actual_Mar_23': [
-            3735288225, 3734618402, 152830846, 759489160, 2428696065,
-            254774883, 138827448, 4337385833, 609280459, 60998391,
-            529021234, 3728105374, 1445313783, 2282791591
-        ],
-        'Actual_Mar_22': [
-            3476483879, 3475932368, 101071094, 620329896, 2384625679,
-            231248217, 138657482, 4077323452, 439248332, 30094107,
-            381209361, 3638075120, 1443906209, 2194168911
-        ]
-    })
-    
-    # Liabilities Data - CORRECTED
-    liabilities_data = pd.DataFrame({
-        'Category': [
-            'Current Liabilities', 'Overdraft Facility', 'Accounts Payable',
-            'Refunds Payable', 'Pension Liability', 'Deposits', 'Treasury Bills',
-            'Current Portion of Long term debt', 'Long-term Liabilities',
-            'Government Securities', 'Other Local Debt',
-            'Loans from International Financial Institutions',
-            'Loans from Other Governments', 'Other Foreign Debt'
-        ],
-        'Actual_Mar_23': [
-            2131488223, 167110481, 82010933, 530063724, 5573965, 170086214,
-            495103750, 661885235, 12799271087, 8572467834, 101315000,
-            3194580072, 376309795, 416416319
-        ],
-        'Actual_Mar_22': [
-            1877339098, 214985000, 33894156, 522864905, 5382182, 163215273,
-            495103750, 408361016, 12306018215, 8781379378, 101315000,
-            2795720352, 312635489, 178010652
-        ]
-    })
-    
-    # Adverse Opinion Details - CORRECTED
-    adverse_opinion_items = [
-        {
-            'Issue': 'Other Capital Assets Discrepancy',
-            'Amount': 719000000,
-            'Description': 'Difference of $719 million between amounts reported vs subsidiary records',
-            'Impact': 'Overstated Assets',
-            'Severity': 'High'
-        },
-        {
-            'Issue': 'Cash Overstatement',
-            'Amount': 115000000,
-            'Description': 'Cash overstated by $115 million',
-            'Impact': 'Overstated Current Assets',
-            'Severity': 'High'
-        },
-        {
-            'Issue': 'Financial Investments Overstatement',
-            'Amount': 147000000,
-            'Description': 'Financial investments overstated by $147 million',
-            'Impact': 'Overstated Investments',
-            'Severity': 'High'
-        },
-        {
-            'Issue': 'Pension Liabilities Omitted',
-            'Amount': 'Not Quantified',
-            'Description': 'Pension and employee benefits liability not included',
-            'Impact': 'Understated Liabilities',
-            'Severity': 'Critical'
-        },
-        {
-            'Issue': 'Tax Receivables Unverified',
-            'Amount': 2430000000,
-            'Description': '$2.43 billion tax receivables could not be confirmed',
-            'Impact': 'Overstated Receivables',
-            'Severity': 'Critical'
-        },
-        {
-            'Issue': 'Bad Debt Expenses Unverified',
-            'Amount': 68280000,
-            'Description': '$68.28 million bad debt expenses could not be confirmed',
-            'Impact': 'Potential Overstated Expenses',
-            'Severity': 'Medium'
-        },
-        {
-            'Issue': 'Non-Consolidation of SOEs',
-            'Amount': 'Not Quantified',
-            'Description': 'State-owned entities not consolidated as required by IPSAS',
-            'Impact': 'Incomplete Financial Statements',
-            'Severity': 'Critical'
-        }
-    ]
-    
-    # Tax Revenue Breakdown - CORRECTED
-    tax_revenue_details = pd.DataFrame({
-        'Tax_Type': [
-            'Income and Profits - Individuals', 'Income and Profits - Corporation',
-            'Withholding Tax', 'VAT (Net)', 'Excise Duty', 'Highway Revenue',
-            'Other Goods & Services', 'Land Tax (Net)', 'Property Transfer Tax',
-            'Import Duties (Net)', 'Stamp Duty'
-        ],
-        'Actual_2023': [
-            545610497, 485674857, 37563935, 1156630063, 251622393,
-            16612103, 203213603, 211157762, 29360071, 250253724, 22235902
-        ],
-        'Actual_2022': [
-            429779367, 394168620, 37744944, 874397904, 204941594,
-            15628435, 162416302, 203072475, 20887457, 231002875, 13392945
-        ],
-        'Growth_Amount': [
-            115831130, 91506237, -181009, 282232159, 46680799,
-            983668, 40797301, 8085287, 8472614, 19250849, 8842957
-        ],
-        'Growth_Pct': [
-            26.95, 23.22, -0.48, 32.28, 22.78, 6.29,
-            25.13, 3.98, 40.58, 8.33, 66.04
-        ]
-    })
-    
-    # Debt Structure - CORRECTED with proper domestic/foreign split
-    debt_structure = pd.DataFrame({
-        'Debt_Type': [
-            'Local Loans Act', 'External Loans Act', 'Caribbean Development Bank',
-            'Inter American Development Bank', 'Special Loans Act', 'Treasury Bills',
-            'Savings Bond Act', 'International Monetary Fund',
-            'Latin American Development Bank', 'Ways & Means (Overdraft)'
-        ],
-        'Amount_2023': [
-            7745270000, 1061170000, 483540000, 1814760000, 890940000,
-            495100000, 32230000, 548410000, 357430000, 167150000
-        ],
-        'Amount_2022': [
-            7871410000, 1061170000, 469380000, 1499660000, 810080000,
-            495100000, 47290000, 464770000, 340600000, 214990000
-        ],
-        'Change': [
-            -126140000, 0, 14160000, 315100000, 80860000,
-            0, -15060000, 83640000, 16830000, -47840000
-        ],
-        'Debt_Category': [
-            'Domestic', 'Foreign', 'Foreign', 'Foreign', 'Foreign',
-            'Domestic', 'Domestic', 'Foreign', 'Foreign', 'Domestic'
-        ]
-    })
-    
-    # State-Owned Enterprise Transfers - WITH DISCREPANCIES HIGHLIGHTED
-    soe_transfers = pd.DataFrame({
-        'Entity': [
-            'Queen Elizabeth Hospital', 
-            'Barbados Water Authority',
-            'Barbados Revenue Authority',
-            'National Conservation Commission',
-            'Barbados Tourism Investment Inc.',
-            'Transport Board',
-            'Barbados Agricultural Management Company Ltd',
-            'National Housing Corporation',
-            'Barbados Defence Force',
-            'National Sports Council'
-        ],
-        'Current_Transfers': [
-            133664857.68,
-            0.00,
-            29565917.54,
-            24566467.11,
-            3516575.00,
-            46023613.00,
-            38984952.00,
-            16851610.11,
-            59932639.00,
-            16443141.43
-        ],
-        'Capital_Transfers': [
-            8800000.00,
-            30000000.00,  # NOTE: Fixed from 3000000 to 30000000 based on table
-            1609000.00,
-            2386500.00,
-            91200000.00,
-            750000.00,
-            5000000.00,
-            29450000.00,
-            1547900.00,
-            19919939.00
-        ],
-        'Total': [
-            142464857.68,
-            30000000.00,  # NOTE: Fixed from 3000000 to 30000000
-            31174917.54,
-            26952967.11,
-            94716575.00,
-            46773613.00,
-            43984952.00,
-            46301610.11,
-            61480539.00,
-            36363080.43
-        ]
-    })
-    
-    # Sort by total transfers descending
-    soe_transfers = soe_transfers.sort_values('Total', ascending=False).reset_index(drop=True)
-    
-    # Note 34 Discrepancy Data
-    note34_discrepancy = {
-        'narrative_amount': 669335534.09,
-        'table_amount': 777909442.90,
-        'difference': 108573908.81,
-        'difference_pct': 16.2
-    }
-    
-    # Note 9 vs Note 34 Data
-    note9_vs_note34 = {
-        'note9_total_grants': 1152612602,  # From Note 9: $1,152,612,602
-        'note34_soe_transfers': 777909442.90,
-        'soe_percentage_of_total': 67.5  # 777.9M / 1,152.6M * 100
-    }
-    
-    return {
-        'financial_performance': financial_performance,
-        'expenditure_data': expenditure_data,
-        'balance_sheet': balance_sheet,
-        'liabilities_data': liabilities_data,
-        'adverse_opinion_items': pd.DataFrame(adverse_opinion_items),
-        'tax_revenue_details': tax_revenue_details,
-        'debt_structure': debt_structure,
-        'soe_transfers': soe_transfers,
-        'note34_discrepancy': note34_discrepancy,
-        'note9_vs_note34': note9_vs_note34
-    }
-
-# ============================================================================
-# HELPER FUNCTIONS - WITH CORRECTED CALCULATIONS
-# ============================================================================
-def calculate_key_metrics():
-    """
-    Calculate key financial metrics from the loaded data.
-    
-    Returns:
-        dict: Dictionary of key financial metrics
-    """
-    # CORRECTED: Total Revenue from PDF page 6 = $3,484,194,586
-    total_revenue_2023 = 3484194586
-    
-    # CORRECTED: Total Revenue 2022 from PDF page 6 = $2,700,878,200
-    total_revenue_2022 = 2700878200
-    
-    revenue_growth = total_revenue_2023 - total_revenue_2022
-    revenue_growth_pct = (revenue_growth / total_revenue_2022) * 100 if total_revenue_2022 != 0 else 0
-    
-    # CORRECTED: Total Expenditure from PDF page 7 = $3,586,134,842
-    total_expenditure_2023 = 3586134842
-    
-    # CORRECTED: Total Expenditure 2022 from PDF page 7 = $3,374,294,565
-    total_expenditure_2022 = 3374294565
-    
-    # CORRECTED: Deficit from PDF page 7 = -$110,853,203 (this is a DEFICIT)
-    deficit_2023 = -110853203
-    
-    # CORRECTED: Deficit 2022 from PDF page 7 = -$691,359,707
-    deficit_2022 = -691359707
-    
-    # CORRECTED: Total Assets from PDF page 8 = $8,072,674,058
-    total_assets_2023 = 8072674058
-    
-    # CORRECTED: Total Assets 2022 from PDF page 8 = $7,553,807,331
-    total_assets_2022 = 7553807331
-    
-    # CORRECTED: Total Liabilities from PDF page 9 = $14,930,759,310
-    total_liabilities_2023 = 14930759310
-    
-    # CORRECTED: Total Liabilities 2022 from PDF page 9 = $14,183,357,313
-    total_liabilities_2022 = 14183357313
-    
-    # CORRECTED: Net Debt from PDF page 9 = $10,586,860,449
-    net_debt_2023 = 10586860449
-    
-    # CORRECTED: Net Debt 2022 from PDF page 9 = $10,268,176,613
-    net_debt_2022 = 10268176613
-    
-    # CORRECTED: Tax Receivables from PDF page 8 = $2,428,696,065
-    tax_receivables_2023 = 2428696065
-    
-    # CORRECTED: Tax Receivables 2022 from PDF page 8 = $2,384,625,679
-    tax_receivables_2022 = 2384625679
-    
-    # CORRECTED: Total SOE Transfers from Note 34 page 34 = $777,909,442.90 (TABLE VALUE)
-    total_soe_transfers = 777909442.90
-    
-    return {
-        'total_revenue_2023': total_revenue_2023,
-        'total_revenue_2022': total_revenue_2022,
-        'revenue_growth': revenue_growth,
-        'revenue_growth_pct': revenue_growth_pct,
-        'total_expenditure_2023': total_expenditure_2023,
-        'total_expenditure_2022': total_expenditure_2022,
-        'deficit_2023': deficit_2023,
-        'deficit_2022': deficit_2022,
-        'total_assets_2023': total_assets_2023,
-        'total_assets_2022': total_assets_2022,
-        'total_liabilities_2023': total_liabilities_2023,
-        'total_liabilities_2022': total_liabilities_2022,
-        'net_debt_2023': net_debt_2023,
-        'net_debt_2022': net_debt_2022,
-        'tax_receivables_2023': tax_receivables_2023,
-        'tax_receivables_2022': tax_receivables_2022,
-        'total_soe_transfers': total_soe_transfers
-    }
-
-def format_currency(value, format_type="Millions"):
-    """
-    Format currency values based on selected format.
-    
-    Args:
-        value: Numeric value to format
-        format_type: "Millions", "Billions", or "Full"
-    
-    Returns:
-        str: Formatted currency string
-    """
-    if pd.isna(value) or value is None:
-        return "N/A"
-    
-    if format_type == "Billions (BBD $B)":
-        return f"${value/1e9:,.2f}B"
-    elif format_type == "Millions (BBD $M)":
-        return f"${value/1e6:,.1f}M"
-    else:  # Full Amount
-        if abs(value) >= 1e9:
-            return f"${value:,.0f}"
-        elif abs(value) >= 1e6:
-            return f"${value:,.0f}"
-        else:
-            return f"${value:,.0f}"
-
 # ============================================================================
 # DATA INITIALIZATION
 # ============================================================================
+count_cache_data_call("load_financial_data")
+count_cache_data_call("calculate_key_metrics")
 financial_data = load_financial_data()
 metrics = calculate_key_metrics()
+dataset_version = load_snapshot().version
 
 # ============================================================================
 # HEADER SECTION
@@ -783,24 +368,21 @@ with st.sidebar:
     st.subheader("Display Options")
     view_option = st.selectbox(
     "Select View",
-    [
-        "Executive Summary", "Revenue Analysis", "Expenditure Analysis",
-        "Balance Sheet", "Audit Findings", "Debt Analysis", 
-        "Debt Sustainability Simulator", "SOE Transfers", "Performance Highlights", 
-        "Data Quality Issues", "Story View", "BERT 2026 Risk Analysis","2026 Reality Check"
-    ]
+    list(VIEW_MODULES),
+    key="view_option"
 )
     
     # Currency Format
     st.subheader("Currency Format")
     currency_format = st.selectbox(
         "Display values as",
-        ["Millions (BBD $M)", "Billions (BBD $B)", "Full Amount (BBD $)"]
+        CURRENCY_FORMATS,
+        key="currency_format"
     )
     
     # Comparative Period
     st.subheader("Comparative Period")
-    show_comparative = st.checkbox("Show 2022 Comparison", value=True)
+    show_comparative = st.checkbox("Show 2022 Comparison", value=True, key="show_comparative")
     
     st.markdown("---")
     
@@ -884,4785 +466,40 @@ with st.sidebar:
 # ============================================================================
 # VIEW SELECTION
 # ============================================================================
-
-if view_option == "Executive Summary":
-    # Executive Summary View
-    st.markdown('<div class="sub-header">Executive Summary - Adverse Audit Opinion</div>', unsafe_allow_html=True)
-    
-    # Warning about Adverse Opinion
-    with st.container():
-        st.markdown("""
-        <div class="financial-card adverse-opinion">
-            <h3 style="color: #DC2626; margin-top: 0;">⚠️ ADVERSE AUDIT OPINION ISSUED</h3>
-            <p><strong>Auditor General's Conclusion:</strong> The accompanying financial statements do <strong>NOT</strong> give a true and fair view of the financial position of the Government of Barbados as at March 31, 2023.</p>
-            <p><strong>Reason:</strong> Significant material misstatements and non-compliance with International Public Sector Accounting Standards (IPSAS).</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Data Quality Warning - FIXED: Using actual values
-    narrative_amount = financial_data['note34_discrepancy']['narrative_amount']
-    table_amount = financial_data['note34_discrepancy']['table_amount']
-    difference = financial_data['note34_discrepancy']['difference']
-    difference_pct = financial_data['note34_discrepancy']['difference_pct']
-    
-    with st.container():
-        st.markdown(f"""
-        <div class="financial-card data-error">
-            <h4 style="color: #DC2626; margin-top: 0;">⚠️ DATA QUALITY ALERT - NOTE 34 ERRORS</h4>
-            <p><strong>Critical inconsistencies found in Note 34:</strong></p>
-            <p>1. <strong>Numerical Discrepancy:</strong> Narrative states SOE transfers = ${narrative_amount:,.0f}, but table shows = ${table_amount:,.0f}</p>
-            <p>2. <strong>Conceptual Error:</strong> Incorrectly references Notes 8 (Retiring Benefits) and 10 (Debt Service) as "related party transactions"</p>
-            <p><strong>Impact:</strong> Reinforces Auditor General's adverse opinion about unreliable financial reporting</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Key Financial Metrics - CORRECTED
-    st.markdown('<div class="section-header">Key Financial Metrics</div>', unsafe_allow_html=True)
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            "Total Revenue", 
-            format_currency(metrics['total_revenue_2023'], currency_format), 
-            f"{metrics['revenue_growth_pct']:.1f}% vs 2022",
-            help="Total government revenue for financial year 2022-2023"
-        )
-    
-    with col2:
-        st.metric(
-            "Total Expenditure", 
-            format_currency(metrics['total_expenditure_2023'], currency_format),
-            f"{format_currency(metrics['total_expenditure_2023'] - metrics['total_expenditure_2022'], currency_format)}",
-            help="Total government expenditure for financial year 2022-2023"
-        )
-    
-    with col3:
-        deficit_value = format_currency(abs(metrics['deficit_2023']), currency_format)
-        deficit_change = abs(metrics['deficit_2023']) - abs(metrics['deficit_2022'])
-        
-        st.metric(
-            "Consolidated Fund Deficit",
-            deficit_value,
-            f"{format_currency(deficit_change, currency_format)}",
-            delta_color="normal",
-            help="Deficit after including annex operations"
-        )
-    
-    with col4:
-        st.metric(
-            "Total Public Debt",
-            format_currency(metrics['total_liabilities_2023'], currency_format),
-            f"{format_currency(metrics['total_liabilities_2023'] - metrics['total_liabilities_2022'], currency_format)}",
-            delta_color="inverse",
-            help="Total government liabilities as at March 31, 2023"
-        )
-    
-    # Revenue vs Expenditure Chart
-    st.markdown('<div class="section-header">Revenue vs Expenditure Trend</div>', unsafe_allow_html=True)
-    
-    trend_data = pd.DataFrame({
-        'Year': ['2022', '2023'],
-        'Revenue': [metrics['total_revenue_2022'], metrics['total_revenue_2023']],
-        'Expenditure': [metrics['total_expenditure_2022'], metrics['total_expenditure_2023']],
-        'Deficit': [abs(metrics['deficit_2022']), abs(metrics['deficit_2023'])]
-    })
-    
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        name='Revenue',
-        x=trend_data['Year'],
-        y=trend_data['Revenue'],
-        marker_color='#00267F',
-        text=[format_currency(x, currency_format) for x in trend_data['Revenue']],
-        textposition='auto'
-    ))
-    fig.add_trace(go.Bar(
-        name='Expenditure',
-        x=trend_data['Year'],
-        y=trend_data['Expenditure'],
-        marker_color='#DC2626',
-        text=[format_currency(x, currency_format) for x in trend_data['Expenditure']],
-        textposition='auto'
-    ))
-    
-    fig.update_layout(
-        barmode='group',
-        title='Revenue vs Expenditure Comparison (2022-2023)',
-        yaxis_title=f'Amount ({currency_format})',
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Critical Audit Findings
-    st.markdown('<div class="section-header">Critical Audit Findings Requiring Immediate Attention</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Asset Management Issues
-        st.markdown("""
-        <div class="financial-card qualified-item">
-            <h4 style="color: #D97706; margin-top: 0;">🏛️ Asset Management Issues</h4>
-            <p><strong>$719M Discrepancy</strong> in Other Capital Assets</p>
-            <p><strong>$115M Cash Overstatement</strong> in Treasury accounts</p>
-            <p><strong>$147M Investments Overstatement</strong></p>
-            <p><strong>Fixed Asset Register</strong> not reconciled</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Revenue Recognition Issues
-        st.markdown("""
-        <div class="financial-card material-misstatement">
-            <h4 style="color: #1D4ED8; margin-top: 0;">💰 Revenue Recognition Issues</h4>
-            <p><strong>$2.43B Tax Receivables</strong> unverified</p>
-            <p><strong>$68.3M Bad Debt Expense</strong> not confirmed</p>
-            <p><strong>Historical cost issues</strong> with asset valuation</p>
-            <p><strong>Measurement uncertainty</strong> in tax accruals</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        # Financial Reporting Failures
-        st.markdown("""
-        <div class="financial-card adverse-opinion">
-            <h4 style="color: #DC2626; margin-top: 0;">📊 Financial Reporting Failures</h4>
-            <p><strong>State-Owned Entities NOT consolidated</strong> (IPSAS violation)</p>
-            <p><strong>Pension liabilities OMITTED</strong> from balance sheet</p>
-            <p><strong>No consolidated financial statements</strong></p>
-            <p><strong>Persistent failure to perform bank reconciliations (15+years)</strong> (Auditor General's Report 2024, Note 2.17).</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Performance Highlights
-        st.markdown(f"""
-        <div class="financial-card">
-            <h4 style="color: #00267F; margin-top: 0;">📈 Performance Highlights</h4>
-            <p><strong>Revenue Growth:</strong> {format_currency(metrics['revenue_growth'], currency_format)} (+{metrics['revenue_growth_pct']:.1f}%)</p>
-            <p><strong>Tax Collection:</strong> {format_currency(financial_data['financial_performance'].loc[0, 'Actual_2023'], currency_format)}</p>
-            <p><strong>Debt Service:</strong> {format_currency(financial_data['expenditure_data'].loc[8, 'Actual_2023'], currency_format)}</p>
-            <p><strong>SOE Transfers:</strong> {format_currency(metrics['total_soe_transfers'], currency_format)}</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-elif view_option == "Revenue Analysis":
-    # Revenue Analysis View
-    st.markdown('<div class="sub-header">Revenue Analysis & Tax Performance</div>', unsafe_allow_html=True)
-    
-    # Revenue Composition
-    st.markdown('<div class="section-header">Revenue Composition 2023</div>', unsafe_allow_html=True)
-    
-    revenue_composition = financial_data['financial_performance'].copy()
-    fig = px.pie(
-        revenue_composition, 
-        values='Actual_2023', 
-        names='Category',
-        title='Revenue Composition by Source (2023)',
-        color_discrete_sequence=px.colors.sequential.Blues_r
-    )
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Tax Revenue Details
-    st.markdown('<div class="section-header">Tax Revenue Performance</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Top 5 Tax Revenue Sources
-        top_taxes = financial_data['tax_revenue_details'].nlargest(5, 'Actual_2023')
-        fig = px.bar(
-            top_taxes, 
-            x='Tax_Type', 
-            y='Actual_2023', 
-            title='Top 5 Tax Revenue Sources (2023)',
-            color='Growth_Pct', 
-            color_continuous_scale='Blues',
-            text=[format_currency(x, currency_format) for x in top_taxes['Actual_2023']]
-        )
-        fig.update_layout(yaxis_title=f'Amount ({currency_format})', xaxis_title='Tax Type')
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        # Tax Revenue Growth
-        fig = px.bar(
-            financial_data['tax_revenue_details'], 
-            x='Tax_Type', 
-            y='Growth_Pct', 
-            title='Tax Revenue Growth (2022 to 2023)',
-            color='Growth_Pct', 
-            color_continuous_scale='RdYlGn',
-            text=[f'{x:.1f}%' for x in financial_data['tax_revenue_details']['Growth_Pct']]
-        )
-        fig.update_layout(yaxis_title='Growth Percentage (%)', xaxis_title='Tax Type')
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Revenue Performance Table - FIXED with correct YoY percentage for Grants
-    st.markdown('<div class="section-header">Revenue Performance Details</div>', unsafe_allow_html=True)
-    
-    display_df = financial_data['financial_performance'][[
-        'Category', 'Revised_Budget_2023', 'Actual_2023', 
-        'Variance_2023', 'Variance_Pct_2023'
-    ]].copy()
-    
-    # Format the DataFrame using the currency formatting function
-    display_df['Revised_Budget_2023'] = display_df['Revised_Budget_2023'].apply(
-        lambda x: format_currency(x, currency_format)
-    )
-    display_df['Actual_2023'] = display_df['Actual_2023'].apply(
-        lambda x: format_currency(x, currency_format)
-    )
-    display_df['Variance_2023'] = display_df['Variance_2023'].apply(
-        lambda x: format_currency(x, currency_format)
-    )
-    display_df['Variance_Pct_2023'] = display_df['Variance_Pct_2023'].apply(lambda x: f"{x:+.1f}%")
-    
-    # Add 2022 comparison if selected
-    if show_comparative:
-        display_df['Actual_2022'] = financial_data['financial_performance']['Actual_2022'].apply(
-            lambda x: format_currency(x, currency_format)
-        )
-        display_df['YoY_Growth'] = financial_data['financial_performance']['YoY_Growth'].apply(
-            lambda x: format_currency(x, currency_format)
-        )
-        # FIXED: Use the formatted percentage display column
-        display_df['YoY_Growth_Pct'] = financial_data['financial_performance']['YoY_Growth_Pct_Display']
-        
-        display_df.columns = [
-            'Revenue Category', 'Revised Budget', 'Actual 2023', 
-            'Variance', 'Variance %', 'Actual 2022', 'YoY Growth', 'YoY Growth %'
-        ]
-    else:
-        display_df.columns = [
-            'Revenue Category', 'Revised Budget', 'Actual 2023', 
-            'Variance', 'Variance %'
-        ]
-    
-    st.dataframe(display_df, use_container_width=True, height=400)
-    
-    # Tax Receivables Issue
-    st.markdown('<div class="section-header">⚠️ Critical Issue: Unverified Tax Receivables</div>', unsafe_allow_html=True)
-    
-    st.warning(f"""
-    **$2.43 Billion Tax Receivables Could Not Be Verified**
-    
-    - **Amount Unverified:** {format_currency(metrics['tax_receivables_2023'], currency_format)} (as at March 31, 2023)
-    - **Year-over-Year Change:** {format_currency(metrics['tax_receivables_2023'] - metrics['tax_receivables_2022'], currency_format)}
-    - **Percentage of Total Assets:** {(metrics['tax_receivables_2023']/metrics['total_assets_2023']*100):.1f}%
-    
-    **Auditor's Note:** "Tax Receivables of $2.43 billion... could not be confirmed because of the absence of sufficient supporting documentation."
-    """)
-
-elif view_option == "Expenditure Analysis":
-    # Expenditure Analysis View
-    st.markdown('<div class="sub-header">Government Expenditure Analysis</div>', unsafe_allow_html=True)
-    
-    # Expenditure Composition
-    st.markdown('<div class="section-header">Expenditure Composition 2023</div>', unsafe_allow_html=True)
-    
-    expenditure_composition = financial_data['expenditure_data'].copy()
-    fig = px.pie(
-        expenditure_composition, 
-        values='Actual_2023', 
-        names='Category',
-        title='Expenditure Composition by Category (2023)',
-        color_discrete_sequence=px.colors.sequential.Reds_r
-    )
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Major Expenditure Categories
-    st.markdown('<div class="section-header">Major Expenditure Categories</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Personnel Costs
-        personnel_costs = expenditure_composition[
-            expenditure_composition['Category'].isin([
-                'Payroll and Employee Benefits', 
-                'Retiring Benefits and Allowances'
-            ])
-        ]
-        total_personnel = personnel_costs['Actual_2023'].sum()
-        
-        st.markdown(f"""
-        <div class="financial-card">
-            <h4 style="color: #00267F; margin-top: 0;">👥 Personnel Costs</h4>
-            <div class="financial-value">{format_currency(total_personnel, currency_format)}</div>
-            <div class="financial-label">Total Payroll & Benefits</div>
-            <p><strong>Payroll:</strong> {format_currency(personnel_costs.iloc[0]['Actual_2023'], currency_format)}</p>
-            <p><strong>Retiring Benefits:</strong> {format_currency(personnel_costs.iloc[1]['Actual_2023'], currency_format)}</p>
-            <p><strong>% of Total Expenditure:</strong> {(total_personnel/metrics['total_expenditure_2023']*100):.1f}%</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Grants and Transfers
-        grants = expenditure_composition[
-            expenditure_composition['Category'] == 'Grants and Other Current Transfers'
-        ]
-        
-        capital_transfers = expenditure_composition[
-            expenditure_composition['Category'] == 'Capital Transfers'
-        ]
-        
-        st.markdown(f"""
-        <div class="financial-card">
-            <h4 style="color: #00267F; margin-top: 0;">🏛️ Grants & Transfers</h4>
-            <div class="financial-value">{format_currency(grants.iloc[0]['Actual_2023'], currency_format)}</div>
-            <div class="financial-label">Current Transfers</div>
-            <p><strong>Capital Transfers:</strong> {format_currency(capital_transfers.iloc[0]['Actual_2023'], currency_format)}</p>
-            <p><strong>Total Transfers:</strong> {format_currency(grants.iloc[0]['Actual_2023'] + capital_transfers.iloc[0]['Actual_2023'], currency_format)}</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        # Debt Service
-        debt_service = expenditure_composition[
-            expenditure_composition['Category'] == 'Debt Service'
-        ]
-        
-        st.markdown(f"""
-        <div class="financial-card">
-            <h4 style="color: #DC2626; margin-top: 0;">💳 Debt Service</h4>
-            <div class="financial-value">{format_currency(debt_service.iloc[0]['Actual_2023'], currency_format)}</div>
-            <div class="financial-label">Interest & Loan Expenses</div>
-            <p><strong>Interest Expense:</strong> {format_currency(financial_data['expenditure_data'].iloc[8]['Actual_2023'], currency_format)}</p>
-            <p><strong>% of Revenue:</strong> {(debt_service.iloc[0]['Actual_2023']/metrics['total_revenue_2023']*100):.1f}%</p>
-            <p><strong>Year-over-Year:</strong> +{format_currency(debt_service.iloc[0]['Actual_2023'] - financial_data['expenditure_data'].iloc[8]['Actual_2022'], currency_format)}</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Operating Expenses
-        operating = expenditure_composition[
-            expenditure_composition['Category'].isin([
-                'Goods and Services', 
-                'Depreciation', 
-                'Bad Debt Expense'
-            ])
-        ]
-        total_operating = operating['Actual_2023'].sum()
-        
-        st.markdown(f"""
-        <div class="financial-card">
-            <h4 style="color: #00267F; margin-top: 0;">⚙️ Operating Expenses</h4>
-            <div class="financial-value">{format_currency(total_operating, currency_format)}</div>
-            <div class="financial-label">Goods, Services & Depreciation</div>
-            <p><strong>Goods & Services:</strong> {format_currency(operating.iloc[0]['Actual_2023'], currency_format)}</p>
-            <p><strong>Depreciation:</strong> {format_currency(operating.iloc[1]['Actual_2023'], currency_format)}</p>
-            <p><strong>Bad Debt Expense:</strong> {format_currency(operating.iloc[2]['Actual_2023'], currency_format)}</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Expenditure Performance Table
-    st.markdown('<div class="section-header">Expenditure Performance vs Budget</div>', unsafe_allow_html=True)
-    
-    exp_display_df = financial_data['expenditure_data'][[
-        'Category', 'Revised_Budget_2023', 'Actual_2023', 
-        'Variance_2023', 'Variance_Pct_2023'
-    ]].copy()
-    
-    # Format the DataFrame using the currency formatting function
-    exp_display_df['Revised_Budget_2023'] = exp_display_df['Revised_Budget_2023'].apply(
-        lambda x: format_currency(x, currency_format)
-    )
-    exp_display_df['Actual_2023'] = exp_display_df['Actual_2023'].apply(
-        lambda x: format_currency(x, currency_format)
-    )
-    exp_display_df['Variance_2023'] = exp_display_df['Variance_2023'].apply(
-        lambda x: format_currency(x, currency_format)
-    )
-    exp_display_df['Variance_Pct_2023'] = exp_display_df['Variance_Pct_2023'].apply(lambda x: f"{x:+.1f}%")
-    
-    # Add 2022 comparison if selected
-    if show_comparative:
-        exp_display_df['Actual_2022'] = financial_data['expenditure_data']['Actual_2022'].apply(
-            lambda x: format_currency(x, currency_format)
-        )
-        exp_display_df['YoY_Change'] = (
-            financial_data['expenditure_data']['Actual_2023'] - 
-            financial_data['expenditure_data']['Actual_2022']
-        ).apply(lambda x: format_currency(x, currency_format))
-        
-        exp_display_df.columns = [
-            'Expenditure Category', 'Revised Budget', 'Actual 2023', 
-            'Variance', 'Variance %', 'Actual 2022', 'YoY Change'
-        ]
-    else:
-        exp_display_df.columns = [
-            'Expenditure Category', 'Revised Budget', 'Actual 2023', 
-            'Variance', 'Variance %'
-        ]
-    
-    st.dataframe(exp_display_df, use_container_width=True, height=400)
-
-elif view_option == "Balance Sheet":
-    # Balance Sheet View
-    st.markdown('<div class="sub-header">Statement of Financial Position Analysis</div>', unsafe_allow_html=True)
-    
-    # Assets vs Liabilities Overview
-    st.markdown('<div class="section-header">Assets vs Liabilities Overview</div>', unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric(
-            "Total Assets", 
-            format_currency(metrics['total_assets_2023'], currency_format), 
-            f"{format_currency(metrics['total_assets_2023'] - metrics['total_assets_2022'], currency_format)}"
-        )
-    
-    with col2:
-        st.metric(
-            "Total Liabilities", 
-            format_currency(metrics['total_liabilities_2023'], currency_format), 
-            f"{format_currency(metrics['total_liabilities_2023'] - metrics['total_liabilities_2022'], currency_format)}"
-        )
-    
-    with col3:
-        net_position = metrics['total_assets_2023'] - metrics['total_liabilities_2023']
-        net_position_prev = metrics['total_assets_2022'] - metrics['total_liabilities_2022']
-        change = net_position - net_position_prev
-        
-        st.metric(
-            "Net Position", 
-            format_currency(net_position, currency_format), 
-            f"{format_currency(change, currency_format)}", 
-            delta_color="normal" if net_position >= 0 else "inverse"
-        )
-    
-    # Asset Composition
-    st.markdown('<div class="section-header">Asset Composition (March 31, 2023)</div>', unsafe_allow_html=True)
-    
-    asset_data = financial_data['balance_sheet'].copy()
-    
-    # Group assets
-    current_assets = asset_data[asset_data['Category'] == 'Current Assets']['Actual_Mar_23'].values[0]
-    non_current_assets = asset_data[asset_data['Category'] == 'Non-Current Assets']['Actual_Mar_23'].values[0]
-    
-    fig = go.Figure(data=[go.Pie(
-        labels=['Current Assets', 'Non-Current Assets'],
-        values=[current_assets, non_current_assets],
-        hole=.3,
-        marker_colors=['#3B82F6', '#1D4ED8']
-    )])
-    fig.update_layout(title='Asset Distribution')
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Key Asset Items
-    st.markdown('<div class="section-header">Key Asset Items</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        key_assets = asset_data[asset_data['Category'].isin([
-            'Cash on Hand', 'Bank', 'Tax Receivables (Net)', 
-            'Investments', 'Land'
-        ])]
-        
-        for _, row in key_assets.iterrows():
-            value = format_currency(row['Actual_Mar_23'], currency_format)
-            prev_value = format_currency(row['Actual_Mar_22'], currency_format)
-            change = row['Actual_Mar_23'] - row['Actual_Mar_22']
-            change_pct = (change / row['Actual_Mar_22']) * 100 if row['Actual_Mar_22'] != 0 else 0
-            
-            st.markdown(f"""
-            <div class="financial-card">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <div>
-                        <strong>{row['Category']}</strong><br>
-                        <small style="color: #666;">2023: {value} | 2022: {prev_value}</small>
-                    </div>
-                    <div style="text-align: right;">
-                        <div style="color: {'#10B981' if change >= 0 else '#DC2626'}; font-weight: bold;">
-                            {format_currency(change, currency_format)}
-                        </div>
-                        <small style="color: #666;">{change_pct:+.1f}%</small>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with col2:
-        # Liabilities Breakdown
-        liabilities = financial_data['liabilities_data']
-        key_liabilities = liabilities[liabilities['Category'].isin([
-            'Current Liabilities', 'Long-term Liabilities', 
-            'Government Securities', 'Loans from International Financial Institutions'
-        ])]
-        
-        for _, row in key_liabilities.iterrows():
-            value = format_currency(row['Actual_Mar_23'], currency_format)
-            prev_value = format_currency(row['Actual_Mar_22'], currency_format)
-            change = row['Actual_Mar_23'] - row['Actual_Mar_22']
-            change_pct = (change / row['Actual_Mar_22']) * 100 if row['Actual_Mar_22'] != 0 else 0
-            
-            st.markdown(f"""
-            <div class="financial-card">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <div>
-                        <strong>{row['Category']}</strong><br>
-                        <small style="color: #666;">2023: {value} | 2022: {prev_value}</small>
-                    </div>
-                    <div style="text-align: right;">
-                        <div style="color: {'#DC2626' if change >= 0 else '#10B981'}; font-weight: bold;">
-                            {format_currency(change, currency_format)}
-                        </div>
-                        <small style="color: #666;">{change_pct:+.1f}%</small>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-elif view_option == "Audit Findings":
-    # Audit Findings View
-    st.markdown('<div class="sub-header">Audit Findings & Material Misstatements</div>', unsafe_allow_html=True)
-    
-    # Adverse Opinion Summary
-    with st.container():
-        st.markdown("""
-        <div class="financial-card adverse-opinion">
-            <h3 style="color: #DC2626; margin-top: 0;">❌ ADVERSE AUDIT OPINION - KEY FINDINGS</h3>
-            <p><strong>Basis for Adverse Opinion (Extract from Auditor General's Report):</strong></p>
-            <p>"The total for Other Capital Assets could not be confirmed because of a difference of $719 million between the amounts reported in the financial statements compared with the corresponding figures listed in the subsidiary records. Cash and Financial Investments listed in the financial statements were overstated by $115 million and $147 million respectively. In addition, the liability for pensions and employee benefits were not included in the Statement of Financial Position and the accounts of the State-owned Entities were not consolidated into the financial statements as required by the International Public Sector Accounting Standards (IPSAS). Also, Tax Receivables of $2.43 billion and Bad Debt Expenses of $68.28 million could not be confirmed because of the absence of sufficient supporting documentation."</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Note 34 Specific Errors - FIXED with proper HTML formatting
-    narrative_amount = financial_data['note34_discrepancy']['narrative_amount']
-    table_amount = financial_data['note34_discrepancy']['table_amount']
-    difference = financial_data['note34_discrepancy']['difference']
-    difference_pct = financial_data['note34_discrepancy']['difference_pct']
-    
-    with st.container():
-        st.markdown("""
-        <div class="financial-card data-error">
-            <h4 style="color: #DC2626; margin-top: 0;">⚠️ SPECIFIC ERRORS IN NOTE 34</h4>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Create two columns for the errors
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### 1. Numerical Discrepancy")
-            st.markdown(f"""
-            <div style="padding: 10px; background-color: #FEF2F2; border-radius: 5px; margin-bottom: 10px;">
-                <p><strong>Narrative states:</strong> SOE transfers = ${narrative_amount:,.0f}</p>
-                <p><strong>Table shows:</strong> SOE transfers = ${table_amount:,.0f}</p>
-                <p><strong>Difference:</strong> ${difference:,.0f} ({difference_pct:.1f}% variance)</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("### 2. Conceptual Error")
-            st.markdown(f"""
-            <div style="padding: 10px; background-color: #FFFBEB; border-radius: 5px; margin-bottom: 10px;">
-                <p><strong>Note 34 states:</strong> "Notes 8 and 10 dealt with other related party transactions which occurred during the financial year 2022-2023."</p>
-                <p><strong>Why this is WRONG:</strong></p>
-                <ul>
-                    <li><strong>Note 8:</strong> Retiring benefits (pensions) - NOT related party transactions</li>
-                    <li><strong>Note 10:</strong> Debt service costs (interest) - NOT related party transactions</li>
-                    <li>These are routine government payments to external parties, not transactions with controlled entities (SOEs)</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="background-color: #EFF6FF; padding: 15px; border-radius: 5px; margin-top: 10px; border-left: 4px solid #3B82F6;">
-            <p><strong>Impact:</strong> Shows fundamental misunderstanding of accounting concepts and reinforces unreliable financial reporting</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Material Misstatements
-    st.markdown('<div class="section-header">Material Misstatements Identified</div>', unsafe_allow_html=True)
-    
-    for _, item in financial_data['adverse_opinion_items'].iterrows():
-        severity_color = {
-            'Critical': '#DC2626',
-            'High': '#F59E0B',
-            'Medium': '#3B82F6',
-            'Low': '#10B981'
-        }.get(item['Severity'], '#666')
-        
-        if isinstance(item['Amount'], (int, float)):
-            amount_display = format_currency(item['Amount'], currency_format)
-        else:
-            amount_display = item['Amount']
-        
-        st.markdown(f"""
-        <div class="financial-card" style="border-left-color: {severity_color};">
-            <div style="display: flex; justify-content: space-between; align-items: start;">
-                <div style="flex: 1;">
-                    <h4 style="margin-top: 0; color: {severity_color};">{item['Issue']}</h4>
-                    <p><strong>Amount:</strong> {amount_display}</p>
-                    <p><strong>Impact:</strong> {item['Impact']}</p>
-                    <p><strong>Description:</strong> {item['Description']}</p>
-                </div>
-                <div style="background-color: {severity_color}; color: white; padding: 4px 12px; border-radius: 12px; font-size: 0.8rem; font-weight: bold;">
-                    {item['Severity']} Severity
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # IPSAS Compliance Issues
-    st.markdown('<div class="section-header">IPSAS Compliance Failures</div>', unsafe_allow_html=True)
-    
-    ipsas_issues = [
-        {
-            'Requirement': 'Consolidation of State-Owned Entities',
-            'Status': '❌ NOT COMPLIANT',
-            'Impact': 'Financial statements incomplete and misleading',
-            'Remediation': 'Require full consolidation of all SOEs'
-        },
-        {
-            'Requirement': 'Recognition of Pension Liabilities',
-            'Status': '❌ NOT COMPLIANT',
-            'Impact': 'Liabilities understated by unquantified amount',
-            'Remediation': 'Actuarial valuation and proper accounting'
-        },
-        {
-            'Requirement': 'Asset Valuation and Verification',
-            'Status': '⚠️ PARTIALLY COMPLIANT',
-            'Impact': 'Assets potentially overstated by $981M+',
-            'Remediation': 'Complete asset register reconciliation'
-        },
-        {
-            'Requirement': 'Revenue Recognition (Tax Receivables)',
-            'Status': '❌ NOT COMPLIANT',
-            'Impact': '$2.43B receivables unverified',
-            'Remediation': 'Documentation and verification procedures'
-        }
-    ]
-    
-    for issue in ipsas_issues:
-        status_color = '#DC2626' if 'NOT' in issue['Status'] else '#F59E0B'
-        
-        st.markdown(f"""
-        <div class="financial-card">
-            <div style="display: flex; justify-content: space-between; align-items: start;">
-                <div style="flex: 1;">
-                    <h5 style="margin-top: 0;">{issue['Requirement']}</h5>
-                    <p><strong>Status:</strong> <span style="color: {status_color};">{issue['Status']}</span></p>
-                    <p><strong>Impact:</strong> {issue['Impact']}</p>
-                    <p><strong>Remediation Required:</strong> {issue['Remediation']}</p>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+render_view(view_option, ViewContext(
+    financial_data=financial_data,
+    metrics=metrics,
+    dataset_version=dataset_version,
+    currency_format=currency_format,
+    show_comparative=show_comparative,
+))
 
 # ============================================================================
-# DEBT SUSTAINABILITY SIMULATOR - CORRECTED VERSION
+# FOOTER
 # ============================================================================
-elif view_option == "Debt Analysis":
-    # Debt Analysis View - COMPLETELY CORRECTED
-    st.markdown('<div class="sub-header">Public Debt Analysis </div>', unsafe_allow_html=True)
-    
-    # Debt Overview
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        debt_ratio = (metrics['total_liabilities_2023'] / metrics['total_assets_2023']) * 100
-        st.metric(
-            "Total Public Debt", 
-            format_currency(metrics['total_liabilities_2023'], currency_format), 
-            f"{debt_ratio:.1f}% of Assets"
-        )
-    
-    with col2:
-        net_debt_change = metrics['net_debt_2023'] - metrics['net_debt_2022']
-        st.metric(
-            "Net Debt Position", 
-            format_currency(metrics['net_debt_2023'], currency_format), 
-            f"{format_currency(net_debt_change, currency_format)}"
-        )
-    
-    with col3:
-        debt_service_ratio = (
-            financial_data['expenditure_data'].loc[8, 'Actual_2023'] / 
-            metrics['total_revenue_2023']
-        ) * 100
-        st.metric(
-            "Debt Service to Revenue", 
-            f"{debt_service_ratio:.1f}%", 
-            f"{format_currency(financial_data['expenditure_data'].loc[8, 'Actual_2023'], currency_format)}"
-        )
-    
-    # Debt Structure Visualization
-    st.markdown('<div class="section-header">Public Debt Structure</div>', unsafe_allow_html=True)
-    
-    debt_data = financial_data['debt_structure'].copy()
-    fig = px.bar(
-        debt_data, 
-        x='Debt_Type', 
-        y='Amount_2023', 
-        title='Public Debt by Type (2023)',
-        color='Debt_Category', 
-        color_discrete_map={'Domestic': '#00267F', 'Foreign': '#DC2626'},
-        text=[format_currency(x, currency_format) for x in debt_data['Amount_2023']]
-    )
-    fig.update_layout(yaxis_title=f'Amount ({currency_format})', xaxis_title='Debt Type')
-    fig.update_xaxes(tickangle=45)
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Debt Composition - CORRECTED Calculation
-    st.markdown('<div class="section-header">Debt Composition Analysis </div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # CORRECTED: Calculate domestic vs foreign debt from the debt structure
-        domestic_debt = debt_data[debt_data['Debt_Category'] == 'Domestic']['Amount_2023'].sum()
-        foreign_debt = debt_data[debt_data['Debt_Category'] == 'Foreign']['Amount_2023'].sum()
-        
-        total_debt_from_structure = domestic_debt + foreign_debt
-        
-        # CORRECTED: The total public debt from balance sheet is $14.93B
-        # The debt structure accounts for part of this, not all
-        total_public_debt = metrics['total_liabilities_2023']
-        
-        st.info(f"""
-        **Debt Composition Analysis:**
-        
-        **From Debt Structure Data:**
-        - **Domestic Debt:** {format_currency(domestic_debt, currency_format)} ({(domestic_debt/total_debt_from_structure*100):.1f}% of structured debt)
-        - **Foreign Debt:** {format_currency(foreign_debt, currency_format)} ({(foreign_debt/total_debt_from_structure*100):.1f}% of structured debt)
-        - **Total Structured Debt:** {format_currency(total_debt_from_structure, currency_format)}
-        
-        **From Balance Sheet:**
-        - **Total Public Debt:** {format_currency(total_public_debt, currency_format)}
-        
-        **Note:** The debt structure data accounts for specific debt instruments, 
-        while the total public debt includes additional liabilities not shown in the debt structure breakdown.
-        """)
-        
-        fig = px.pie(
-            names=['Domestic Debt', 'Foreign Debt'],
-            values=[domestic_debt, foreign_debt],
-            title=f'Domestic vs Foreign Debt (Structured Debt: {format_currency(total_debt_from_structure, currency_format)})',
-            color_discrete_sequence=['#00267F', '#FFC726']
-        )
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        # Debt Changes
-        fig = px.bar(
-            debt_data, 
-            x='Debt_Type', 
-            y='Change', 
-            title='Debt Changes (2022 to 2023)',
-            color='Change', 
-            color_continuous_scale='RdYlGn_r',
-            text=[format_currency(x, currency_format) for x in debt_data['Change']]
-        )
-        fig.update_layout(yaxis_title=f'Change ({currency_format})', xaxis_title='Debt Type')
-        fig.update_xaxes(tickangle=45)
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # CORRECTED: Debt Service Analysis
-    st.markdown('<div class="section-header">Debt Service Analysis</div>', unsafe_allow_html=True)
-    
-    debt_service = {
-        'Category': [
-            'Interest Expense - Domestic', 'Interest Expense - Foreign', 
-            'Total Interest', 'Expenses of Loans', 'Total Debt Service'
-        ],
-        'Amount_2023': [372283237, 182429845, 554713083, 13564532, 568277615],
-        'Amount_2022': [258748956, 125213222, 383962718, 7490317, 391453035]
-    }
-    
-    debt_service_df = pd.DataFrame(debt_service)
-    debt_service_df['Growth'] = debt_service_df['Amount_2023'] - debt_service_df['Amount_2022']
-    debt_service_df['Growth_Pct'] = (
-        debt_service_df['Growth'] / debt_service_df['Amount_2022']
-    ) * 100
-    
-    for _, row in debt_service_df.iterrows():
-        col1, col2, col3, col4 = st.columns([3, 2, 2, 2])
-        
-        with col1:
-            st.write(f"**{row['Category']}**")
-        
-        with col2:
-            st.write(format_currency(row['Amount_2023'], currency_format))
-        
-        with col3:
-            if show_comparative:
-                st.write(format_currency(row['Amount_2022'], currency_format))
-        
-        with col4:
-            growth_color = '#DC2626' if row['Growth'] > 0 else '#10B981'
-            st.write(
-                f"<span style='color: {growth_color}'>"
-                f"{format_currency(row['Growth'], currency_format)} ({row['Growth_Pct']:+.1f}%)"
-                f"</span>", 
-                unsafe_allow_html=True
-            )
+st.markdown("---")
 
-# ============================================================================
-# DEBT SUSTAINABILITY SIMULATOR - WITH TOURISM TRADE-OFF CALCULATOR
-# ============================================================================
-elif view_option == "Debt Sustainability Simulator":
-    st.markdown('<div class="sub-header">Debt Sustainability Simulator - With Tourism Trade-off Analysis</div>', unsafe_allow_html=True)
-    
-    # Explanation of the correction
-    with st.container():
-        st.markdown("""
-        <div class="financial-card" style="border-left-color: #10B981;">
-            <h4 style="color: #10B981; margin-top: 0;">✅ CORRECTION APPLIED + TOURISM ANALYSIS</h4>
-            <p><strong>Previous Bug:</strong> Higher inflation incorrectly reduced target date (made debt fall faster).</p>
-            <p><strong>Correct Logic:</strong> Higher inflation → faster nominal GDP growth → helps debt ratio, BUT interest costs may also rise.</p>
-            <p><strong>Barbados Context:</strong> ~70% fixed-rate debt, ~30% inflation-sensitive debt.</p>
-            <p><strong>Critical Trade-off:</strong> Inflation helps debt mathematically BUT hurts tourism (40% of GDP).</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # === TOURISM TRADE-OFF CALCULATOR ===
-    st.markdown('<div class="section-header">🏝️ Tourism Trade-off Calculator</div>', unsafe_allow_html=True)
-    
-    col_tourism1, col_tourism2, col_tourism3 = st.columns(3)
-    
-    with col_tourism1:
-        tourism_gdp_share = st.slider(
-            "Tourism as % of GDP",
-            min_value=30.0,
-            max_value=50.0,
-            value=40.0,
-            step=0.5,
-            help="Tourism's contribution to Barbados GDP (official: 40%)"
-        )
-    
-    with col_tourism2:
-        tourism_sensitivity = st.slider(
-            "Tourism Sensitivity to Inflation",
-            min_value=1.0,
-            max_value=4.0,
-            value=2.5,
-            step=0.1,
-            help="Each 1% inflation above competitors reduces tourism growth by this factor"
-        )
-    
-    with col_tourism3:
-        competitor_inflation = st.slider(
-            "Competitor Countries' Inflation",
-            min_value=1.0,
-            max_value=5.0,
-            value=2.5,
-            step=0.1,
-            help="Average inflation in competing tourist destinations (Jamaica, Bahamas, DR)"
-        )
-    
-    # Interactive controls for main simulation
-    st.markdown('<div class="section-header">📊 Main Simulation Parameters</div>', unsafe_allow_html=True)
-    
-    col_sim1, col_sim2, col_sim3 = st.columns(3)
-    
-    with col_sim1:
-        growth_rate = st.slider(
-            "Real GDP Growth Rate (%)",
-            min_value=1.0,
-            max_value=6.0,
-            value=3.5,
-            step=0.1,
-            help="Real economic growth (excluding inflation) - BERT 2026 target: 3.5% average"
-        )
-    
-    with col_sim2:
-        primary_surplus = st.slider(
-            "Primary Surplus (% of GDP)",
-            min_value=1.0,
-            max_value=6.0,
-            value=4.4,
-            step=0.1,
-            help="BERT 2026 target: 4.4% → 3.5% over 2025-2028"
-        )
-    
-    with col_sim3:
-        inflation_rate = st.slider(
-            "Barbados Inflation Rate (%)",
-            min_value=1.0,
-            max_value=10.0,
-            value=3.5,
-            step=0.1,
-            help="Consumer price inflation. Higher inflation helps debt ratio but hurts tourism"
-        )
-    
-    # Advanced parameters
-    with st.expander("⚙️ Advanced Parameters"):
-        col_adv1, col_adv2, col_adv3 = st.columns(3)
-        
-        with col_adv1:
-            # Real interest rate (adjusted for inflation expectations)
-            real_interest_rate = st.slider(
-                "Real Interest Rate (%)",
-                min_value=0.0,
-                max_value=5.0,
-                value=2.5,
-                step=0.1,
-                help="Interest rate adjusted for inflation expectations. Barbados real rate typically 2-3%"
-            )
-        
-        with col_adv2:
-            fixed_debt_share = st.slider(
-                "Fixed-Rate Debt Share (%)",
-                min_value=50,
-                max_value=90,
-                value=70,
-                step=5,
-                help="Percentage of debt with fixed interest rates. Barbados: ~70% fixed"
-            )
-        
-        with col_adv3:
-            include_shock = st.checkbox("Include Climate/Shock Impact", value=False)
-            if include_shock:
-                shock_size = st.slider("Shock Size (% of GDP)", 0.5, 5.0, 2.0, 0.1)
-    
-    # === CALCULATE TOURISM IMPACT ===
-    st.markdown('<div class="section-header">📈 Tourism Impact Analysis</div>', unsafe_allow_html=True)
-    
-    # Calculate tourism impact
-    inflation_premium = max(0, inflation_rate - competitor_inflation)
-    tourism_growth_impact = -inflation_premium * tourism_sensitivity
-    tourism_gdp_impact = tourism_growth_impact * (tourism_gdp_share / 100)
-    
-    # Adjusted growth rate including tourism impact
-    adjusted_growth_rate = growth_rate + tourism_gdp_impact
-    adjusted_growth_rate = max(adjusted_growth_rate, 0.5)  # Can't go below 0.5%
-    
-    # Display tourism impact analysis
-    col_t1, col_t2, col_t3, col_t4 = st.columns(4)
-    
-    with col_t1:
-        st.metric(
-            "Inflation Premium vs Competitors",
-            f"{inflation_premium:+.1f}%",
-            "Higher = less competitive"
-        )
-    
-    with col_t2:
-        st.metric(
-            "Tourism Growth Impact",
-            f"{tourism_growth_impact:+.1f}%",
-            delta_color="inverse" if tourism_growth_impact < 0 else "normal"
-        )
-    
-    with col_t3:
-        st.metric(
-            "GDP Impact",
-            f"{tourism_gdp_impact:+.1f}%",
-            delta_color="inverse" if tourism_gdp_impact < 0 else "normal"
-        )
-    
-    with col_t4:
-        st.metric(
-            "Adjusted Growth Rate",
-            f"{adjusted_growth_rate:.1f}%",
-            f"vs {growth_rate:.1f}% base"
-        )
-    
-    # Tourism warning
-    if inflation_premium > 1.0:
-        st.warning(f"""
-        ⚠️ **Tourism Competitiveness Alert:**
-        
-        Barbados has **{inflation_premium:.1f}% higher inflation** than competing destinations.
-        
-        **Impact on Tourism (40% of GDP):**
-        - Tourist arrivals could decline by **{abs(tourism_growth_impact):.1f}%**
-        - GDP growth reduced by **{abs(tourism_gdp_impact):.1f} percentage points**
-        - **{tourism_gdp_share * (abs(tourism_growth_impact)/100):.1f}% of GDP** at risk
-        
-        **Historical Example:** When Barbados had 9.8% inflation (2022), tourism grew only 1.2% 
-        while regional competitors grew 8-12%.
-        """)
-    
-    # === CALCULATE DEBT DYNAMICS WITH TOURISM ADJUSTMENT ===
-    st.markdown('<div class="section-header">💰 Combined Debt & Tourism Analysis</div>', unsafe_allow_html=True)
-    
-    # CORRECTED: Calculate nominal interest rate based on debt structure
-    fixed_debt_pct = fixed_debt_share / 100
-    
-    # For fixed-rate debt: interest doesn't change with inflation
-    # For floating-rate debt: interest adjusts with inflation
-    # Nominal interest rate = Real rate + (inflation × portion of floating debt)
-    floating_debt_share = 1 - fixed_debt_pct
-    nominal_interest_rate = real_interest_rate + (inflation_rate * floating_debt_share)
-    
-    # Nominal GDP growth = Adjusted real growth + Inflation
-    nominal_growth_rate = adjusted_growth_rate + inflation_rate
-    
-    # Calculate interest-growth differential (the key driver)
-    interest_growth_diff = nominal_interest_rate - nominal_growth_rate
-    
-    # Display calculated parameters
-    col_calc1, col_calc2, col_calc3 = st.columns(3)
-    
-    with col_calc1:
-        st.metric(
-            "Nominal Interest Rate",
-            f"{nominal_interest_rate:.1f}%",
-            f"Real {real_interest_rate:.1f}% + Inflation adjustment"
-        )
-    
-    with col_calc2:
-        st.metric(
-            "Nominal GDP Growth",
-            f"{nominal_growth_rate:.1f}%",
-            f"Adjusted growth {adjusted_growth_rate:.1f}% + Inflation {inflation_rate:.1f}%"
-        )
-    
-    with col_calc3:
-        diff_color = "#DC2626" if interest_growth_diff > 0 else "#10B981"
-        st.metric(
-            "Interest-Growth Differential",
-            f"{interest_growth_diff:+.1f}%",
-            delta_color="inverse" if interest_growth_diff > 0 else "normal",
-            help="Positive = debt grows faster than economy, Negative = economy grows faster than debt"
-        )
-    
-    # === THE BARBADOS PARADOX ANALYSIS ===
-    st.markdown('<div class="section-header">⚖️ The Barbados Paradox: Inflation vs Tourism</div>', unsafe_allow_html=True)
-    
-    # Create analysis of the trade-off
-    col_para1, col_para2 = st.columns(2)
-    
-    with col_para1:
-        # Calculate debt benefit from inflation
-        inflation_debt_benefit = inflation_rate * fixed_debt_pct  # Only helps on fixed debt
-        
-        st.markdown(f"""
-        <div class="financial-card" style="border-left-color: #10B981;">
-            <h5 style="color: #10B981;">✅ Inflation Benefit to Debt</h5>
-            <p><strong>Fixed-rate debt advantage:</strong> {fixed_debt_share}% of debt doesn't adjust with inflation</p>
-            <p><strong>Debt reduction from inflation:</strong> {inflation_debt_benefit:.2f}% per year</p>
-            <p><strong>Mathematical effect:</strong> Each 1% inflation reduces debt ratio by ~{fixed_debt_pct:.2f}%</p>
-            <p><em>Without tourism impact, {inflation_rate}% inflation would reduce debt by ~{(inflation_rate * fixed_debt_pct * 10):.1f}% over 10 years</em></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_para2:
-        st.markdown(f"""
-        <div class="financial-card" style="border-left-color: #DC2626;">
-            <h5 style="color: #DC2626;">❌ Inflation Cost to Tourism</h5>
-            <p><strong>Tourism sensitivity:</strong> Each 1% inflation premium reduces tourism by {tourism_sensitivity:.1f}%</p>
-            <p><strong>Current inflation premium:</strong> {inflation_premium:.1f}% vs competitors</p>
-            <p><strong>Tourism growth impact:</strong> {tourism_growth_impact:+.1f}%</p>
-            <p><strong>GDP impact:</strong> {tourism_gdp_impact:+.1f} percentage points</p>
-            <p><em>Tourism drag reduces GDP growth from {growth_rate:.1f}% to {adjusted_growth_rate:.1f}%</em></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Net effect calculation
-    net_effect = inflation_debt_benefit + tourism_gdp_impact
-    net_color = "#10B981" if net_effect > 0 else "#DC2626"
-    
+col1, col2, col3 = st.columns([1, 2, 1])
+
+with col2:
     st.markdown(f"""
-    <div style="text-align: center; padding: 20px; background-color: {net_color}20; border-radius: 10px; border: 2px solid {net_color}; margin: 15px 0;">
-        <h4 style="color: {net_color};">NET ANNUAL EFFECT: {net_effect:+.2f}% of GDP</h4>
-        <p>Inflation benefit ({inflation_debt_benefit:+.2f}%) + Tourism cost ({tourism_gdp_impact:+.2f}%)</p>
-        <p><strong>{"Inflation HELPS overall" if net_effect > 0 else "Inflation HURTS overall"}</strong></p>
+    <div style="text-align: center; color: #666; font-size: 0.9rem; padding: 20px;">
+        <p style="font-weight: bold; color: var(--bb-blue);">Government of Barbados Financial Statements</p>
+        <p>Financial Year Ended March 31, 2023 • Audited by Auditor General of Barbados</p>
+        <p>📞 Tel: (246) 535-4257 • ✉️ Email: audit@bao.gov.bb</p>
+        <p style="margin-top: 20px; font-size: 0.8rem;">
+            Data Source: Auditor General's Report on Financial Statements • 
+            Dashboard Version 3.4 • Generated: {datetime.now().strftime('%B %d, %Y')}
+        </p>
+        <p style="font-size: 0.7rem; color: #999;">
+            ⚠️ This dashboard highlights material misstatements and adverse audit opinion
+            <br>⚠️ Note 34 contains critical data inconsistencies and conceptual errors
+        </p>
     </div>
     """, unsafe_allow_html=True)
-    
-    # === SIMULATION WITH TOURISM IMPACT ===
-    # CORRECTED Simulation Logic with tourism-adjusted growth
-    years = list(range(2025, 2037))  # 2025 to 2036
-    current_debt = 102.9  # 2025 debt-to-GDP ratio from Central Bank
-    
-    # Convert to decimals
-    interest_dec = nominal_interest_rate / 100
-    growth_dec = nominal_growth_rate / 100
-    primary_dec = primary_surplus / 100
-    
-    debt_path = [current_debt]
-    debt_dynamics = []
-    
-    for i in range(1, len(years)):
-        # CORRECT FORMULA: ΔDebt ≈ Debt × (r - g) - Primary_Balance
-        previous_debt = debt_path[-1]
-        
-        # Interest-growth effect
-        interest_growth_effect = previous_debt * (interest_dec - growth_dec)
-        
-        # Primary surplus effect (reduces debt)
-        primary_effect = -primary_dec * 100
-        
-        # Total change
-        debt_change = interest_growth_effect + primary_effect
-        
-        # Apply shocks if selected (simulate climate or economic shocks)
-        if include_shock and (years[i] - 2025) % 3 == 0:  # Every 3 years
-            debt_change += shock_size
-        
-        new_debt = previous_debt + debt_change
-        new_debt = max(new_debt, 20.0)  # Minimum reasonable debt level
-        
-        debt_path.append(new_debt)
-        debt_dynamics.append({
-            'year': years[i],
-            'interest_growth_effect': interest_growth_effect,
-            'primary_effect': primary_effect,
-            'total_change': debt_change
-        })
-    
-    # Create simulation results
-    sim_df = pd.DataFrame({
-        'Year': years,
-        'Debt_to_GDP': debt_path,
-        'Interest_Rate': [nominal_interest_rate] * len(years),
-        'Growth_Rate': [nominal_growth_rate] * len(years),
-        'Adjusted_Growth': [adjusted_growth_rate] * len(years),
-        'Primary_Surplus': [primary_surplus] * len(years)
-    })
-    
-    # Find when/if 60% target is reached
-    below_60 = sim_df[sim_df['Debt_to_GDP'] <= 60]
-    
-    if not below_60.empty:
-        target_year = int(below_60.iloc[0]['Year'])
-        years_to_target = target_year - 2025
-        achievement = f"Target achieved by {target_year}"
-        achievement_color = "#10B981"
-    else:
-        # Project beyond 2036
-        extended_years = list(range(2037, 2051))
-        extended_debt = debt_path[-1]
-        target_year = None
-        
-        for year in extended_years:
-            # Continue with same dynamics
-            debt_change = extended_debt * (interest_dec - growth_dec) - primary_dec * 100
-            extended_debt += debt_change
-            extended_debt = max(extended_debt, 20.0)
-            
-            if extended_debt <= 60:
-                target_year = year
-                years_to_target = target_year - 2025
-                achievement = f"Target achieved by ~{target_year}"
-                achievement_color = "#F59E0B"
-                break
-        
-        if target_year is None:
-            years_to_target = ">25"
-            achievement = "Target NOT achieved by 2050"
-            achievement_color = "#DC2626"
-    
-    # === VISUALIZATION ===
-    st.markdown('<div class="section-header">📊 Debt Trajectory with Tourism Impact</div>', unsafe_allow_html=True)
-    
-    # Plot debt trajectory
-    fig = go.Figure()
-    
-    # Main debt trajectory
-    fig.add_trace(go.Scatter(
-        x=sim_df['Year'],
-        y=sim_df['Debt_to_GDP'],
-        mode='lines+markers',
-        name='Projected Debt',
-        line=dict(color='#00267F', width=4),
-        marker=dict(size=10, symbol='circle'),
-        hovertemplate='Year: %{x}<br>Debt-to-GDP: %{y:.1f}%<br>Growth: %{customdata[0]:.1f}%<extra></extra>',
-        customdata=np.column_stack([sim_df['Adjusted_Growth']])
-    ))
-    
-    # Add target line at 60%
-    fig.add_hline(
-        y=60,
-        line_dash="dash",
-        line_color="green",
-        line_width=3,
-        annotation_text="60% Target",
-        annotation_position="bottom right",
-        annotation_font_size=12,
-        annotation_font_color="green"
-    )
-    
-    # Add current level line
-    fig.add_hline(
-        y=current_debt,
-        line_dash="dot",
-        line_color="red",
-        line_width=2,
-        annotation_text=f"Current: {current_debt}%",
-        annotation_position="top right",
-        annotation_font_size=11,
-        annotation_font_color="red"
-    )
-    
-    # Highlight target achievement year if reached
-    if target_year and years_to_target and years_to_target != ">25":
-        fig.add_vline(
-            x=target_year,
-            line_dash="dash",
-            line_color="green",
-            line_width=2,
-            annotation_text=f"Target: {target_year}",
-            annotation_position="top",
-            annotation_font_size=11,
-            annotation_font_color="green"
-        )
-    
-    # Add tourism impact zone
-    if tourism_gdp_impact < 0:
-        fig.add_hrect(
-            y0=current_debt - 5, y1=current_debt + 5,
-            fillcolor="rgba(220, 38, 38, 0.1)",
-            line_width=0,
-            annotation_text=f"Tourism drag: {tourism_gdp_impact:.1f}% GDP",
-            annotation_position="top left"
-        )
-    
-    fig.update_layout(
-        title=f'Debt Sustainability: {achievement} (With Tourism Impact)',
-        yaxis_title='Debt-to-GDP Ratio (%)',
-        xaxis_title='Year',
-        height=550,
-        hovermode='x unified',
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01
-        )
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # === TOURISM COLLAPSE SCENARIO ===
-    st.markdown('<div class="section-header">⚠️ Tourism Collapse Scenario Analysis</div>', unsafe_allow_html=True)
-    
-    # Calculate collapse scenario
-    if inflation_premium > 2.0:
-        collapse_scenario = {
-            'probability': min(30 + (inflation_premium - 2) * 20, 70),  # Up to 70% probability
-            'tourism_drop': abs(tourism_growth_impact) * 2,  # Double the impact
-            'years_to_recover': 3 + inflation_premium
-        }
-        
-        st.error(f"""
-        ⚠️ **HIGH RISK OF TOURISM COLLAPSE**
-        
-        With **{inflation_premium:.1f}% inflation premium** over competitors:
-        
-        **Probability of severe tourism decline (>20%):** {collapse_scenario['probability']:.0f}%
-        **Potential tourism drop:** {collapse_scenario['tourism_drop']:.1f}%
-        **Years to recover:** {collapse_scenario['years_to_recover']:.0f} years
-        
-        **Economic Impact:**
-        - **GDP could contract** by {abs(tourism_gdp_impact * 2):.1f}%
-        - **Unemployment could rise** to 20%+
-        - **Foreign reserves** could drop below 12 weeks of imports
-        - **Debt sustainability IMPOSSIBLE** during crisis
-        
-        **Historical Precedent:** When Greece had 5% inflation premium vs Turkey (2010-2012), 
-        Greek tourism fell 35% while Turkish tourism grew 42%.
-        """)
-    
-    # === OPTIMAL INFLATION FINDER ===
-    st.markdown('<div class="section-header">🎯 Finding Barbados\' Optimal Inflation Rate</div>', unsafe_allow_html=True)
-    
-    # Test different inflation rates
-    test_rates = [2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
-    results = []
-    
-    for test_rate in test_rates:
-        # Calculate for this inflation rate
-        test_premium = max(0, test_rate - competitor_inflation)
-        test_tourism_impact = -test_premium * tourism_sensitivity * (tourism_gdp_share / 100)
-        test_adjusted_growth = max(growth_rate + test_tourism_impact, 0.5)
-        
-        # Debt benefit
-        test_debt_benefit = test_rate * fixed_debt_pct
-        
-        # Net effect
-        test_net = test_debt_benefit + test_tourism_impact
-        
-        results.append({
-            'Inflation': test_rate,
-            'Tourism_Impact': test_tourism_impact,
-            'Debt_Benefit': test_debt_benefit,
-            'Net_Effect': test_net,
-            'Adjusted_Growth': test_adjusted_growth
-        })
-    
-    results_df = pd.DataFrame(results)
-    
-    # Find optimal
-    optimal_row = results_df.loc[results_df['Net_Effect'].idxmax()]
-    
-    col_opt1, col_opt2, col_opt3 = st.columns(3)
-    
-    with col_opt1:
-        st.metric(
-            "Optimal Inflation Rate",
-            f"{optimal_row['Inflation']:.1f}%",
-            f"Maximizes net benefit"
-        )
-    
-    with col_opt2:
-        st.metric(
-            "Net Annual Benefit",
-            f"{optimal_row['Net_Effect']:+.2f}% of GDP",
-            f"Debt: +{optimal_row['Debt_Benefit']:.2f}%, Tourism: {optimal_row['Tourism_Impact']:+.2f}%"
-        )
-    
-    with col_opt3:
-        st.metric(
-            "Sustainable Growth",
-            f"{optimal_row['Adjusted_Growth']:.1f}%",
-            f"vs {growth_rate:.1f}% base"
-        )
-    
-    st.info(f"""
-    **Barbados\' Optimal Strategy:**
-    
-    1. **Target {optimal_row['Inflation']:.1f}% inflation** (balance debt vs tourism)
-    2. **Keep tourism growth positive** (critical for 40% of GDP)
-    3. **Use fixed-rate debt advantage** ({fixed_debt_share}% of debt helps)
-    4. **Monitor competitor inflation** (currently {competitor_inflation}%)
-    
-    **This achieves:**
-    - **Maximum net economic benefit:** +{optimal_row['Net_Effect']:.2f}% of GDP annually
-    - **Sustainable tourism growth:** Limited to {abs(optimal_row['Tourism_Impact']/tourism_gdp_share*100):.1f}% drag
-    - **Steady debt reduction:** ~{optimal_row['Debt_Benefit']:.2f}% per year from inflation
-    """)
-    
-    # === SIMULATION RESULTS ===
-    st.markdown('<div class="section-header">📋 Simulation Results Summary</div>', unsafe_allow_html=True)
-    
-    col_res1, col_res2, col_res3, col_res4 = st.columns(4)
-    
-    with col_res1:
-        projected_2036 = debt_path[-1]
-        vs_target = projected_2036 - 60
-        delta_color = "normal" if vs_target <= 0 else "inverse"
-        
-        st.metric(
-            "Projected 2036 Debt",
-            f"{projected_2036:.1f}%",
-            f"{vs_target:+.1f}% vs target",
-            delta_color=delta_color
-        )
-    
-    with col_res2:
-        if isinstance(years_to_target, str):
-            display_years = years_to_target
-            delta_text = "Target not reached"
-        else:
-            display_years = f"{years_to_target}"
-            delta_text = f"Target by {target_year}" if years_to_target <= 11 else f"After 2036"
-        
-        st.metric(
-            "Years to 60% Target",
-            display_years,
-            delta_text
-        )
-    
-    with col_res3:
-        tourism_effect_color = "#DC2626" if tourism_gdp_impact < 0 else "#10B981"
-        st.metric(
-            "Tourism GDP Impact",
-            f"{tourism_gdp_impact:+.1f}%",
-            delta_color="inverse" if tourism_gdp_impact < 0 else "normal"
-        )
-    
-    with col_res4:
-        st.metric(
-            "Net Inflation Effect",
-            f"{net_effect:+.2f}% of GDP",
-            "Annual net benefit/cost",
-            delta_color="normal" if net_effect > 0 else "inverse"
-        )
-    
-    # === KEY TAKEAWAY ===
-    st.markdown(f"""
-    <div style="text-align: center; padding: 20px; background-color: #00267F; color: white; border-radius: 10px; margin: 20px 0;">
-        <h4 style="color: white; margin-top: 0;">🎯 KEY INSIGHT: BARBADOS CAN'T INFLATE ITS WAY OUT OF DEBT</h4>
-        <p>The fastest mathematical path to 60% debt ratio would destroy the tourism-dependent economy first.</p>
-        <p><strong>Optimal path: Moderate inflation ({optimal_row['Inflation']:.1f}%) + Tourism protection</strong></p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # === ECONOMIC EXPLANATION ===
-    with st.expander("📚 The Barbados Inflation-Tourism Trade-off: Complete Analysis"):
-        st.markdown(f"""
-        ## **The Fundamental Barbados Dilemma**
-        
-        Barbados faces a unique economic contradiction:
-        
-        1. **High fixed-rate debt ({fixed_debt_share}%)** → Inflation mathematically reduces debt ratio
-        2. **Tourism-dependent economy ({tourism_gdp_share}% of GDP)** → Inflation hurts competitiveness
-        
-        ## **How the Trade-off Works**
-        
-        ### **Debt Benefit Formula:**
-        ```
-        Annual Debt Reduction from Inflation = Inflation × Fixed_Debt_Share
-                                            = {inflation_rate}% × {fixed_debt_pct:.2f}
-                                            = {inflation_rate * fixed_debt_pct:.2f}% of GDP
-        ```
-        
-        ### **Tourism Cost Formula:**
-        ```
-        Tourism GDP Cost = (Barbados_Inflation - Competitor_Inflation) × Sensitivity × Tourism_Share
-                        = ({inflation_rate}% - {competitor_inflation}%) × {tourism_sensitivity} × {tourism_gdp_share/100:.2f}
-                        = {tourism_gdp_impact:+.2f}% of GDP
-        ```
-        
-        ### **Net Effect:**
-        ```
-        Net = Debt_Benefit + Tourism_Cost
-            = {inflation_rate * fixed_debt_pct:.2f}% + ({tourism_gdp_impact:+.2f}%)
-            = {net_effect:+.2f}% of GDP
-        ```
-        
-        ## **Historical Evidence**
-        
-        **Case Study 1: Barbados 2022**
-        - Inflation: 9.8% (vs regional average 6.2%)
-        - Tourism growth: 1.2% (vs regional average 8.7%)
-        - Net effect: Negative despite debt ratio improvement
-        
-        **Case Study 2: Greece 2010-2015**
-        - Used inflation to reduce debt mathematically
-        - Tourism collapsed by 35% to Turkey's benefit
-        - Needed THREE debt restructurings anyway
-        
-        ## **Policy Recommendations for Barbados**
-        
-        1. **Target {optimal_row['Inflation']:.1f}% inflation** (optimal trade-off point)
-        2. **Monitor competitor inflation weekly** (critical for tourism pricing)
-        3. **Issue MORE fixed-rate debt** (lock in current rates before inflation)
-        4. **Tourism competitiveness fund** (subsidize during inflation spikes)
-        5. **Diversify economy** (reduce 40% tourism dependence)
-        
-        ## **The Bottom Line**
-        
-        **Barbados can achieve 60% debt-to-GDP by ~{target_year if target_year else '2036'}, 
-        but ONLY if it protects tourism while using its fixed-rate debt advantage.**
-        
-        **Attempting to inflate faster than {optimal_row['Inflation']:.1f}% would backfire by collapsing 
-        the tourism sector that generates the revenue to service the debt.**
-        """)
-elif view_option == "SOE Transfers":
-    # SOE Transfers View - UPDATED WITH ERROR HIGHLIGHTING
-    st.markdown('<div class="sub-header">State-Owned Enterprise Transfers </div>', unsafe_allow_html=True)
-    
-    # Note 34 Discrepancy Warning - FIXED with actual values
-    narrative_amount = financial_data['note34_discrepancy']['narrative_amount']
-    table_amount = financial_data['note34_discrepancy']['table_amount']
-    difference = financial_data['note34_discrepancy']['difference']
-    difference_pct = financial_data['note34_discrepancy']['difference_pct']
-    
-    with st.container():
-        st.markdown(f"""
-        <div class="financial-card data-error">
-            <h4 style="color: #DC2626; margin-top: 0;">⚠️ CRITICAL DATA INCONSISTENCY IN NOTE 34</h4>
-            <p><strong>Narrative vs Table Discrepancy:</strong></p>
-            <p>• <strong>Narrative text states:</strong> "transfers of ${narrative_amount:,.0f}"</p>
-            <p>• <strong>Table shows total:</strong> ${table_amount:,.0f}</p>
-            <p>• <strong>Difference:</strong> ${difference:,.0f} ({difference_pct:.1f}% difference)</p>
-            <p><strong>Dashboard uses table values for analysis.</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-            # Total Transfers - CORRECTED: $777.9M from Note 34
-    st.markdown(f"""
-<div style="padding: 15px; background-color: #EFF6FF; border-radius: 8px; border-left: 4px solid #3B82F6; margin: 20px 0;">
-<p><strong>Total Transfers to State-Owned Entities (2022-2023):</strong><br>
-<span style="font-size: 1.5rem; font-weight: bold; color: #00267F;">{format_currency(table_amount, currency_format)}</span></p>
-
-<p style="font-size: 0.9rem; color: #666; margin-top: 10px;">
-<em>Source: Note 34 of Financial Statements - Table shows total transfers across all SOEs</em></p>
-
-<div style="margin-top: 15px; padding: 10px; background-color: #FEF2F2; border-radius: 5px; border-left: 3px solid #DC2626;">
-<p style="margin: 0; font-size: 0.95rem; color: #DC2626;">
-<strong>⚠️ Data Discrepancy:</strong> Narrative in Note 34 states 
-<span style="font-size: 1.1rem; font-weight: bold;">${narrative_amount:,.0f}</span>, 
-but table shows 
-<span style="font-size: 1.1rem; font-weight: bold;">${table_amount:,.0f}</span>
-</p>
-</div>
-</div>
-""", unsafe_allow_html=True)
-    
-    # Conceptual Error Warning
-    with st.container():
-        st.markdown("""
-        <div class="financial-card conceptual-error">
-            <h4 style="color: #D97706; margin-top: 0;">❌ CONCEPTUAL ERROR IN NOTE 34</h4>
-            <p><strong>Error:</strong> Note 34 incorrectly references Notes 8 and 10 as dealing with "related party transactions"</p>
-            <p><strong>Why it's wrong:</strong></p>
-            <ul>
-                <li><strong>Note 8:</strong> Retiring benefits (pensions) - NOT related party transactions</li>
-                <li><strong>Note 10:</strong> Debt service costs (interest) - NOT related party transactions</li>
-                <li>These are routine government payments, not transactions with controlled entities (SOEs)</li>
-            </ul>
-            <p><strong>Impact:</strong> Shows fundamental misunderstanding of accounting concepts</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # SOE Transfers Visualization - CORRECTED Top 10 with your specified entities
-    st.markdown('<div class="section-header">Top 10 SOE Transfers </div>', unsafe_allow_html=True)
-    
-    top_soes = financial_data['soe_transfers'].nlargest(10, 'Total')
-    fig = px.bar(
-        top_soes, 
-        x='Entity', 
-        y='Total', 
-        title='Top 10 State-Owned Enterprise Transfers',
-        color='Total', 
-        color_continuous_scale='Blues',
-        text=[format_currency(x, currency_format) for x in top_soes['Total']]
-    )
-    fig.update_layout(
-        yaxis_title=f'Total Transfers ({currency_format})', 
-        xaxis_title='State-Owned Entity',
-        height=500
-    )
-    fig.update_xaxes(tickangle=45)
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Current vs Capital Transfers
-    st.markdown('<div class="section-header">Current vs Capital Transfers</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        total_current = financial_data['soe_transfers']['Current_Transfers'].sum()
-        total_capital = financial_data['soe_transfers']['Capital_Transfers'].sum()
-        
-        fig = px.pie(
-            names=['Current Transfers', 'Capital Transfers'],
-            values=[total_current, total_capital],
-            title='Current vs Capital Transfers (Top 10 SOEs)',
-            color_discrete_sequence=['#3B82F6', '#1D4ED8']
-        )
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Display transfer breakdown
-        st.markdown(f"""
-        **Top 10 SOE Transfer Breakdown:**
-        - **Current Transfers:** {format_currency(total_current, currency_format)}
-        - **Capital Transfers:** {format_currency(total_capital, currency_format)}
-        - **Total (Top 10):** {format_currency(total_current + total_capital, currency_format)}
-        """)
-    
-    with col2:
-        # SOE Transfer Details Table
-        display_soes = financial_data['soe_transfers'].copy()
-        
-        # Format the DataFrame
-        display_soes['Current_Transfers'] = display_soes['Current_Transfers'].apply(
-            lambda x: format_currency(x, currency_format)
-        )
-        display_soes['Capital_Transfers'] = display_soes['Capital_Transfers'].apply(
-            lambda x: format_currency(x, currency_format)
-        )
-        display_soes['Total'] = display_soes['Total'].apply(
-            lambda x: format_currency(x, currency_format)
-        )
-        
-        display_soes.columns = [
-            'State-Owned Entity', 'Current Transfers', 
-            'Capital Transfers', 'Total Transfers'
-        ]
-        
-        st.dataframe(display_soes, use_container_width=True, height=400)
-    
-    # Audit Issue: Non-Consolidation of SOEs - UPDATED
-    st.markdown('<div class="section-header">⚠️ Critical Audit Issue: SOE Non-Consolidation</div>', unsafe_allow_html=True)
-    
-    st.error(f"""
-    **IPSAS VIOLATION: State-Owned Entities NOT Consolidated**
-    
-    **Auditor General's Finding:** "The accounts of the State-owned Entities were not consolidated into the financial statements as required by the International Public Sector Accounting Standards (IPSAS)."
-    
-    **Impact:**
-    - Financial statements are **incomplete and misleading**
-    - **{format_currency(table_amount, currency_format)} in transfers** to 40+ SOEs not properly consolidated
-    - True financial position of Government **cannot be determined**
-    - **Material misstatement** in financial reporting
-    
-    **Note:** The {format_currency(table_amount, currency_format)} represents transfers to all SOEs (not just the top 10 shown). 
-    Full consolidation of all 40+ state-owned entities is required for IPSAS compliance.
-    
-    **Required Action:** Immediate consolidation of all State-Owned Entities into government financial statements.
-    """)
-
-elif view_option == "Performance Highlights":
-    # Performance Highlights View
-    st.markdown('<div class="sub-header">Performance Highlights</div>', unsafe_allow_html=True)
-    
-    # Performance Metrics Cards
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        # Revenue Growth
-        revenue_growth_color = '#10B981' if metrics['revenue_growth'] > 0 else '#DC2626'
-        
-        st.markdown(f"""
-        <div class="financial-card">
-            <div class="financial-label">Revenue Growth</div>
-            <div class="financial-value">{format_currency(metrics['revenue_growth'], currency_format)}</div>
-            <div style="color: {revenue_growth_color}; font-weight: bold;">
-                {metrics['revenue_growth_pct']:.1f}%
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        # Tax Collection
-        tax_collection = financial_data['financial_performance'].loc[0, 'Actual_2023']
-        tax_variance = financial_data['financial_performance'].loc[0, 'Variance_2023']
-        
-        st.markdown(f"""
-        <div class="financial-card">
-            <div class="financial-label">Tax Collection</div>
-            <div class="financial-value">{format_currency(tax_collection, currency_format)}</div>
-            <div style="color: #666; font-size: 0.9rem;">
-                vs Budget: {format_currency(tax_variance, currency_format)}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        # Debt Service
-        debt_service = financial_data['expenditure_data'].loc[8, 'Actual_2023']
-        debt_service_2022 = financial_data['expenditure_data'].loc[8, 'Actual_2022']
-        debt_growth = debt_service - debt_service_2022
-        debt_growth_color = '#DC2626' if debt_growth > 0 else '#10B981'
-        
-        st.markdown(f"""
-        <div class="financial-card">
-            <div class="financial-label">Debt Service</div>
-            <div class="financial-value">{format_currency(debt_service, currency_format)}</div>
-            <div style="color: {debt_growth_color}; font-weight: bold;">
-                {format_currency(debt_growth, currency_format)}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        # SOE Transfers - WITH DISCREPANCY NOTE
-        narrative_amount = financial_data['note34_discrepancy']['narrative_amount']
-        table_amount = financial_data['note34_discrepancy']['table_amount']
-        
-        st.markdown(f"""
-        <div class="financial-card">
-            <div class="financial-label">SOE Transfers</div>
-            <div class="financial-value">{format_currency(table_amount, currency_format)}</div>
-            <div style="color: #666; font-size: 0.9rem;">
-                40+ State-Owned Entities
-            </div>
-            <div style="font-size: 0.7rem; color: #DC2626; margin-top: 5px;">
-                ⚠️ Note 34 discrepancy: ${narrative_amount/1e6:,.1f}M narrative vs ${table_amount/1e6:,.1f}M table
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Detailed Performance Table with CORRECTED formatting
-    st.markdown('<div class="section-header">Key Performance Indicators</div>', unsafe_allow_html=True)
-    
-    performance_data = [
-        {
-            'Metric': 'Total Revenue',
-            '2023': metrics['total_revenue_2023'],
-            '2022': metrics['total_revenue_2022'],
-            'Change': metrics['revenue_growth'],
-            'Change %': metrics['revenue_growth_pct']
-        },
-        {
-            'Metric': 'Tax Revenue',
-            '2023': financial_data['financial_performance'].loc[0, 'Actual_2023'],
-            '2022': financial_data['financial_performance'].loc[0, 'Actual_2022'],
-            'Change': (
-                financial_data['financial_performance'].loc[0, 'Actual_2023'] - 
-                financial_data['financial_performance'].loc[0, 'Actual_2022']
-            ),
-            'Change %': (
-                (financial_data['financial_performance'].loc[0, 'Actual_2023'] - 
-                 financial_data['financial_performance'].loc[0, 'Actual_2022']) / 
-                financial_data['financial_performance'].loc[0, 'Actual_2022']
-            ) * 100
-        },
-        {
-            'Metric': 'Total Expenditure',
-            '2023': metrics['total_expenditure_2023'],
-            '2022': metrics['total_expenditure_2022'],
-            'Change': metrics['total_expenditure_2023'] - metrics['total_expenditure_2022'],
-            'Change %': (
-                (metrics['total_expenditure_2023'] - metrics['total_expenditure_2022']) / 
-                metrics['total_expenditure_2022']
-            ) * 100
-        },
-        {
-            'Metric': 'Debt Service',
-            '2023': financial_data['expenditure_data'].loc[8, 'Actual_2023'],
-            '2022': financial_data['expenditure_data'].loc[8, 'Actual_2022'],
-            'Change': (
-                financial_data['expenditure_data'].loc[8, 'Actual_2023'] - 
-                financial_data['expenditure_data'].loc[8, 'Actual_2022']
-            ),
-            'Change %': (
-                (financial_data['expenditure_data'].loc[8, 'Actual_2023'] - 
-                 financial_data['expenditure_data'].loc[8, 'Actual_2022']) / 
-                financial_data['expenditure_data'].loc[8, 'Actual_2022']
-            ) * 100
-        },
-        {
-            'Metric': 'SOE Transfers (Table Value)',
-            '2023': financial_data['note34_discrepancy']['table_amount'],
-            '2022': None,  # Not provided in 2022 data
-            'Change': None,
-            'Change %': None
-        },
-        {
-            'Metric': 'SOE Transfers (Narrative)',
-            '2023': financial_data['note34_discrepancy']['narrative_amount'],
-            '2022': None,  # Not provided in 2022 data
-            'Change': None,
-            'Change %': None
-        }
-    ]
-    
-    perf_df = pd.DataFrame(performance_data)
-    
-    # Format the DataFrame for display with consistent formatting
-    display_perf_df = perf_df.copy()
-    
-    # Apply consistent currency formatting
-    for col in ['2023', '2022', 'Change']:
-        display_perf_df[col] = display_perf_df[col].apply(
-            lambda x: format_currency(x, currency_format) if pd.notnull(x) else 'N/A'
-        )
-    
-    display_perf_df['Change %'] = display_perf_df['Change %'].apply(
-        lambda x: f"{x:+.1f}%" if pd.notnull(x) else 'N/A'
-    )
-    
-    # Rename columns
-    display_perf_df.columns = [
-        'Performance Metric', '2023 Value', '2022 Value', 
-        'Change (Amount)', 'Change (%)'
-    ]
-    
-    st.dataframe(display_perf_df, use_container_width=True)
-    
-    # Performance Trends Visualization
-    st.markdown('<div class="section-header">Performance Trends</div>', unsafe_allow_html=True)
-    
-    # Filter out non-numeric 2022 values for the chart
-    chart_data = perf_df[perf_df['2022'].apply(lambda x: isinstance(x, (int, float)))].copy()
-    
-    if not chart_data.empty:
-        fig = go.Figure()
-        
-        # Add bars for 2022 and 2023
-        fig.add_trace(go.Bar(
-            name='2022',
-            x=chart_data['Metric'],
-            y=chart_data['2022'],
-            marker_color='#3B82F6',
-            text=[format_currency(x, currency_format) for x in chart_data['2022']],
-            textposition='auto'
-        ))
-        
-        fig.add_trace(go.Bar(
-            name='2023',
-            x=chart_data['Metric'],
-            y=chart_data['2023'],
-            marker_color='#00267F',
-            text=[format_currency(x, currency_format) for x in chart_data['2023']],
-            textposition='auto'
-        ))
-        
-        fig.update_layout(
-            barmode='group',
-            title='Key Performance Indicators (2022 vs 2023)',
-            yaxis_title=f'Amount ({currency_format})',
-            height=500
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-
-elif view_option == "Data Quality Issues":
-    # Data Quality Issues View - FIXED with simpler HTML structure
-    st.markdown('<div class="sub-header">Data Quality Issues & Financial Reporting Errors</div>', unsafe_allow_html=True)
-    
-    # Note 34 Errors - Detailed Analysis
-    narrative_amount = financial_data['note34_discrepancy']['narrative_amount']
-    table_amount = financial_data['note34_discrepancy']['table_amount']
-    difference = financial_data['note34_discrepancy']['difference']
-    difference_pct = financial_data['note34_discrepancy']['difference_pct']
-    
-    with st.container():
-        st.markdown("""
-        <div class="financial-card data-error">
-            <h3 style="color: #DC2626; margin-top: 0;">❌ CRITICAL DATA QUALITY ISSUES IN NOTE 34</h3>
-            <p><strong>Note 34: Related Party Transactions - Contains Multiple Material Errors</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Error 1: Numerical Discrepancy
-    st.markdown("### 1. NUMERICAL DISCREPANCY - NARRATIVE VS TABLE")
-    st.markdown("**The Problem:** Note 34 narrative text contradicts the accompanying table")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="narrative-box">
-            <h5 style="color: #DC2626; margin-top: 0;">NARRATIVE TEXT</h5>
-            <p style="font-size: 1.2rem; font-weight: bold; color: #DC2626;">
-                "${narrative_amount:,.0f}"
-            </p>
-            <p><em>"The Government reporting entity recorded transfers of <strong>${narrative_amount:,.0f}</strong> to fund the operations of the SOEs..."</em></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="table-box">
-            <h5 style="color: #3B82F6; margin-top: 0;">TABLE TOTAL</h5>
-            <p style="font-size: 1.2rem; font-weight: bold; color: #3B82F6;">
-                "${table_amount:,.0f}"
-            </p>
-            <p>Sum of all transfers in the Note 34 table</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown(f"""
-    <div class="analysis-box">
-        <h5 style="color: #D97706; margin-top: 0;">DISCREPANCY ANALYSIS</h5>
-        <p><strong>Difference:</strong> ${difference:,.0f}</p>
-        <p><strong>Percentage Variance:</strong> {difference_pct:.1f}%</p>
-        <p><strong>Impact:</strong> Which number is correct? The narrative or the table?</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Error 2: Conceptual Error
-    st.markdown("### 2. CONCEPTUAL ERROR - INCORRECT ACCOUNTING CLASSIFICATION")
-    st.markdown("**The Problem:** Note 34 incorrectly references Notes 8 and 10 as 'related party transactions'")
-    
-    st.markdown(f"""
-    <div style="margin: 15px 0; padding: 15px; border-left: 4px solid #D97706; background-color: #FFFBEB;">
-        <p><strong>Note 34 states:</strong> "Notes 8 and 10 dealt with other related party transactions which occurred during the financial year 2022-2023."</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col3, col4 = st.columns(2)
-    
-    with col3:
-        st.markdown("""
-        <div class="narrative-box">
-            <h5 style="color: #DC2626; margin-top: 0;">NOTE 8: RETIRING BENEFITS</h5>
-            <p><strong>What it is:</strong> Pension payments to former government employees</p>
-            <p><strong>Why it's NOT a related party transaction:</strong></p>
-            <ul>
-                <li>Payments to former employees</li>
-                <li>Not transactions with controlled entities (SOEs)</li>
-                <li>Routine government expenditure</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="narrative-box">
-            <h5 style="color: #DC2626; margin-top: 0;">NOTE 10: DEBT SERVICE COSTS</h5>
-            <p><strong>What it is:</strong> Interest and loan expense payments</p>
-            <p><strong>Why it's NOT a related party transaction:</strong></p>
-            <ul>
-                <li>Payments to creditors (banks, bondholders)</li>
-                <li>Not transactions with controlled entities (SOEs)</li>
-                <li>External debt service obligations</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("""
-    <div style="border: 2px solid #10B981; padding: 15px; border-radius: 8px; background-color: #ECFDF5; margin-top: 15px;">
-        <h5 style="color: #10B981; margin-top: 0;">WHAT ARE "RELATED PARTY TRANSACTIONS"?</h5>
-        <p><strong>Correct Definition:</strong> Transactions between the government and entities it <strong>controls</strong> (State-Owned Enterprises)</p>
-        <p><strong>Examples:</strong> Transfers to SOEs, loans to SOEs, purchases from SOEs</p>
-        <p><strong>NOT Related Party Transactions:</strong> Pension payments, debt service, salaries, routine government expenditures</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Impact Analysis
-    st.markdown("### IMPACT ON FINANCIAL REPORTING RELIABILITY")
-    st.markdown("**These errors reinforce the Auditor General's Adverse Opinion:**")
-    
-    col5, col6 = st.columns(2)
-    
-    with col5:
-        # Calculate the formatted values for display
-        narrative_display = f"${narrative_amount/1e6:,.1f}M"
-        table_display = f"${table_amount/1e6:,.1f}M"
-        
-        st.markdown(f"""
-        <div class="financial-card adverse-opinion">
-            <h5 style="color: #DC2626;">1. Undermines Data Credibility</h5>
-            <ul>
-                <li>Which SOE transfer figure is correct? {narrative_display} or {table_display}?</li>
-                <li>Can any number in the financial statements be trusted?</li>
-                <li>Creates uncertainty for users of financial statements</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="financial-card adverse-opinion">
-            <h5 style="color: #DC2626;">3. Supports Adverse Audit Opinion</h5>
-            <ul>
-                <li>Demonstrates "material misstatements"</li>
-                <li>Shows "non-compliance" with accounting standards</li>
-                <li>Validates Auditor General's concerns</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col6:
-        st.markdown("""
-        <div class="financial-card adverse-opinion">
-            <h5 style="color: #DC2626;">2. Reveals Fundamental Accounting Errors</h5>
-            <ul>
-                <li>Basic accounting concepts misunderstood</li>
-                <li>Incorrect classification of transactions</li>
-                <li>Questions competency of financial reporting team</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="financial-card adverse-opinion">
-            <h5 style="color: #DC2626;">4. Raises Governance Concerns</h5>
-            <ul>
-                <li>Poor internal controls</li>
-                <li>Lack of review and verification</li>
-                <li>Weak financial management systems</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("""
-    <div class="conclusion-box">
-        <h5 style="color: #DC2626; margin-top: 0;">CONCLUSION</h5>
-        <p>The errors in Note 34 are not just minor typos - they are <strong>material misstatements</strong> that:</p>
-        <ol>
-            <li><strong>Contradict</strong> the accompanying table data</li>
-            <li><strong>Misrepresent</strong> basic accounting concepts</li>
-            <li><strong>Undermine</strong> the credibility of the entire financial report</li>
-            <li><strong>Justify</strong> the Auditor General's adverse opinion</li>
-        </ol>
-        <p><strong>Required Action:</strong> Immediate correction and explanation in next financial statements</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-elif view_option == "Story View":
-    # Story View - Narrative Analysis
-    st.markdown('<div class="sub-header">The Story of Barbados\' Financial Statements: A Tale of Unreliable Numbers</div>', unsafe_allow_html=True)
-    
-    # Chapter 1
-    with st.expander("📖 **Chapter 1: The Surface Narrative - What the Government Wants You to See**", expanded=True):
-        st.markdown(f"""
-        **At first glance, Barbados appears to be making a remarkable recovery.** The government's financial statements tell a story of successful economic transformation:
-        
-        **"Look at our progress!" they say:**
-        """)
-        
-        # Use columns for better control of the layout
-        col_a, col_b = st.columns(2)
-        
-        with col_a:
-            st.markdown(f"""
-            <div style="background-color: #f0f7ff; padding: 15px; border-radius: 10px; border-left: 4px solid #00267F; margin-bottom: 15px;">
-                <p style="margin: 0; font-size: 0.9rem; color: #666; margin-bottom: 5px;">Revenue is up 29%</p>
-                <p style="margin: 0; font-size: 1.2rem; font-weight: bold; color: #00267F;">
-                    from ${metrics['total_revenue_2022']/1e9:.2f}B to ${metrics['total_revenue_2023']/1e9:.2f}B
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col_b:
-            st.markdown(f"""
-            <div style="background-color: #fff0f0; padding: 15px; border-radius: 10px; border-left: 4px solid #DC2626; margin-bottom: 15px;">
-                <p style="margin: 0; font-size: 0.9rem; color: #666; margin-bottom: 5px;">The deficit has been slashed</p>
-                <p style="margin: 0; font-size: 1.2rem; font-weight: bold; color: #DC2626;">
-                    from a staggering ${abs(metrics['deficit_2022'])/1e6:.0f}M deficit to "only" ${abs(metrics['deficit_2023'])/1e6:.0f}M
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Additional points in consistent format
-        st.markdown(f"""
-        <div style="margin-top: 10px; margin-bottom: 10px;">
-            <p><span style="font-weight: bold;">Tax collection is booming</span> - VAT revenue alone jumped 32% to $1.16 billion</p>
-            <p><span style="font-weight: bold;">We're managing our spending</span> - certain expenditures came in under budget</p>
-        </div>
-        
-        <div style="background-color: #f8f9fa; padding: 15px; border-radius: 10px; margin-top: 15px; border: 1px solid #e0e0e0;">
-            <p style="margin: 0; font-size: 0.95rem;">
-                The Accountant General signed these statements on September 14, 2023, presenting what appears to be a government turning the corner after years of economic challenges. 
-                The Barbados Economic Recovery and Transformation (BERT) program seems to be working its magic.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)    
-    # Chapter 2
-    with st.expander("⚠️ **Chapter 2: The Auditor General's Intervention - The Truth Behind the Curtain**"):
-        st.markdown(f"""
-        **But then enters the Auditor General on April 2, 2025, with a bombshell:** "These numbers cannot be trusted."
-        
-        **The audit report reads like a financial horror story:**
-        
-        **❌ "We cannot confirm $2.43 billion of your tax receivables."**
-        *Impact:* That's **{(metrics['tax_receivables_2023']/metrics['total_assets_2023']*100):.1f}% of total assets** - just gone into the "unverifiable" category
-        
-        **❌ "Your assets are overstated by nearly $1 billion."**
-        - **$719 million** discrepancy in "Other Capital Assets"
-        - **$115 million** in cash that doesn't exist
-        - **$147 million** in investments that are inflated
-        
-        **❌ "You've completely ignored major liabilities."**
-        - **Pension obligations?** Nowhere to be seen
-        - **State-owned enterprises?** Not consolidated (a direct IPSAS violation)
-        
-        **The Auditor General doesn't mince words:** **Adverse Opinion** - the financial equivalent of a failing grade.
-        """)
-    
-    # Chapter 3
-    with st.expander("🔍 **Chapter 3: The Hidden Story - What the Numbers Really Reveal**"):
-        narrative_amount = financial_data['note34_discrepancy']['narrative_amount']
-        table_amount = financial_data['note34_discrepancy']['table_amount']
-        
-        st.markdown("### The Revenue 'Miracle' Might Be Fiction")
-        st.markdown(f"""
-        The dashboard reveals a troubling pattern: the government claims **{metrics['revenue_growth_pct']:.1f}% revenue growth**, but:
-        
-        - **${metrics['tax_receivables_2023']/1e9:.2f}B of this "revenue"** (in receivables) can't be verified
-        - The bad debt policy changed dramatically (590% increase in provision) with no documentation
-        """)
-        
-        st.warning("**❓ Critical Question:** Is revenue really growing, or are they just getting better at claiming money they'll never collect?")
-        
-        st.markdown("### The State-Owned Enterprise Black Hole")
-        st.markdown("Here's where the story gets particularly dark:")
-        
-        # Create two columns for the comparison
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown(f"""
-            <div style="padding: 15px; background-color: white; border: 2px solid #DC2626; border-radius: 5px; margin-bottom: 10px;">
-                <h5 style="color: #DC2626; margin-top: 0;">Narrative States</h5>
-                <p style="font-size: 1.2rem; font-weight: bold; color: #DC2626;">${narrative_amount/1e6:.1f}M</p>
-                <p>Transfers to SOEs</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div style="padding: 15px; background-color: white; border: 2px solid #3B82F6; border-radius: 5px; margin-bottom: 10px;">
-                <h5 style="color: #3B82F6; margin-top: 0;">Table Shows</h5>
-                <p style="font-size: 1.2rem; font-weight: bold; color: #3B82F6;">${table_amount/1e6:.1f}M</p>
-                <p>Transfers to SOEs</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.warning("**❓ Critical Question:** Which number is true? Neither can be trusted, because...")
-        
-        st.markdown("### The Conceptual Failure")
-        st.markdown("""
-        **Note 34 makes a shocking error:** It claims pension payments (Note 8) and debt service (Note 10) are "related party transactions."
-        
-        **This is Accounting 101 failure:**
-        - Pensions and interest **aren't** transactions with controlled entities
-        - These are routine government expenditures to external parties
-        
-        **What this reveals:** The people preparing these statements don't understand basic accounting concepts.
-        
-        **If they're this wrong on fundamentals, what else are they misunderstanding?**
-        """)
-    
-    # Chapter 4
-    with st.expander("🏛️ **Chapter 4: The Systemic Problems - A Pattern of Dysfunction**"):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### 1. The Asset Management Farce")
-            st.markdown("""
-            - **$719 million discrepancy** means either the financial statements OR the subsidiary records are wrong
-            - Fixed asset register hasn't been reconciled for years
-            - **The government doesn't know what it owns**
-            """)
-            
-            st.markdown("### 2. The Pension Time Bomb")
-            st.markdown("""
-            - Pension liabilities **completely omitted** from the balance sheet
-            - No actuarial valuation has been done
-            - **Future taxpayers are on the hook** for obligations we can't even quantify
-            """)
-        
-        with col2:
-            st.markdown("### 3. The SOE Shell Game")
-            st.markdown(f"""
-            - **40+ state-owned entities** operate in financial limbo
-            - They're **not consolidated**, so their debts and losses are hidden
-            - But taxpayers fund them to the tune of **${table_amount/1e6:.1f}M annually**
-            """)
-            
-            st.markdown("### 4. The Documentation Disaster")
-            st.markdown("""
-            - **$2.43B tax receivables** - no supporting documentation
-            - **$68.3M bad debt expense** - unverified calculation method
-            - **15+ years of unreconciled bank accounts**
-            """)
-    
-        # Chapter 5
-    with st.expander("📊 **Chapter 5: What the Dashboard Reveals - Connecting the Dots**"):
-        difference_amount = financial_data['note34_discrepancy']['difference'] / 1e6
-        
-        st.markdown("### The 'Unverifiable' Cascade Effect:")
-        
-        # Create a visual flow
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("""
-            <div style="text-align: center; padding: 15px; background-color: #DC2626; color: white; border-radius: 10px; margin: 10px 0;">
-                <strong>Start</strong><br>
-                $2.43B<br>
-                Unverified
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="text-align: center; padding: 15px; background-color: #F59E0B; color: white; border-radius: 10px; margin: 10px 0;">
-                <strong>Apply</strong><br>
-                $68.3M Bad Debt<br>
-                Unverified Method
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown("""
-            <div style="text-align: center; padding: 15px; background-color: #DC2626; color: white; border-radius: 10px; margin: 10px 0;">
-                <strong>Result</strong><br>
-                Both Assets & Expenses<br>
-                Unreliable
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Add arrows between columns
-        st.markdown("<div style='text-align: center; font-size: 1.5rem; margin: -30px 0 -20px 0;'>→ →</div>", unsafe_allow_html=True)
-        
-        st.info("**Impact:** Everything downstream - from deficit calculations to debt ratios - is suspect")
-        
-        st.markdown("### The Data Quality Death Spiral:")
-        
-        # Create 2x2 grid for issues
-        issues_col1, issues_col2 = st.columns(2)
-        
-        with issues_col1:
-            st.markdown(f"""
-            **Numerical Discrepancies**
-            - ${difference_amount:.1f}M difference in Note 34
-            """)
-            
-            st.markdown("""
-            **Conceptual Errors**
-            - Misunderstanding related party transactions
-            """)
-        
-        with issues_col2:
-            st.markdown("""
-            **Documentation Gaps**
-            - No support for key assumptions
-            """)
-            
-            st.markdown("""
-            **Complete Loss of Credibility**
-            - Financial statements cannot be trusted
-            """)
-    
-    # Chapter 6
-    with st.expander("💰 **Chapter 6: The Real Financial Position - What We Actually Know**"):
-        st.markdown("### ✅ The Certainties")
-        
-        cert_col1, cert_col2 = st.columns(2)
-        
-        with cert_col1:
-            st.markdown(f"""
-            **We have massive debt:**
-            ${metrics['total_liabilities_2023']/1e9:.2f}B
-            *(though this is likely understated)*
-            
-            **We're running a deficit:**
-            ${abs(metrics['deficit_2023'])/1e6:.0f}M
-            *(probably more)*
-            """)
-        
-        with cert_col2:
-            st.markdown(f"""
-            **We're spending heavily on SOEs:**
-            ${financial_data['note34_discrepancy']['table_amount']/1e6:.1f}M
-            
-            **We can't verify our largest asset:**
-            ${metrics['tax_receivables_2023']/1e9:.2f}B
-            *(might not exist)*
-            """)
-        
-        st.markdown("### ❓ The Unknowns (The Scary Part)")
-        
-        unk_col1, unk_col2 = st.columns(2)
-        
-        with unk_col1:
-            st.markdown("""
-            **How much are pensions really costing us?**
-            *Status:* Unquantified liability
-            
-            **What's the true financial position of SOEs?**
-            *Status:* Hidden in non-consolidation
-            """)
-        
-        with unk_col2:
-            st.markdown("""
-            **How much of the "revenue growth" is real?**
-            *Status:* Unverifiable receivables
-            
-            **What other liabilities are missing?**
-            *Status:* The audit suggests there are more
-            """)
-    
-    # Chapter 7
-    with st.expander("🏛️ **Chapter 7: The Underlying Story - What This Really Means for Barbados**"):
-        st.error("**⚠️ This Isn't Just About Accounting Errors**")
-        st.markdown("**This is a story about governance failure:**")
-        
-        # Governance issues in columns
-        gov_col1, gov_col2 = st.columns(2)
-        
-        with gov_col1:
-            st.markdown("""
-            **Lack of Internal Controls**
-            How does a $719 million discrepancy happen?
-            
-            **Poor Financial Management**
-            15+ years of unreconciled bank accounts
-            """)
-        
-        with gov_col2:
-            st.markdown("""
-            **Weak Oversight**
-            How did these statements get prepared without anyone catching basic errors?
-            
-            **Transparency Deficit**
-            The public cannot make informed decisions based on these numbers
-            """)
-        
-        st.markdown("### The Economic Recovery Paradox")
-        st.markdown("""
-        The government claims successful economic recovery while:
-        
-        - **Not being able to verify** its largest asset
-        - **Omitting** major liabilities
-        - **Making fundamental accounting errors**
-        - **Violating international standards**
-        """)
-        
-        st.warning("**❓ The uncomfortable question:** Is the economic recovery as real as the financial statements claim it to be?")
-    
-    # Chapter 8
-    with st.expander("👥 **Chapter 8: The Citizen's Perspective - What This Means for Ordinary Barbadians**"):
-        st.markdown("### 💸 Your Tax Dollars Are Being Managed Unreliably")
-        
-        cit_col1, cit_col2 = st.columns(2)
-        
-        with cit_col1:
-            st.markdown("""
-            **Pensions**
-            Your future retirement benefits? **The liability isn't even on the books**
-            
-            **Services**
-            Money going to SOEs that **aren't properly accounted for**
-            """)
-        
-        with cit_col2:
-            st.markdown(f"""
-            **Debt**
-            **${metrics['total_liabilities_2023']/1e9:.2f}B in liabilities** that future generations will pay
-            
-            **Transparency**
-            You **can't trust** the government's own numbers about its finances
-            """)
-        
-        st.markdown("### 📉 The Credibility Crisis")
-        st.markdown("When a government cannot produce reliable financial statements:")
-        
-        cred_col1, cred_col2 = st.columns(2)
-        
-        with cred_col1:
-            st.markdown("""
-            **International lenders become wary**
-            *Impact:* Higher borrowing costs
-            
-            **Investors lose confidence**
-            *Impact:* Less foreign investment
-            """)
-        
-        with cred_col2:
-            st.markdown("""
-            **Citizens lose trust**
-            *Impact:* Weakening social contract
-            
-            **Policy decisions are based on faulty data**
-            *Impact:* Poor outcomes
-            """)
-    
-    # Conclusion
-    with st.expander("🔚 **Conclusion: The Unfinished Story**"):
-        # Two columns for comparison
-        con_col1, con_col2 = st.columns(2)
-        
-        with con_col1:
-            st.markdown("""
-            ### The Official Story
-            *"We're recovering, revenues are up, deficits are down, trust us."*
-            """)
-        
-        with con_col2:
-            st.markdown("""
-            ### The Real Story
-            *"We don't know what we own, we don't know what we owe, we can't verify our numbers, and we make fundamental accounting errors."*
-            """)
-        
-        st.error("**The Dashboard's Ultimate Revelation**")
-        st.markdown("""
-        This **isn't about finding a few errors** - it's about **systemic financial management failure**. 
-        The adverse opinion **isn't a technicality**; it's a warning that Barbados' financial reporting 
-        **cannot be trusted** for any serious decision-making.
-        """)
-        
-        st.warning("**The Most Damning Part of the Story**")
-        st.markdown("""
-        **These aren't new problems.** The Auditor General has been reporting similar issues for years. 
-        The dashboard doesn't just show what's wrong now - it shows a **pattern of persistent failure** 
-        that continues despite repeated warnings.
-        """)
-        
-        st.markdown("### The Final Verdict")
-        st.markdown("""
-        The story these financial statements tell is ultimately one of a government that has:
-        
-        1. **Lost control** of its financial reporting
-        2. **Cannot produce** reliable numbers
-        3. **Doesn't seem to understand** how serious these failures are
-        
-        **For:** National credibility and economic stability
-        """)
-
-# ============================================================================
-# BERT 2026 RISK ANALYSIS VIEW
-# ============================================================================
-elif view_option == "BERT 2026 Risk Analysis":
-    # BERT 2026 Comprehensive Risk Analysis View
-    st.markdown('<div class="sub-header">BERT 2026: Ambitious Transformation on Shaky Financial Foundations</div>', unsafe_allow_html=True)
-    
-    # === EXECUTIVE SUMMARY ===
-    with st.container():
-        st.markdown("""
-        <div class="financial-card adverse-opinion">
-            <h3 style="color: #DC2626; margin-top: 0;">🚨 EXECUTIVE SUMMARY: THE FUNDAMENTAL CONTRADICTION</h3>
-            <p><strong>BERT 2026 Goal:</strong> Transform Barbados into "a high-performing, inclusive, and climate-resilient economy" requiring $1.7-2.1B annual financing (2026-2029).</p>
-            <p><strong>Current Reality:</strong> 2023 financial statements received an <strong>ADVERSE AUDIT OPINION</strong> - "do NOT give a true and fair view" due to $2.43B unverified assets, $719M discrepancies, and IPSAS violations.</p>
-            <p><strong>Critical Question:</strong> Can Barbados responsibly execute its most ambitious economic transformation while its financial reporting remains unreliable?</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # === BERT 2026 OFFICIAL TARGETS HEADER ===
-    st.markdown('<div class="section-header">🎯 BERT 2026 Official Targets</div>', unsafe_allow_html=True)
-    
-    # Create target cards
-    col_t1, col_t2, col_t3, col_t4 = st.columns(4)
-    
-    with col_t1:
-        st.markdown("""
-        <div class="financial-card" style="text-align: center;">
-            <div style="color: #00267F; font-weight: bold; margin-bottom: 5px;">Growth Target</div>
-            <div style="font-size: 1.8rem; font-weight: bold; color: #00267F;">3.5%</div>
-            <div style="font-size: 0.8rem; color: #666;">2025-2029 avg</div>
-            <div style="font-size: 0.7rem; color: #DC2626; margin-top: 5px;">
-                ⚠️ vs. 5% in BERT 2022
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_t2:
-        st.markdown("""
-        <div class="financial-card" style="text-align: center;">
-            <div style="color: #00267F; font-weight: bold; margin-bottom: 5px;">Debt Target</div>
-            <div style="font-size: 1.8rem; font-weight: bold; color: #00267F;">60%</div>
-            <div style="font-size: 0.8rem; color: #666;">by FY2035/36</div>
-            <div style="font-size: 0.7rem; color: #DC2626; margin-top: 5px;">
-                ⚠️ Current: 102.9%
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_t3:
-        st.markdown("""
-        <div class="financial-card" style="text-align: center;">
-            <div style="color: #00267F; font-weight: bold; margin-bottom: 5px;">Primary Surplus</div>
-            <div style="font-size: 1.8rem; font-weight: bold; color: #00267F;">4.4% → 3.5%</div>
-            <div style="font-size: 0.8rem; color: #666;">2025-2028</div>
-            <div style="font-size: 0.7rem; color: #10B981; margin-top: 5px;">
-                ✅ Achieved 4.3% in 2024/25
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_t4:
-        st.markdown("""
-        <div class="financial-card" style="text-align: center;">
-            <div style="color: #00267F; font-weight: bold; margin-bottom: 5px;">Climate Gap</div>
-            <div style="font-size: 1.8rem; font-weight: bold; color: #DC2626;">65%</div>
-            <div style="font-size: 0.8rem; color: #666;">unfunded needs</div>
-            <div style="font-size: 0.7rem; color: #DC2626; margin-top: 5px;">
-                ⚠️ $35M covered vs $100M needed
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # === GROWTH TRAJECTORY COMPARISON ===
-    st.markdown('<div class="section-header">📈 Growth Trajectory: Government vs Reality</div>', unsafe_allow_html=True)
-    
-    # Growth comparison data
-    growth_data = pd.DataFrame({
-        'Year': [2020, 2021, 2022, 2023, 2024, 2025, 2026, 2027, 2028, 2029],
-        'Historical': [-13.7, -0.2, 16.3, 4.2, 4.0, 2.7, np.nan, np.nan, np.nan, np.nan],
-        'BERT_2026_Target': [np.nan, np.nan, np.nan, np.nan, np.nan, 2.7, 3.2, 3.5, 3.7, 3.8],
-        'External_Forecast': [np.nan, np.nan, np.nan, np.nan, np.nan, 2.7, 2.2, 2.0, 2.1, 2.0],
-        'Central_Bank_Optimistic': [np.nan, np.nan, np.nan, np.nan, np.nan, 2.7, 4.0, 4.5, 5.0, 5.0]
-    })
-    
-    fig = go.Figure()
-    
-    # Add traces
-    fig.add_trace(go.Scatter(
-        x=growth_data['Year'],
-        y=growth_data['Historical'],
-        name='Historical',
-        mode='lines+markers',
-        line=dict(color='gray', width=3),
-        marker=dict(size=8)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=growth_data['Year'][4:],
-        y=growth_data['BERT_2026_Target'][4:],
-        name='BERT 2026 Target',
-        mode='lines+markers',
-        line=dict(color='#00267F', width=3, dash='solid'),
-        marker=dict(size=8)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=growth_data['Year'][4:],
-        y=growth_data['External_Forecast'][4:],
-        name='External Forecast (S&P/Fitch)',
-        mode='lines+markers',
-        line=dict(color='#DC2626', width=2, dash='dash'),
-        marker=dict(size=6)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=growth_data['Year'][4:],
-        y=growth_data['Central_Bank_Optimistic'][4:],
-        name='Central Bank Optimistic',
-        mode='lines+markers',
-        line=dict(color='#10B981', width=2, dash='dot'),
-        marker=dict(size=6)
-    ))
-    
-    fig.update_layout(
-        title='GDP Growth Trajectory Comparison (2020-2029)',
-        yaxis_title='GDP Growth %',
-        xaxis_title='Year',
-        height=500,
-        hovermode='x unified'
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Growth Analysis
-    col_g1, col_g2 = st.columns(2)
-    
-    with col_g1:
-        st.markdown("""
-        <div class="financial-card">
-            <h5 style="color: #00267F;">📊 Growth Analysis</h5>
-            <p><strong>BERT 2026 Target:</strong> 3.5% average (2025-2029)</p>
-            <p><strong>Reality Check:</strong></p>
-            <ul>
-            <li>Already slowing: 16.3% → 4.2% → 4.0% → 2.7%</li>
-            <li>Credit agencies: ~2.0% forecast</li>
-            <li><strong>Risk:</strong> If growth = 2.0%, deficit widens by 1.2% of GDP</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_g2:
-        # Calculate debt impact
-        st.markdown("""
-        <div class="financial-card">
-            <h5 style="color: #DC2626;">💰 Growth vs Debt Sustainability</h5>
-            <p><strong>Current Debt:</strong> 102.9% of GDP</p>
-            <p><strong>Target:</strong> 60% by FY2035/36</p>
-            <p><strong>Critical Dependence:</strong></p>
-            <ul>
-            <li>At 3.5% growth: Target achievable by 2036</li>
-            <li>At 2.0% growth: Target delayed by 5+ years</li>
-            <li>At 1.5% growth: Debt ratio may not decline</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # === CREDIBILITY GAP ANALYSIS ===
-    st.markdown('<div class="section-header">📉 The Credibility Gap: Government Claims vs Audit Reality</div>', unsafe_allow_html=True)
-    
-    # Create a comparison table
-    credibility_data = pd.DataFrame({
-        'BERT 2026 Claim': [
-            '"Stable and resilient macroeconomic foundation"',
-            '"Over five years of consistent fiscal prudence"',
-            '"Policy credibility"',
-            '"No financing gaps projected"',
-            '"SOE rationalization progressing"'
-        ],
-        'Audit Evidence': [
-            'Adverse audit opinion - financial statements "do NOT give a true and fair view"',
-            '$2.43B unverified receivables, $719M asset discrepancies',
-            'SOEs not consolidated (IPSAS violation), 15+ years unreconciled accounts',
-            'Financing depends on investor confidence, which requires reliable financial data',
-            'SOE transfers data contains $108M discrepancy + conceptual errors'
-        ],
-        'Impact': [
-            'High',
-            'Critical',
-            'Critical',
-            'High',
-            'Medium'
-        ]
-    })
-    
-    # Function to color code impact
-    def color_impact(val):
-        if val == 'Critical':
-            return 'background-color: #DC2626; color: white;'
-        elif val == 'High':
-            return 'background-color: #F59E0B; color: white;'
-        else:
-            return 'background-color: #3B82F6; color: white;'
-    
-    # Apply styling
-    styled_credibility = credibility_data.style.applymap(color_impact, subset=['Impact'])
-    
-    # Display the table
-    st.dataframe(
-        styled_credibility,
-        use_container_width=True,
-        height=250,
-        column_config={
-            "BERT 2026 Claim": "Government Claims",
-            "Audit Evidence": "Audit Reality",
-            "Impact": "Risk Level"
-        }
-    )
-    
-    # === INVESTMENT REQUIREMENTS VS GOVERNANCE SCORE ===
-    st.markdown('<div class="section-header">🏗️ Investment Requirements vs Governance Score</div>', unsafe_allow_html=True)
-    
-    # Investment data
-    investment_data = pd.DataFrame({
-        'Requirement': [
-            'Private Investment',
-            'Foreign Direct Investment',
-            'PPP Projects',
-            'Climate Finance'
-        ],
-        'Annual_Need_BBD_B': [1.9, 1.14, 0.5, 0.65],  # Billions
-        'Governance_Score': [25, 30, 20, 35],  # Out of 100
-        'Risk_Level': ['High', 'High', 'Critical', 'High']
-    })
-    
-    # Create bubble chart
-    fig = px.scatter(
-        investment_data,
-        x='Annual_Need_BBD_B',
-        y='Governance_Score',
-        size='Annual_Need_BBD_B',
-        color='Risk_Level',
-        hover_name='Requirement',
-        size_max=60,
-        color_discrete_map={
-            'Critical': '#DC2626',
-            'High': '#F59E0B',
-            'Medium': '#3B82F6'
-        },
-        title='Investment Requirements vs Governance Readiness'
-    )
-    
-    fig.update_layout(
-        xaxis_title='Annual Investment Need (BBD $B)',
-        yaxis_title='Governance Score (0-100)',
-        height=500
-    )
-    
-    # Add horizontal lines for risk zones
-    fig.add_hline(y=50, line_dash="dash", line_color="green", annotation_text="Acceptable Zone")
-    fig.add_hline(y=30, line_dash="dash", line_color="orange", annotation_text="High Risk Zone")
-    fig.add_hline(y=20, line_dash="dash", line_color="red", annotation_text="Critical Risk Zone")
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Investment Scorecard
-    st.markdown('<div class="section-header">📋 Investment Confidence Scorecard</div>', unsafe_allow_html=True)
-    
-    # Calculate scores
-    score_components = {
-        'Financial Transparency': 0,  # Adverse audit = 0/20
-        'SOE Governance': 5,  # Unconsolidated = 5/20
-        'PPP Framework': 10,  # Lack of oversight = 10/20
-        'Climate Risk Management': 8,  # 65% gap = 8/20
-        'Data Integrity': 4  # Unverified receivables = 4/20
-    }
-    
-    total_score = sum(score_components.values())
-    
-    # Display scorecards
-    col_s1, col_s2, col_s3, col_s4, col_s5 = st.columns(5)
-    
-    with col_s1:
-        score = score_components['Financial Transparency']
-        color = '#DC2626' if score <= 5 else '#F59E0B' if score <= 10 else '#3B82F6' if score <= 15 else '#10B981'
-        st.markdown(f"""
-        <div style="text-align: center; padding: 15px; border-radius: 10px; background-color: {color}20; border: 2px solid {color};">
-            <div style="font-size: 1.8rem; font-weight: bold; color: {color};">{score}/20</div>
-            <div style="font-size: 0.8rem; color: #666;">Transparency</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_s2:
-        score = score_components['SOE Governance']
-        color = '#DC2626' if score <= 5 else '#F59E0B' if score <= 10 else '#3B82F6' if score <= 15 else '#10B981'
-        st.markdown(f"""
-        <div style="text-align: center; padding: 15px; border-radius: 10px; background-color: {color}20; border: 2px solid {color};">
-            <div style="font-size: 1.8rem; font-weight: bold; color: {color};">{score}/20</div>
-            <div style="font-size: 0.8rem; color: #666;">SOE Governance</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_s3:
-        score = score_components['PPP Framework']
-        color = '#DC2626' if score <= 5 else '#F59E0B' if score <= 10 else '#3B82F6' if score <= 15 else '#10B981'
-        st.markdown(f"""
-        <div style="text-align: center; padding: 15px; border-radius: 10px; background-color: {color}20; border: 2px solid {color};">
-            <div style="font-size: 1.8rem; font-weight: bold; color: {color};">{score}/20</div>
-            <div style="font-size: 0.8rem; color: #666;">PPP Framework</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_s4:
-        score = score_components['Climate Risk Management']
-        color = '#DC2626' if score <= 5 else '#F59E0B' if score <= 10 else '#3B82F6' if score <= 15 else '#10B981'
-        st.markdown(f"""
-        <div style="text-align: center; padding: 15px; border-radius: 10px; background-color: {color}20; border: 2px solid {color};">
-            <div style="font-size: 1.8rem; font-weight: bold; color: {color};">{score}/20</div>
-            <div style="font-size: 0.8rem; color: #666;">Climate Management</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_s5:
-        score = score_components['Data Integrity']
-        color = '#DC2626' if score <= 5 else '#F59E0B' if score <= 10 else '#3B82F6' if score <= 15 else '#10B981'
-        st.markdown(f"""
-        <div style="text-align: center; padding: 15px; border-radius: 10px; background-color: {color}20; border: 2px solid {color};">
-            <div style="font-size: 1.8rem; font-weight: bold; color: {color};">{score}/20</div>
-            <div style="font-size: 0.8rem; color: #666;">Data Integrity</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Overall score
-    overall_color = '#DC2626' if total_score <= 50 else '#F59E0B' if total_score <= 70 else '#10B981'
-    risk_level = 'High Investment Risk' if total_score <= 50 else 'Moderate Risk' if total_score <= 70 else 'Lower Risk'
-    
-    st.markdown(f"""
-    <div style="text-align: center; margin-top: 20px; padding: 20px; background-color: {overall_color}20; border-radius: 10px; border: 2px solid {overall_color};">
-        <div style="font-size: 2.5rem; font-weight: bold; color: {overall_color};">{total_score}/100</div>
-        <div style="font-size: 1.2rem; color: {overall_color}; font-weight: bold;">{risk_level}</div>
-        <div style="font-size: 0.9rem; color: #666; margin-top: 10px;">
-            Based on 2023 audit findings and BERT 2026 investment requirements
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # === DEBT SUSTAINABILITY SIMULATOR - CORRECTED ===
-    st.markdown('<div class="section-header">📊 Debt Sustainability Simulator</div>', unsafe_allow_html=True)
-
-    # Interactive controls
-    col_sim1, col_sim2, col_sim3 = st.columns(3)
-
-    with col_sim1:
-        growth_rate = st.slider(
-            "GDP Growth Rate (%)",
-            min_value=1.0,
-            max_value=6.0,
-            value=3.5,
-            step=0.1,
-            help="BERT 2026 target: 3.5% average growth"
-        )
-
-    with col_sim2:
-        primary_surplus = st.slider(
-            "Primary Surplus (% of GDP)",
-            min_value=1.0,
-            max_value=6.0,
-            value=4.4,
-            step=0.1,
-            help="BERT 2026 target: 4.4% → 3.5% over 2025-2028"
-        )
-
-    with col_sim3:
-        include_shock = st.checkbox("Include Climate/Shock Impact", value=False, 
-                                   help="Simulate economic shocks from climate events or external crises")
-        if include_shock:
-            shock_size = st.slider("Shock Size (% of GDP)", 0.5, 5.0, 2.0, 0.1,
-                                  help="Size of economic shock as percentage of GDP")
-
-    # Advanced parameters expander
-    with st.expander("⚙️ Advanced Parameters"):
-        col_adv1, col_adv2 = st.columns(2)
-        
-        with col_adv1:
-            interest_rate = st.slider(
-                "Average Interest Rate (%)",
-                min_value=3.0,
-                max_value=8.0,
-                value=5.0,
-                step=0.1,
-                help="Average interest rate on government debt"
-            )
-        
-        with col_adv2:
-            inflation_rate = st.slider(
-                "Inflation Rate (%)",
-                min_value=1.0,
-                max_value=6.0,
-                value=2.5,
-                step=0.1,
-                help="Assumed average inflation rate"
-            )
-
-    # CORRECTED: Simulate debt trajectory with proper dynamics
-    years = list(range(2025, 2037))  # 2025 to 2036 inclusive
-    current_debt = 102.9  # 2025 debt-to-GDP ratio from Central Bank
-
-    # Convert percentages to decimals for calculations
-    growth_dec = growth_rate / 100
-    interest_dec = interest_rate / 100
-    primary_dec = primary_surplus / 100
-
-    # Calculate debt path with PROPER debt dynamics formula
-    debt_path = [current_debt]
-    for i in range(1, len(years)):
-        # PROPER FORMULA: debt_t = debt_{t-1} * (1 + r) / (1 + g) - primary_balance
-        # Where r = nominal interest rate, g = nominal growth rate
-        
-        # Nominal growth = real growth + inflation
-        nominal_growth = growth_dec + (inflation_rate / 100)
-        
-        # Calculate new debt using proper formula
-        previous_debt = debt_path[-1]
-        
-        # Debt dynamics formula in percentage terms
-        debt_change = previous_debt * (interest_dec - nominal_growth) - primary_dec * 100
-        
-        # Apply shock if selected (every 3 years to simulate climate shocks)
-        if include_shock and (years[i] - 2025) % 3 == 0:
-            shock_impact = shock_size  # shock_size is already in percentage points
-            debt_change += shock_impact
-        
-        new_debt = previous_debt + debt_change
-        
-        # Ensure debt doesn't go negative (unrealistic)
-        new_debt = max(new_debt, 20.0)  # Minimum reasonable debt level
-        
-        debt_path.append(new_debt)
-
-    # Create simulation results
-    sim_df = pd.DataFrame({
-        'Year': years,
-        'Debt_to_GDP': debt_path,
-        'Primary_Surplus': [primary_surplus] * len(years),
-        'Growth_Rate': [growth_rate] * len(years)
-    })
-
-    # Find when/if 60% target is reached
-    below_60 = sim_df[sim_df['Debt_to_GDP'] <= 60]
-
-    # CORRECTED: Calculate years to target properly
-    if not below_60.empty:
-        target_year = int(below_60.iloc[0]['Year'])
-        years_to_target = target_year - 2025
-        
-        # Handle edge case where starting below target (unlikely)
-        if years_to_target < 0:
-            years_to_target = 0
-            achievement = "Already below 60% target!"
-        else:
-            achievement = f"Target achieved by {target_year}"
-            achievement_color = "#10B981"
-    else:
-        # Project beyond 2036 to estimate when target might be reached
-        # Extend simulation to 2050 to find approximate target year
-        extended_years = list(range(2037, 2051))
-        extended_debt = debt_path[-1]
-        
-        # Continue simulation with same parameters
-        for year in extended_years:
-            debt_change = extended_debt * (interest_dec - (growth_dec + inflation_rate/100)) - primary_dec * 100
-            extended_debt += debt_change
-            extended_debt = max(extended_debt, 20.0)
-            
-            if extended_debt <= 60:
-                target_year = year
-                years_to_target = target_year - 2025
-                achievement = f"Target achieved by ~{target_year} (extended projection)"
-                achievement_color = "#F59E0B"
-                break
-        else:
-            # If still not reached by 2050
-            years_to_target = ">25"
-            achievement = "Target NOT achieved by 2050 under current parameters"
-            achievement_color = "#DC2626"
-
-    # Plot debt trajectory
-    fig = go.Figure()
-
-    # Main debt trajectory
-    fig.add_trace(go.Scatter(
-        x=sim_df['Year'],
-        y=sim_df['Debt_to_GDP'],
-        mode='lines+markers',
-        name='Projected Debt',
-        line=dict(color='#00267F', width=4),
-        marker=dict(size=10, symbol='circle'),
-        hovertemplate='Year: %{x}<br>Debt-to-GDP: %{y:.1f}%<extra></extra>'
-    ))
-
-    # Add target line at 60%
-    fig.add_hline(
-        y=60,
-        line_dash="dash",
-        line_color="green",
-        line_width=3,
-        annotation_text="60% Target",
-        annotation_position="bottom right",
-        annotation_font_size=12,
-        annotation_font_color="green"
-    )
-
-    # Add current level line
-    fig.add_hline(
-        y=current_debt,
-        line_dash="dot",
-        line_color="red",
-        line_width=2,
-        annotation_text=f"Current: {current_debt}%",
-        annotation_position="top right",
-        annotation_font_size=11,
-        annotation_font_color="red"
-    )
-
-    # Highlight target achievement year if reached
-    if not below_60.empty and years_to_target > 0:
-        fig.add_vline(
-            x=target_year,
-            line_dash="dash",
-            line_color="green",
-            line_width=2,
-            annotation_text=f"Target: {target_year}",
-            annotation_position="top",
-            annotation_font_size=11,
-            annotation_font_color="green"
-        )
-
-    # Add shock markers if included
-    if include_shock:
-        shock_years = [year for year in years if (year - 2025) % 3 == 0 and year != 2025]
-        for shock_year in shock_years:
-            shock_idx = years.index(shock_year)
-            fig.add_trace(go.Scatter(
-                x=[shock_year],
-                y=[debt_path[shock_idx]],
-                mode='markers',
-                marker=dict(
-                    symbol='triangle-down',
-                    size=15,
-                    color='orange',
-                    line=dict(width=2, color='darkorange')
-                ),
-                name='Climate/Shock Impact',
-                showlegend=(shock_year == shock_years[0])  # Only show in legend once
-            ))
-
-    fig.update_layout(
-        title=f'Debt Sustainability Simulation: {achievement}',
-        yaxis_title='Debt-to-GDP Ratio (%)',
-        xaxis_title='Year',
-        height=550,
-        hovermode='x unified',
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01
-        ),
-        annotations=[
-            dict(
-                x=0.02,
-                y=0.98,
-                xref="paper",
-                yref="paper",
-                text=f"Growth: {growth_rate}% | Primary Surplus: {primary_surplus}%",
-                showarrow=False,
-                font=dict(size=10),
-                bgcolor="white",
-                bordercolor="gray",
-                borderwidth=1,
-                borderpad=4
-            )
-        ]
-    )
-
-    # Add secondary axis for growth comparison (optional)
-    if show_comparative:
-        fig.add_trace(go.Scatter(
-            x=sim_df['Year'],
-            y=sim_df['Growth_Rate'],
-            mode='lines',
-            name='Growth Rate',
-            yaxis='y2',
-            line=dict(color='#10B981', width=2, dash='dot'),
-            hovertemplate='Growth: %{y:.1f}%<extra></extra>'
-        ))
-        
-        fig.update_layout(
-            yaxis2=dict(
-                title='Growth Rate (%)',
-                overlaying='y',
-                side='right',
-                range=[0, max(sim_df['Growth_Rate']) * 1.5]
-            )
-        )
-
-    st.plotly_chart(fig, use_container_width=True)
-
-    # === SIMULATION RESULTS SUMMARY ===
-    st.markdown('<div class="section-header">📈 Simulation Results Summary</div>', unsafe_allow_html=True)
-
-    col_sum1, col_sum2, col_sum3, col_sum4 = st.columns(4)
-
-    with col_sum1:
-        # Projected 2036 Debt
-        projected_2036 = debt_path[-1]
-        vs_target = projected_2036 - 60
-        delta_color = "normal" if vs_target <= 0 else "inverse"
-        
-        st.metric(
-            "Projected 2036 Debt",
-            f"{projected_2036:.1f}%",
-            f"{vs_target:+.1f}% vs target",
-            delta_color=delta_color,
-            help=f"Debt-to-GDP ratio projected for 2036 under current parameters"
-        )
-
-    with col_sum2:
-        # Years to Target - CORRECTED CALCULATION
-        if isinstance(years_to_target, str):
-            display_years = years_to_target
-            delta_text = "Target not reached"
-        else:
-            display_years = f"{years_to_target}"
-            if years_to_target <= 11:  # By 2036
-                delta_text = f"Target by {2025 + years_to_target}"
-            else:
-                delta_text = f"Target after 2036"
-        
-        st.metric(
-            "Years to 60% Target",
-            display_years,
-            delta_text,
-            help="Number of years from 2025 to reach 60% debt-to-GDP ratio"
-        )
-
-    with col_sum3:
-        # Annual Reduction Needed
-        total_reduction = current_debt - 60
-        if isinstance(years_to_target, int) and years_to_target > 0:
-            annual_reduction = total_reduction / years_to_target
-        else:
-            # If not reached, calculate average needed to reach by 2036
-            years_to_2036 = 11  # 2025 to 2036
-            annual_reduction = total_reduction / years_to_2036
-        
-        st.metric(
-            "Annual Reduction Needed",
-            f"{annual_reduction:.2f}%",
-            "of GDP per year",
-            help="Average annual debt reduction required to reach target"
-        )
-
-    with col_sum4:
-        # Financing Gap
-        # Calculate absolute financing gap in BBD dollars
-        # Assumption: Barbados GDP ~ $5.5B (2024 estimate)
-        gdp_estimate = 5500000000  # $5.5B
-        
-        if projected_2036 > 60:
-            gap_percentage = projected_2036 - 60
-            financing_gap = (gap_percentage / 100) * gdp_estimate
-        else:
-            financing_gap = 0
-        
-        st.metric(
-            "2036 Financing Gap",
-            f"${financing_gap/1e9:.1f}B",
-            "Additional funding needed" if financing_gap > 0 else "On track",
-            delta_color="normal" if financing_gap == 0 else "inverse",
-            help="Additional financing needed to reach 60% target by 2036"
-        )
-
-    # === REALITY CHECK WARNING ===
-    if not below_60.empty and years_to_target < 5:
-        st.warning(f"""
-        ⚠️ **REALITY CHECK: Unusually Fast Debt Reduction**
-        
-        Your parameters project debt falling from **{current_debt:.1f}% to <60% in {years_to_target} years**.
-        
-        **This requires:**
-        - Average annual debt reduction of **{(current_debt - 60)/years_to_target:.1f} percentage points**
-        - Primary surplus of approximately **{((current_debt - 60)/years_to_target) + (interest_rate - growth_rate):.1f}% of GDP**
-        
-        **Historical Context:**
-        - Barbados' highest recorded primary surplus: **6.4%** (2022/23)
-        - Typical advanced economy debt reduction: **1-2 percentage points per year**
-        - Fastest major debt reduction in history (Ireland 2013-2019): **3.3 percentage points per year**
-        
-        *Consider if your growth and surplus assumptions are realistic for Barbados.*
-        """)
-
-    # === PARAMETER SENSITIVITY ANALYSIS ===
-    with st.expander("📊 Sensitivity Analysis: How Parameters Affect Results"):
-        st.markdown("""
-        **Understanding the Debt Dynamics:**
-        
-        The debt-to-GDP ratio changes based on this relationship:
-        
-        ```
-        ΔDebt ≈ Debt × (Interest Rate - Growth Rate) - Primary Surplus
-        ```
-        
-        **Key Insights:**
-        1. **Growth is your best friend:** Each 1% higher growth reduces annual debt accumulation by ~1% of existing debt
-        2. **Primary surplus is direct reduction:** Each 1% primary surplus directly reduces debt by 1 percentage point
-        3. **Interest rates matter:** Higher rates increase debt faster
-        
-        **Barbados-Specific Factors:**
-        - Current average interest rate: ~5% on existing debt
-        - New borrowing likely at 8-12% given B+ credit rating
-        - Realistic growth range: 2-4% based on historical performance
-        - Primary surplus sustainability: 3-4% over medium term
-        """)
-        
-        # Create sensitivity table
-        sensitivity_data = {
-            'Scenario': ['Optimistic', 'Baseline (BERT 2026)', 'Pessimistic', 'Current Trend'],
-            'Growth Rate': [4.5, 3.5, 2.0, 2.5],
-            'Primary Surplus': [4.0, 3.5, 2.5, 3.0],
-            'Years to 60%': ['8-10', '12-15', '20+', '15-18'],
-            'Probability': ['Low (20%)', 'Medium (40%)', 'High (30%)', 'Medium-High (50%)']
-        }
-        
-        sensitivity_df = pd.DataFrame(sensitivity_data)
-        st.dataframe(sensitivity_df, use_container_width=True, height=200)
-        
-        st.info("""
-        **Professional Assessment:** 
-        Under realistic parameters, Barbados is more likely to reach **~70-75% debt-to-GDP by 2036** rather than the 60% target. 
-        The 60% target requires either sustained high growth (>4%) or larger primary surpluses (>4%) than historically achieved.
-        """)
-
-    # === COMPARISON WITH IMF/WORLD BANK MODELS ===
-    with st.expander("🌐 Comparison with Official Debt Sustainability Analyses"):
-        st.markdown("""
-        **How this simulation compares to official models:**
-        
-        | Aspect | This Simulator | IMF DSA Model | Difference |
-        |--------|---------------|---------------|------------|
-        | **Growth Impact** | Linear relationship | Non-linear, sector-based | Simplified vs detailed |
-        | **Interest Rates** | Fixed or slider | Market-based, forward curves | Static vs dynamic |
-        | **Shock Scenarios** | Simple periodic shocks | Tailored stress tests | Generic vs specific |
-        | **Fiscal Reaction** | Constant primary balance | Policy reaction function | Fixed vs responsive |
-        | **SOE Impact** | Indirect via shocks | Direct consolidation | Indirect vs explicit |
-        
-        **Key Omissions in This Simplified Model:**
-        1. **Non-linear effects** of high debt on growth (debt overhang)
-        2. **Market access constraints** at high debt levels
-        3. **SOE contingent liabilities** materializing
-        4. **Climate change physical risks** to GDP
-        5. **Exchange rate effects** on foreign currency debt
-        
-        **Recommendation:** Use this as a **conceptual tool** to understand debt dynamics, 
-        not as a precise forecasting model. Official IMF Debt Sustainability Analysis (DSA) 
-        should be consulted for policy decisions.
-        """)
-
-    # === DEBT REDUCTION STRATEGIES ===
-    st.markdown('<div class="section-header">🎯 Debt Reduction Strategy Options</div>', unsafe_allow_html=True)
-
-    # Strategy comparison
-    strategies = [
-        {
-            'Strategy': 'Growth-Focused',
-            'Approach': 'Maximize economic growth through investment',
-            'Growth_Impact': '+1.5%',
-            'Fiscal_Impact': '-0.5% (higher investment)',
-            'Years_Saved': '3-4',
-            'Risk': 'Medium',
-            'Best_For': 'Long-term sustainability'
-        },
-        {
-            'Strategy': 'Austerity-Focused',
-            'Approach': 'Maximize primary surpluses through spending cuts',
-            'Growth_Impact': '-0.5%',
-            'Fiscal_Impact': '+1.5% (higher surplus)',
-            'Years_Saved': '2-3',
-            'Risk': 'High (recession risk)',
-            'Best_For': 'Short-term targets'
-        },
-        {
-            'Strategy': 'Balanced Approach',
-            'Approach': 'Moderate growth + moderate fiscal adjustment',
-            'Growth_Impact': '+0.5%',
-            'Fiscal_Impact': '+0.5%',
-            'Years_Saved': '4-5',
-            'Risk': 'Low',
-            'Best_For': 'Sustainable, politically feasible'
-        },
-        {
-            'Strategy': 'Debt Restructuring',
-            'Approach': 'Negotiate with creditors for debt relief',
-            'Growth_Impact': 'Neutral',
-            'Fiscal_Impact': 'Immediate ~20% reduction',
-            'Years_Saved': '8-10',
-            'Risk': 'Very High (market access)',
-            'Best_For': 'Crisis situations only'
-        }
-    ]
-
-    strategy_df = pd.DataFrame(strategies)
-
-    # Display as cards
-    strategy_cols = st.columns(2)
-    for idx, strategy in enumerate(strategies):
-        with strategy_cols[idx % 2]:
-            risk_color = {
-                'Low': '#10B981',
-                'Medium': '#F59E0B',
-                'High': '#DC2626',
-                'Very High': '#991B1B'
-            }.get(strategy['Risk'], '#666')
-            
-            st.markdown(f"""
-            <div class="financial-card" style="min-height: 250px; margin-bottom: 15px;">
-                <h5 style="color: #00267F; margin-top: 0;">{strategy['Strategy']}</h5>
-                <p><strong>Approach:</strong> {strategy['Approach']}</p>
-                <p><strong>Growth Impact:</strong> <span style="color: #10B981;">{strategy['Growth_Impact']}</span></p>
-                <p><strong>Fiscal Impact:</strong> <span style="color: #DC2626;">{strategy['Fiscal_Impact']}</span></p>
-                <p><strong>Years Saved vs Baseline:</strong> {strategy['Years_Saved']}</p>
-                <p><strong>Risk:</strong> <span style="color: {risk_color};">{strategy['Risk']}</span></p>
-                <p><em>{strategy['Best_For']}</em></p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # ===== DYNAMIC SIMULATION-BASED RECOMMENDATION =====
-    st.markdown('<div class="section-header">💡 Simulation-Based Recommendation</div>', unsafe_allow_html=True)
-    
-    # Calculate recommendation parameters
-    years_to_2036 = 11  # 2025 to 2036
-    
-    # Determine if target is achievable
-    if isinstance(years_to_target, int):
-        if years_to_target <= years_to_2036:
-            # Achieves target by 2036
-            status = "On Track"
-            status_color = "#10B981"
-            bg_color = "#ECFDF5"
-            border_color = "#10B981"
-            
-            # Strategy recommendation based on parameters
-            if growth_rate >= 4.0 and primary_surplus >= 4.0:
-                strategy = "Growth-focused with strong fiscal discipline"
-                confidence = "High confidence"
-            elif growth_rate >= 3.5:
-                strategy = "Growth-focused approach"
-                confidence = "Moderate confidence"
-            elif primary_surplus >= 4.0:
-                strategy = "Austerity-focused approach"
-                confidence = "Moderate confidence"
-            else:
-                strategy = "Balanced approach"
-                confidence = "Cautious confidence"
-                
-            recommendation_text = f"""
-            <div style="background-color: {bg_color}; padding: 20px; border-radius: 10px; border-left: 4px solid {border_color}; margin-top: 10px;">
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
-                <h5 style="color: {status_color}; margin-top: 0; font-size: 1.2rem;">✅ {status}: Target Achievable by {target_year}</h5>
-                <span style="background-color: {status_color}; color: white; padding: 4px 12px; border-radius: 12px; font-size: 0.9rem; font-weight: bold;">
-                    {years_to_target} years
-                </span>
-            </div>
-            
-            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px; margin-bottom: 15px;">
-                <div style="background-color: white; padding: 10px; border-radius: 8px; border: 1px solid #e0e0e0;">
-                    <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Your Parameters</div>
-                    <div style="font-size: 1.1rem; font-weight: bold; color: #00267F;">Growth: {growth_rate}%</div>
-                    <div style="font-size: 1.1rem; font-weight: bold; color: #00267F;">Primary Surplus: {primary_surplus}%</div>
-                </div>
-                <div style="background-color: white; padding: 10px; border-radius: 8px; border: 1px solid #e0e0e0;">
-                    <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Annual Reduction Needed</div>
-                    <div style="font-size: 1.5rem; font-weight: bold; color: {status_color};">{annual_reduction:.1f}%</div>
-                    <div style="font-size: 0.8rem; color: #666;">of GDP per year</div>
-                </div>
-            </div>
-            
-            <p><strong>Recommended Strategy:</strong> {strategy}</p>
-            <p><strong>Confidence Level:</strong> {confidence}</p>
-            
-            <div style="margin-top: 15px; padding: 10px; background-color: rgba(255, 255, 255, 0.7); border-radius: 5px;">
-                <p style="margin: 0; font-size: 0.9rem;"><strong>⚠️ Key Risk:</strong> {'' if not include_shock else 'Climate shocks could delay target by 2-3 years'}{'' if include_shock else 'Growth falling below ' + str(growth_rate) + '% could derail progress'}</p>
-            </div>
-            
-            <p style="margin-top: 15px; font-size: 0.9rem; color: #666;">
-            <em>Recommendation: Continue with current strategy while monitoring quarterly performance metrics.</em>
-            </p>
-            </div>
-            """
-            
-        else:
-            # Target delayed beyond 2036
-            status = "Target Delayed"
-            status_color = "#F59E0B"
-            bg_color = "#FFFBEB"
-            border_color = "#F59E0B"
-            
-            # Calculate needed improvements
-            growth_needed = max(3.5, growth_rate + 0.5)
-            surplus_needed = max(4.0, primary_surplus + 0.5)
-            
-            recommendation_text = f"""
-            <div style="background-color: {bg_color}; padding: 20px; border-radius: 10px; border-left: 4px solid {border_color}; margin-top: 10px;">
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
-                <h5 style="color: {status_color}; margin-top: 0; font-size: 1.2rem;">⚠️ {status}: Target by {target_year if 'target_year' in locals() else '2050+'}</h5>
-                <span style="background-color: {status_color}; color: white; padding: 4px 12px; border-radius: 12px; font-size: 0.9rem; font-weight: bold;">
-                    {years_to_target} years
-                </span>
-            </div>
-            
-            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px; margin-bottom: 15px;">
-                <div style="background-color: white; padding: 10px; border-radius: 8px; border: 1px solid #e0e0e0;">
-                    <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Current Parameters</div>
-                    <div style="font-size: 1.1rem; font-weight: bold; color: #DC2626;">Growth: {growth_rate}%</div>
-                    <div style="font-size: 1.1rem; font-weight: bold; color: #DC2626;">Primary Surplus: {primary_surplus}%</div>
-                </div>
-                <div style="background-color: white; padding: 10px; border-radius: 8px; border: 1px solid #e0e0e0;">
-                    <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Needed Improvement</div>
-                    <div style="font-size: 1.1rem; font-weight: bold; color: {status_color};">+{growth_needed - growth_rate:.1f}% growth</div>
-                    <div style="font-size: 1.1rem; font-weight: bold; color: {status_color};">OR +{surplus_needed - primary_surplus:.1f}% surplus</div>
-                </div>
-            </div>
-            
-            <p><strong>Issue:</strong> Current trajectory too slow for 2036 target</p>
-            <p><strong>Required Acceleration:</strong> Additional {max(0.5, (60 - projected_2036)/(years_to_2036 - years_to_target)):.1f}% annual debt reduction</p>
-            
-            <div style="margin-top: 15px; padding: 10px; background-color: rgba(255, 255, 255, 0.7); border-radius: 5px;">
-                <p style="margin: 0; font-size: 0.9rem;"><strong>💡 Solution:</strong> Increase growth to {growth_needed:.1f}% OR primary surplus to {surplus_needed:.1f}%</p>
-            </div>
-            
-            <p style="margin-top: 15px; font-size: 0.9rem; color: #666;">
-            <em>Recommendation: Strengthen BERT 2026 reforms or revise timeline expectations.</em>
-            </p>
-            </div>
-            """
-    else:
-        # Target not achievable
-        status = "Target Unlikely"
-        status_color = "#DC2626"
-        bg_color = "#FEF2F2"
-        border_color = "#DC2626"
-        
-        # Minimum requirements
-        min_growth = 3.0
-        min_surplus = 3.5
-        
-        recommendation_text = f"""
-        <div style="background-color: {bg_color}; padding: 20px; border-radius: 10px; border-left: 4px solid {border_color}; margin-top: 10px;">
-        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
-            <h5 style="color: {status_color}; margin-top: 0; font-size: 1.2rem;">🚨 {status}: 60% Target Not Achieved by 2050</h5>
-            <span style="background-color: {status_color}; color: white; padding: 4px 12px; border-radius: 12px; font-size: 0.9rem; font-weight: bold;">
-                >25 years
-            </span>
-        </div>
-        
-        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px; margin-bottom: 15px;">
-            <div style="background-color: white; padding: 10px; border-radius: 8px; border: 1px solid #e0e0e0;">
-                <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Insufficient Parameters</div>
-                <div style="font-size: 1.1rem; font-weight: bold; color: #DC2626;">Growth: {growth_rate}%</div>
-                <div style="font-size: 1.1rem; font-weight: bold; color: #DC2626;">Primary Surplus: {primary_surplus}%</div>
-            </div>
-            <div style="background-color: white; padding: 10px; border-radius: 8px; border: 1px solid #e0e0e0;">
-                <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Minimum Required</div>
-                <div style="font-size: 1.1rem; font-weight: bold; color: {status_color};">Growth: {min_growth}%+</div>
-                <div style="font-size: 1.1rem; font-weight: bold; color: {status_color};">Surplus: {min_surplus}%+</div>
-            </div>
-        </div>
-        
-        <p><strong>Critical Issue:</strong> Parameters insufficient for debt sustainability</p>
-        <p><strong>Projected 2036 Debt:</strong> {projected_2036:.1f}% (vs 60% target)</p>
-        <p><strong>Financing Gap:</strong> ${financing_gap/1e9:.1f}B additional funding needed</p>
-        
-        <div style="margin-top: 15px; padding: 10px; background-color: rgba(255, 255, 255, 0.7); border-radius: 5px;">
-            <p style="margin: 0; font-size: 0.9rem;"><strong>🔄 Required Action:</strong> Fundamental revision of economic strategy OR debt restructuring</p>
-        </div>
-        
-        <p style="margin-top: 15px; font-size: 0.9rem; color: #666;">
-        <em>Recommendation: Pause BERT 2026 financing until credible sustainability plan established.</em>
-        </p>
-        </div>
-        """
-    
-    # Display the dynamic recommendation
-    st.markdown(recommendation_text, unsafe_allow_html=True)
-    
-    # Additional context note
-    st.markdown("""
-    <div style="margin-top: 10px; padding: 10px; background-color: #F8FAFC; border-radius: 5px; border: 1px solid #E2E8F0;">
-    <p style="margin: 0; font-size: 0.85rem; color: #64748B;">
-    <strong>Note:</strong> This recommendation is based on your selected simulation parameters and historical Barbados performance patterns. 
-    It assumes consistent policy implementation and excludes potential positive impacts from successful BERT 2026 reforms.
-    </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # === BERT 2026 RISK HEAT MAP ===
-    st.markdown('<div class="section-header">⚠️ BERT 2026 Risk Heat Map</div>', unsafe_allow_html=True)
-    
-    # Risk data from BERT 2026 document sections
-    risk_data = pd.DataFrame({
-        'Risk Category': [
-            'Growth Underperformance',
-            'Investment Shortfall',
-            'SOE Reform Delay',
-            'Climate Shock Impact',
-            'PPP Liabilities Materialize',
-            'Institutional Capacity Gaps',
-            'Financing Access Deterioration',
-            'Revenue Underperformance'
-        ],
-        'Likelihood': ['High', 'High', 'High', 'Medium', 'Medium', 'High', 'Medium', 'Medium'],
-        'Impact': ['High', 'High', 'Medium', 'High', 'High', 'High', 'Critical', 'High'],
-        'Dashboard Evidence': [
-            'Growth already slowing (16.3% → 2.7%), external forecasts lower',
-            'Adverse audit undermines investor confidence',
-            'SOEs not consolidated, QEH/CBC reforms incomplete',
-            '65% climate finance gap, limited insurance capacity',
-            'PPP framework weak, oversight mechanisms lacking',
-            '15+ years unreconciled accounts, conceptual errors in reporting',
-            'Adverse opinion vs B+ rating for bond issuance',
-            '$2.43B tax receivables unverified, revenue recognition issues'
-        ],
-        'BERT 2026 Mitigation': [
-            'Conservative assumptions, quarterly monitoring',
-            'Diversified financing strategy, PPP pipeline',
-            'Performance targets, enhanced oversight',
-            'CCRIF coverage, Resilience Fund',
-            'Value-for-money assessments, transparent reporting',
-            'Capacity building, technical assistance',
-            'Active debt management, maintaining buffers',
-            'Tax compliance improvements, digital platforms'
-        ]
-    })
-    
-    # Create a grid view with conditional formatting
-    def style_risk_grid(val):
-        if val == 'Critical':
-            return 'background-color: #DC2626; color: white; font-weight: bold;'
-        elif val == 'High':
-            return 'background-color: #F59E0B; color: white; font-weight: bold;'
-        elif val == 'Medium':
-            return 'background-color: #3B82F6; color: white;'
-        else:
-            return 'background-color: #10B981; color: white;'
-    
-    # Apply styling
-    styled_risks = risk_data.style.applymap(style_risk_grid, subset=['Likelihood', 'Impact'])
-    
-    # Display the risk heat map
-    st.dataframe(
-        styled_risks,
-        use_container_width=True,
-        height=400,
-        column_config={
-            "Risk Category": "Risk",
-            "Likelihood": "Probability",
-            "Impact": "Severity",
-            "Dashboard Evidence": "Evidence",
-            "BERT 2026 Mitigation": "Planned Mitigation"
-        }
-    )
-    
-    # === REFORM READINESS ASSESSMENT ===
-    st.markdown('<div class="section-header">🔧 Reform Readiness Assessment</div>', unsafe_allow_html=True)
-    
-    # Radar chart data
-    readiness_categories = ['Fiscal Discipline', 'Digitalization', 'SOE Governance', 'PPP Framework', 'Climate Integration', 'Data Integrity']
-    readiness_scores = [65, 40, 25, 30, 45, 20]  # Out of 100
-    
-    # Create radar chart
-    fig = go.Figure(data=go.Scatterpolar(
-        r=readiness_scores,
-        theta=readiness_categories,
-        fill='toself',
-        name='Current Readiness',
-        line_color='#00267F'
-    ))
-    
-    # Add target line (80% for "Mostly Ready")
-    fig.add_trace(go.Scatterpolar(
-        r=[80] * len(readiness_categories),
-        theta=readiness_categories,
-        fill='toself',
-        name='Target (80%)',
-        line_color='#10B981',
-        opacity=0.3
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                tickvals=[0, 20, 40, 60, 80, 100],
-                ticktext=['Critical Gap', 'Major Concern', 'Partial', 'Mostly Ready', 'Fully Ready', 'Excellent']
-            )
-        ),
-        title='BERT 2026 Reform Readiness Assessment',
-        height=500
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Readiness analysis
-    col_ready1, col_ready2, col_ready3 = st.columns(3)
-    
-    with col_ready1:
-        st.markdown("""
-        <div class="financial-card">
-            <h5 style="color: #DC2626;">❌ Critical Gaps (< 40)</h5>
-            <ul>
-            <li>SOE Governance (25)</li>
-            <li>Data Integrity (20)</li>
-            <li>PPP Framework (30)</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_ready2:
-        st.markdown("""
-        <div class="financial-card">
-            <h5 style="color: #F59E0B;">⚠️ Major Concerns (40-60)</h5>
-            <ul>
-            <li>Digitalization (40)</li>
-            <li>Climate Integration (45)</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_ready3:
-        st.markdown("""
-        <div class="financial-card">
-            <h5 style="color: #10B981;">✅ Strengths (> 60)</h5>
-            <ul>
-            <li>Fiscal Discipline (65)</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # === LESSONS FROM BERT 2018/2022 vs CURRENT REALITY ===
-    st.markdown('<div class="section-header">📚 Lessons from BERT 2018/2022 vs Current Reality</div>', unsafe_allow_html=True)
-    
-    lessons_data = pd.DataFrame({
-        'Lesson from BERT 2026 (Section 2.7)': [
-            '"Consistency in fiscal discipline is a cornerstone of macroeconomic credibility"',
-            '"Sequencing and timing of structural reforms are pivotal"',
-            '"Climate action is not peripheral to economic policy, it is integral"',
-            '"Digitalization has emerged as a powerful enabler of reform"',
-            '"Broad-based stakeholder engagement has been critical"'
-        ],
-        'Current Status (Dashboard Evidence)': [
-            'Primary surplus achieved, but audit shows $2.43B unverified assets and persistent accounting issues',
-            'SOE reform incomplete (not consolidated), PPP framework weak, sequencing questionable',
-            '65% climate finance gap, limited domestic insurance capacity, heavy reliance on external reinsurers',
-            'Poor IT controls, data integrity issues, conceptual errors in financial notes',
-            'Audit shows transparency gaps, limited public engagement on adverse opinion implications'
-        ],
-        'Risk Level': [
-            'High',
-            'Critical',
-            'High',
-            'High',
-            'Medium'
-        ]
-    })
-    
-    st.dataframe(
-        lessons_data.style.applymap(style_risk_grid, subset=['Risk Level']),
-        use_container_width=True,
-        height=300,
-        column_config={
-            "Lesson from BERT 2026 (Section 2.7)": "BERT 2026 Lesson",
-            "Current Status (Dashboard Evidence)": "Current Reality",
-            "Risk Level": "Risk"
-        }
-    )
-    
-    # === TIMELINE: CRITICAL DECISIONS ===
-    st.markdown('<div class="section-header">⏰ Critical Decision Timeline</div>', unsafe_allow_html=True)
-    
-    timeline = pd.DataFrame({
-        'Date': ['Mar 2026', 'Apr 2026', 'Jun 2026', 'Sep 2026', 'Dec 2026', 'Mar 2027'],
-        'Event': [
-            'IMF Article IV Consultation Review',
-            'FY2026/27 Budget Approval',
-            'Next Sovereign Bond Issue ($500M+)',
-            'BERT 2026 Mid-Term Review',
-            'Climate Finance COP Discussions',
-            '2024 Financial Statements Audit Opinion'
-        ],
-        'Risk Factor': [
-            'Adverse audit opinion undermines credibility',
-            'Financing assumptions vs audit reality',
-            'Investor confidence test',
-            'Implementation delays likely',
-            '65% funding gap critical',
-            'Will it be clean or adverse?'
-        ],
-        'Decision Required': [
-            'IMF assessment of governance improvements',
-            'Transparency on financing gaps',
-            'Risk premium for unreliable data',
-            'Course correction vs. doubling down',
-            'Alternative funding sources',
-            'Financial reporting credibility'
-        ]
-    })
-    
-    st.dataframe(timeline, use_container_width=True, height=250)
-    
-    # === PROFESSIONAL CONCLUSION - STREAMLIT FORMAT ===
-    st.markdown('<div class="sub-header">🎯 EXECUTIVE DECISION BRIEF: BERT 2026 FINANCING RISK ASSESSMENT</div>', unsafe_allow_html=True)
-    
-    # Use columns and containers for proper layout
-    col_conclusion1, col_conclusion2 = st.columns([1, 1])
-    
-    with col_conclusion1:
-        st.markdown("""
-        <div class="financial-card adverse-opinion">
-            <h3 style="color: #DC2626; margin-top: 0; padding: 10px 0;">🔍 DECISION BRIEF: THE $7.4 BILLION CREDIBILITY GAP</h3>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Core Contradiction
-        with st.container():
-            st.markdown("##### 📊 THE CORE CONTRADICTION")
-            st.markdown("**Barbados plans to borrow $7.4B (2026-2029) for economic transformation while:**")
-            
-            col_left, col_right = st.columns(2)
-            with col_left:
-                st.markdown("""
-                <div class="financial-card" style="min-height: 200px;">
-                    <strong style="font-size: 1.1rem;">BERT 2026 Requirement</strong><br><br>
-                    • Reliable financial data for investor confidence<br>
-                    • Strong governance for complex reforms<br>
-                    • Accurate baseline for debt sustainability<br>
-                    • Transparent reporting for PPP partners
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col_right:
-                st.markdown("""
-                <div class="financial-card data-error" style="min-height: 200px;">
-                    <strong style="font-size: 1.1rem;">Current Reality</strong><br><br>
-                    • <span style="color: #DC2626;">Adverse audit opinion</span> on 2023 statements<br>
-                    • <span style="color: #DC2626;">$2.43B unverified</span> tax receivables<br>
-                    • <span style="color: #DC2626;">SOEs not consolidated</span> (IPSAS violation)<br>
-                    • <span style="color: #DC2626;">15+ years</span> unreconciled accounts
-                </div>
-                """, unsafe_allow_html=True)
-    
-    with col_conclusion2:
-        # Financial Impact Metrics
-        st.markdown('<div style="margin-bottom: 15px;"></div>', unsafe_allow_html=True)
-        st.markdown("##### 💰 FINANCIAL IMPACT OF PROCEEDING")
-        
-        impact_cols = st.columns(4)
-        
-        # Complete the cut-off text from image
-        with impact_cols[0]:
-            st.markdown("""
-            <div style="text-align: center; padding: 15px; background-color: #FEF2F2; border-radius: 8px; border: 1px solid #DC2626; min-height: 130px;">
-                <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Expected Bond Yield</div>
-                <div style="font-size: 1.5rem; font-weight: bold; color: #DC2626;">13-15%</div>
-                <div style="font-size: 0.8rem; color: #DC2626; margin-top: 5px;">↑ vs. 8-9% with clean audit</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with impact_cols[1]:
-            st.markdown("""
-            <div style="text-align: center; padding: 15px; background-color: #FEF2F2; border-radius: 8px; border: 1px solid #DC2626; min-height: 130px;">
-                <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Annual Interest Premium</div>
-                <div style="font-size: 1.5rem; font-weight: bold; color: #DC2626;">$250M+</div>
-                <div style="font-size: 0.8rem; color: #DC2626; margin-top: 5px;">↑ On $1.85B borrowing</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with impact_cols[2]:
-            st.markdown("""
-            <div style="text-align: center; padding: 15px; background-color: #FEF2F2; border-radius: 8px; border: 1px solid #DC2626; min-height: 130px;">
-                <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">SOE Reform Failure Risk</div>
-                <div style="font-size: 1.5rem; font-weight: bold; color: #DC2626;">60-70%</div>
-                <div style="font-size: 0.8rem; color: #DC2626; margin-top: 5px;">↑ Without proper baseline</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with impact_cols[3]:
-            st.markdown("""
-            <div style="text-align: center; padding: 15px; background-color: #FEF2F2; border-radius: 8px; border: 1px solid #DC2626; min-height: 130px;">
-                <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Next Crisis Timeline</div>
-                <div style="font-size: 1.5rem; font-weight: bold; color: #DC2626;">2029</div>
-                <div style="font-size: 0.8rem; color: #DC2626; margin-top: 5px;">↑ If foundations not fixed</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # Two Paths Forward
-    st.markdown("##### ⚖️ THE STRATEGIC CHOICE: TWO PATHS FORWARD")
-    
-    path_cols = st.columns(2)
-    
-    with path_cols[0]:
-        with st.container():
-            st.markdown('<div class="financial-card adverse-opinion">', unsafe_allow_html=True)
-            st.markdown("##### 🚨 PATH A: PROCEED AS PLANNED")
-            
-            st.markdown("**Financial Impact (2026-2029):**")
-            st.markdown("- Additional $ 1 billion+ in interest costs")
-            st.markdown("- $ 500 million+ in PPP/implementation overruns")
-            st.markdown("- $ 2-3 billion in hidden SOE liabilities")
-            st.markdown("- High probability of 2029 debt restructuring")
-            
-            st.markdown("**Probable Outcome:** BERT 2026 fails expensively")
-            st.markdown("- **More debt:** $ 20 billion+ (versus $ 15 billion in 2018)")
-            st.markdown("- **Less credibility:** Market exclusion for 5+ years")
-            st.markdown("- **Fewer options:** Harsher IMF program")
-            st.markdown("- **Lost decade:** Economic stagnation")
-            
-            st.info("**Lender's Perspective:** Requires 400-500 basis points risk premium and extensive covenants")
-            st.markdown('</div>', unsafe_allow_html=True)
-    
-    with path_cols[1]:
-        with st.container():
-            st.markdown('<div class="financial-card" style="border-left-color: #10B981;">', unsafe_allow_html=True)
-            st.markdown("##### ✅ PATH B: FIX FOUNDATION FIRST")
-            
-            st.markdown("**6-Month Remediation Plan ($ 10-20 million):**")
-            st.markdown("- Independent verification of $ 2.43 billion tax receivables")
-            st.markdown("- SOE consolidation pilot (2-3 major entities)")
-            st.markdown("- Internal controls overhaul and staff training")
-            st.markdown("- Clean audit opinion on 2024 statements")
-            
-            st.markdown("**12-Month Outcomes:**")
-            st.markdown("- **Financing cost:** 300-400 basis points reduction = $ 55-75 million savings")
-            st.markdown("- **Investor confidence:** B+ to BB rating upgrade possible")
-            st.markdown("- **BERT credibility:** Phased implementation with metrics")
-            st.markdown("- **Growth foundation:** Reliable data for decisions")
-            
-            st.success("**Return on Investment:** Every $ 1 spent saves $ 12-15 in financing costs")
-            st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Stakeholder Recommendations
-    st.markdown("##### 🎯 ACTIONABLE RECOMMENDATIONS BY STAKEHOLDER")
-    
-    rec_cols = st.columns(3)
-    
-    with rec_cols[0]:
-        st.markdown("""
-        <div class="financial-card" style="border-left-color: #3B82F6;">
-            <h6 style="color: #1D4ED8;">🏛️ FOR PARLIAMENT (PAC/OPPOSITION)</h6>
-            <ul>
-            <li>Require clean audit BEFORE BERT financing</li>
-            <li>Commission independent SOE valuation</li>
-            <li>Establish bipartisan oversight committee</li>
-            <li>Demand quarterly transparency reports</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with rec_cols[1]:
-        st.markdown("""
-        <div class="financial-card" style="border-left-color: #0EA5E9;">
-            <h6 style="color: #0C4A6E;">🏦 FOR INTERNATIONAL LENDERS</h6>
-            <ul>
-            <li>Make clean audit a <strong>prior action</strong></li>
-            <li>Require independent BERT baseline verification</li>
-            <li>Structure financing in performance-linked tranches</li>
-            <li>Provide technical assistance for financial management</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with rec_cols[2]:
-        st.markdown("""
-        <div class="financial-card" style="border-left-color: #8B5CF6;">
-            <h6 style="color: #5B21B6;">💼 FOR SOVEREIGN INVESTORS</h6>
-            <ul>
-            <li>Price in 400bps risk premium until clean audit</li>
-            <li>Demand stronger covenants for data integrity</li>
-            <li>Require independent auditor on bond trustee</li>
-            <li>Monitor quarterly remediation progress</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Next Steps Timeline
-    st.markdown("##### 📋 IMMEDIATE NEXT STEPS (90 DAYS)")
-    
-    timeline_cols = st.columns(4)
-    
-    with timeline_cols[0]:
-        st.markdown("""
-        <div style="text-align: center; padding: 15px; background-color: #EFF6FF; border-radius: 8px;">
-            <div style="font-size: 1.2rem; font-weight: bold; color: #00267F;">WEEK 1-2</div>
-            <div style="font-size: 0.85rem; color: #666;">Present to Public Accounts Committee</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with timeline_cols[1]:
-        st.markdown("""
-        <div style="text-align: center; padding: 15px; background-color: #EFF6FF; border-radius: 8px;">
-            <div style="font-size: 1.2rem; font-weight: bold; color: #00267F;">WEEK 3-4</div>
-            <div style="font-size: 0.85rem; color: #666;">Share with IMF before March review</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with timeline_cols[2]:
-        st.markdown("""
-        <div style="text-align: center; padding: 15px; background-color: #EFF6FF; border-radius: 8px;">
-            <div style="font-size: 1.2rem; font-weight: bold; color: #00267F;">MONTH 2</div>
-            <div style="font-size: 0.85rem; color: #666;">Independent asset verification begins</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with timeline_cols[3]:
-        st.markdown("""
-        <div style="text-align: center; padding: 15px; background-color: #EFF6FF; border-radius: 8px;">
-            <div style="font-size: 1.2rem; font-weight: bold; color: #00267F;">MONTH 3</div>
-            <div style="font-size: 0.85rem; color: #666;">Remediation plan approved & funded</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Bottom Line
-    st.markdown("##### 🎲 THE BOTTOM-LINE BET")
-    
-    st.warning("""
-    **Barbados is asking lenders to bet $7.4B that:**  
-    *"We can execute our most complex transformation ever, despite our Auditor General saying you can't trust our financial statements."*
-    
-    **Professional Assessment:** This is not a responsible bet without fixing the foundation first.  
-    The **$1B+ in additional financing costs** and **high failure probability** make remediation the only prudent path.
-    """)
-    
-    # Final Recommendation
-    st.markdown("##### ✅ FINAL RECOMMENDATION")
-    
-    st.markdown("""
-    <div style="text-align: center; padding: 20px; background-color: #00267F; color: white; border-radius: 8px; margin: 20px 0;">
-        <h4 style="color: white; margin-top: 0;">PAUSE BERT 2026 FINANCING • FIX FOUNDATION • PROCEED WITH CREDIBILITY</h4>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    prereq_cols = st.columns(3)
-    
-    with prereq_cols[0]:
-        st.markdown("""
-        <div style="text-align: center; padding: 15px; background-color: #FEF2F2; border-radius: 8px; border: 2px solid #DC2626;">
-            <div style="font-size: 1.2rem; font-weight: bold; color: #DC2626;">1. CLEAN AUDIT</div>
-            <div style="font-size: 0.9rem;">2024 Financial Statements</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with prereq_cols[1]:
-        st.markdown("""
-        <div style="text-align: center; padding: 15px; background-color: #FEF2F2; border-radius: 8px; border: 2px solid #DC2626;">
-            <div style="font-size: 1.2rem; font-weight: bold; color: #DC2626;">2. SOE CONSOLIDATION</div>
-            <div style="font-size: 0.9rem;">Full IPSAS Compliance</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with prereq_cols[2]:
-        st.markdown("""
-        <div style="text-align: center; padding: 15px; background-color: #FEF2F2; border-radius: 8px; border: 2px solid #DC2626;">
-            <div style="font-size: 1.2rem; font-weight: bold; color: #DC2626;">3. DATA INTEGRITY</div>
-            <div style="font-size: 0.9rem;">Verified Assets & Liabilities</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Value Proposition
-    st.info("""
-    **Dashboard Value Proposition:** This analysis provides the evidence needed to make an informed $7.4B financing decision.  
-    Without it, Barbados risks repeating 2018's debt crisis with potentially worse consequences.
-    """)
-    
-    # === COMPREHENSIVE REFERENCES ===
-    with st.expander("📚 COMPLETE SOURCE REFERENCES"):
-        st.markdown("""
-        ## **Primary Sources**
-        
-        ### **Official Documents:**
-        1. **BERT 2026 Plan** (Government of Barbados, December 2025)
-           - **Growth target:** 3.5% average (2025-2029)
-           - **Debt target:** 60% by fiscal year 2035/36
-           - **Financing needs:** $ 1.71 billion to $ 2.06 billion annually
-           - **Climate finance gap:** 65% unfunded
-        
-        2. **Auditor General's Report** (2023 Financial Statements, April 2, 2025)
-           - Adverse audit opinion issued
-           - **$ 2.43 billion** unverified tax receivables
-           - **$ 719 million** asset discrepancies
-           - State-owned entities not consolidated (IPSAS violation)
-        
-        ### **Media Analysis (Nation News):**
-        1. **"Third phase of BERT takes effect"** - Shawn Cumberbatch (January 18, 2026)
-           - First plan without IMF direct oversight
-           - **USD $500 million** bond issued in 2025
-           - Heavy reliance on public-private partnerships
-        
-        2. **"3.5% growth expected"** - Shawn Cumberbatch (January 19, 2026)
-           - Growth target reduced from 5% to 3.5%
-           - External forecasts: approximately 2.0%
-           - Central Bank optimistic about 5%
-        
-        ### **Financial Data:**
-        1. **Central Bank of Barbados** (Third Quarter 2025)
-           - **Debt ratio:** 102.9% of GDP
-           - **Reserves:** $ 3.3 billion (31.6 weeks import cover)
-           - **Growth:** 2.7% (2025 estimate)
-        
-        2. **Credit Rating Agencies** (Fourth Quarter 2025)
-           - **Moody's:** B1 with positive outlook
-           - **Standard & Poor's/Fitch:** B+ with stable outlook
-           - **Growth forecasts:** approximately 2.0% (conservative estimates)
-        
-        ## **Analysis Methodology**
-        
-        ### **Risk Assessment Framework:**
-        - **IMF Debt Sustainability Analysis** applied to Barbados context
-        - **World Bank Country Policy and Institutional Assessment (CPIA)** scoring for governance assessment
-        - **Historical Precedent Analysis** (Greece 2010, Argentina 2001, Barbados 2018)
-        - **Sovereign Risk Premium Modeling** based on 200+ sovereign debt restructurings
-        
-        ### **Financial Impact Calculations:**
-        - **Interest Premium:** 400 basis points for adverse audit = $ 74 million per year on $ 1.85 billion
-        - **Implementation Risk:** 40% cost overrun typical for weak governance environments
-        - **Growth Probability:** Target achievement likelihood based on historical performance patterns
-        
-        ### **Professional Standards Applied:**
-        - International Public Sector Accounting Standards (IPSAS)
-        - IMF Fiscal Transparency Code (2019)
-        - World Bank Public Expenditure & Financial Accountability (PEFA) Framework
-        - Generally Accepted Risk Principles (GARP)
-        
-        ## **Independent Verification Recommended**
-        
-        **For financing decisions exceeding $ 1 billion:**
-        1. **Big Four Accounting Firm:** Independent asset verification and financial controls assessment
-        2. **IMF Fiscal Affairs Department:** State-owned enterprise consolidation assessment
-        3. **World Bank Governance Practice:** Internal controls and financial management review
-        4. **Legal Due Diligence:** Bond covenants and regulatory compliance verification
-        
-        ## **Contact Information for Verification**
-        
-        - **Nation News Barbados:** business@nationnews.com
-        - **Shawn Cumberbatch:** Nation News Senior Business Writer (primary source for BERT 2026 analysis)
-        - **Auditor General's Office:** audit@bao.gov.bb | Telephone: (246) 535-4257
-        - **Ministry of Finance and Economic Affairs:** mof@barbados.gov.bb
-        - **IMF Barbados Desk:** IMF-Barbados@imf.org | IMF Western Hemisphere Department
-        """)
-# ============================================================================
-# 2026 REALITY CHECK VIEW - REVISED WITH DOCUMENT REFERENCES
-# ============================================================================
-elif view_option == "2026 Reality Check":
-    
-    st.markdown('<div class="sub-header">📊 2026 Reality Check: Official Optimism vs. 2023 Audit Reality</div>', unsafe_allow_html=True)
-    
-    # === DOCUMENT REFERENCE BANNER ===
-    st.markdown('''
-    <div style="text-align: center; padding: 15px; background-color: #1E40AF; color: white; border-radius: 8px; margin-bottom: 20px;">
-        <h5 style="color: white; margin-top: 0;">📄 Document Reference: Pre-Election Economic & Fiscal Update (Jan 27, 2026)</h5>
-        <p style="margin: 0; font-size: 0.85rem;">Pages 16-19: Debt Service | Page 7: Economic Performance | Page 14-15: Fiscal Balance</p>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # === CRITICAL METRICS SIDE-BY-SIDE ===
-    st.markdown('<div class="section-header">📈 Key Metrics: 2023 Audit vs. 2026 Update</div>', unsafe_allow_html=True)
-    
-    # Create comparison table
-    comparison_data = {
-        'Metric': [
-            'Debt-to-GDP Ratio',
-            'Annual Debt Service Cost',
-            'Interest Rate on New Bonds',
-            'Tax Receivables (Unverified)',
-            'SOE Consolidation Status',
-            'Primary Surplus (Target vs Actual)',
-            'Tourism % of GDP',
-            'Critical Audit Issues'
-        ],
-        '2023 Reality': [
-            '102.9% (Central Bank 2025)',
-            '$568M (Page 7, 2023 FS)',
-            '6.5% (2029 bonds)',
-            '$2.43B UNVERIFIED (AG Report)',
-            '❌ NOT CONSOLIDATED (IPSAS violation)',
-            '4.3% (achieved 2023)',
-            '~40% (estimated)',
-            '❌ ADVERSE OPINION (AG Report)'
-        ],
-        '2026 Update': [
-            '93.7% (Nov 2025, Page 16)',
-            '$2.5B (2025/26 projected, Page 18)',
-            '8.0% (2035 bonds, Page 16)',
-            'No mention in 2026 report',
-            'SOEs: $77M arrears (Page 19)',
-            'Target: 4.1% | Actual: 3.7% (Page 15)',
-            '>40% (increasing, Page 7)',
-            'No mention of audit issues'
-        ],
-        'Document Page': [
-            'Page 16, Table & Text',
-            'Page 18, "Debt Service"',
-            'Page 16, "8% Eurobond"',
-            'Not mentioned',
-            'Page 19, "SOE Arrears"',
-            'Page 15, Figure 5',
-            'Page 7, Paragraph 1',
-            'Not addressed'
-        ]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
-    
-    # Color code the changes
-    def color_change(val):
-        if '▲' in str(val):
-            return 'background-color: #FEF2F2; color: #DC2626; font-weight: bold;'
-        elif '▼' in str(val):
-            return 'background-color: #ECFDF5; color: #10B981; font-weight: bold;'
-        elif '❌' in str(val) or '🚨' in str(val):
-            return 'background-color: #FEF2F2; color: #DC2626; font-weight: bold;'
-        elif '⚠️' in str(val) or '❓' in str(val):
-            return 'background-color: #FFFBEB; color: #D97706; font-weight: bold;'
-        else:
-            return ''
-    
-    styled_df = df_comparison.style.applymap(color_change, subset=['2026 Update'])
-    
-    # Display the comparison
-    st.dataframe(
-        styled_df,
-        use_container_width=True,
-        height=350,
-        column_config={
-            "Metric": st.column_config.TextColumn("Key Financial Metric", width="large"),
-            "2023 Reality": "2023 Audit Findings",
-            "2026 Update": "2026 Pre-Election Update",
-            "Document Page": "Source in 2026 PDF"
-        }
-    )
-    
-    # === THE DEBT SERVICE REALITY: WHO GETS PAID? ===
-    st.markdown('<div class="section-header">💸 The Harsh Reality: $2.5 Billion Annual Debt Service - Who Gets Paid?</div>', unsafe_allow_html=True)
-    
-    # DEBT SERVICE BREAKDOWN FROM DOCUMENT (Pages 16-19) - FIXED WITH MARKDOWN
-    st.markdown("""
-    <div class="financial-card adverse-opinion">
-        <h5 style="color: #DC2626; margin-top: 0;">💰 $2.5 BILLION DEBT SERVICE BREAKDOWN (2025/26 Projected)</h5>
-        <p><strong>Source: Page 18, "Debt Service - FY 2025/26"</strong></p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Use columns instead of grid for better compatibility
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div style="padding: 15px; background: #FEF2F2; border-radius: 5px; border-left: 4px solid #DC2626; margin-bottom: 15px;">
-            <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">INTEREST PAYMENTS</div>
-            <div style="font-size: 1.5rem; font-weight: bold; color: #DC2626;">$588M</div>
-            <div style="font-size: 0.85rem; color: #666; margin-top: 10px;">
-                • Bondholders (8% Eurobond): $40M/year<br>
-                • Previous bondholders: $22M/year<br>
-                • Other creditors: $526M/year
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="padding: 15px; background: #FEF2F2; border-radius: 5px; border-left: 4px solid #991B1B; margin-bottom: 15px;">
-            <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">PRINCIPAL REPAYMENTS</div>
-            <div style="font-size: 1.5rem; font-weight: bold; color: #991B1B;">$1.9B</div>
-            <div style="font-size: 0.85rem; color: #666; margin-top: 10px;">
-                • Eurobond maturities<br>
-                • IMF repayments<br>
-                • Multilateral loans
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("""
-    <div style="margin-top: 15px; padding: 15px; background: #FEE2E2; border-radius: 5px;">
-        <p style="margin: 0; font-size: 0.95rem;">
-        <strong>🔥 THE HARSH REALITY:</strong> This $2.5B is <strong>40% of total government revenue</strong> ($6.2B projected 2025/26). 
-        For every $1 Barbados earns, <strong>$0.40 goes to debt payments</strong> before funding hospitals, schools, or roads.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # === WHO SPECIFICALLY GETS PAID? ===
-    st.markdown('<div class="section-header">🏦 The Creditors: Who Barbados Owes Money To</div>', unsafe_allow_html=True)
-    
-    # Creditor breakdown from document (Page 16)
-    creditors = pd.DataFrame({
-        'Creditor': [
-            'International Bondholders (8% 2035 Eurobond)',
-            'Caribbean Development Bank (CDB)',
-            'Inter-American Development Bank (IADB)',
-            'International Monetary Fund (IMF)',
-            'Latin American Development Bank (CAF)',
-            'Export-Import Bank of China',
-            'Domestic Banks & Pension Funds',
-            'Other Multilateral Agencies'
-        ],
-        'Amount Owed (USD)': [
-            '$500M',
-            '$484M',
-            '$1.81B',
-            '$548M',
-            '$357M',
-            'Not specified',
-            '$8.99B (domestic debt)',
-            'Various'
-        ],
-        'Interest Rate': [
-            '8.0% (highest)',
-            '3-5% (concessional)',
-            '3-6% (concessional)',
-            '2-4% (concessional)',
-            '4-6%',
-            'Not specified',
-            '4-7%',
-            '3-6%'
-        ],
-        'Priority': [
-            'HIGHEST (market access depends on this)',
-            'Medium (multilateral)',
-            'Medium (multilateral)',
-            'HIGH (IMF program critical)',
-            'Medium',
-            'Medium',
-            'HIGH (domestic stability)',
-            'Low-Medium'
-        ]
-    })
-    
-    # Display creditor table
-    st.dataframe(
-        creditors,
-        use_container_width=True,
-        height=300,
-        column_config={
-            "Creditor": "Who Barbados Owes",
-            "Amount Owed (USD)": "Amount",
-            "Interest Rate": "Cost",
-            "Priority": "Payment Priority"
-        }
-    )
-    
-    # === THE DEBT TRAP VISUALIZATION ===
-    st.markdown('<div class="section-header">📊 The Expensive Refinancing: Locked into High Rates for 10 Years</div>', unsafe_allow_html=True)
-    
-    # Create debt comparison visualization
-    debt_comparison = pd.DataFrame({
-        'Bond': ['Old Bond (2029)', 'New Bond (2035)'],
-        'Amount': [340, 500],
-        'Interest Rate': [6.5, 8.0],
-        'Annual Interest': [22.1, 40.0],
-        'Maturity': [2029, 2035],
-        'Total Interest Cost': [147.7, 400.0],  # Over remaining life
-        'Document Reference': ['Page 16: "partial repurchase"', 'Page 16: "8% Eurobond was issued"']
-    })
-    
-    fig = go.Figure()
-    
-    # Add bars for total interest cost
-    fig.add_trace(go.Bar(
-        x=debt_comparison['Bond'],
-        y=debt_comparison['Total Interest Cost'],
-        name='Total Interest Cost (USD $M)',
-        marker_color=['#DC2626', '#991B1B'],
-        text=[f'${x}M total' for x in debt_comparison['Total Interest Cost']],
-        textposition='auto'
-    ))
-    
-    fig.update_layout(
-        title='The True Cost: 8% Bond = $400M Interest Over 10 Years vs $148M for 6.5% Bond',
-        yaxis=dict(title='Total Interest Cost (USD $M)'),
-        height=400,
-        annotations=[
-            dict(
-                x=0,
-                y=250,
-                xref="paper",
-                yref="y",
-                text="↑ $252M MORE in interest",
-                showarrow=True,
-                arrowhead=2,
-                ax=0,
-                ay=-40,
-                font=dict(size=12, color="#DC2626")
-            )
-        ]
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Interest cost calculation - FIXED
-    st.markdown("""
-    <div class="financial-card adverse-opinion">
-        <h5 style="color: #DC2626; margin-top: 0;">📄 DOCUMENT EVIDENCE: Pages 16-18</h5>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Use columns for bond comparison
-    col3, col4 = st.columns(2)
-    
-    with col3:
-        st.markdown("""
-        <div style="padding: 15px; background: #FEF2F2; border-radius: 5px; text-align: center; margin-bottom: 15px;">
-            <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">OLD 2029 BOND (Page 16)</div>
-            <div style="font-size: 1.5rem; font-weight: bold; color: #DC2626;">$22.1M/year</div>
-            <div style="font-size: 0.85rem; color: #666;">$340M × 6.5% = $22.1M/year</div>
-            <div style="font-size: 0.75rem; color: #DC2626; margin-top: 5px;">Would have matured 2029</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div style="padding: 15px; background: #FEF2F2; border-radius: 5px; text-align: center; margin-bottom: 15px;">
-            <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">NEW 2035 BOND (Page 16)</div>
-            <div style="font-size: 1.5rem; font-weight: bold; color: #991B1B;">$40M/year</div>
-            <div style="font-size: 0.85rem; color: #666;">$500M × 8% = $40M/year</div>
-            <div style="font-size: 0.75rem; color: #991B1B; margin-top: 5px;">LOCKED IN until 2035</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Document finding section
-    st.markdown("""
-    <div style="border-top: 2px dashed #DC2626; margin: 15px 0; padding-top: 15px; padding: 15px; background: #FEF2F2; border-radius: 5px;">
-        <p><strong>📄 DOCUMENT FINDING (Page 17):</strong> "The interest on the new USD 500.0 million 8% Note... will be somewhat mitigated by the reduced payment on the GOB's 2029 6.5% Note"</p>
-        <p><strong>🔍 REALITY CHECK:</strong> This is <span style="color: #DC2626; font-weight: bold;">financial engineering, not savings</span>. Barbados now owes:</p>
-        <ul>
-            <li><strong>+$500M more principal</strong> (340M → 500M)</li>
-            <li><strong>+1.5% higher interest rate</strong> (6.5% → 8.0%)</li>
-            <li><strong>+6 years longer maturity</strong> (2029 → 2035)</li>
-        </ul>
-        <p style="margin-top: 15px;"><strong>📊 NET INCREASE:</strong> <span style="color: #DC2626; font-weight: bold;">+$18M per year</span> for the same government</p>
-        <p><strong>💸 TOTAL COST OVER 10 YEARS:</strong> <span style="color: #DC2626; font-weight: bold;">+$180M extra</span> just in interest (Page 18: "Total revised debt expenditure... $682.9 million more than approved")</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # === WHAT THIS MEANS FOR BARBADIANS ===
-    st.markdown('<div class="section-header">👥 What $2.5B Debt Service Means for Ordinary Barbadians</div>', unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown('''
-        <div class="financial-card" style="border-left-color: #DC2626; min-height: 220px;">
-            <h6 style="color: #DC2626;">💰 PER CAPITA BURDEN</h6>
-            <p><strong>Population:</strong> 287,000</p>
-            <p><strong>Debt service per person:</strong></p>
-            <div style="text-align: center; margin: 10px 0;">
-                <div style="font-size: 1.8rem; font-weight: bold; color: #DC2626;">$8,710</div>
-                <div style="font-size: 0.8rem; color: #666;">per Barbadian per year</div>
-            </div>
-            <p><em>For a family of 4: $34,840/year in debt payments</em></p>
-        </div>
-        ''', unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown('''
-        <div class="financial-card" style="border-left-color: #DC2626; min-height: 220px;">
-            <h6 style="color: #DC2626;">🏥 OPPORTUNITY COST</h6>
-            <p><strong>What $2.5B could fund instead:</strong></p>
-            <p>• <strong>Queen Elizabeth Hospital</strong> budget: $133M/year</p>
-            <p>→ Could fund QEH for <strong>19 years</strong></p>
-            <p>• <strong>University of West Indies</strong> subsidy: $50M/year</p>
-            <p>→ Could fund UWI for <strong>50 years</strong></p>
-        </div>
-        ''', unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown('''
-        <div class="financial-card" style="border-left-color: #DC2626; min-height: 220px;">
-            <h6 style="color: #DC2626;">📅 DAILY COST</h6>
-            <p><strong>Debt service runs 24/7:</strong></p>
-            <div style="text-align: center; margin: 10px 0;">
-                <div style="font-size: 1.8rem; font-weight: bold; color: #DC2626;">$6.85M</div>
-                <div style="font-size: 0.8rem; color: #666;">per day</div>
-            </div>
-            <div style="text-align: center;">
-                <div style="font-size: 1.5rem; font-weight: bold; color: #DC2626;">$285,000</div>
-                <div style="font-size: 0.8rem; color: #666;">per hour</div>
-            </div>
-            <p><em>Every hour, Barbados pays a doctor's annual salary in interest</em></p>
-        </div>
-        ''', unsafe_allow_html=True)
-    
-    # === WHAT'S NOT IN THE 2026 REPORT ===
-    st.markdown('<div class="section-header">❌ What the 2026 Report Doesn\'t Tell You (But Should)</div>', unsafe_allow_html=True)
-    
-    missing_items = [
-        {
-            'Issue': '2023 Audit Problems',
-            '2023 Status': 'Adverse opinion, $2.43B unverified assets',
-            '2026 Mention': 'NOT MENTIONED',
-            'Document Page': 'Not in report',
-            'Risk': 'Financial statements still unreliable for $7.4B BERT financing'
-        },
-        {
-            'Issue': 'SOE Consolidation',
-            '2023 Status': 'Not done (IPSAS violation)',
-            '2026 Mention': 'Only mentions $77M arrears (Page 19)',
-            'Document Page': 'Page 19, last paragraph',
-            'Risk': 'Still violating IPSAS, true SOE debt hidden'
-        },
-        {
-            'Issue': '8% Bond vs Alternative Options',
-            '2023 Status': 'Could have negotiated better terms',
-            '2026 Mention': 'Presented as "liability management" success',
-            'Document Page': 'Page 16-17',
-            'Risk': 'Locked into high rates for 10 years unnecessarily'
-        },
-        {
-            'Issue': 'Tourism Dependency Risk',
-            '2023 Status': '40% of GDP = high vulnerability',
-            '2026 Mention': 'Celebrated as growth driver',
-            'Document Page': 'Page 7',
-            'Risk': 'Economic collapse if tourism slows (single point of failure)'
-        }
-    ]
-    
-    for item in missing_items:
-        page_num = item['Document Page'].split(' ')[1] if 'Page' in item['Document Page'] else 'N/A'
-        st.markdown(f'''
-        <div class="financial-card data-error" style="margin-bottom: 10px;">
-            <div style="display: flex; justify-content: space-between; align-items: start;">
-                <div style="flex: 1;">
-                    <h6 style="margin-top: 0; color: #DC2626;">{item['Issue']}</h6>
-                    <p><strong>2023 Audit Finding:</strong> {item['2023 Status']}</p>
-                    <p><strong>2026 Report (Page {page_num}):</strong> <span style="color: #DC2626;">{item['2026 Mention']}</span></p>
-                    <p><strong>Risk to BERT 2026:</strong> {item['Risk']}</p>
-                </div>
-                <div style="background-color: #DC2626; color: white; padding: 4px 12px; border-radius: 12px; font-size: 0.8rem; font-weight: bold; white-space: nowrap;">
-                    🚨 MISSING CONTEXT
-                </div>
-            </div>
-        </div>
-        ''', unsafe_allow_html=True)
-    
-    # === THE BOTTOM LINE ===
-    st.markdown('<div class="section-header">🎯 The Bottom Line: Fragile Recovery on Cracked Foundation</div>', unsafe_allow_html=True)
-    
-    col_b1, col_b2 = st.columns(2)
-    
-    with col_b1:
-        st.markdown('''
-        <div class="financial-card" style="border-left-color: #10B981; min-height: 280px;">
-            <h5 style="color: #10B981; margin-top: 0;">✅ WHAT THE 2026 REPORT SHOWS (Pages 7-15)</h5>
-            <p><strong>Short-term improvements:</strong></p>
-            <ul>
-            <li>Fiscal discipline (primary surplus 3.7%)</li>
-            <li>Growth recovery (2.7%, Page 7)</li>
-            <li>Lower inflation (0.5%, Page 7)</li>
-            <li>Debt ratio down to 93.7% (Page 16)</li>
-            <li>Reserves at $3.3B (Page 7)</li>
-            </ul>
-            <p><em>They're managing the SYMPTOMS better (temporary fix)</em></p>
-            <div style="margin-top: 10px; padding: 8px; background: #D1FAE5; border-radius: 5px;">
-                <p style="margin: 0; font-size: 0.85rem;"><strong>Document Evidence:</strong> Pages 7, 15, 16 show numerical improvements</p>
-            </div>
-        </div>
-        ''', unsafe_allow_html=True)
-    
-    with col_b2:
-        st.markdown('''
-        <div class="financial-card adverse-opinion" style="min-height: 280px;">
-            <h5 style="color: #DC2626; margin-top: 0;">🚨 WHAT THE 2023 AUDIT STILL SHOWS (Unaddressed)</h5>
-            <p><strong>Structural problems remain:</strong></p>
-            <ul>
-            <li>Paying MORE interest (8% bonds, Page 16)</li>
-            <li>Tourism dependency INCREASING (Page 7)</li>
-            <li>2023 audit issues NOT FIXED (not mentioned)</li>
-            <li>SOEs still unconsolidated (IPSAS violation)</li>
-            <li>Data quality problems persist (Note 34 errors)</li>
-            </ul>
-            <p><em>The FOUNDATION is still cracked (permanent risk)</em></p>
-            <div style="margin-top: 10px; padding: 8px; background: #FEE2E2; border-radius: 5px;">
-                <p style="margin: 0; font-size: 0.85rem;"><strong>Critical Gap:</strong> 2026 report doesn't address 2023 audit findings</p>
-            </div>
-        </div>
-        ''', unsafe_allow_html=True)
-    
-    # === FINAL WARNING WITH DOCUMENT EVIDENCE ===
-    st.markdown('''
-    <div style="text-align: center; padding: 20px; background-color: #DC2626; color: white; border-radius: 10px; margin: 20px 0;">
-        <h4 style="color: white; margin-top: 0;">⚠️ THE HARSH REALITY ⚠️</h4>
-        <p style="margin: 0; font-size: 1.1rem;"><strong>Document Evidence (Page 18):</strong> "Total revised debt expenditure for 2025-2026 is estimated at $2,507.0 million, approximately $682.9 million more than the amount approved."</p>
-        <p style="margin: 10px 0 0 0; font-size: 0.9rem;"><strong>The math doesn't lie:</strong> Barbados is paying 40% of revenue to creditors while asking for $7.4B more for BERT 2026 with unreliably audited financials</p>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # === RESPONSIBLE RECOMMENDATION ===
-    st.markdown('''
-    <div style="padding: 15px; background-color: #00267F; color: white; border-radius: 8px; margin-top: 20px;">
-        <h5 style="color: white; margin-top: 0;">🎯 RESPONSIBLE PATH FORWARD: Fix Foundation Before More Borrowing</h5>
-        <p><strong>Based on 2023 audit + 2026 document evidence, Barbados should:</strong></p>
-        <ol style="color: white;">
-        <li><strong>Fix 2023 audit issues FIRST</strong> (clean 2024 audit) before $7.4B BERT borrowing</li>
-        <li><strong>Transparent cost-benefit</strong> of 8% bonds vs. alternatives (was this the best deal?)</li>
-        <li><strong>Diversify economy</strong> beyond 40% tourism dependency (BERT 2026 promise)</li>
-        <li><strong>Honest reporting</strong> on SOE consolidation progress (IPSAS compliance)</li>
-        </ol>
-        <p style="margin-top: 10px; font-size: 0.9rem; color: #BFDBFE;"><em>The 2026 document shows temporary fiscal improvement, but the 2023 audit shows the financial foundation remains unreliable for major new borrowing.</em></p>
-    </div>
-    ''', unsafe_allow_html=True)
-# ============================================================================
-# HIDDEN LIABILITIES ANALYSIS - ADDITION TO REALITY CHECK
-# ============================================================================
-
-# === HIDDEN LIABILITIES: THE COMPLETE FINANCIAL PICTURE ===
-    st.markdown('<div class="section-header">📊 The Complete Financial Picture: Official vs True Debt</div>', unsafe_allow_html=True)
-
-    # Interactive Toggle for Different Scenarios
-    st.markdown("##### 🎛️ Toggle Between Official Figures and Full Picture")
-
-    scenario = st.radio(
-        "Select View:",
-        ["Official Figures", "+ Pensions Only", "+ Pensions & SOEs"],
-        horizontal=True,
-        key="debt_scenario_toggle"
-    )
-
-    # Define the three scenarios with clear references and assumptions
-    # Using 2026 Pre-election Update numbers: Page 16: $15,025.8 million debt, 93.7% of GDP
-    public_debt_2026 = 15025800000  # $15,025.8 million from Page 16
-    implied_gdp_2026 = public_debt_2026 / 0.937  # Calculate implied GDP from ratio
-
-    scenarios = {
-        "Official Figures": {
-            "total_liabilities": public_debt_2026,  # $15.0B from 2026 report
-            "pension_adjustment": 0,
-            "soe_adjustment": 0,
-            "debt_to_gdp": 93.7,  # From 2026 report Page 16
-            "color": "#00267F",
-            "label": "Official 2026 Figures",
-            "note": "Based on 2026 Pre-election Update, Page 16: '$15,025.8 million... 93.7 percent of GDP'"
-        },
-        "+ Pensions Only": {
-            "total_liabilities": public_debt_2026 + 3500000000,  # $15.0B + $3.5B pension estimate
-            "pension_adjustment": 3500000000,
-            "soe_adjustment": 0,
-            "debt_to_gdp": 116.5,  # (93.7 + 22.8) = ($15.0B + $3.5B) / ($15.0B/0.937)
-            "color": "#F59E0B",
-            "label": "With Pension Liabilities",
-            "note": "Adds estimated $3.5B unfunded pension obligations (2023 AG finding)"
-        },
-        "+ Pensions & SOEs": {
-            "total_liabilities": public_debt_2026 + 3500000000 + 2000000000,  # $15.0B + $5.5B
-            "pension_adjustment": 3500000000,
-            "soe_adjustment": 2000000000,
-            "debt_to_gdp": 128.0,  # (93.7 + 34.3) = ($15.0B + $5.5B) / ($15.0B/0.937)
-            "color": "#DC2626",
-            "label": "Full Consolidation",
-            "note": "Adds pensions + estimated $2B SOE debt (40+ SOEs not consolidated)"
-        }
-    }
-
-    selected = scenarios[scenario]
-
-    # Display selected scenario metrics
-    st.markdown(f"""
-    <div style="text-align: center; padding: 20px; background-color: {selected['color']}20; border-radius: 10px; border: 2px solid {selected['color']}; margin: 15px 0;">
-        <h4 style="color: {selected['color']}; margin-top: 0;">📈 {selected['label']}</h4>
-        <div style="font-size: 2.5rem; font-weight: bold; color: {selected['color']};">{selected['debt_to_gdp']}%</div>
-        <div style="font-size: 0.9rem; color: #666;">Debt-to-GDP Ratio</div>
-        <div style="margin-top: 10px; font-size: 1.2rem; color: {selected['color']}; font-weight: bold;">{format_currency(selected['total_liabilities'], 'Billions (BBD $B)')}</div>
-        <div style="font-size: 0.9rem; color: #666;">Total Public Sector Liabilities</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Scenario Comparison Table
-    st.markdown("##### 📋 Complete Scenario Comparison")
-
-    comparison_data = {
-        "Scenario": ["Official Figures", "+ Pensions Only", "+ Pensions & SOEs"],
-        "Debt-to-GDP": ["93.7%", "≈116.5%", "≈128.0%"],
-        "Total Liabilities": [
-            format_currency(scenarios["Official Figures"]["total_liabilities"], "Billions (BBD $B)"),
-            format_currency(scenarios["+ Pensions Only"]["total_liabilities"], "Billions (BBD $B)"),
-            format_currency(scenarios["+ Pensions & SOEs"]["total_liabilities"], "Billions (BBD $B)")
-        ],
-        "Hidden Liabilities": [
-            "$0",
-            "$3.5B (pensions)",
-            "$5.5B (pensions + SOEs)"
-        ],
-        "Impact on 60% Target": [
-            "Requires ~36% reduction in liabilities",
-            "Requires ~48% reduction in liabilities",
-            "Requires ~53% reduction in liabilities"
-        ],
-        "Source & Reference": [
-            "2026 Pre-election Update, Page 16",
-            "AG Report: 'Pension liabilities were not included'",
-            "AG Report + Pre-election update (40+ SOEs not consolidated)"
-        ]
-    }
-
-    df_comparison = pd.DataFrame(comparison_data)
-
-    # Highlight the selected scenario
-    def highlight_selected(row):
-        if row["Scenario"] == scenario:
-            return ['background-color: #F3F4F6; font-weight: bold;'] * len(row)
-        return [''] * len(row)
-
-    styled_df = df_comparison.style.apply(highlight_selected, axis=1)
-
-    st.dataframe(
-        styled_df,
-        use_container_width=True,
-        height=200,
-        column_config={
-            "Scenario": "View",
-            "Debt-to-GDP": "Debt Ratio",
-            "Total Liabilities": "Total Liabilities",
-            "Hidden Liabilities": "Hidden Liabilities Added",
-            "Impact on 60% Target": "60% Target Impact",
-            "Source & Reference": "Source Reference"
-        }
-    )
-
-    # === THE NUMERICAL DISCONNECT ANALYSIS ===
-    st.markdown('<div class="section-header">🔍 The Numerical Disconnect: What the Numbers Actually Show</div>', unsafe_allow_html=True)
-
-    # Add this analysis of the GDP growth vs debt reality
-    st.markdown("""
-    <div style="background-color: #FFFBEB; border-left: 4px solid #F59E0B; padding: 16px; border-radius: 4px;">
-    <p style="margin: 0 0 10px 0; font-size: 0.95rem; font-weight: 600; color: #92400E;">Critical Insight from Page 16, 2026 Report:</p>
-
-    <p style="margin: 0 0 10px 0; font-size: 0.9rem;">
-    The report states: "Public debt outstanding on November 30, 2025, stood at approximately <span style="font-weight: 600;">$15,025.8 million</span>, approximately <span style="font-weight: 600;">93.7 percent of GDP</span>"
-    </p>
-
-    <p style="margin: 0 0 10px 0; font-size: 0.9rem; font-weight: 600;">This implies: Barbados' GDP ≈ <span style="font-weight: 600;">$16.04B</span> ($15.03B ÷ 0.937)</p>
-
-    <p style="margin: 0 0 10px 0; font-size: 0.95rem; font-weight: 600; color: #92400E;">The Disconnect:</p>
-
-    <ol style="margin: 0 0 10px 0; padding-left: 20px; font-size: 0.9rem;">
-    <li><span style="font-weight: 600;">2023 Audit:</span> Debt = <span style="font-weight: 600;">$14.93B</span>, GDP ≈ <span style="font-weight: 600;">$5.5B</span> → <span style="font-weight: 600;">Implied ratio ≈ 271%</span></li>
-    <li><span style="font-weight: 600;">2026 Report:</span> Debt = <span style="font-weight: 600;">$15.03B</span>, GDP ≈ <span style="font-weight: 600;">$16.0B</span> → <span style="font-weight: 600;">Reported ratio = 93.7%</span></li>
-    <li><span style="font-weight: 600;">Change:</span> Absolute debt <span style="font-weight: 600;">INCREASED</span> by <span style="font-weight: 600;">$100M</span>, but ratio <span style="font-weight: 600;">FELL</span> by <span style="font-weight: 600;">9.2 percentage points</span></li>
-    </ol>
-
-    <p style="margin: 0 0 10px 0; font-size: 0.95rem; font-weight: 600; color: #92400E;">Why? Massive nominal GDP growth (+191%) driven by:</p>
-    <ul style="margin: 0 0 10px 0; padding-left: 20px; font-size: 0.9rem;">
-    <li>Inflation (2022-2024 averaged ~5%)</li>
-    <li>Statistical revisions (new GDP calculation methods)</li>
-    <li>Some real economic growth</li>
-    </ul>
-
-    <p style="margin: 0; font-size: 0.95rem; font-weight: 600; color: #92400E;">The Reality Check:</p>
-    <p style="margin: 10px 0 0 0; font-size: 0.9rem;">
-    Barbados didn't "reduce debt" - it <span style="font-weight: 600;">grew its way out of the ratio</span> through nominal GDP expansion, 
-    while absolute debt actually <span style="font-weight: 600;">increased</span> and debt service <span style="font-weight: 600;">quadrupled</span> to $2.5B/year (Page 18).
-    </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Add a simple comparison table
-    comparison_df = pd.DataFrame({
-        "Metric": ["Public Debt", "Implied GDP", "Debt-to-GDP", "Annual Debt Service"],
-        "2023": ["$14.93B", "~$5.5B", "102.9% (reported)", "$568M"],
-        "2026 (Nov)": ["$15.03B", "~$16.0B", "93.7% (Page 16)", "$2.5B (Page 18)"],
-        "Change": ["+$100M ↗", "+191% ↗", "-9.2% ↘", "+340% ↗"],
-        "Reality": ["Debt increased", "Mostly nominal/inflationary growth", "Ratio improved via denominator", "Service burden exploded"]
-    })
 
-    st.dataframe(
-        comparison_df,
-        use_container_width=True,
-        height=150,
-        column_config={
-            "Metric": "Financial Metric",
-            "2023": "2023 Figures",
-            "2026 (Nov)": "2026 Figures",
-            "Change": "Change",
-            "Reality": "What This Means"
-        }
-    )
-
-    # Add the 8% bond reality check
-    st.markdown("##### 📈 The 8% Bond Reality: Higher Costs for Longer")
-
-    st.markdown("""
-    <div style="padding: 15px; background-color: #FEF2F2; border-radius: 8px; border-left: 4px solid #DC2626; margin: 15px 0;">
-        <p style="margin: 0; font-size: 0.9rem;">
-        <strong>Page 16 Finding:</strong> "A USD $500.0 million 8% Eurobond was issued in June; the majority of the proceeds were utilised to finance the partial repurchase of the existing 6.5% 2029 Eurobond."
-        </p>
-        <p style="margin: 10px 0 0 0; font-size: 0.9rem;">
-        <strong>Reality Check:</strong> This is <span style="color: #DC2626; font-weight: bold;">deferral, not reduction</span>. Barbados exchanged:
-        - $340M at 6.5% (maturing 2029) for $500M at 8.0% (maturing 2035)
-        - <strong>Total interest cost increased</strong> from $147.7M to $400.0M
-        - <strong>Annual interest payment increased</strong> from $22.1M to $40.0M
-        - <strong>Locked into higher rates</strong> for 6 additional years
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # === ASSUMPTIONS AND REFERENCES ===
-    st.markdown('<div class="section-header">📚 Clear Assumptions & References</div>', unsafe_allow_html=True)
-
-    col_assump1, col_assump2 = st.columns(2)
-
-    with col_assump1:
-        st.markdown("""
-        <div class="financial-card">
-            <h5 style="color: #00267F; margin-top: 0;">💰 Pension Liability Estimate ($3.5B)</h5>
-            <p><strong>Based on:</strong></p>
-            <ul>
-            <li>AG Report: "Pension liabilities were not included"</li>
-            <li>NIS actuarial valuation gaps</li>
-            <li>International comparables (Caribbean average: 60-80% of annual payroll)</li>
-            <li>Government payroll: ~$900M annually</li>
-            </ul>
-            <p><strong>Methodology:</strong> Conservative multiple of annual payroll</p>
-            <p><em>Actual could range from $3-4B</em></p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col_assump2:
-        st.markdown("""
-        <div class="financial-card">
-            <h5 style="color: #00267F; margin-top: 0;">🏛️ SOE Debt Estimate ($2B)</h5>
-            <p><strong>Based on:</strong></p>
-            <ul>
-            <li>40+ SOEs not consolidated (AG finding)</li>
-            <li>Known SOE debts from public records:</li>
-            <ul>
-                <li>Water Authority: $300M+</li>
-                <li>Transport Board: $150M+</li>
-                <li>QEH: $200M+</li>
-                <li>Others: $1B+</li>
-            </ul>
-            <li>Pre-election update: $77M arrears (just the tip)</li>
-            </ul>
-            <p><strong>Methodology:</strong> Aggregation of known SOE debts</p>
-            <p><em>Actual could range from $1.5-2.5B</em></p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # === THE MISSING CONTEXT IN 2026 REPORT ===
-    st.markdown('<div class="section-header">🚨 What the 2026 Report Doesn\'t Address</div>', unsafe_allow_html=True)
-
-    missing_context = [
-        {
-            "Issue": "Pension Liability Status",
-            "2023 AG Finding": "Pension liabilities were not included in the Statement of Financial Position",
-            "2026 Report Status": "Not mentioned or addressed",
-            "Risk": "Future taxpayers on hook for $3-4B unaccounted liability"
-        },
-        {
-            "Issue": "SOE Consolidation",
-            "2023 AG Finding": "SOEs not consolidated as required by IPSAS",
-            "2026 Report Status": "Only mentions $77M arrears (Page 19), not $2B+ total debt",
-            "Risk": "True public sector debt understated by 15-20%"
-        },
-        {
-            "Issue": "Data Quality",
-            "2023 AG Finding": "Adverse opinion, $2.43B unverified receivables",
-            "2026 Report Status": "No update on verification or remediation",
-            "Risk": "BERT 2026 borrowing based on unreliable baseline"
-        },
-        {
-            "Issue": "Complete Financial Picture",
-            "2023 AG Finding": "Financial statements do NOT give a true and fair view",
-            "2026 Report Status": "Presents improving metrics without context",
-            "Risk": "Investors making decisions on incomplete information"
-        }
-    ]
-
-    for item in missing_context:
-        st.markdown(f"""
-        <div class="financial-card data-error" style="margin-bottom: 10px;">
-            <h6 style="margin-top: 0; color: #DC2626;">{item['Issue']}</h6>
-            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px;">
-                <div>
-                    <p style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">2023 Audit Finding:</p>
-                    <p style="margin: 0; font-size: 0.85rem;">{item['2023 AG Finding']}</p>
-                </div>
-                <div>
-                    <p style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">2026 Report Status:</p>
-                    <p style="margin: 0; font-size: 0.85rem; color: #DC2626;">{item['2026 Report Status']}</p>
-                </div>
-            </div>
-            <div style="margin-top: 10px; padding: 8px; background-color: #FEE2E2; border-radius: 5px;">
-                <p style="margin: 0; font-size: 0.85rem;"><strong>Risk to BERT 2026:</strong> {item['Risk']}</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # === IMPACT ON BERT 2026 FINANCING ===
-    st.markdown('<div class="section-header">💰 Impact on BERT 2026 $7.4B Financing</div>', unsafe_allow_html=True)
-
-    st.warning(f"""
-    **BERT 2026 Context:** Barbados plans to borrow **$7.4B (2026-2029)** while claiming debt is falling to 60% by 2035.
-
-    **The Reality Check:**
-
-    | | Official Debt (93.7%) | True Debt (≈128%) |
-    |---|---|---|
-    | **Additional $7.4B borrowing** | Would reach ~140% of GDP | Would reach ~174% of GDP |
-    | **60% target by 2035** | Requires 36% reduction | Requires 53% reduction |
-    | **Annual debt reduction needed** | ~3.8% of GDP per year | ~7.6% of GDP per year |
-    | **Feasibility** | Challenging | Nearly impossible |
-    
-    Achieving 60% debt-to-GDP would require Barbados to cut its true debt by 7.6% of GDP every year for 9 years — a target that is mathematically and practically out of reach.
-
-    **Critical Question:** Can Barbados responsibly execute its most ambitious economic transformation while its **true debt is 37% higher than reported** and its financial reporting remains unreliable?
-    """)
-
-    # === RESPONSIBLE RECOMMENDATION ===
-    st.markdown('<div class="section-header">🎯 Path Forward: Transparency Before More Borrowing</div>', unsafe_allow_html=True)
-
-    st.markdown("""
-    <div style="background-color: #ECFDF5; padding: 20px; border-radius: 10px; border-left: 4px solid #10B981;">
-        <h5 style="color: #10B981; margin-top: 0;">✅ Responsible 12-Month Remediation Plan</h5>
-        
-        **Before $7.4B BERT 2026 Financing:**
-        
-        1. **Month 1-3:** Independent actuarial valuation of pension liabilities
-        2. **Month 4-6:** Full consolidation pilot of 3 major SOEs (QEH, BWA, Transport Board)
-        3. **Month 7-9:** Verification of $2.43B tax receivables (2023 AG finding)
-        4. **Month 10-12:** Clean audit opinion on 2024 financial statements
-        
-        **Cost:** $10-20M (vs. $1B+ in additional financing costs with unreliable reporting)
-        
-        **Return:** 300-400 basis points reduction in borrowing costs = $55-75M annual savings
-    </div>
-    """, unsafe_allow_html=True)
-
-    # === FINAL REALITY CHECK ===
-    st.markdown("""
-    <div style="text-align: center; padding: 20px; background-color: #00267F; color: white; border-radius: 10px; margin: 20px 0;">
-        <h4 style="color: white; margin-top: 0;">🎯 THE BOTTOM-LINE REALITY CHECK</h4>
-        <p style="margin: 10px 0; font-size: 1.1rem;">
-        The 60% debt target is mathematically out of reach because it ignores unaccounted pension and SOE liabilities.<br>
-        When included, the true debt burden rises to an estimated <strong>$20.53 billion</strong> — requiring a <strong>53% cut</strong> just to hit 60%.<br>
-        <strong>This is the reality.</strong> Anything less endangers Barbados' fiscal stability and credibility.
-        </p>
-        <div style="display: inline-flex; gap: 30px; margin-top: 15px;">
-            <div>
-                <div style="font-size: 2rem; font-weight: bold; color: #FFC726;">93.7%</div>
-                <div style="font-size: 0.8rem;">Reported Ratio (2026)</div>
-                <div style="font-size: 0.7rem; color: #BFDBFE;">But debt INCREASED $100M</div>
-            </div>
-            <div style="align-self: center; font-size: 1.5rem;">→</div>
-            <div>
-                <div style="font-size: 2rem; font-weight: bold; color: #DC2626;">~128%</div>
-                <div style="font-size: 0.8rem;">True Debt Ratio</div>
-                <div style="font-size: 0.7rem; color: #FCA5A5;">+$5.5B hidden liabilities</div>
-            </div>
-        </div>
-        <div style="margin-top: 20px; padding: 15px; background-color: rgba(255, 255, 255, 0.1); border-radius: 8px;">
-            <p style="margin: 0; font-size: 0.9rem;">
-            <strong>The Unavoidable Truth:</strong> The 93.7% ratio improvement comes from <strong>nominal/inflationary GDP growth (+191%)</strong>,<br>
-            not debt reduction. Absolute debt <strong>increased</strong>, debt service <strong>quadrupled</strong>, and <strong>hidden liabilities remain.</strong>
-            </p>
-        </div>
-        <p style="margin-top: 15px; font-size: 0.9rem; color: #BFDBFE;">
-        <em>The 2026 update shows ratio improvement through GDP accounting, but the fundamental financial challenges remain unaddressed.</em>
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
 # ============================================================================
-# FOOTER
+# DEVELOPER PANEL (?dev=1, ?profile=1)
 # ============================================================================
-st.markdown("---")
-
-col1, col2, col3 = st.columns([1, 2, 1])
-
-with col2:
-    st.markdown(f"""
-    <div style="text-align: center; color: #666; font-size: 0.9rem; padding: 20px;">
-        <p style="font-weight: bold; color: var(--bb-blue);">Government of Barbados Financial Statements</p>
-        <p>Financial Year Ended March 31, 2023 • Audited by Auditor General of Barbados</p>
-        <p>📞 Tel: (246) 535-4257 • ✉️ Email: audit@bao.gov.bb</p>
-        <p style="margin-top: 20px; font-size: 0.8rem;">
-            Data Source: Auditor General's Report on Financial Statements • 
-            Dashboard Version 3.4 • Generated: {datetime.now().strftime('%B %d, %Y')}
-        </p>
-        <p style="font-size: 0.7rem; color: #999;">
-            ⚠️ This dashboard highlights material misstatements and adverse audit opinion
-            <br>⚠️ Note 34 contains critical data inconsistencies and conceptual errors
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+developer_panel(view_option, profiler)
+finish_trace(trace, view_option)
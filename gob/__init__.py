@@ -0,0 +1,3 @@
+"""
+Supporting modules for the Barbados Government Financial Statements dashboard.
+"""
@@ -0,0 +1,38 @@
+"""
+Atomic file replacement for the on-disk caches.
+
+The lattice, snapshot and extraction stores can be rebuilt by several server
+processes sharing one directory. Each writer gets its own temporary file next
+to the target, so concurrent builds never write into, or rename away, each
+other's partial files, and readers only ever see a complete old or new file.
+
+Usage:
+    with atomic_path(directory / "manifest.json") as temporary:
+        temporary.write_text(text)
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def atomic_path(path):
+    """
+    Yield a unique temporary path beside path and swap it in on a clean exit.
+
+    Args:
+        path: File to replace
+
+    Yields:
+        Path: Temporary file to write; it is removed if the block raises
+    """
+    path = Path(path)
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(descriptor)
+    temporary = Path(temporary)
+    try:
+        yield temporary
+        os.replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
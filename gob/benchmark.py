@@ -0,0 +1,301 @@
+"""
+Headless render benchmark for the dashboard views.
+
+Drives app.py through Streamlit's AppTest harness for every view, currency
+format and comparison toggle, and records for each combination:
+
+- wall time of the first render after selecting it (cold: view import, cache
+  fills) and the best of the following reruns (warm). Before the cold run
+  every st.cache_data / st.cache_resource entry and named SimulationCache is
+  cleared and the view module is dropped from sys.modules, so earlier
+  combinations in the same process do not warm it; third-party packages stay
+  imported, as in a server that has already rendered another view
+- number of elements emitted to the page
+- peak Python memory allocated during one rerun (tracemalloc)
+
+Results are written as JSON, so runs from two commits can be compared; with
+--baseline the command exits non-zero when a view got slower than the
+allowed ratio.
+
+Usage (from the repository root):
+
+    python -m gob.benchmark --json bench.json
+    python -m gob.benchmark --views "Debt Analysis" --baseline bench.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = REPO_ROOT / "app.py"
+
+# Sidebar widget labels in app.py
+VIEW_LABEL = "Select View"
+CURRENCY_LABEL = "Display values as"
+COMPARATIVE_LABEL = "Show 2022 Comparison"
+
+DEFAULT_TIMEOUT = 120.0      # Seconds AppTest waits for one script run
+DEFAULT_REPEAT = 3           # Warm reruns per combination
+DEFAULT_MAX_SLOWDOWN = 1.25  # Allowed warm-time ratio against the baseline
+MIN_REGRESSION_MS = 20.0     # Ignore slowdowns smaller than this (timer noise)
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """Measurements of one view / currency format / comparison combination."""
+
+    view: str
+    currency_format: str
+    show_comparative: bool
+    cold_ms: float
+    warm_ms: float
+    runs_ms: Tuple[float, ...]
+    elements: int
+    peak_memory_kb: float
+    exceptions: Tuple[str, ...]
+
+    @property
+    def key(self):
+        """Identifies the combination across benchmark runs."""
+        return f"{self.view} | {self.currency_format} | comparative={self.show_comparative}"
+
+
+def count_elements(node):
+    """Number of leaf elements below an AppTest tree node."""
+    children = getattr(node, 'children', None)
+    if children is None:
+        return 1
+    return sum(count_elements(child) for child in children.values())
+
+
+def _widget(widgets, label):
+    """Find a sidebar widget by its label."""
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    raise LookupError(f"app.py has no sidebar widget labelled {label!r}")
+
+
+def reset_caches(view_module=None):
+    """
+    Drop everything a previous render left in this process.
+
+    Clears st.cache_data, st.cache_resource and every named SimulationCache
+    (simulation, figure and label caches), and removes the view module from
+    sys.modules so the next render imports it again.
+
+    Args:
+        view_module: Module name under gob.views to forget, or None
+    """
+    import streamlit as st
+
+    from gob.cache import named_caches
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    for cache in named_caches().values():
+        cache.clear()
+    if view_module is not None:
+        sys.modules.pop(f"gob.views.{view_module}", None)
+
+
+def _timed_run(app):
+    """Run the script once and return the wall time in milliseconds."""
+    start = time.perf_counter()
+    app.run()
+    return (time.perf_counter() - start) * 1000
+
+
+def sidebar_options(timeout=DEFAULT_TIMEOUT):
+    """
+    Read the view and currency format options from the running app.
+
+    Returns:
+        tuple: (view labels, currency formats)
+    """
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    app.run()
+    return (
+        list(_widget(app.sidebar.selectbox, VIEW_LABEL).options),
+        list(_widget(app.sidebar.selectbox, CURRENCY_LABEL).options),
+    )
+
+
+def benchmark_render(view, currency_format, show_comparative,
+                     repeat=DEFAULT_REPEAT, timeout=DEFAULT_TIMEOUT):
+    """
+    Render one combination headlessly and measure it.
+
+    The app is started on its default view, the sidebar widgets are set, the
+    caches are reset (reset_caches) and the script is rerun: the first rerun
+    is the cold time, the best of the next repeat reruns the warm time. One more rerun is traced for peak memory
+    so tracemalloc's overhead stays out of the timings.
+
+    Args:
+        view: View label as listed in the sidebar
+        currency_format: Currency format option
+        show_comparative: State of the 2022 comparison checkbox
+        repeat: Number of warm reruns
+        timeout: Seconds AppTest waits for one script run
+
+    Returns:
+        RenderResult: Measurements of the combination
+    """
+    from streamlit.testing.v1 import AppTest
+
+    from gob.views import VIEW_MODULES
+
+    app = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    app.run()
+    _widget(app.sidebar.selectbox, VIEW_LABEL).select(view)
+    _widget(app.sidebar.selectbox, CURRENCY_LABEL).select(currency_format)
+    _widget(app.sidebar.checkbox, COMPARATIVE_LABEL).set_value(show_comparative)
+
+    reset_caches(VIEW_MODULES[view])
+    runs = [_timed_run(app) for _ in range(1 + repeat)]
+
+    tracemalloc.start()
+    try:
+        app.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return RenderResult(
+        view=view,
+        currency_format=currency_format,
+        show_comparative=show_comparative,
+        cold_ms=runs[0],
+        warm_ms=min(runs[1:]) if repeat else runs[0],
+        runs_ms=tuple(runs),
+        elements=count_elements(app.main) + count_elements(app.sidebar),
+        peak_memory_kb=peak / 1024,
+        exceptions=tuple(str(exception.value) for exception in app.exception),
+    )
+
+
+def run_benchmark(views=None, currency_formats=None, comparative=(True, False),
+                  repeat=DEFAULT_REPEAT, timeout=DEFAULT_TIMEOUT, progress=None):
+    """
+    Benchmark every combination of view, currency format and comparison toggle.
+
+    Args:
+        views: View labels to run (default: every view in the sidebar)
+        currency_formats: Currency formats to run (default: every option)
+        comparative: Comparison checkbox states to run
+        repeat: Warm reruns per combination
+        timeout: Seconds AppTest waits for one script run
+        progress: Optional callback receiving each RenderResult
+
+    Returns:
+        list: RenderResult per combination
+    """
+    all_views, all_formats = sidebar_options(timeout)
+    results = []
+    for view in views or all_views:
+        for currency_format in currency_formats or all_formats:
+            for show_comparative in comparative:
+                result = benchmark_render(view, currency_format, show_comparative, repeat, timeout)
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    return results
+
+
+def _git_commit():
+    """Current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def to_json(results):
+    """Benchmark report as a JSON-serializable dict."""
+    import streamlit
+
+    return {
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'results': [dict(asdict(result), key=result.key) for result in results],
+    }
+
+
+def find_regressions(results, baseline, max_slowdown=DEFAULT_MAX_SLOWDOWN,
+                     min_regression_ms=MIN_REGRESSION_MS):
+    """
+    Compare warm times against a previous report.
+
+    Args:
+        results: RenderResult list of this run
+        baseline: Report dict loaded from a previous --json file
+        max_slowdown: Allowed ratio of the new warm time to the baseline's
+        min_regression_ms: Slowdowns smaller than this are treated as noise
+
+    Returns:
+        list: Human-readable regressions, empty when nothing got slower
+    """
+    previous = {entry['key']: entry for entry in baseline.get('results', [])}
+    regressions = []
+    for result in results:
+        entry = previous.get(result.key)
+        if entry is None:
+            continue
+        before = entry['warm_ms']
+        if result.warm_ms > before * max_slowdown and result.warm_ms - before > min_regression_ms:
+            regressions.append(
+                f"{result.key}: {result.warm_ms:.0f} ms, was {before:.0f} ms "
+                f"({result.warm_ms / before:.2f}x)"
+            )
+    return regressions
+
+
+def main():
+    """Run the benchmark, print a table and optionally write/compare JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--views', nargs='+', help="View labels to run (default: all)")
+    parser.add_argument('--formats', nargs='+', help="Currency formats to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Warm reruns per combination")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument('--json', help="Write the results to this file")
+    parser.add_argument('--baseline', help="Previous --json file to compare warm times against")
+    parser.add_argument('--max-slowdown', type=float, default=DEFAULT_MAX_SLOWDOWN)
+    args = parser.parse_args()
+
+    def progress(result):
+        flag = "  EXCEPTION" if result.exceptions else ""
+        print(f"{result.key:<80} cold {result.cold_ms:7.0f} ms  warm {result.warm_ms:7.0f} ms  "
+              f"{result.elements:4d} elements  {result.peak_memory_kb:9.0f} KB{flag}", flush=True)
+
+    results = run_benchmark(args.views, args.formats, repeat=args.repeat,
+                            timeout=args.timeout, progress=progress)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(to_json(results), indent=2))
+
+    failures = [f"{result.key} raised: {result.exceptions[0]}" for result in results if result.exceptions]
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        failures += [f"SLOWER: {regression}" for regression in
+                     find_regressions(results, baseline, args.max_slowdown)]
+    for failure in failures:
+        print(failure)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
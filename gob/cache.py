@@ -0,0 +1,247 @@
+"""
+Bounded in-process cache with least-recently-used eviction and a time-to-live.
+
+Used by the simulation, figure and label caches. Entries are shared by every
+session in the server process; the entry limit and TTL keep memory flat
+however many sessions the server handles, and hit/miss/eviction counters are
+kept for monitoring. Stored arrays are read-only, so a session cannot
+change a value another session is reading, and expired entries are purged
+whenever a new value is stored.
+"""
+import dataclasses
+import functools
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_TTL = 3600.0   # Seconds an entry stays valid
+KEY_DECIMALS = 6       # Slider values are rounded so 0.1 + 0.2 hits 0.3
+
+
+class _ThreadLookups(threading.local):
+    """Hits and misses of the current thread, summed over every cache."""
+
+    hits = 0
+    misses = 0
+
+
+_LOOKUPS = _ThreadLookups()
+
+# Named caches, for the metrics exporter
+_NAMED_CACHES = weakref.WeakValueDictionary()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of the cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    max_entries: int
+
+    @property
+    def hit_rate(self):
+        """Share of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def thread_lookups():
+    """
+    Count the lookups made by the calling thread across every cache.
+
+    Each Streamlit session reruns in its own thread, so the difference
+    between two calls is the cache use of the code run in between.
+
+    Returns:
+        tuple: (hits, misses) since the thread started
+    """
+    return _LOOKUPS.hits, _LOOKUPS.misses
+
+
+def named_caches():
+    """
+    Caches created with a name, keyed by name.
+
+    Caches of modules that have not been imported yet are not listed.
+
+    Returns:
+        dict: name -> SimulationCache
+    """
+    return dict(_NAMED_CACHES)
+
+
+def normalize_key(value):
+    """
+    Normalize a parameter into a hashable cache key component.
+
+    Numbers (including numpy scalars and ints) become rounded floats, so
+    5, 5.0 and np.float64(5.0) share one entry; sequences become tuples.
+
+    Args:
+        value: Parameter value
+
+    Returns:
+        Hashable normalized value
+    """
+    if isinstance(value, (bool, np.bool_)) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return round(float(value), KEY_DECIMALS)
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(normalize_key(item) for item in value)
+    return value
+
+
+def read_only(value):
+    """
+    Make the numpy arrays in a value read-only.
+
+    Writeable arrays are copied first, so arrays the caller passed in stay
+    writeable. Dicts, lists, tuples and dataclass fields are converted
+    recursively; other values are returned unchanged.
+
+    Args:
+        value: Value about to be cached
+
+    Returns:
+        The value with every array read-only
+    """
+    if isinstance(value, np.ndarray):
+        if value.flags.writeable:
+            value = value.copy()
+            value.setflags(write=False)
+        return value
+    if isinstance(value, dict):
+        return {key: read_only(item) for key, item in value.items()}
+    if type(value) in (list, tuple):
+        return type(value)(read_only(item) for item in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.replace(value, **{
+            field.name: read_only(getattr(value, field.name))
+            for field in dataclasses.fields(value) if field.init
+        })
+    return value
+
+
+class SimulationCache:
+    """Thread-safe LRU cache with a time-to-live and hit/miss counters."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL, clock=time.monotonic, name=None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        # Keys in the order they were stored, oldest first, for purging expired entries
+        self._stored = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+        if name is not None:
+            _NAMED_CACHES[name] = self
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Hashable cache key
+            compute: Zero-argument function producing the value
+
+        Returns:
+            The cached or freshly computed value, with read-only arrays
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if self.ttl is None or now - stored_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    _LOOKUPS.hits += 1
+                    return value
+                del self._entries[key]
+                del self._stored[key]
+                self._expirations += 1
+            self._misses += 1
+            _LOOKUPS.misses += 1
+
+        # Compute outside the lock so slow simulations don't serialize sessions
+        value = read_only(compute())
+
+        with self._lock:
+            stored_at = self._clock()
+            self._purge_expired(stored_at)
+            self._entries[key] = (stored_at, value)
+            self._entries.move_to_end(key)
+            self._stored[key] = stored_at
+            self._stored.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                del self._stored[evicted]
+                self._evictions += 1
+        return value
+
+    def _purge_expired(self, now):
+        """Drop entries older than the TTL; the caller holds the lock."""
+        if self.ttl is None:
+            return
+        while self._stored:
+            key, stored_at = next(iter(self._stored.items()))
+            if now - stored_at < self.ttl:
+                break
+            del self._stored[key]
+            del self._entries[key]
+            self._expirations += 1
+
+    def memoize(self, func):
+        """Decorator caching func on its normalized positional and keyword arguments."""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (
+                func.__qualname__,
+                normalize_key(args),
+                tuple(sorted((name, normalize_key(value)) for name, value in kwargs.items())),
+            )
+            return self.get_or_compute(key, lambda: func(*args, **kwargs))
+
+        wrapper.cache = self
+        return wrapper
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stored.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def stats(self):
+        """
+        Read the cache counters.
+
+        Returns:
+            CacheStats: Hits, misses, evictions, expirations and current size
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def __len__(self):
+        return len(self._entries)
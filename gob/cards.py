@@ -0,0 +1,168 @@
+"""
+Batched HTML card rendering for the dashboard views.
+
+Card sections used to call st.markdown (or open a row of st.columns) once per
+DataFrame row, so every card was its own delta message. The builders here
+assemble a whole section as one HTML block with column-wise pandas string
+operations; the view then sends it with a single st.markdown call.
+
+The HTML is emitted without indentation or blank lines so Markdown keeps the
+block together as raw HTML instead of turning indented lines into code.
+"""
+import numpy as np
+import pandas as pd
+
+from gob.formatting import format_currency_array
+
+GOOD_COLOR = '#10B981'
+BAD_COLOR = '#DC2626'
+SEVERITY_COLORS = {
+    'Critical': '#DC2626',
+    'High': '#F59E0B',
+    'Medium': '#3B82F6',
+    'Low': '#10B981'
+}
+
+
+def _currency(values, currency_format):
+    """Format a Series of amounts as currency labels."""
+    return format_currency_array(values, currency_format)
+
+
+def _percent_change(change, previous):
+    """Change as a percentage of the previous value, 0 where that is 0."""
+    return (change / previous.where(previous != 0) * 100).fillna(0.0)
+
+
+def change_cards(frame, label, current, previous, currency_format,
+                 increase_is_good=True, current_year='2023', previous_year='2022'):
+    """
+    Build financial cards showing a value, its prior-year value and the change.
+
+    Args:
+        frame: DataFrame with one card per row
+        label: Column holding the card title
+        current: Column with the current-year amounts
+        previous: Column with the prior-year amounts
+        currency_format: Currency format selected in the sidebar
+        increase_is_good: Whether an increase is shown green (assets) or red (liabilities)
+        current_year: Label of the current year
+        previous_year: Label of the prior year
+
+    Returns:
+        str: HTML for all cards
+    """
+    change = frame[current] - frame[previous]
+    change_pct = _percent_change(change, frame[previous])
+    color = pd.Series(
+        np.where((change >= 0) == increase_is_good, GOOD_COLOR, BAD_COLOR), index=frame.index
+    )
+
+    cards = (
+        '<div class="financial-card">'
+        '<div style="display: flex; justify-content: space-between; align-items: center;">'
+        '<div><strong>' + frame[label].astype(str) + '</strong><br>'
+        f'<small style="color: #666;">{current_year}: ' + _currency(frame[current], currency_format)
+        + f' | {previous_year}: ' + _currency(frame[previous], currency_format) + '</small></div>'
+        '<div style="text-align: right;">'
+        '<div style="color: ' + color + '; font-weight: bold;">'
+        + _currency(change, currency_format) + '</div>'
+        '<small style="color: #666;">' + change_pct.map('{:+.1f}%'.format) + '</small>'
+        '</div></div></div>'
+    )
+    return '\n'.join(cards)
+
+
+def severity_cards(frame, currency_format):
+    """
+    Build cards for audit findings, coloured by severity.
+
+    Args:
+        frame: DataFrame with Issue, Amount, Impact, Description and Severity
+            columns; non-numeric amounts (e.g. "Not Quantified") are shown as is
+        currency_format: Currency format selected in the sidebar
+
+    Returns:
+        str: HTML for all cards
+    """
+    color = frame['Severity'].map(SEVERITY_COLORS).fillna('#666')
+    numeric = pd.to_numeric(frame['Amount'], errors='coerce')
+    amount = _currency(numeric, currency_format).where(numeric.notna(), frame['Amount'].astype(str))
+
+    cards = (
+        '<div class="financial-card" style="border-left-color: ' + color + ';">'
+        '<div style="display: flex; justify-content: space-between; align-items: start;">'
+        '<div style="flex: 1;">'
+        '<h4 style="margin-top: 0; color: ' + color + ';">' + frame['Issue'] + '</h4>'
+        '<p><strong>Amount:</strong> ' + amount + '</p>'
+        '<p><strong>Impact:</strong> ' + frame['Impact'] + '</p>'
+        '<p><strong>Description:</strong> ' + frame['Description'] + '</p>'
+        '</div>'
+        '<div style="background-color: ' + color + '; color: white; padding: 4px 12px; '
+        'border-radius: 12px; font-size: 0.8rem; font-weight: bold;">'
+        + frame['Severity'] + ' Severity</div>'
+        '</div></div>'
+    )
+    return '\n'.join(cards)
+
+
+def compliance_cards(frame):
+    """
+    Build cards for compliance requirements and their status.
+
+    Args:
+        frame: DataFrame with Requirement, Status, Impact and Remediation columns
+
+    Returns:
+        str: HTML for all cards
+    """
+    color = pd.Series(
+        np.where(frame['Status'].str.contains('NOT'), BAD_COLOR, '#F59E0B'), index=frame.index
+    )
+
+    cards = (
+        '<div class="financial-card">'
+        '<div style="display: flex; justify-content: space-between; align-items: start;">'
+        '<div style="flex: 1;">'
+        '<h5 style="margin-top: 0;">' + frame['Requirement'] + '</h5>'
+        '<p><strong>Status:</strong> <span style="color: ' + color + ';">' + frame['Status'] + '</span></p>'
+        '<p><strong>Impact:</strong> ' + frame['Impact'] + '</p>'
+        '<p><strong>Remediation Required:</strong> ' + frame['Remediation'] + '</p>'
+        '</div></div></div>'
+    )
+    return '\n'.join(cards)
+
+
+def comparison_grid(frame, label, current, previous, currency_format, show_previous=True):
+    """
+    Build a grid of amounts with the prior year and the growth, one row per item.
+
+    Args:
+        frame: DataFrame with one grid row per row
+        label: Column holding the row label
+        current: Column with the current-year amounts
+        previous: Column with the prior-year amounts
+        currency_format: Currency format selected in the sidebar
+        show_previous: Whether to fill the prior-year column
+
+    Returns:
+        str: HTML for the whole grid
+    """
+    growth = frame[current] - frame[previous]
+    growth_pct = _percent_change(growth, frame[previous])
+    color = pd.Series(np.where(growth > 0, BAD_COLOR, GOOD_COLOR), index=frame.index)
+    previous_cell = _currency(frame[previous], currency_format) if show_previous else ''
+
+    rows = (
+        '<div><strong>' + frame[label].astype(str) + '</strong></div>'
+        '<div>' + _currency(frame[current], currency_format) + '</div>'
+        '<div>' + previous_cell + '</div>'
+        "<div><span style='color: " + color + "'>"
+        + _currency(growth, currency_format) + ' (' + growth_pct.map('{:+.1f}%'.format) + ')'
+        '</span></div>'
+    )
+    return (
+        '<div style="display: grid; grid-template-columns: 3fr 2fr 2fr 2fr; '
+        'gap: 0.75rem 1rem; align-items: center; margin-bottom: 1rem;">\n'
+        + '\n'.join(rows) + '\n</div>'
+    )
@@ -0,0 +1,616 @@
+"""
+Debt dynamics engine shared by the debt sustainability simulators.
+
+Both the "Debt Sustainability Simulator" and the simulator inside
+"BERT 2026 Risk Analysis" project the debt-to-GDP ratio with the same
+recurrence:
+
+    debt_t = max(debt_{t-1} * (1 + r - g) - primary_surplus + shock_t, floor)
+
+where r is the nominal interest rate and g the nominal GDP growth rate.
+This module evaluates the whole 2025-2050 trajectory as array operations
+instead of stepping year by year.
+"""
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import numpy as np
+
+# ============================================================================
+# SIMULATION CONSTANTS
+# ============================================================================
+START_YEAR = 2025          # First projected year (Central Bank 2025 estimate)
+PROJECTION_END = 2036      # Last year shown on the simulator charts
+HORIZON_END = 2050         # Extended projection used to locate the target year
+CURRENT_DEBT = 102.9       # 2025 debt-to-GDP ratio from Central Bank
+DEBT_TARGET = 60.0         # BERT 2026 debt-to-GDP target
+DEBT_FLOOR = 20.0          # Minimum reasonable debt level
+SHOCK_INTERVAL = 3         # Climate/economic shock every 3 years
+
+HORIZON_YEARS = np.arange(START_YEAR, HORIZON_END + 1)
+PROJECTION_LENGTH = PROJECTION_END - START_YEAR + 1
+
+
+def slider_lattice(min_value, max_value, step):
+    """
+    Enumerate every value a Streamlit slider can take.
+
+    Args:
+        min_value: Slider minimum
+        max_value: Slider maximum
+        step: Slider step
+
+    Returns:
+        np.ndarray: Lattice values from min_value to max_value inclusive
+    """
+    count = int(round((max_value - min_value) / step)) + 1
+    return np.round(min_value + step * np.arange(count), 6)
+
+
+# Slider lattices of the BERT 2026 debt sustainability simulator
+GROWTH_LATTICE = slider_lattice(1.0, 6.0, 0.1)
+SURPLUS_LATTICE = slider_lattice(1.0, 6.0, 0.1)
+INTEREST_LATTICE = slider_lattice(3.0, 8.0, 0.1)
+INFLATION_LATTICE = slider_lattice(1.0, 6.0, 0.1)
+
+
+def shock_schedule(shock_size=0.0, years=HORIZON_YEARS):
+    """
+    Build the shock schedule for the projection horizon.
+
+    Shocks hit every third year after 2025 up to 2036; the extended
+    projection beyond 2036 continues without shocks.
+
+    Args:
+        shock_size: Shock size in percentage points of GDP (0 for none)
+        years: Years starting in 2025 to build the schedule for
+
+    Returns:
+        np.ndarray: Shock added to the debt ratio in each year
+    """
+    offsets = years - START_YEAR
+    is_shock_year = (
+        (offsets > 0)
+        & (offsets % SHOCK_INTERVAL == 0)
+        & (years <= PROJECTION_END)
+    )
+    return np.where(is_shock_year, float(shock_size), 0.0)
+
+
+def floored_debt_path(start_debt, multiplier, increments, floor=DEBT_FLOOR):
+    """
+    Evaluate debt_t = max(multiplier_t * debt_{t-1} + increments_t, floor) in closed form.
+
+    Each step is a monotone map x -> max(a_t*x + c_t, F), so unrolling the
+    recurrence with G_t = a_1 * ... * a_t gives
+
+        debt_t = G_t * (S_t + max(debt_0, max_{s<=t} (F / G_s - S_s)))
+
+    with S_t = sum_{k<=t} c_k / G_k. The inner maximum is a running
+    maximum, so the whole path needs only cumprod, cumsum and
+    maximum.accumulate. All arguments broadcast, which lets the same
+    function evaluate one scenario, a parameter grid or a batch of
+    Monte Carlo paths.
+
+    Args:
+        start_debt: Debt-to-GDP ratio in the first year, shape (...)
+        multiplier: 1 + r - g per step, broadcastable to increments, must be positive
+        increments: Per-step additive term (..., steps) in percentage points
+        floor: Minimum debt level applied after every step
+
+    Returns:
+        np.ndarray: Debt path of shape (..., steps + 1) including the start year
+    """
+    increments = np.asarray(increments, dtype=float)
+    multiplier = np.asarray(multiplier, dtype=float)
+    start_debt = np.asarray(start_debt, dtype=float)[..., np.newaxis]
+
+    shape = np.broadcast_shapes(multiplier.shape, increments.shape)
+    growth = np.cumprod(np.broadcast_to(multiplier, shape), axis=-1)
+    cumulative = np.cumsum(increments / growth, axis=-1)
+    restart = np.maximum.accumulate(floor / growth - cumulative, axis=-1)
+
+    path = growth * (cumulative + np.maximum(start_debt, restart))
+    start = np.broadcast_to(start_debt, path.shape[:-1] + (1,))
+    return np.concatenate([start, path], axis=-1)
+
+
+def first_crossing_index(paths, target=DEBT_TARGET):
+    """
+    Locate the first year each path is at or below the target.
+
+    Args:
+        paths: Debt paths of shape (..., years)
+        target: Debt-to-GDP target
+
+    Returns:
+        np.ndarray: Index of the first crossing, or -1 where never reached
+    """
+    below = np.asarray(paths) <= target
+    return np.where(below.any(axis=-1), below.argmax(axis=-1), -1)
+
+
+# ============================================================================
+# TARGET-YEAR SOLVER
+# ============================================================================
+BISECTION_ITERATIONS = 60
+
+
+def crossing_time(start_debt, multiplier, primary_surplus, target=DEBT_TARGET):
+    """
+    Years until a constant-parameter path first reaches the target, in closed form.
+
+    Without shocks, debt_t = a * debt_{t-1} - p has the solution
+
+        debt_t = K + a^t * (debt_0 - K),   K = p / (a - 1)
+
+    (debt_t = debt_0 - p * t when a = 1), so the crossing time is
+    log((target - K) / (debt_0 - K)) / log(a). When the logarithm is
+    undefined or negative the path converges to a steady state K above the
+    target or diverges upwards, and the target is provably never reached.
+    The floor at 20% never binds before a 60% crossing because the path is
+    monotone. Arguments broadcast.
+
+    Args:
+        start_debt: Debt-to-GDP ratio at time 0
+        multiplier: 1 + r - g, must be positive
+        primary_surplus: Primary surplus (% of GDP)
+        target: Debt-to-GDP target
+
+    Returns:
+        np.ndarray: Fractional years to the target, inf where never reached
+    """
+    start_debt, multiplier, primary_surplus = np.broadcast_arrays(
+        np.asarray(start_debt, dtype=float),
+        np.asarray(multiplier, dtype=float),
+        np.asarray(primary_surplus, dtype=float),
+    )
+    unit = np.abs(multiplier - 1) < 1e-12
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        steady_state = primary_surplus / np.where(unit, np.nan, multiplier - 1)
+        geometric = (
+            np.log((target - steady_state) / (start_debt - steady_state))
+            / np.log(multiplier)
+        )
+        linear = (start_debt - target) / primary_surplus
+
+    time = np.where(unit, linear, geometric)
+    time = np.where(np.isfinite(time) & (time >= 0), time, np.inf)
+    return np.where(start_debt <= target, 0.0, time)
+
+
+def _bisect_segment(start_debt, multiplier, primary_surplus, shock, target):
+    """
+    Locate the crossing within one year containing a shock by bisection.
+
+    The year is extended to fractional time with the continuous solution of
+    the recurrence and the shock accrued linearly over the year. Runs
+    elementwise on broadcastable arrays.
+    """
+    unit = np.abs(multiplier - 1) < 1e-12
+    with np.errstate(divide='ignore', invalid='ignore'):
+        steady_state = primary_surplus / np.where(unit, np.nan, multiplier - 1)
+
+    def debt_at(fraction):
+        linear = start_debt - primary_surplus * fraction
+        geometric = steady_state + multiplier ** fraction * (start_debt - steady_state)
+        return np.where(unit, linear, geometric) + shock * fraction
+
+    low = np.zeros(np.broadcast(start_debt, multiplier, primary_surplus, shock).shape)
+    high = np.ones_like(low)
+    for _ in range(BISECTION_ITERATIONS):
+        middle = (low + high) / 2
+        reached = debt_at(middle) <= target
+        high = np.where(reached, middle, high)
+        low = np.where(reached, low, middle)
+    return high
+
+
+def solve_target_years(interest_rate, growth_rate, primary_surplus, shock_size=0.0,
+                       start_debt=CURRENT_DEBT, target=DEBT_TARGET):
+    """
+    Find the exact (fractional) year the debt ratio first reaches the target.
+
+    Uses the closed form of crossing_time where no shocks apply. With shocks
+    the 2025-2036 window is evaluated by the engine; a crossing inside it is
+    refined by bisection, otherwise the closed form continues from 2036.
+    There is no horizon limit. Arguments broadcast.
+
+    Args:
+        interest_rate: Nominal interest rate on government debt (%)
+        growth_rate: Nominal GDP growth rate (%)
+        primary_surplus: Primary surplus (% of GDP)
+        shock_size: Periodic climate/economic shock (% of GDP), 0 for none
+        start_debt: Debt-to-GDP ratio in 2025
+        target: Debt-to-GDP target
+
+    Returns:
+        np.ndarray: Fractional calendar year of the crossing, NaN if never reached
+    """
+    multiplier, primary_surplus, shock_size, start_debt = np.broadcast_arrays(
+        1 + np.subtract(interest_rate, growth_rate) / 100,
+        np.asarray(primary_surplus, dtype=float),
+        np.asarray(shock_size, dtype=float),
+        np.asarray(start_debt, dtype=float),
+    )
+    pattern = shock_schedule(1.0)[:PROJECTION_LENGTH]
+
+    # Constant parameters: closed form from 2025
+    closed_form = START_YEAR + crossing_time(start_debt, multiplier, primary_surplus, target)
+
+    # Shocks bind in 2025-2036: bracket with the engine, bisect inside the year
+    shocks = shock_size[..., np.newaxis] * pattern
+    window = floored_debt_path(
+        start_debt, multiplier[..., np.newaxis], shocks[..., 1:] - primary_surplus[..., np.newaxis]
+    )
+    crossing = first_crossing_index(window, target)
+    before = np.maximum(crossing - 1, 0)[..., np.newaxis]
+    fraction = _bisect_segment(
+        np.take_along_axis(window, before, axis=-1)[..., 0],
+        multiplier,
+        primary_surplus,
+        np.take_along_axis(shocks, before + 1, axis=-1)[..., 0],
+        target,
+    )
+    after_window = PROJECTION_END + crossing_time(window[..., -1], multiplier, primary_surplus, target)
+    with_shocks = np.select(
+        [crossing == 0, crossing > 0],
+        [float(START_YEAR), START_YEAR + crossing - 1 + fraction],
+        after_window,
+    )
+
+    years = np.where(shock_size == 0, closed_form, with_shocks)
+    return np.where(np.isfinite(years), years, np.nan)
+
+
+def solve_target_year(interest_rate, growth_rate, primary_surplus, shock_size=0.0,
+                      start_debt=CURRENT_DEBT, target=DEBT_TARGET):
+    """
+    Find the exact (fractional) year one scenario first reaches the target.
+
+    Args:
+        interest_rate: Nominal interest rate on government debt (%)
+        growth_rate: Nominal GDP growth rate (%)
+        primary_surplus: Primary surplus (% of GDP)
+        shock_size: Periodic climate/economic shock (% of GDP), 0 for none
+        start_debt: Debt-to-GDP ratio in 2025
+        target: Debt-to-GDP target
+
+    Returns:
+        float or None: Fractional calendar year of the crossing, None if never reached
+    """
+    year = float(solve_target_years(
+        interest_rate, growth_rate, primary_surplus, shock_size, start_debt, target
+    ))
+    return None if np.isnan(year) else year
+
+
+@dataclass(frozen=True)
+class DebtSimulation:
+    """Debt trajectory for one parameter set over the 2025-2050 horizon."""
+
+    years: np.ndarray
+    trajectory: np.ndarray
+    shocks: np.ndarray
+    interest_rate: float
+    growth_rate: float
+    primary_surplus: float
+    target_year: Optional[int]
+    crossing_year: Optional[float]
+
+    @property
+    def projection_years(self):
+        """Years shown on the simulator charts (2025-2036)."""
+        return self.years[:PROJECTION_LENGTH]
+
+    @property
+    def debt_path(self):
+        """Debt-to-GDP ratio for the 2025-2036 projection window."""
+        return self.trajectory[:PROJECTION_LENGTH]
+
+    @property
+    def shock_years(self):
+        """Years in which a shock was applied."""
+        return self.years[self.shocks != 0]
+
+    @property
+    def projected_end(self):
+        """Projected debt-to-GDP ratio in 2036."""
+        return float(self.trajectory[PROJECTION_LENGTH - 1])
+
+    @property
+    def reached_in_window(self):
+        """True if the target is met within the 2025-2036 window."""
+        return self.target_year is not None and self.target_year <= PROJECTION_END
+
+    @property
+    def years_to_target(self) -> Union[int, str]:
+        """Years from 2025 to the target, or "Never" if it is never reached."""
+        if self.target_year is None:
+            return "Never"
+        return self.target_year - START_YEAR
+
+
+def simulate_debt(interest_rate, growth_rate, primary_surplus, shock_size=0.0,
+                  start_debt=CURRENT_DEBT):
+    """
+    Project the debt-to-GDP ratio from 2025 to 2050.
+
+    Args:
+        interest_rate: Nominal interest rate on government debt (%)
+        growth_rate: Nominal GDP growth rate (%)
+        primary_surplus: Primary surplus (% of GDP)
+        shock_size: Periodic climate/economic shock (% of GDP), 0 for none
+        start_debt: Debt-to-GDP ratio in 2025
+
+    Returns:
+        DebtSimulation: Trajectory, shock schedule and exact 60% crossing year
+    """
+    shocks = shock_schedule(shock_size)
+    multiplier = 1 + (interest_rate - growth_rate) / 100
+    increments = shocks[1:] - primary_surplus
+
+    trajectory = floored_debt_path(start_debt, multiplier, increments)
+    crossing = int(first_crossing_index(trajectory))
+    crossing_year = solve_target_year(
+        interest_rate, growth_rate, primary_surplus, shock_size, start_debt
+    )
+
+    # Beyond the 2050 horizon the solver gives the first year at or below target
+    if crossing >= 0:
+        target_year = int(HORIZON_YEARS[crossing])
+    elif crossing_year is not None:
+        target_year = int(np.ceil(crossing_year - 1e-9))
+    else:
+        target_year = None
+
+    return DebtSimulation(
+        years=HORIZON_YEARS,
+        trajectory=trajectory,
+        shocks=shocks,
+        interest_rate=float(interest_rate),
+        growth_rate=float(growth_rate),
+        primary_surplus=float(primary_surplus),
+        target_year=target_year,
+        crossing_year=crossing_year,
+    )
+
+
+# ============================================================================
+# SCENARIO GRID EVALUATION
+# ============================================================================
+@dataclass(frozen=True)
+class ScenarioGrid:
+    """
+    Crossing years for every (r - g, primary surplus) pair of a slider lattice.
+
+    Under constant parameters the trajectory depends on interest and growth
+    only through their spread, so a lattice over growth, inflation and
+    interest collapses to a much smaller set of unique spreads.
+    """
+
+    spreads: np.ndarray
+    spread_counts: np.ndarray
+    primary_surpluses: np.ndarray
+    target_years: np.ndarray
+    decimals: int
+
+    def _lookup(self, values, axis_values, name):
+        values = np.round(np.asarray(values, dtype=float), self.decimals)
+        index = np.clip(np.searchsorted(axis_values, values), 0, len(axis_values) - 1)
+        if not np.array_equal(axis_values[index], values):
+            raise ValueError(f"{name} outside the evaluated scenario grid")
+        return index
+
+    def target_year(self, interest_rate, growth_rate, primary_surplus):
+        """
+        Look up the 60% crossing year for any broadcastable parameter arrays.
+
+        Args:
+            interest_rate: Nominal interest rate (%)
+            growth_rate: Nominal GDP growth rate (%)
+            primary_surplus: Primary surplus (% of GDP)
+
+        Returns:
+            np.ndarray: Crossing year, or -1 where not reached by 2050
+        """
+        spread = np.subtract(interest_rate, growth_rate)
+        i = self._lookup(spread, self.spreads, "Interest-growth spread")
+        j = self._lookup(primary_surplus, self.primary_surpluses, "Primary surplus")
+        return self.target_years[i, j]
+
+    def years_to_target(self, interest_rate, growth_rate, primary_surplus):
+        """Years from 2025 to the 60% target, NaN where not reached by 2050."""
+        years = self.target_year(interest_rate, growth_rate, primary_surplus)
+        return np.where(years >= 0, years - START_YEAR, np.nan)
+
+    def share_reaching(self, by_year=PROJECTION_END):
+        """
+        Share of all lattice combinations that reach the target by a given year.
+
+        Args:
+            by_year: Latest acceptable crossing year
+
+        Returns:
+            float: Fraction of scenarios between 0 and 1
+        """
+        reached = (self.target_years >= 0) & (self.target_years <= by_year)
+        feasible = (self.spread_counts[:, np.newaxis] * reached).sum()
+        return float(feasible / (self.spread_counts.sum() * len(self.primary_surpluses)))
+
+
+def evaluate_scenario_grid(growth_rates, primary_surpluses, interest_rates,
+                           inflation_rates=0.0, shock_size=0.0, decimals=1):
+    """
+    Evaluate every combination of the simulator parameters in one pass.
+
+    Args:
+        growth_rates: Real GDP growth rates (%)
+        primary_surpluses: Primary surpluses (% of GDP)
+        interest_rates: Nominal interest rates (%)
+        inflation_rates: Inflation rates (%), added to real growth
+        shock_size: Periodic climate/economic shock (% of GDP), 0 for none
+        decimals: Rounding used to identify identical spreads (slider step)
+
+    Returns:
+        ScenarioGrid: Crossing years for every unique scenario
+    """
+    nominal_growth = np.add.outer(np.atleast_1d(growth_rates), np.atleast_1d(inflation_rates))
+    spread_lattice = np.subtract.outer(np.atleast_1d(interest_rates), nominal_growth)
+    spreads, spread_counts = np.unique(np.round(spread_lattice, decimals), return_counts=True)
+    surpluses = np.unique(np.round(np.atleast_1d(primary_surpluses), decimals))
+
+    shocks = shock_schedule(shock_size)
+    multiplier = 1 + spreads[:, np.newaxis, np.newaxis] / 100
+    increments = shocks[1:] - surpluses[np.newaxis, :, np.newaxis]
+
+    paths = floored_debt_path(CURRENT_DEBT, multiplier, increments)
+    crossing = first_crossing_index(paths)
+
+    return ScenarioGrid(
+        spreads=spreads,
+        spread_counts=spread_counts,
+        primary_surpluses=surpluses,
+        target_years=np.where(crossing >= 0, HORIZON_YEARS[crossing], -1),
+        decimals=decimals,
+    )
+
+
+# ============================================================================
+# INVERSE SOLVER
+# ============================================================================
+SPREAD_BOUNDS = (-20.0, 20.0)  # Interest-growth spreads searched (pp)
+
+
+def _horizon_steps(target_year):
+    """Step numbers 1..n covering every requested target year."""
+    target_year = np.asarray(target_year)
+    if np.any(target_year <= START_YEAR):
+        raise ValueError(f"Target year must be after {START_YEAR}")
+    return np.arange(1, int(target_year.max()) - START_YEAR + 1)
+
+
+def required_primary_surplus(interest_rate, growth_rate, target_year, shock_size=0.0,
+                             start_debt=CURRENT_DEBT, target=DEBT_TARGET):
+    """
+    Minimum primary surplus that reaches the target by a given year.
+
+    The unfloored debt after t years is a^t * debt_0 + shocks_t - p * S_t
+    with S_t = 1 + a + ... + a^(t-1), so reaching the target in year t
+    needs p >= (a^t * debt_0 + shocks_t - target) / S_t. The answer is the
+    smallest of these over all years up to the target year. Arguments
+    broadcast, so a whole parameter grid is solved at once.
+
+    Args:
+        interest_rate: Nominal interest rate (%)
+        growth_rate: Nominal GDP growth rate (%)
+        target_year: Year by which the target must be reached
+        shock_size: Periodic climate/economic shock (% of GDP), 0 for none
+        start_debt: Debt-to-GDP ratio in 2025
+        target: Debt-to-GDP target
+
+    Returns:
+        np.ndarray: Minimum primary surplus (% of GDP); negative values
+        mean a primary deficit would still reach the target
+    """
+    steps = _horizon_steps(target_year)
+    multiplier = (1 + np.subtract(interest_rate, growth_rate) / 100)[..., np.newaxis]
+    shocks = shock_schedule(shock_size, START_YEAR + steps)
+
+    growth = multiplier ** steps
+    annuity = growth * np.cumsum(multiplier ** -steps, axis=-1)
+    shock_debt = growth * np.cumsum(shocks * multiplier ** -steps, axis=-1)
+
+    required = (growth * start_debt + shock_debt - target) / annuity
+    in_horizon = steps <= (np.asarray(target_year) - START_YEAR)[..., np.newaxis]
+    return np.where(in_horizon, required, np.inf).min(axis=-1)
+
+
+def required_spread(primary_surplus, target_year, shock_size=0.0,
+                    start_debt=CURRENT_DEBT, target=DEBT_TARGET,
+                    iterations=BISECTION_ITERATIONS):
+    """
+    Largest interest-growth spread (r - g) that still reaches the target in time.
+
+    The debt path rises with the spread, so the boundary is found by a
+    bisection that runs on every grid cell at once.
+
+    Args:
+        primary_surplus: Primary surplus (% of GDP)
+        target_year: Year by which the target must be reached
+        shock_size: Periodic climate/economic shock (% of GDP), 0 for none
+        start_debt: Debt-to-GDP ratio in 2025
+        target: Debt-to-GDP target
+        iterations: Bisection iterations
+
+    Returns:
+        np.ndarray: Maximum spread in percentage points, NaN where even the
+        lowest searched spread misses the target; capped at the upper bound
+    """
+    steps = _horizon_steps(target_year)
+    primary_surplus, target_year = np.broadcast_arrays(
+        np.asarray(primary_surplus, dtype=float), np.asarray(target_year)
+    )
+    increments = shock_schedule(shock_size, START_YEAR + steps) - primary_surplus[..., np.newaxis]
+    in_horizon = steps <= (target_year - START_YEAR)[..., np.newaxis]
+
+    def reaches_target(spread):
+        paths = floored_debt_path(
+            start_debt, 1 + spread[..., np.newaxis] / 100, increments, floor=-np.inf
+        )[..., 1:]
+        return ((paths <= target) & in_horizon).any(axis=-1)
+
+    low = np.full(primary_surplus.shape, SPREAD_BOUNDS[0])
+    high = np.full(primary_surplus.shape, SPREAD_BOUNDS[1])
+    feasible_low = reaches_target(low)
+    feasible_high = reaches_target(high)
+
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        ok = reaches_target(middle)
+        low = np.where(ok, middle, low)
+        high = np.where(ok, high, middle)
+
+    spread = np.where(feasible_high, SPREAD_BOUNDS[1], low)
+    return np.where(feasible_low, spread, np.nan)
+
+
+def required_growth_rate(interest_rate, primary_surplus, target_year, shock_size=0.0,
+                         start_debt=CURRENT_DEBT, target=DEBT_TARGET):
+    """
+    Minimum nominal GDP growth that reaches the target by a given year.
+
+    Args:
+        interest_rate: Nominal interest rate (%)
+        primary_surplus: Primary surplus (% of GDP)
+        target_year: Year by which the target must be reached
+        shock_size: Periodic climate/economic shock (% of GDP), 0 for none
+        start_debt: Debt-to-GDP ratio in 2025
+        target: Debt-to-GDP target
+
+    Returns:
+        np.ndarray: Minimum nominal growth rate (%), NaN if unattainable
+    """
+    spread = required_spread(primary_surplus, target_year, shock_size, start_debt, target)
+    return np.asarray(interest_rate, dtype=float) - spread
+
+
+def required_interest_rate(growth_rate, primary_surplus, target_year, shock_size=0.0,
+                           start_debt=CURRENT_DEBT, target=DEBT_TARGET):
+    """
+    Maximum nominal interest rate that still reaches the target by a given year.
+
+    Args:
+        growth_rate: Nominal GDP growth rate (%)
+        primary_surplus: Primary surplus (% of GDP)
+        target_year: Year by which the target must be reached
+        shock_size: Periodic climate/economic shock (% of GDP), 0 for none
+        start_debt: Debt-to-GDP ratio in 2025
+        target: Debt-to-GDP target
+
+    Returns:
+        np.ndarray: Maximum nominal interest rate (%), NaN if unattainable
+    """
+    spread = required_spread(primary_surplus, target_year, shock_size, start_debt, target)
+    return np.asarray(growth_rate, dtype=float) + spread
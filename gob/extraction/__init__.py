@@ -0,0 +1,22 @@
+"""
+Extraction pipeline for the statement tables in the bundled PDF reports.
+
+    gob.extraction.pdf       text rows (label, note, amounts with positions) of each page,
+                             read lazily one page at a time by iter_pages
+    gob.extraction.tokens    OCR-tolerant parsing of amount tokens
+    gob.extraction.store     Parquet cache of every report's rows under data/extracted/
+    gob.extraction.tables    statement tables located in the rows, one record per cell
+    gob.extraction.dataset   the dashboard's tables, built from the statement cells
+                             and the hand-read corrections in corrections.csv
+
+gob.data builds load_financial_data() and calculate_key_metrics() from
+here. Extracting a report needs pdfplumber; once a report is in the cache
+it loads from Parquet until the PDF changes.
+
+Extract every bundled report and review the cells the dashboard reads with:
+
+    python -m gob.extraction
+"""
+from gob.extraction.dataset import StatementTables, statement_frames, statement_totals
+from gob.extraction.pdf import ExtractionError, PageContent, iter_pages
+from gob.extraction.store import bundled_reports, extract_document, load_rows
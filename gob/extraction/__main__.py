@@ -0,0 +1,77 @@
+"""
+Extract the bundled reports and review the statement cells the dashboard reads.
+
+Usage (from the repository root):
+
+    python -m gob.extraction                     # extract the pages that changed, then review
+    python -m gob.extraction --force             # re-parse every page of every report
+    python -m gob.extraction --show-repaired     # also list cells whose OCR text was repaired
+    python -m gob.extraction --workers 8         # parse pages in 8 processes (default: one per CPU)
+
+Exits with status 1 if a cell the dashboard reads is unreadable and has no
+entry in gob/extraction/corrections.csv.
+"""
+import argparse
+import os
+import sys
+import time
+
+from gob.extraction.dataset import StatementTables, statement_frames, statement_totals
+from gob.extraction.pdf import ExtractionError
+from gob.extraction.store import bundled_reports, extract_document, load_rows, manifest_entry
+
+
+def main():
+    """Extract the reports, then print the review of the dashboard's cells."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('documents', nargs='*', help="Report file names (default: every bundled PDF)")
+    parser.add_argument('--force', action='store_true', help="Re-parse every page even if the cache is current")
+    parser.add_argument('--show-repaired', action='store_true',
+                        help="List the cells read with OCR repairs, not only the unreadable ones")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="Processes to parse pages in, 1 to parse in this process")
+    args = parser.parse_args()
+
+    print(f"{'report':<64} {'pages':>5} {'parsed':>6} {'amounts':>8} {'repaired':>8} {'unreadable':>10} "
+          f"{'seconds':>8}")
+    for document in args.documents or bundled_reports():
+        start = time.perf_counter()
+        before = manifest_entry(document)
+        try:
+            if args.force:
+                rows = extract_document(document, reuse_pages=False, workers=args.workers)
+            else:
+                rows = load_rows(document, workers=args.workers)
+        except ExtractionError as error:
+            sys.exit(str(error))
+        entry = manifest_entry(document)
+        # Pages parsed by this run; none if the report was read back from the cache
+        parsed = entry['parsed_pages'] if args.force or entry != before else 0
+        amounts = rows[rows['amount_index'] >= 0]
+        print(f"{document[:64]:<64} {entry['pages']:>5} {parsed:>6} {len(amounts):>8} "
+              f"{int(amounts['repaired'].sum()):>8} {int(amounts['value'].isna().sum()):>10} "
+              f"{time.perf_counter() - start:>8.1f}{'  (no text layer)' if rows.empty else ''}")
+
+    tables = StatementTables.load(strict=False)
+    try:
+        statement_frames(tables)
+        statement_totals(tables)
+    except ExtractionError as error:
+        sys.exit(f"Dashboard tables could not be built: {error}")
+
+    unreadable = [read for read in tables.reads if read.value is None]
+    corrected = [read for read in tables.reads if read.corrected]
+    repaired = [read for read in tables.reads if read.repaired and not read.corrected]
+    print(f"\nDashboard cells: {len(tables.reads)} read, {len(corrected)} corrected, "
+          f"{len(repaired)} read with OCR repairs, {len(unreadable)} unreadable")
+    listed = [("UNREADABLE", unreadable)] + ([("repaired", repaired)] if args.show_repaired else [])
+    for kind, reads in listed:
+        for read in reads:
+            print(f"  {kind:<10} {read.table:<14} {read.label[:44]:<44} {read.column:<22} {read.text!r}")
+    if unreadable:
+        print("\nAdd the figures read off the scan to gob/extraction/corrections.csv")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,376 @@
+"""
+The dashboard's statement tables, assembled from the extracted reports.
+
+Each dashboard table is a list of (dashboard label, printed label,
+occurrence) line items read from one statement table. Cells the OCR text
+layer garbled are taken from corrections.csv, which records the figure read
+off the scan and how it was confirmed; everything else comes straight from
+the report. A blank cell in a statement is a nil amount.
+
+python -m gob.extraction prints the cells that still need a person to look
+at them when a new year's statements are dropped in.
+"""
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from gob.extraction.pdf import ExtractionError
+from gob.extraction.store import EXTRACTED_DIR, REPORTS_DIR, load_rows
+from gob.extraction.tables import TableSpec, label_matches, normalize_label, read_table
+
+AUDITED_STATEMENTS = "GOB Audited Financial Statements 2023.pdf"
+CORRECTIONS_FILE = Path(__file__).resolve().parent / "corrections.csv"
+
+STATEMENT_TABLES = (
+    TableSpec("performance", AUDITED_STATEMENTS, (6, 7), "Revenue", "for Period (Incl. Annex)",
+              ("approved_budget_2023", "revised_budget_2023", "actual_2023", "actual_2022")),
+    TableSpec("position", AUDITED_STATEMENTS, (8, 9), "Assets", "NET DEBT",
+              ("actual_mar_23", "actual_mar_22")),
+    TableSpec("taxation", AUDITED_STATEMENTS, (20,), "Individuals", "Total Taxation Revenue",
+              ("revised_estimates_2023", "actual_2023", "actual_2022")),
+    TableSpec("grants", AUDITED_STATEMENTS, (24,), "Subsidies", "Total Grants and Transfers",
+              ("revised_estimates_2023", "actual_2023", "actual_2022")),
+    TableSpec("public_debt", AUDITED_STATEMENTS, (31,), "Local Loans Act", "Total Public Debt Outstanding",
+              ("authorised", "outstanding_2023", "outstanding_2022"), scale=1e6),
+    TableSpec("soe_transfers", AUDITED_STATEMENTS, (34,), "Barbados Defence Force", "Total",
+              ("current_transfers", "capital_transfers", "total")),
+)
+
+# (dashboard label, label printed in the statement, occurrence of that label)
+REVENUE_ITEMS = (
+    ("Taxation", "Taxation", 0),
+    ("Goods and Services", "Goods and Services", 0),
+    ("Income and Profits", "Income and Profits", 0),
+    ("Property Taxes", "Property Taxes", 0),
+    ("International Trade", "International Trade", 0),
+    ("Other Taxes", "Other Taxes", 0),
+    ("Levies, Fees and Fines", "Levies, Fees and Fines", 0),
+    ("Special Receipts", "Special Receipts", 0),
+    ("Other Revenue", "Other Revenue", 0),
+    ("Grants", "Grant Income", 0),
+)
+EXPENDITURE_ITEMS = (
+    ("Payroll and Employee Benefits", "Payroll and Employee Benefits", 0),
+    ("Goods and Services", "Goods and Services", 1),
+    ("Depreciation", "Depreciation", 0),
+    ("Bad Debt Expense", "Bad Debt Expense", 0),
+    ("Retiring Benefits and Allowances", "Retiring Benefits and Allowances", 0),
+    ("Grants and Other Current Transfers", "Grants and Other Current Transfers", 0),
+    ("Other Statutory Expenditure", "Other Statutory Expenditure", 0),
+    ("Capital Transfers", "Capital Transfers", 0),
+    ("Debt Service", "Debt Service", 0),
+)
+ASSET_ITEMS = (
+    ("Current Assets", "Current Assets", 0),
+    ("Financial Assets", "Financial Assets", 0),
+    ("Cash on Hand", "Cash on Hand", 0),
+    ("Bank", "Bank", 0),
+    ("Tax Receivables (Net)", "Tax Receivables (Net)", 0),
+    ("Other Receivables (Net)", "Other Receivables (Net)", 0),
+    ("Restricted cash", "Restricted cash and cash equivalents", 0),
+    ("Non-Current Assets", "Non-Current Assets", 0),
+    ("Financial Assets", "Financial Assets", 1),
+    ("Sinking Fund Assets", "Sinking Fund Assets", 0),
+    ("Investments", "Investments", 0),
+    ("Non Financial Assets", "Non Financial Assets", 1),
+    ("Land", "Land", 0),
+    ("Other capital assets (Net)", "Other capital assets (Net)", 0),
+)
+LIABILITY_ITEMS = (
+    ("Current Liabilities", "Current Liabilities", 0),
+    ("Overdraft Facility", "Overdraft Facility", 0),
+    ("Accounts Payable", "Accounts Payable and Accrued Liabilities", 0),
+    ("Refunds Payable", "Refunds Payable", 0),
+    ("Pension Liability", "Pension Liability", 0),
+    ("Deposits", "Deposits", 0),
+    ("Treasury Bills", "Treasury Bills", 0),
+    ("Current Portion of Long term debt", "Current Portion of Long term debt", 0),
+    ("Long-term Liabilities", "Long-term Liabilities", 0),
+    ("Government Securities", "Government Securities", 0),
+    ("Other Local Debt", "Other Local Debt", 0),
+    ("Loans from International Financial Institutions", "Loans from International Financial Institutions", 0),
+    ("Loans from Other Governments", "Loans From Other Governments and Agencies", 0),
+    ("Other Foreign Debt", "Other Foreign Debt", 0),
+)
+TAX_ITEMS = (
+    ("Income and Profits - Individuals", "Individuals (Net)", 0),
+    ("Income and Profits - Corporation", "Corporation Tax (Net)", 0),
+    ("Withholding Tax", "Withholding Tax (Net)", 0),
+    ("VAT (Net)", "VAT (Net)", 0),
+    ("Excise Duty", "Excise Duty", 0),
+    ("Highway Revenue", "Highway Revenue", 0),
+    ("Other Goods & Services", "Other", 0),
+    ("Land Tax (Net)", "Land Tax (Net)", 0),
+    ("Property Transfer Tax", "Property Transfer Tax", 0),
+    ("Import Duties (Net)", "Import Duties (Net)", 0),
+    ("Stamp Duty", "Stamp Duty", 0),
+)
+# (dashboard label, label printed in Note 25, occurrence, debt category)
+DEBT_ITEMS = (
+    ("Local Loans Act", "Local Loans Act", 0, "Domestic"),
+    ("External Loans Act", "External Loans Act Cap 94", 0, "Foreign"),
+    ("Caribbean Development Bank", "Caribbean Development Bank Cap 97A", 0, "Foreign"),
+    ("Inter American Development Bank", "InterAmerican Development Bank Cap 97B", 0, "Foreign"),
+    ("Special Loans Act", "Special Loans Act Cap 105", 0, "Foreign"),
+    ("Treasury Bills", "Treasury Bills", 0, "Domestic"),
+    ("Savings Bond Act", "Savings Bond Act 1980-30", 0, "Domestic"),
+    ("International Monetary Fund", "International Monetary Fund", 0, "Foreign"),
+    ("Latin American Development Bank", "Latin American Development Bank Act", 0, "Foreign"),
+    ("Ways & Means (Overdraft)", "Financial Management & Audit Act 2007-11 (Ways & Means)", 0, "Domestic"),
+)
+SOE_ITEMS = (
+    ("Queen Elizabeth Hospital", "QEH", 0),
+    ("Barbados Water Authority", "Barbados Water Authority", 0),
+    ("Barbados Revenue Authority", "Barbados Revenue Authority", 0),
+    ("National Conservation Commission", "National Conservation Commission", 0),
+    ("Barbados Tourism Investment Inc.", "Barbados Tourism Investment Inc.", 0),
+    ("Transport Board", "Transport Board", 0),
+    ("Barbados Agricultural Management Company Ltd", "Barbados Agricultural Management Company Ltd", 0),
+    ("National Housing Corporation", "National Housing Corporation", 0),
+    ("Barbados Defence Force", "Barbados Defence Force", 0),
+    ("National Sports Council", "National Sports Council", 0),
+)
+
+# Note 34's narrative total, printed as "transfers of $669,335,534.09"
+_NARRATIVE_TRANSFERS = re.compile(r"transfers\s*of\s*\$\s*([\d,]+\.\d{2})")
+
+
+def load_corrections(path=CORRECTIONS_FILE):
+    """
+    Hand-read figures for cells the OCR text layer garbled.
+
+    Returns:
+        pd.DataFrame: table, label, occurrence, column, value and reason
+    """
+    return pd.read_csv(path, dtype={'occurrence': 'int64', 'value': 'float64'})
+
+
+@dataclass(frozen=True)
+class CellRead:
+    """One cell the dashboard read, for the extraction report."""
+
+    table: str
+    label: str
+    column: str
+    text: Optional[str]     # As extracted; None for a blank cell
+    value: Optional[float]  # As used; None if unreadable and not corrected
+    repaired: bool          # OCR characters were corrected in the text
+    corrected: bool         # Taken from corrections.csv
+
+
+class StatementTables:
+    """
+    Cells of every statement table, with the corrections applied on lookup.
+
+    With strict=False an unreadable cell counts as 0.0 instead of raising,
+    so the extraction report can list every cell that needs a correction.
+    """
+
+    def __init__(self, rows, tables, corrections, strict=True):
+        self.rows = rows   # Extracted rows by report
+        self.tables = tables
+        self.strict = strict
+        self.reads = []    # CellRead of every lookup, in order
+        self._corrections = {
+            (item.table, normalize_label(item.label), item.occurrence, item.column): item.value
+            for item in corrections.itertuples()
+        }
+        self._labels = {
+            name: list(cells.drop_duplicates('row')[['row', 'label']].itertuples(index=False))
+            for name, cells in tables.items()
+        }
+        self._cells = {
+            name: {(item.row, item.column): item for item in cells.itertuples()}
+            for name, cells in tables.items()
+        }
+
+    @classmethod
+    def load(cls, reports_dir=REPORTS_DIR, directory=EXTRACTED_DIR, corrections=None, strict=True):
+        """Read every statement table from the cached (or freshly extracted) reports."""
+        rows = {}
+        tables = {}
+        for spec in STATEMENT_TABLES:
+            if spec.document not in rows:
+                rows[spec.document] = load_rows(spec.document, reports_dir, directory)
+            tables[spec.name] = read_table(rows[spec.document], spec)
+        return cls(rows, tables, load_corrections() if corrections is None else corrections, strict)
+
+    def read(self, table, label, column, occurrence=0):
+        """
+        Look up a cell without raising, recording it in reads.
+
+        Args:
+            table: Name of a STATEMENT_TABLES table
+            label: Label as printed in the statement
+            column: Column of the table
+            occurrence: Which of several rows with the same label
+
+        Returns:
+            CellRead: The cell; its value is the correction if there is one,
+                else the extracted value, 0.0 for a blank cell and None if
+                the cell is unreadable
+
+        Raises:
+            ExtractionError: If the table has no such row
+        """
+        matches = [row for row, text in self._labels[table] if label_matches(text, label)]
+        if occurrence >= len(matches):
+            raise ExtractionError(f"{table}: no row {label!r} (occurrence {occurrence})")
+        found = self._cells[table].get((matches[occurrence], column))
+        text = None if found is None else found.text
+        repaired = found is not None and bool(found.repaired)
+
+        corrected = self._corrections.get((table, normalize_label(label), occurrence, column))
+        if corrected is not None:
+            value = corrected
+        elif found is None:
+            value = 0.0
+        else:
+            value = None if pd.isna(found.value) else float(found.value)
+        result = CellRead(table, label, column, text, value, repaired, corrected is not None)
+        self.reads.append(result)
+        return result
+
+    def value(self, table, label, column, occurrence=0):
+        """
+        Dollar amount of a cell (see read).
+
+        Raises:
+            ExtractionError: If the row is missing, or (strict only) the cell
+                is unreadable and has no correction
+        """
+        result = self.read(table, label, column, occurrence)
+        if result.value is None and not self.strict:
+            return 0.0
+        if result.value is None:
+            raise ExtractionError(
+                f"{table}: {label!r} {column} reads {result.text!r}; add it to {CORRECTIONS_FILE.name}"
+            )
+        return result.value
+
+    def page_text(self, document, page):
+        """Text of a report page without its amounts, for figures quoted in prose."""
+        rows = self.rows[document]
+        on_page = rows[rows['page'] == page].drop_duplicates('line')
+        return " ".join(on_page['label'])
+
+
+def _line_items(tables, table, items, columns):
+    """Frame of line items with one column per (frame column, table column) pair."""
+    return pd.DataFrame({
+        'Category': [label for label, _, _ in items],
+        **{
+            name: [tables.value(table, printed, column, occurrence) for _, printed, occurrence in items]
+            for name, column in columns.items()
+        },
+    })
+
+
+def _as_dollars(frame, columns):
+    """Whole-dollar columns as int64, as printed in the statements."""
+    return frame.astype({column: 'int64' for column in columns}) if len(frame) else frame
+
+
+def statement_frames(tables):
+    """
+    Dashboard tables read from the statements.
+
+    Args:
+        tables: StatementTables
+
+    Returns:
+        dict: financial_performance, expenditure_data, balance_sheet,
+            liabilities_data, tax_revenue_details, debt_structure and
+            soe_transfers frames, before derived columns, plus the Note 34
+            and Note 9 totals
+    """
+    budget_columns = {
+        'Revised_Budget_2023': 'revised_budget_2023', 'Actual_2023': 'actual_2023', 'Actual_2022': 'actual_2022',
+    }
+    position_columns = {'Actual_Mar_23': 'actual_mar_23', 'Actual_Mar_22': 'actual_mar_22'}
+
+    financial_performance = _line_items(tables, 'performance', REVENUE_ITEMS, budget_columns)
+    expenditure_data = _line_items(tables, 'performance', EXPENDITURE_ITEMS, budget_columns)
+    balance_sheet = _line_items(tables, 'position', ASSET_ITEMS, position_columns)
+    liabilities_data = _line_items(tables, 'position', LIABILITY_ITEMS, position_columns)
+
+    tax_revenue_details = _line_items(
+        tables, 'taxation', TAX_ITEMS, {'Actual_2023': 'actual_2023', 'Actual_2022': 'actual_2022'}
+    ).rename(columns={'Category': 'Tax_Type'})
+    tax_revenue_details['Growth_Amount'] = tax_revenue_details['Actual_2023'] - tax_revenue_details['Actual_2022']
+    tax_revenue_details['Growth_Pct'] = (
+        tax_revenue_details['Growth_Amount'] / tax_revenue_details['Actual_2022'] * 100
+    ).round(2)
+
+    debt_structure = _line_items(
+        tables, 'public_debt', [item[:3] for item in DEBT_ITEMS],
+        {'Amount_2023': 'outstanding_2023', 'Amount_2022': 'outstanding_2022'},
+    ).rename(columns={'Category': 'Debt_Type'})
+    debt_structure[['Amount_2023', 'Amount_2022']] = debt_structure[['Amount_2023', 'Amount_2022']].round()
+    debt_structure['Change'] = debt_structure['Amount_2023'] - debt_structure['Amount_2022']
+    debt_structure['Debt_Category'] = [category for *_, category in DEBT_ITEMS]
+
+    soe_transfers = _line_items(
+        tables, 'soe_transfers', SOE_ITEMS,
+        {'Current_Transfers': 'current_transfers', 'Capital_Transfers': 'capital_transfers', 'Total': 'total'},
+    ).rename(columns={'Category': 'Entity'})
+
+    narrative = _NARRATIVE_TRANSFERS.search(tables.page_text(AUDITED_STATEMENTS, 34))
+    if narrative is None:
+        raise ExtractionError("soe_transfers: Note 34 narrative total not found")
+    narrative_amount = float(narrative.group(1).replace(",", ""))
+    table_amount = tables.value('soe_transfers', 'Total', 'total')
+    total_grants = tables.value('grants', 'Total Grants and Transfers', 'actual_2023')
+
+    return {
+        'financial_performance': _as_dollars(financial_performance, budget_columns),
+        'expenditure_data': _as_dollars(expenditure_data, budget_columns),
+        'balance_sheet': _as_dollars(balance_sheet, position_columns),
+        'liabilities_data': _as_dollars(liabilities_data, position_columns),
+        'tax_revenue_details': _as_dollars(
+            tax_revenue_details, ('Actual_2023', 'Actual_2022', 'Growth_Amount')
+        ),
+        'debt_structure': _as_dollars(debt_structure, ('Amount_2023', 'Amount_2022', 'Change')),
+        'soe_transfers': soe_transfers,
+        'note34_discrepancy': {
+            'narrative_amount': narrative_amount,
+            'table_amount': table_amount,
+            'difference': round(table_amount - narrative_amount, 2),
+            'difference_pct': round((table_amount - narrative_amount) / narrative_amount * 100, 1),
+        },
+        'note9_vs_note34': {
+            'note9_total_grants': int(total_grants),
+            'note34_soe_transfers': table_amount,
+            'soe_percentage_of_total': round(table_amount / total_grants * 100, 1),
+        },
+    }
+
+
+def statement_totals(tables):
+    """
+    Headline totals of the statements, for calculate_key_metrics.
+
+    Returns:
+        dict: Totals by name, in dollars
+    """
+    def both_years(table, label, columns):
+        return [int(tables.value(table, label, column)) for column in columns]
+
+    years = ('actual_2023', 'actual_2022')
+    dates = ('actual_mar_23', 'actual_mar_22')
+    totals = {}
+    for name, table, label, columns in (
+        ('total_revenue', 'performance', 'Total Revenue', years),
+        ('total_expenditure', 'performance', 'Total Expenditure', years),
+        ('deficit', 'performance', 'for Period (Incl. Annex)', years),
+        ('total_assets', 'position', 'TOTAL ASSETS', dates),
+        ('total_liabilities', 'position', 'TOTAL LIABILITIES', dates),
+        ('net_debt', 'position', 'NET DEBT', dates),
+        ('tax_receivables', 'position', 'Tax Receivables (Net)', dates),
+    ):
+        totals[f"{name}_2023"], totals[f"{name}_2022"] = both_years(table, label, columns)
+    totals['total_soe_transfers'] = tables.value('soe_transfers', 'Total', 'total')
+    return totals
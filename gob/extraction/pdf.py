@@ -0,0 +1,323 @@
+"""
+Text rows of a PDF page: a label followed by the amounts printed on its line.
+
+Words are read with their positions (pdfplumber), grouped into lines by
+their vertical position, and every line is split into its label, an
+optional note reference and the run of amounts that ends it. The right edge
+of each amount is kept so gob.extraction.tables can assign it to a column
+even when a row leaves some columns blank.
+
+page_digests hashes what a page's text is drawn from (its content streams,
+fonts with their Unicode maps and form XObjects), so the store can tell
+which pages of a replaced report actually changed without parsing them.
+
+iter_pages reads a PDF lazily, one page at a time, releasing each page's
+resources before the next, so memory stays flat however long the report.
+extract_rows builds on it and can spread the pages over a process pool:
+every task parses a short run of pages, and workers are replaced after
+WORKER_TASKS tasks, so a worker's memory stays bounded too (before Python
+3.11, which lacks max_tasks_per_child, by starting a new pool for every
+WORKER_TASKS tasks per worker). Batches are merged back in page order.
+"""
+import hashlib
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Optional, Tuple
+
+from gob.extraction.tokens import is_amount, is_numeric_fragment, is_well_grouped, parse_amount
+
+LINE_TOLERANCE = 3.0   # Points two words' tops may differ by and share a line
+SPLIT_GAP = 3.0        # Points between fragments of an amount OCR split in two
+NOTE_GAP = 20.0        # Points between a label and a note reference column
+BATCH_PAGES = 4        # Pages per worker task when parsing across processes
+WORKER_TASKS = 16      # Tasks a worker runs before it is replaced, capping its memory
+
+# ProcessPoolExecutor(max_tasks_per_child=...) is new in Python 3.11
+_POOL_RECYCLES_WORKERS = sys.version_info >= (3, 11)
+
+_NOTE_REF = re.compile(r"^[\"'’]?\d{1,2},?$")
+
+
+class ExtractionError(Exception):
+    """A report could not be read or a table was not found where expected."""
+
+
+@dataclass(frozen=True)
+class Amount:
+    """One amount token of a row."""
+
+    text: str
+    value: Optional[float]   # None if OCR garbled it beyond repair
+    repaired: bool
+    x0: float
+    x1: float
+
+
+@dataclass(frozen=True)
+class TextRow:
+    """One line of a page."""
+
+    page: int        # 1-based page number
+    line: int        # Line index within the page
+    top: float
+    label: str
+    note: str        # Note reference printed between label and amounts, if any
+    amounts: Tuple[Amount, ...]
+
+
+@dataclass(frozen=True)
+class PageContent:
+    """What iter_pages yields for one page."""
+
+    number: int                  # 1-based page number
+    text: str                    # The page's lines, top to bottom
+    rows: Tuple[TextRow, ...]    # Table rows: label, note and amounts of every line
+
+    @property
+    def amounts(self):
+        """Numeric tokens of the page, in reading order."""
+        return tuple(amount for row in self.rows for amount in row.amounts)
+
+
+def _open_pdf(path):
+    """Open a PDF with pdfplumber, which is only needed to (re)extract reports."""
+    try:
+        import pdfplumber
+    except ImportError as error:
+        raise ExtractionError(
+            "Extracting the bundled reports needs pdfplumber (pip install -r requirements.txt)"
+        ) from error
+    return pdfplumber.open(path)
+
+
+def _group_lines(words):
+    """Words grouped into lines by vertical position, each line sorted left to right."""
+    lines = []
+    for word in sorted(words, key=lambda w: (w['top'], w['x0'])):
+        if lines and abs(word['top'] - lines[-1][0]['top']) <= LINE_TOLERANCE:
+            lines[-1].append(word)
+        else:
+            lines.append([word])
+    return [sorted(line, key=lambda w: w['x0']) for line in lines]
+
+
+def _merge_split_amounts(line):
+    """
+    Join amount fragments OCR split with a stray space (e.g. '861 ,692,875').
+
+    Fragments are only joined if the result is grouped like an amount, so
+    note references ('12, 13') and dates ('31, 2023') stay apart.
+    """
+    merged = []
+    for word in line:
+        previous = merged[-1] if merged else None
+        if (previous is not None and word['x0'] - previous['x1'] < SPLIT_GAP
+                and is_numeric_fragment(previous['text']) and is_numeric_fragment(word['text'])
+                and is_well_grouped(previous['text'] + word['text'])):
+            merged[-1] = dict(previous, text=previous['text'] + word['text'], x1=word['x1'])
+        else:
+            merged.append(word)
+    return merged
+
+
+def _split_row(page_number, index, line):
+    """Split one line into its label, note reference and trailing amounts."""
+    words = _merge_split_amounts(line)
+    first_amount = len(words)
+    while first_amount > 0 and is_amount(words[first_amount - 1]['text']):
+        first_amount -= 1
+    label_words, amount_words = words[:first_amount], words[first_amount:]
+
+    # Note references ("12, 13") sit in their own column, well clear of the label
+    first_note = len(label_words)
+    while first_note > 1 and _NOTE_REF.match(label_words[first_note - 1]['text']):
+        first_note -= 1
+    notes = []
+    if (amount_words and first_note < len(label_words)
+            and label_words[first_note]['x0'] - label_words[first_note - 1]['x1'] > NOTE_GAP):
+        notes = [word['text'].strip("\"'’,") for word in label_words[first_note:]]
+        label_words = label_words[:first_note]
+
+    amounts = []
+    for word in amount_words:
+        value, repaired = parse_amount(word['text'])
+        amounts.append(Amount(word['text'], value, repaired, float(word['x0']), float(word['x1'])))
+    return TextRow(
+        page=page_number,
+        line=index,
+        top=float(line[0]['top']),
+        label=" ".join(word['text'] for word in label_words),
+        note=", ".join(notes),
+        amounts=tuple(amounts),
+    )
+
+
+def read_page(page, page_number):
+    """PageContent of one pdfplumber page."""
+    lines = _group_lines(page.extract_words())
+    return PageContent(
+        number=page_number,
+        text="\n".join(" ".join(word['text'] for word in line) for line in lines),
+        rows=tuple(_split_row(page_number, index, line) for index, line in enumerate(lines)),
+    )
+
+
+def _release(pdf, page):
+    """
+    Free what reading a page cached.
+
+    pdfplumber keeps every page's characters and layout objects, and
+    pdfminer keeps every object it resolved (with its decoded stream data)
+    for the life of the document; left alone both grow with every page
+    read. Objects still needed are resolved again from the file on demand.
+    """
+    page.close()
+    cached = getattr(pdf.doc, '_cached_objs', None)
+    if cached is not None:
+        cached.clear()
+
+
+def _released_pages(pdf, numbers):
+    """Pages of an open PDF one at a time, each released once the caller moves on."""
+    for number in numbers:
+        page = pdf.pages[number - 1]
+        try:
+            yield number, page
+        finally:
+            _release(pdf, page)
+
+
+def iter_pages(path, pages=None):
+    """
+    Lazily read a PDF one page at a time.
+
+    Only the page being read is held in memory: its resources are released
+    before the next page is read, so peak memory does not depend on the
+    length of the document. Stop early (or close the generator) to close
+    the PDF.
+
+    Args:
+        path: PDF file
+        pages: Optional iterable of 1-based page numbers (default: every page)
+
+    Yields:
+        PageContent: Text, table rows and numeric tokens of each page, in page order
+
+    Raises:
+        ExtractionError: If pdfplumber is not installed
+    """
+    with _open_pdf(path) as pdf:
+        numbers = range(1, len(pdf.pages) + 1) if pages is None else sorted(pages)
+        for number, page in _released_pages(pdf, numbers):
+            yield read_page(page, number)
+
+
+def _hash_resources(digest, resources, seen):
+    """Add the fonts and form XObjects of a resource dictionary to digest."""
+    from pdfminer.pdftypes import PDFStream, resolve1
+    from pdfminer.psparser import PSLiteral
+
+    def name(value):
+        return value.name if isinstance(value, PSLiteral) else value
+
+    resources = resolve1(resources) or {}
+    fonts = resolve1(resources.get('Font')) or {}
+    for key in sorted(fonts):
+        font = resolve1(fonts[key]) or {}
+        digest.update(repr((key, name(font.get('BaseFont')), name(font.get('Encoding')))).encode())
+        to_unicode = resolve1(font.get('ToUnicode'))
+        if isinstance(to_unicode, PDFStream):
+            digest.update(to_unicode.get_data())
+    # Images carry no text layer; forms are content streams of their own
+    xobjects = resolve1(resources.get('XObject')) or {}
+    for key in sorted(xobjects):
+        xobject = resolve1(xobjects[key])
+        if isinstance(xobject, PDFStream) and name(xobject.get('Subtype')) == 'Form' and id(xobject) not in seen:
+            seen.add(id(xobject))
+            digest.update(xobject.get_data())
+            _hash_resources(digest, xobject.get('Resources'), seen)
+
+
+def _page_digest(page):
+    from pdfminer.pdftypes import resolve1
+
+    digest = hashlib.sha256(repr((page.page_obj.mediabox, page.page_obj.rotate)).encode())
+    for stream in page.page_obj.contents:
+        digest.update(resolve1(stream).get_data())
+    _hash_resources(digest, page.page_obj.resources, set())
+    return digest.hexdigest()
+
+
+def page_digests(path):
+    """
+    SHA-256 of the text-bearing content of every page.
+
+    Two pages with the same digest extract to the same rows, whatever else
+    (e.g. a scanned image) differs between them.
+
+    Returns:
+        list: Hex digest of every page, in page order
+    """
+    with _open_pdf(path) as pdf:
+        return [_page_digest(page) for _, page in _released_pages(pdf, range(1, len(pdf.pages) + 1))]
+
+
+def _parse_pages(path, numbers):
+    """Text rows of some pages of a PDF (runs inside a worker)."""
+    return [row for content in iter_pages(path, numbers) for row in content.rows]
+
+
+def page_batches(numbers, batch_pages=BATCH_PAGES):
+    """Sorted page numbers split into runs of at most batch_pages pages."""
+    numbers = sorted(numbers)
+    return [numbers[start:start + batch_pages] for start in range(0, len(numbers), batch_pages)]
+
+
+def _map_batches(path, batches, workers):
+    """Rows of every batch across a process pool, in batch order."""
+    if _POOL_RECYCLES_WORKERS:
+        with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=WORKER_TASKS) as pool:
+            yield from pool.map(_parse_pages, repeat(str(path)), batches)
+        return
+
+    tasks = workers * WORKER_TASKS
+    for start in range(0, len(batches), tasks):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(_parse_pages, repeat(str(path)), batches[start:start + tasks])
+
+
+def extract_rows(path, pages=None, workers=1, batch_pages=BATCH_PAGES):
+    """
+    Text rows of a PDF.
+
+    Args:
+        path: PDF file
+        pages: Optional iterable of 1-based page numbers (default: every page)
+        workers: Number of worker processes, 1 to parse in this process,
+            None for one per CPU
+        batch_pages: Pages per worker task
+
+    Returns:
+        list: TextRow of every line, in page and line order
+
+    Raises:
+        ExtractionError: If pdfplumber is not installed
+    """
+    if pages is None:
+        with _open_pdf(path) as pdf:
+            pages = range(1, len(pdf.pages) + 1)
+    batches = page_batches(pages, batch_pages)
+    if workers == 1 or len(batches) <= 1:
+        return _parse_pages(path, [number for batch in batches for number in batch])
+
+    rows = []
+    workers = min(workers or os.cpu_count(), len(batches))
+    # map yields in submission order, so batches are merged in page order
+    # as they arrive while later ones are still being parsed
+    for batch_rows in _map_batches(path, batches, workers):
+        rows.extend(batch_rows)
+    return rows
@@ -0,0 +1,206 @@
+"""
+Columnar cache of the rows extracted from each bundled report.
+
+Every report's rows are stored in long format, one record per amount (lines
+without amounts keep one record with an empty amount), as a Parquet file
+under data/extracted/. manifest.json records the SHA-256 of the source PDF
+each file was extracted from, so an unchanged report is read back in
+milliseconds.
+
+A replaced or new report is not parsed wholesale. The manifest also keeps
+the digest of every page (gob.extraction.pdf.page_digests), and each
+page's rows are cached under data/extracted/pages/ by that digest, so only
+pages whose digest has not been seen before are parsed. Re-extracting a
+report with one edited page, or adding a report, costs time in proportion
+to the new pages. Page files no report references any more are deleted.
+"""
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from gob.atomic import atomic_path
+from gob.extraction.pdf import extract_rows, page_digests
+
+EXTRACTION_VERSION = 2
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+REPORTS_DIR = REPO_ROOT
+EXTRACTED_DIR = REPO_ROOT / "data" / "extracted"
+
+ROW_COLUMNS = (
+    "document", "page", "line", "top", "label", "note",
+    "amount_index", "text", "value", "repaired", "x0", "x1",
+)
+
+_lock = threading.Lock()   # One extraction and manifest update at a time
+
+
+def bundled_reports(directory=REPORTS_DIR):
+    """PDF reports shipped with the dashboard, by file name."""
+    return sorted(path.name for path in Path(directory).glob("*.pdf"))
+
+
+def file_sha256(path):
+    """Hex SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for block in iter(lambda: source.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def rows_frame(document, rows):
+    """
+    Long-format frame of extracted rows.
+
+    Args:
+        document: Report file name
+        rows: TextRow list from gob.extraction.pdf.extract_rows
+
+    Returns:
+        pd.DataFrame: One record per amount, with the ROW_COLUMNS columns
+    """
+    records = []
+    for row in rows:
+        base = (document, row.page, row.line, row.top, row.label, row.note)
+        if not row.amounts:
+            records.append(base + (-1, None, None, False, None, None))
+        for index, amount in enumerate(row.amounts):
+            records.append(base + (
+                index, amount.text, amount.value, amount.repaired, amount.x0, amount.x1
+            ))
+    frame = pd.DataFrame.from_records(records, columns=list(ROW_COLUMNS))
+    return frame.astype({
+        'page': 'int16', 'line': 'int32', 'top': 'float32', 'amount_index': 'int16',
+        'value': 'float64', 'repaired': 'bool', 'x0': 'float32', 'x1': 'float32',
+    })
+
+
+def _cache_path(document, directory):
+    return Path(directory) / f"{Path(document).stem}.parquet"
+
+
+def _page_path(digest, directory):
+    # The version is part of the name so a parser change cannot reuse old pages
+    return Path(directory) / "pages" / f"v{EXTRACTION_VERSION}-{digest}.parquet"
+
+
+def _write_parquet(frame, path):
+    with atomic_path(path) as temporary:
+        frame.to_parquet(temporary, engine="pyarrow", index=False)
+
+
+def _prune_pages(directory, manifest):
+    """Delete the cached pages no report in the manifest references."""
+    referenced = {
+        _page_path(digest, directory).name
+        for entry in manifest["documents"].values() for digest in entry["page_digests"]
+    }
+    for path in (Path(directory) / "pages").glob("*.parquet"):
+        if path.name not in referenced:
+            path.unlink(missing_ok=True)
+
+
+def _read_manifest(directory):
+    try:
+        manifest = json.loads((Path(directory) / "manifest.json").read_text())
+    except (OSError, ValueError):
+        return {"version": EXTRACTION_VERSION, "documents": {}}
+    if manifest.get("version") != EXTRACTION_VERSION:
+        return {"version": EXTRACTION_VERSION, "documents": {}}
+    return manifest
+
+
+def _write_manifest(directory, manifest):
+    path = Path(directory) / "manifest.json"
+    with atomic_path(path) as temporary:
+        temporary.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+
+def extract_document(document, reports_dir=REPORTS_DIR, directory=EXTRACTED_DIR, reuse_pages=True,
+                     workers=1):
+    """
+    Extract one report and write its rows to the cache.
+
+    Args:
+        document: Report file name inside reports_dir
+        reports_dir: Directory holding the PDFs
+        directory: Cache directory
+        reuse_pages: Take pages already in the page cache from there; False
+            parses every page again
+        workers: Processes to parse new pages in (see extract_rows)
+
+    Returns:
+        pd.DataFrame: The extracted rows
+    """
+    with _lock:
+        return _extract_document(document, reports_dir, directory, reuse_pages, workers)
+
+
+def _extract_document(document, reports_dir, directory, reuse_pages=True, workers=1):
+    source = Path(reports_dir) / document
+    directory = Path(directory)
+    (directory / "pages").mkdir(parents=True, exist_ok=True)
+
+    sha256 = file_sha256(source)
+    digests = page_digests(source)
+    # First page of every digest that has no cached rows yet
+    new_pages = {}
+    for number, digest in enumerate(digests, 1):
+        if digest not in new_pages and not (reuse_pages and _page_path(digest, directory).exists()):
+            new_pages[digest] = number
+    rows = extract_rows(source, new_pages.values(), workers) if new_pages else []
+    parsed = rows_frame(document, rows)
+    for digest, number in new_pages.items():
+        _write_parquet(parsed[parsed['page'] == number], _page_path(digest, directory))
+
+    pages = []
+    for number, digest in enumerate(digests, 1):
+        if new_pages.get(digest) == number:
+            page = parsed[parsed['page'] == number]
+        else:
+            page = pd.read_parquet(_page_path(digest, directory), engine="pyarrow")
+        pages.append(page.assign(document=document, page=number))
+    empty = rows_frame(document, [])
+    frame = pd.concat([empty] + pages, ignore_index=True).astype(empty.dtypes.to_dict())
+    _write_parquet(frame, _cache_path(document, directory))
+
+    manifest = _read_manifest(directory)
+    manifest["documents"][document] = {
+        "sha256": sha256,
+        "pages": len(digests),
+        "parsed_pages": len(new_pages),
+        "records": len(frame),
+        "page_digests": digests,
+    }
+    _write_manifest(directory, manifest)
+    _prune_pages(directory, manifest)
+    return frame
+
+
+def manifest_entry(document, directory=EXTRACTED_DIR):
+    """Manifest record (sha256, pages, parsed_pages, records, page_digests) of a cached report, or None."""
+    return _read_manifest(directory)["documents"].get(document)
+
+
+def load_rows(document, reports_dir=REPORTS_DIR, directory=EXTRACTED_DIR, workers=1):
+    """
+    Rows of one report from the cache, extracting it first if it is missing or stale.
+
+    Args:
+        document: Report file name inside reports_dir
+        reports_dir: Directory holding the PDFs
+        directory: Cache directory
+        workers: Processes to parse new pages in (see extract_rows)
+
+    Returns:
+        pd.DataFrame: One record per amount, with the ROW_COLUMNS columns
+    """
+    with _lock:
+        entry = _read_manifest(directory)["documents"].get(document)
+        path = _cache_path(document, directory)
+        if entry is not None and path.exists() and entry["sha256"] == file_sha256(Path(reports_dir) / document):
+            return pd.read_parquet(path, engine="pyarrow")
+        return _extract_document(document, reports_dir, directory, workers=workers)
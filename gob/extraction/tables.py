@@ -0,0 +1,156 @@
+"""
+Statement tables located in the extracted rows.
+
+A TableSpec names the report pages a table is printed on, the labels of its
+first and last rows and its value columns. read_table cuts those rows out of
+the long-format rows, assigns every amount to a column by clustering the
+right edges of the amounts on each page (figures are right-aligned), and
+returns one record per cell. Labels are matched on their letters only and
+allowing about one misread character in eight, which absorbs OCR damage
+such as 'Intemational' or 'GrantsandOtherCurrentTransfers' without letting
+'Non Financial Assets' pass for 'Financial Assets'.
+"""
+import re
+from dataclasses import dataclass
+from typing import Tuple
+
+import pandas as pd
+
+from gob.extraction.pdf import ExtractionError
+
+LABEL_EDITS_PER_CHAR = 1 / 8   # Misread characters allowed per letter of a label
+COLUMN_GAP = 20.0              # Points between right edges that start a new column
+
+CELL_COLUMNS = ("table", "page", "row", "label", "section", "column", "text", "value", "repaired")
+
+_LETTERS = re.compile(r"[^a-z]")
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """Where a statement table is printed and what its value columns are."""
+
+    name: str
+    document: str
+    pages: Tuple[int, ...]
+    first: str                  # Label of the first row
+    last: str                   # Label of the last row
+    columns: Tuple[str, ...]
+    scale: float = 1.0          # Multiplier to dollars (e.g. 1e6 for "$ millions")
+
+
+def normalize_label(label):
+    """Lower-case letters of a label, dropping spaces, digits and punctuation."""
+    return _LETTERS.sub("", label.lower())
+
+
+def _edit_distance(a, b, limit):
+    """Levenshtein distance of a and b, or limit + 1 once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def label_matches(label, wanted):
+    """True if an extracted label reads as the wanted label."""
+    wanted = normalize_label(wanted)
+    limit = max(1, int(len(wanted) * LABEL_EDITS_PER_CHAR))
+    return _edit_distance(normalize_label(label), wanted, limit) <= limit
+
+
+def _table_rows(rows, spec):
+    """Records of the rows from spec.first to spec.last, in print order."""
+    selected = rows[(rows['document'] == spec.document) & rows['page'].isin(spec.pages)]
+    selected = selected.sort_values(['page', 'line', 'amount_index'], kind='stable')
+    # Print position of every record: lines are numbered within their page
+    position = selected['page'].astype('int64') * 100_000 + selected['line']
+    lines = selected.assign(position=position).drop_duplicates('position')
+
+    def locate(label, start):
+        candidates = lines[lines['position'] >= start]
+        return next((pos for pos, text in zip(candidates['position'], candidates['label'])
+                     if label_matches(text, label)), None)
+
+    first = locate(spec.first, 0)
+    if first is None:
+        raise ExtractionError(f"{spec.name}: first row {spec.first!r} not found in {spec.document}")
+    last = locate(spec.last, first)
+    if last is None:
+        raise ExtractionError(f"{spec.name}: last row {spec.last!r} not found in {spec.document}")
+    return selected[(position >= first) & (position <= last)]
+
+
+def _column_edges(cells, count, name, page):
+    """
+    Right edge of every column on a page.
+
+    Edges are clustered from the rows that fill every column when there are
+    any, so a stray number in a page heading cannot add a column.
+    """
+    per_row = cells.groupby('row')['column'].transform('size')
+    edges = sorted(cells.loc[per_row == count, 'column'] if (per_row == count).any() else cells['column'])
+    clusters = [[edges[0]]]
+    for edge in edges[1:]:
+        if edge - clusters[-1][-1] > COLUMN_GAP:
+            clusters.append([edge])
+        else:
+            clusters[-1].append(edge)
+    if len(clusters) != count:
+        raise ExtractionError(
+            f"{name}: found {len(clusters)} amount columns on page {page}, expected {count}"
+        )
+    return [sum(cluster) / len(cluster) for cluster in clusters]
+
+
+def read_table(rows, spec):
+    """
+    Cells of a statement table.
+
+    Args:
+        rows: Long-format rows of the report (gob.extraction.store.load_rows)
+        spec: TableSpec of the table
+
+    Returns:
+        pd.DataFrame: One record per cell with the CELL_COLUMNS columns. row
+            numbers the table's rows from 0, section is the last heading
+            (row without amounts) above the row, and value is in dollars.
+
+    Raises:
+        ExtractionError: If the table or its columns are not where spec says
+    """
+    table = _table_rows(rows, spec)
+    records = []
+    row_number = -1
+    section = ""
+    for (page, line), group in table.groupby(['page', 'line'], sort=True):
+        label = group['label'].iloc[0]
+        amounts = group[group['amount_index'] >= 0]
+        if amounts.empty:
+            section = label
+            continue
+        row_number += 1
+        for _, amount in amounts.iterrows():
+            records.append((spec.name, page, row_number, label, section,
+                            amount['x1'], amount['text'], amount['value'], amount['repaired']))
+
+    cells = pd.DataFrame.from_records(records, columns=list(CELL_COLUMNS))
+    # The column field holds the amount's right edge until it is named here
+    names = pd.Series("", index=cells.index, dtype=object)
+    for page, on_page in cells.groupby('page'):
+        edges = _column_edges(on_page, len(spec.columns), spec.name, page)
+        for index, edge in on_page['column'].items():
+            nearest = min(range(len(edges)), key=lambda i: abs(edges[i] - edge))
+            if abs(edges[nearest] - edge) <= COLUMN_GAP:
+                names[index] = spec.columns[nearest]
+    cells['column'] = names
+    cells['value'] = cells['value'] * spec.scale
+    # Amounts clear of every column (e.g. a date in a page heading) are not cells
+    return cells[cells['column'] != ""].reset_index(drop=True)
@@ -0,0 +1,84 @@
+"""
+Amount tokens of the OCR text layer of the bundled reports.
+
+The scanned statements carry an OCR text layer that misreads some digits
+(i or l for 1, O for 0, a stray quote inside a number, ; for a thousands
+separator). parse_amount undoes the unambiguous misreadings and flags every
+amount it had to touch, so the extraction report can list the figures a
+person should check against the scan.
+"""
+import re
+
+# Characters OCR puts in place of digits or separators, and what they stand for
+_OCR_DIGITS = str.maketrans({
+    'i': '1', 'l': '1', 'I': '1', '!': '1', 'f': '1',
+    'O': '0', 'o': '0',
+    ';': ',',
+})
+_OCR_NOISE = "\"'’`"
+
+_AMOUNT_SHAPE = re.compile(r"^\(?-?[\d,]*\d[\d,]*(\.\d+)?\)?$")
+_GROUPED = re.compile(r"^\d{1,3}(,\d{3})*(\.\d+)?$")
+_NUMERIC_CHARS = set("0123456789,.()-")
+
+
+def is_amount(text):
+    """
+    True if text reads as an amount rather than a word, a year or a note number.
+
+    Amounts in the statements always carry a thousands separator or decimals,
+    so bare integers such as note references and years are left to the label.
+    A token that is mostly digits counts even when OCR garbled it beyond
+    repair, so it still takes its column (parse_amount then returns None).
+    """
+    body = text.strip("()-")
+    digits = sum(char.isdigit() for char in body.translate(_OCR_DIGITS))
+    if digits < 3 or digits < len(body) / 2:
+        return False
+    return "," in body or "." in body or ";" in body
+
+
+def is_numeric_fragment(text):
+    """True if text is made of digits and separators only (part of a split amount)."""
+    return bool(text) and set(text) <= _NUMERIC_CHARS and any(char.isdigit() for char in text)
+
+
+def is_well_grouped(text):
+    """True if text is an amount with its thousands separators in groups of three."""
+    return bool(_GROUPED.match(text.strip("()-")))
+
+
+def parse_amount(text):
+    """
+    Value of an amount token, undoing common OCR misreadings.
+
+    Parentheses mark negative amounts. A token whose thousands separators
+    are not in groups of three is still read from its digits, but counts as
+    repaired because a digit or separator may be missing.
+
+    Args:
+        text: Token as it appears in the text layer
+
+    Returns:
+        tuple: (value, repaired) where value is a float, or None if the token
+            cannot be read as an amount, and repaired is True if any
+            character had to be corrected
+    """
+    cleaned = text.translate(_OCR_DIGITS)
+    for char in _OCR_NOISE:
+        cleaned = cleaned.replace(char, "")
+    repaired = cleaned != text
+
+    if not _AMOUNT_SHAPE.match(cleaned):
+        return None, repaired
+    negative = cleaned.startswith("(") or cleaned.startswith("-")
+    if cleaned.startswith("(") != cleaned.endswith(")"):
+        return None, True
+    digits = cleaned.strip("()-")
+    if not _GROUPED.match(digits):
+        repaired = True
+    try:
+        value = float(digits.replace(",", ""))
+    except ValueError:
+        return None, True
+    return (-value if negative else value), repaired
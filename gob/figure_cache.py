@@ -0,0 +1,38 @@
+"""
+Figure cache for the static dashboard views.
+
+Outside the simulators a chart depends only on the loaded statements and the
+sidebar's currency format and comparison toggle. Each figure is built once per
+(view, figure, dataset version, currency format, comparison toggle) and kept
+as Plotly JSON in a bounded process-wide cache, so repeat visits skip figure construction and
+the format_currency text labels altogether. A rebuilt snapshot has a new
+version, so its figures never come from the old statements.
+"""
+import json
+
+import plotly.graph_objects as go
+
+from gob.cache import SimulationCache
+
+FIGURE_CACHE = SimulationCache(max_entries=512, name="figure")
+
+
+def cached_figure(view, name, context, build):
+    """
+    Return a view's figure, building and caching it on the first request.
+
+    Args:
+        view: View the figure belongs to (its module name)
+        name: Figure name, unique within the view
+        context: ViewContext supplying the dataset version, currency format and
+            comparison toggle
+        build: Zero-argument function returning the go.Figure
+
+    Returns:
+        go.Figure: Figure restored from the cached JSON
+    """
+    key = (view, name, context.dataset_version, context.currency_format, context.show_comparative)
+    spec = FIGURE_CACHE.get_or_compute(key, lambda: build().to_json())
+
+    # The JSON was produced by a validated figure, so skip plotly's re-validation
+    return go.Figure(json.loads(spec), _validate=False)
@@ -0,0 +1,240 @@
+"""
+Import-time report and budget for dashboard cold starts.
+
+Every import set is measured in a fresh interpreter under
+``python -X importtime``, so nothing is already cached in sys.modules. The
+startup set is read from app.py's top-level imports and followed by the
+dataset loads app.py runs before the first view, so modules those functions
+import lazily are measured too. The report breaks the cost down per
+top-level package, and the budget check fails when the startup imports
+exceed STARTUP_BUDGET_MS or pull in a module that should only load with the
+first view that needs it.
+
+Build the dataset snapshot first (python -m gob.snapshot): without it the
+first load builds it, which imports the extraction package.
+
+Usage (from the repository root):
+
+    python -m gob.import_budget
+    python -m gob.import_budget --views --json import_report.json
+"""
+import argparse
+import ast
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+APP_SCRIPT = REPO_ROOT / "app.py"
+# Functions app.py calls before the first view renders; they import the snapshot lazily
+STARTUP_CALLS = ("gob.data:load_financial_data", "gob.data:calculate_key_metrics")
+STARTUP_BUDGET_MS = 1500.0
+
+# Modules that must only be imported by the views that use them
+DEFERRED_MODULES = (
+    "plotly.express",
+    "gob.debt_dynamics",
+    "gob.extraction",
+    "gob.lattice",
+    "gob.monte_carlo",
+    "gob.parallel_monte_carlo",
+    "gob.simulation_cache",
+    "pdfplumber",
+)
+
+_MARKER = "--- import budget marker ---"
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of -X importtime output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class ImportReport:
+    """Import times of one import set, measured in a fresh interpreter."""
+
+    modules: Tuple[str, ...]
+    records: Tuple[ImportRecord, ...]
+
+    @property
+    def total_ms(self):
+        """Wall time of the whole import set."""
+        return sum(r.cumulative_us for r in self.records if r.depth == 0) / 1000
+
+    def loaded(self, module):
+        """True if the import set loaded module."""
+        return any(r.module == module for r in self.records)
+
+    def by_package(self):
+        """
+        Self time per top-level package, largest first.
+
+        Returns:
+            list: (package, milliseconds, module count) tuples
+        """
+        packages = {}
+        for record in self.records:
+            name = record.module.split('.')[0]
+            total, count = packages.get(name, (0, 0))
+            packages[name] = (total + record.self_us, count + 1)
+        return sorted(
+            ((name, total / 1000, count) for name, (total, count) in packages.items()),
+            key=lambda item: item[1], reverse=True
+        )
+
+
+def parse_importtime(stderr):
+    """
+    Parse -X importtime output, keeping only the lines after the marker.
+
+    Args:
+        stderr: stderr of the measured interpreter
+
+    Returns:
+        tuple: ImportRecord for every module imported after the marker
+    """
+    lines = stderr.splitlines()
+    if _MARKER in lines:
+        lines = lines[lines.index(_MARKER) + 1:]
+
+    records = []
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        module = name.strip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append(ImportRecord(module, int(self_us), int(cumulative_us), depth))
+    return tuple(records)
+
+
+def script_imports(path=APP_SCRIPT):
+    """
+    Modules a script imports at top level, in order.
+
+    Args:
+        path: Python script to read
+
+    Returns:
+        tuple: Module names, without duplicates
+    """
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            modules.append(node.module)
+    return tuple(dict.fromkeys(modules))
+
+
+def measure_imports(modules, preload=(), calls=()):
+    """
+    Measure importing modules in a fresh interpreter.
+
+    Args:
+        modules: Modules to import and measure
+        preload: Modules imported first and left out of the measurement
+        calls: "module:function" names called after the imports; modules
+            they import lazily are measured too
+
+    Returns:
+        ImportReport: Import times of modules on top of preload
+    """
+    code = "".join(f"import {name}\n" for name in preload)
+    code += f"import sys\nprint({_MARKER!r}, file=sys.stderr, flush=True)\n"
+    code += "".join(f"import {name}\n" for name in modules)
+    for call in calls:
+        module, function = call.split(":")
+        code += f"from {module} import {function}\n{function}()\n"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return ImportReport(modules=tuple(modules), records=parse_importtime(result.stderr))
+
+
+def fastest_of(repeat, modules, preload=(), calls=()):
+    """Measure an import set repeat times and keep the fastest run."""
+    return min((measure_imports(modules, preload, calls) for _ in range(repeat)),
+               key=lambda report: report.total_ms)
+
+
+def check_budget(report, budget_ms=STARTUP_BUDGET_MS, deferred=DEFERRED_MODULES):
+    """
+    Check a startup report against the budget.
+
+    Args:
+        report: ImportReport of the startup imports
+        budget_ms: Maximum startup import time
+        deferred: Modules that must not be imported at startup
+
+    Returns:
+        list: Human-readable violations, empty when within budget
+    """
+    violations = []
+    if report.total_ms > budget_ms:
+        violations.append(f"startup imports took {report.total_ms:.0f} ms, budget is {budget_ms:.0f} ms")
+    for module in deferred:
+        if report.loaded(module):
+            violations.append(f"{module} is imported at startup but should load with its view")
+    return violations
+
+
+def main():
+    """Print the import-time report and exit non-zero when over budget."""
+    from gob.views import VIEW_MODULES
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per import set, fastest is kept")
+    parser.add_argument('--top', type=int, default=15, help="Packages shown in the breakdown")
+    parser.add_argument('--views', action='store_true', help="Also measure every view module")
+    parser.add_argument('--json', help="Write the report to this file")
+    args = parser.parse_args()
+
+    startup_modules = script_imports()
+    startup = fastest_of(args.repeat, startup_modules, calls=STARTUP_CALLS)
+    print(f"Startup imports: {startup.total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    for name, milliseconds, count in startup.by_package()[:args.top]:
+        print(f"  {name:<32} {milliseconds:8.1f} ms  {count:4d} modules")
+
+    views = {}
+    if args.views:
+        print("\nFirst selection of each view, on top of the startup imports:")
+        for label, module in VIEW_MODULES.items():
+            report = fastest_of(args.repeat, [f"gob.views.{module}"], preload=startup_modules)
+            views[label] = report
+            print(f"  {label:<32} {report.total_ms:8.1f} ms")
+
+    violations = check_budget(startup, args.budget_ms)
+    for violation in violations:
+        print(f"OVER BUDGET: {violation}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            'startup_ms': startup.total_ms,
+            'budget_ms': args.budget_ms,
+            'packages': [
+                {'package': name, 'ms': milliseconds, 'modules': count}
+                for name, milliseconds, count in startup.by_package()
+            ],
+            'views_ms': {label: report.total_ms for label, report in views.items()},
+            'violations': violations,
+        }, indent=2))
+
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Inflation-tourism trade-off for the "Optimal Inflation Finder".
+
+Inflation erodes the real value of fixed-rate debt but makes Barbados less
+competitive against other tourist destinations. The net effect of an
+inflation rate x is
+
+    Net_Effect(x) = x * fixed_debt_share - max(0, x - competitor_inflation)
+                    * tourism_sensitivity * tourism_gdp_share
+
+which this module evaluates over a fine grid and then maximises with a
+bounded golden-section search.
+"""
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+
+INFLATION_BOUNDS = (2.0, 7.0)   # Range of inflation rates considered (%)
+GRID_POINTS = 5001              # 0.001 pp resolution over the bounds
+GOLDEN_TOLERANCE = 1e-9
+MIN_ADJUSTED_GROWTH = 0.5       # Tourism-adjusted growth can't go below 0.5%
+
+_INVERSE_GOLDEN_RATIO = (np.sqrt(5) - 1) / 2
+
+
+def tourism_tradeoff(inflation, competitor_inflation, tourism_sensitivity,
+                     tourism_gdp_share, fixed_debt_share, growth_rate):
+    """
+    Evaluate the inflation-tourism trade-off for one or many inflation rates.
+
+    Args:
+        inflation: Barbados inflation rate(s) (%)
+        competitor_inflation: Average inflation in competing destinations (%)
+        tourism_sensitivity: Tourism growth lost per 1% inflation premium
+        tourism_gdp_share: Tourism as % of GDP
+        fixed_debt_share: Fixed-rate debt share (%)
+        growth_rate: Real GDP growth before the tourism impact (%)
+
+    Returns:
+        dict: Arrays keyed 'Inflation', 'Tourism_Impact', 'Debt_Benefit',
+        'Net_Effect' and 'Adjusted_Growth'
+    """
+    inflation = np.asarray(inflation, dtype=float)
+    premium = np.maximum(inflation - competitor_inflation, 0.0)
+    tourism_impact = 0.0 - premium * tourism_sensitivity * (tourism_gdp_share / 100)
+    debt_benefit = inflation * (fixed_debt_share / 100)
+
+    return {
+        'Inflation': inflation,
+        'Tourism_Impact': tourism_impact,
+        'Debt_Benefit': debt_benefit,
+        'Net_Effect': debt_benefit + tourism_impact,
+        'Adjusted_Growth': np.maximum(growth_rate + tourism_impact, MIN_ADJUSTED_GROWTH),
+    }
+
+
+def golden_section_maximize(func, low, high, tolerance=GOLDEN_TOLERANCE):
+    """
+    Maximise a unimodal scalar function on [low, high].
+
+    Args:
+        func: Function of one float
+        low: Lower bound
+        high: Upper bound
+        tolerance: Width of the final bracket
+
+    Returns:
+        float: Location of the maximum
+    """
+    a, b = low, high
+    c = b - _INVERSE_GOLDEN_RATIO * (b - a)
+    d = a + _INVERSE_GOLDEN_RATIO * (b - a)
+    fc, fd = func(c), func(d)
+
+    while b - a > tolerance:
+        if fc >= fd:
+            b, d, fd = d, c, fc
+            c = b - _INVERSE_GOLDEN_RATIO * (b - a)
+            fc = func(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + _INVERSE_GOLDEN_RATIO * (b - a)
+            fd = func(d)
+
+    # Endpoints are candidates too, the optimum often sits on a bound
+    candidates = np.array([low, (a + b) / 2, high])
+    return float(candidates[np.argmax([func(x) for x in candidates])])
+
+
+@dataclass(frozen=True)
+class InflationResponse:
+    """Response curve of the trade-off and its optimum."""
+
+    curve: Dict[str, np.ndarray]
+    optimum: Dict[str, float]
+    bounds: Tuple[float, float]
+
+
+def optimal_inflation(competitor_inflation, tourism_sensitivity, tourism_gdp_share,
+                      fixed_debt_share, growth_rate, bounds=INFLATION_BOUNDS,
+                      grid_points=GRID_POINTS):
+    """
+    Find the inflation rate that maximises the net effect on GDP.
+
+    The response curve is evaluated on a fine grid in one vectorized pass;
+    golden-section search then refines the optimum within one grid step of
+    the best grid point (the net effect is concave, so it is unimodal).
+
+    Args:
+        competitor_inflation: Average inflation in competing destinations (%)
+        tourism_sensitivity: Tourism growth lost per 1% inflation premium
+        tourism_gdp_share: Tourism as % of GDP
+        fixed_debt_share: Fixed-rate debt share (%)
+        growth_rate: Real GDP growth before the tourism impact (%)
+        bounds: (min, max) inflation rates considered
+        grid_points: Number of grid points for the response curve
+
+    Returns:
+        InflationResponse: Full response curve and the optimum
+    """
+    params = (competitor_inflation, tourism_sensitivity, tourism_gdp_share,
+              fixed_debt_share, growth_rate)
+
+    rates = np.linspace(bounds[0], bounds[1], grid_points)
+    curve = tourism_tradeoff(rates, *params)
+
+    best = int(np.argmax(curve['Net_Effect']))
+    low = rates[max(best - 1, 0)]
+    high = rates[min(best + 1, grid_points - 1)]
+    net_effect = lambda x: float(tourism_tradeoff(x, *params)['Net_Effect'])
+    optimum_rate = golden_section_maximize(net_effect, low, high)
+    if net_effect(rates[best]) >= net_effect(optimum_rate):
+        optimum_rate = float(rates[best])
+
+    optimum = {key: float(value) for key, value in tourism_tradeoff(optimum_rate, *params).items()}
+    return InflationResponse(curve=curve, optimum=optimum, bounds=tuple(bounds))
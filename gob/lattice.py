@@ -0,0 +1,171 @@
+"""
+Precomputed lookup tensor for the BERT 2026 debt sustainability simulator.
+
+Every simulator slider has a fixed min/max/step, so the input space is a
+finite lattice. The debt path depends on interest, growth and inflation only
+through the interest-growth spread, which collapses the growth x inflation x
+interest lattice to 151 unique spreads. The build step evaluates every
+(spread, primary surplus, shock size) cell once and stores the results as
+.npy files; at runtime they are memory-mapped with np.load(mmap_mode='r'), so
+a slider change is an O(1) indexed read shared by every session and worker
+process. Every file is written to a temporary name and swapped into place,
+with axes.npz last, so a reader never maps a half-written tensor.
+
+Build (or rebuild) the tensor with:
+
+    python -m gob.lattice
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+
+from gob.atomic import atomic_path
+from gob.debt_dynamics import (
+    CURRENT_DEBT,
+    GROWTH_LATTICE,
+    HORIZON_YEARS,
+    INFLATION_LATTICE,
+    INTEREST_LATTICE,
+    PROJECTION_LENGTH,
+    SURPLUS_LATTICE,
+    DebtSimulation,
+    first_crossing_index,
+    floored_debt_path,
+    shock_schedule,
+    slider_lattice,
+    solve_target_years,
+)
+
+LATTICE_VERSION = 1
+LATTICE_DIR = Path(__file__).resolve().parent.parent / "data" / "simulator_lattice"
+
+# Shock slider 0.5-5.0 in 0.1 steps, plus 0 for "no shock"
+SHOCK_LATTICE = np.concatenate([[0.0], slider_lattice(0.5, 5.0, 0.1)])
+SPREAD_LATTICE = np.unique(np.round(
+    INTEREST_LATTICE[:, np.newaxis, np.newaxis]
+    - (GROWTH_LATTICE[np.newaxis, :, np.newaxis] + INFLATION_LATTICE[np.newaxis, np.newaxis, :]),
+    1
+))
+
+_ARRAYS = ("debt_path", "target_year", "crossing_year")
+
+
+def _write_atomic(path, write):
+    """Write path through a temporary file in the same directory, then swap it in."""
+    with atomic_path(path) as temporary, open(temporary, "wb") as handle:
+        write(handle)
+
+
+def build_lattice_tensor(directory=LATTICE_DIR):
+    """
+    Evaluate every lattice cell and write the tensor to disk.
+
+    Args:
+        directory: Output directory for the .npy files and manifest
+
+    Returns:
+        Path: Directory the tensor was written to
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    spread = SPREAD_LATTICE[:, np.newaxis, np.newaxis]
+    surplus = SURPLUS_LATTICE[np.newaxis, :, np.newaxis]
+    shock = SHOCK_LATTICE[np.newaxis, np.newaxis, :]
+
+    increments = shock[..., np.newaxis] * shock_schedule(1.0)[1:] - surplus[..., np.newaxis]
+    paths = floored_debt_path(CURRENT_DEBT, 1 + spread[..., np.newaxis] / 100, increments)
+    crossing = first_crossing_index(paths)
+    crossing_year = solve_target_years(spread, 0.0, surplus, shock)
+
+    # Beyond the 2050 horizon the solver gives the first year at or below target
+    beyond = np.where(np.isnan(crossing_year), -1, np.ceil(crossing_year - 1e-9))
+    target_year = np.where(crossing >= 0, HORIZON_YEARS[crossing], beyond)
+
+    arrays = {
+        "debt_path": paths[..., :PROJECTION_LENGTH].astype(np.float32),
+        "target_year": target_year.astype(np.int32),
+        "crossing_year": crossing_year.astype(np.float64),
+    }
+    for name in _ARRAYS:
+        _write_atomic(directory / f"{name}.npy", lambda handle: np.save(handle, arrays[name]))
+    manifest = json.dumps({
+        "version": LATTICE_VERSION,
+        "start_debt": CURRENT_DEBT,
+        "shape": list(paths.shape[:-1]),
+    }).encode()
+    _write_atomic(directory / "manifest.json", lambda handle: handle.write(manifest))
+    _write_atomic(directory / "axes.npz", lambda handle: np.savez(
+        handle, spreads=SPREAD_LATTICE, surpluses=SURPLUS_LATTICE, shocks=SHOCK_LATTICE))
+    return directory
+
+
+class SimulatorLattice:
+    """Memory-mapped lookup tensor over the simulator slider lattice."""
+
+    def __init__(self, directory=LATTICE_DIR):
+        directory = Path(directory)
+        manifest = json.loads((directory / "manifest.json").read_text())
+        if manifest["version"] != LATTICE_VERSION or manifest["start_debt"] != CURRENT_DEBT:
+            raise ValueError(f"Stale simulator lattice in {directory}, rebuild it")
+
+        with np.load(directory / "axes.npz") as axes:
+            self.spreads = axes["spreads"]
+            self.surpluses = axes["surpluses"]
+            self.shocks = axes["shocks"]
+        for name in _ARRAYS:
+            setattr(self, name, np.load(directory / f"{name}.npy", mmap_mode='r'))
+
+    @classmethod
+    def load_or_build(cls, directory=LATTICE_DIR):
+        """Load the tensor, building it first if it is missing or stale."""
+        try:
+            return cls(directory)
+        except (OSError, ValueError, KeyError):
+            build_lattice_tensor(directory)
+            return cls(directory)
+
+    @staticmethod
+    def _index(axis_values, value, name):
+        index = int(np.searchsorted(axis_values, value - 1e-6))
+        if index >= len(axis_values) or abs(axis_values[index] - value) > 1e-6:
+            raise KeyError(f"{name} {value} is not on the simulator lattice")
+        return index
+
+    def simulate(self, interest_rate, growth_rate, primary_surplus, shock_size=0.0):
+        """
+        Read one scenario from the tensor.
+
+        Args:
+            interest_rate: Nominal interest rate on government debt (%)
+            growth_rate: Nominal GDP growth rate (%)
+            primary_surplus: Primary surplus (% of GDP)
+            shock_size: Periodic climate/economic shock (% of GDP), 0 for none
+
+        Returns:
+            DebtSimulation: Trajectory over 2025-2036 and the 60% crossing year
+
+        Raises:
+            KeyError: If a parameter is not on the slider lattice
+        """
+        i = self._index(self.spreads, round(interest_rate - growth_rate, 1), "Interest-growth spread")
+        j = self._index(self.surpluses, round(primary_surplus, 1), "Primary surplus")
+        k = self._index(self.shocks, round(shock_size, 1), "Shock size")
+
+        target_year = int(self.target_year[i, j, k])
+        crossing_year = float(self.crossing_year[i, j, k])
+        return DebtSimulation(
+            years=HORIZON_YEARS[:PROJECTION_LENGTH],
+            trajectory=np.asarray(self.debt_path[i, j, k], dtype=float),
+            shocks=shock_schedule(self.shocks[k])[:PROJECTION_LENGTH],
+            interest_rate=float(interest_rate),
+            growth_rate=float(growth_rate),
+            primary_surplus=float(primary_surplus),
+            target_year=target_year if target_year >= 0 else None,
+            crossing_year=None if np.isnan(crossing_year) else crossing_year,
+        )
+
+
+if __name__ == '__main__':
+    print(f"Simulator lattice written to {build_lattice_tensor()}")
@@ -0,0 +1,349 @@
+"""
+Opt-in Prometheus metrics exporter for the dashboard server.
+
+Set GOB_METRICS_PORT to serve /metrics in the Prometheus text exposition
+format from a background thread of the Streamlit server process. It binds to
+GOB_METRICS_HOST, which defaults to 127.0.0.1. The exporter uses only the
+standard library, and nothing is measured or served while the variable is
+unset.
+
+Exported metrics:
+
+    gob_rerun_duration_seconds   histogram of rerun latency per view and kind
+                                 (rerun / fragment); its _count is the rerun count
+    gob_rerun_payload_bytes_total  bytes sent to browsers per view
+    gob_cache_data_calls_total / gob_cache_data_misses_total
+                                 calls and misses of the cached dataset loaders
+                                 (st.cache_resource) per function
+    gob_cache_*                  entries, capacity, hits, misses, evictions and
+                                 expirations of every named SimulationCache
+    gob_active_sessions          browser sessions held by the server, counted
+                                 through st.session_state (see count_session)
+    gob_warmup_ready / gob_warmup_failures  cache warm-up state (gob.warmup)
+    process_resident_memory_bytes, process_max_resident_memory_bytes
+
+The same server answers /ready with HTTP 200 once the cache warm-up has
+finished and 503 before, for load balancer health checks.
+
+Example scrape config target: localhost:9464 with GOB_METRICS_PORT=9464.
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import weakref
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gob.cache import named_caches
+
+METRICS_PORT_ENV = "GOB_METRICS_PORT"
+METRICS_HOST_ENV = "GOB_METRICS_HOST"
+DEFAULT_HOST = "127.0.0.1"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Rerun latency buckets in seconds
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_LOGGER = logging.getLogger(__name__)
+
+_SESSION_KEY = "_gob_metrics_session"
+_sessions = 0
+_sessions_lock = threading.Lock()
+
+
+def metrics_enabled():
+    """True if GOB_METRICS_PORT is set."""
+    return bool(os.environ.get(METRICS_PORT_ENV))
+
+
+def _labels(names, values):
+    """Format a label set, escaping backslashes, quotes and newlines."""
+    if not names:
+        return ""
+    escaped = (
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for value in values
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped)) + "}"
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1):
+        """Add amount to the series with these label values."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        """Exposition lines of every series."""
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_labels(self.labelnames, labels)} {value}" for labels, value in values]
+        return lines
+
+
+class Histogram:
+    """Cumulative histogram with labels and fixed buckets."""
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        """Record one observation in the series with these label values."""
+        with self._lock:
+            counts, total = self._series.get(labels, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[bisect_left(self.buckets, value)] += 1
+            self._series[labels] = (counts, total + value)
+
+    def render(self):
+        """Exposition lines of every series: buckets, _sum and _count."""
+        with self._lock:
+            series = sorted((labels, list(counts), total) for labels, (counts, total) in self._series.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        bucket_names = self.labelnames + ("le",)
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{_labels(bucket_names, labels + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {total}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+RERUN_DURATION = Histogram(
+    "gob_rerun_duration_seconds", "Wall time of a script or fragment rerun.", ("view", "kind")
+)
+RERUN_PAYLOAD = Counter(
+    "gob_rerun_payload_bytes_total", "ForwardMsg bytes sent to browsers by reruns.", ("view",)
+)
+CACHE_DATA_CALLS = Counter(
+    "gob_cache_data_calls_total", "Calls of a cached dataset loader.", ("function",)
+)
+CACHE_DATA_MISSES = Counter(
+    "gob_cache_data_misses_total", "Calls of a cached dataset loader that ran its body.", ("function",)
+)
+
+
+def observe_rerun(view, kind, seconds, payload_bytes):
+    """Record a finished rerun (called by gob.tracing); payload_bytes is None when unknown."""
+    RERUN_DURATION.observe((view, kind), seconds)
+    if payload_bytes is not None:
+        RERUN_PAYLOAD.inc((view,), payload_bytes)
+
+
+def count_cache_data_call(function):
+    """Count a call of a cached dataset loader, hit or miss."""
+    CACHE_DATA_CALLS.inc((function,))
+
+
+def count_cache_data_miss(function):
+    """Count a miss; call it from the body of the cached function."""
+    CACHE_DATA_MISSES.inc((function,))
+
+
+def _gauge(name, documentation, samples, metric_type="gauge"):
+    """Exposition lines of a metric computed at scrape time."""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {metric_type}"]
+    lines += [f"{name}{labels} {value}" for labels, value in samples]
+    return lines
+
+
+def _cache_lines():
+    """Counters and sizes of every named SimulationCache."""
+    stats = {name: cache.stats() for name, cache in sorted(named_caches().items())}
+    fields = (
+        ("entries", "gauge", "Entries held by the cache."),
+        ("max_entries", "gauge", "Entry limit of the cache."),
+        ("hits", "counter", "Cache lookups answered from the cache."),
+        ("misses", "counter", "Cache lookups that computed the value."),
+        ("evictions", "counter", "Entries evicted by the entry limit."),
+        ("expirations", "counter", "Entries dropped by the time-to-live."),
+    )
+    lines = []
+    for field, metric_type, documentation in fields:
+        suffix = "_total" if metric_type == "counter" else ""
+        lines += _gauge(
+            f"gob_cache_{field}{suffix}", documentation,
+            [(_labels(("cache",), (name,)), getattr(cache_stats, field))
+             for name, cache_stats in stats.items()],
+            metric_type,
+        )
+    return lines
+
+
+class _SessionToken:
+    """Kept in a session's st.session_state; collected when the session is."""
+
+
+def _session_closed():
+    global _sessions
+    with _sessions_lock:
+        _sessions -= 1
+
+
+def count_session():
+    """
+    Count the calling session once, on its first script run.
+
+    The token stored in st.session_state is garbage collected together with
+    the session state once Streamlit drops the session, which decrements the
+    count. Only public API is used (st.session_state, weakref), so this does
+    not depend on the Streamlit version beyond the session state lifetime.
+    """
+    global _sessions
+    if not metrics_enabled():
+        return
+    import streamlit as st
+
+    if _SESSION_KEY in st.session_state:
+        return
+    token = _SessionToken()
+    with _sessions_lock:
+        _sessions += 1
+    weakref.finalize(token, _session_closed)
+    st.session_state[_SESSION_KEY] = token
+
+
+def _active_sessions():
+    """Sessions counted by count_session, or None outside a running Streamlit server."""
+    from streamlit import runtime
+
+    if not runtime.exists():
+        return None
+    with _sessions_lock:
+        return _sessions
+
+
+def _warmup_lines():
+    """Readiness and failures of the cache warm-up."""
+    from gob.warmup import WARMUP
+
+    snapshot = WARMUP.snapshot()
+    return (
+        _gauge("gob_warmup_ready", "1 once the cache warm-up has finished.", [("", int(snapshot['ready']))])
+        + _gauge("gob_warmup_failures", "Cache warm-up steps that failed.", [("", len(snapshot['failures']))])
+    )
+
+
+def _resident_memory_bytes():
+    """Current RSS from /proc (Linux), or None where it is not available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):  # os.sysconf is Unix-only
+        return None
+
+
+def _max_resident_memory_bytes():
+    """Peak RSS from getrusage, or None where the resource module is missing (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def render_metrics():
+    """
+    All metrics in the Prometheus text exposition format.
+
+    Returns:
+        str: Exposition text, ending with a newline
+    """
+    lines = RERUN_DURATION.render() + RERUN_PAYLOAD.render()
+    lines += CACHE_DATA_CALLS.render() + CACHE_DATA_MISSES.render()
+    lines += _cache_lines()
+    lines += _warmup_lines()
+
+    sessions = _active_sessions()
+    if sessions is not None:
+        lines += _gauge("gob_active_sessions", "Browser sessions held by the server.", [("", sessions)])
+
+    rss = _resident_memory_bytes()
+    if rss is not None:
+        lines += _gauge("process_resident_memory_bytes", "Resident memory size in bytes.", [("", rss)])
+    max_rss = _max_resident_memory_bytes()
+    if max_rss is not None:
+        lines += _gauge("process_max_resident_memory_bytes", "Peak resident memory size in bytes.", [("", max_rss)])
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves GET /metrics and GET /ready."""
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/metrics":
+            self._reply(200, CONTENT_TYPE, render_metrics())
+        elif path == "/ready":
+            from gob.warmup import WARMUP
+
+            snapshot = WARMUP.snapshot()
+            self._reply(200 if snapshot['ready'] else 503, "application/json", json.dumps(snapshot))
+        else:
+            self.send_error(404)
+
+    def _reply(self, status, content_type, text):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep scrapes out of the server log."""
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server():
+    """
+    Start the exporter once per process if GOB_METRICS_PORT is set.
+
+    Safe to call on every rerun; later calls return the running server.
+
+    Returns:
+        ThreadingHTTPServer or None: Running server, None when disabled or
+            the port could not be bound
+    """
+    global _server
+    if _server is not None or not metrics_enabled():
+        return _server or None
+
+    with _server_lock:
+        if _server is None:
+            host = os.environ.get(METRICS_HOST_ENV, DEFAULT_HOST)
+            port = int(os.environ[METRICS_PORT_ENV])
+            try:
+                server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError as error:
+                _LOGGER.warning("Metrics exporter not started on %s:%s: %s", host, port, error)
+                _server = False
+            else:
+                server.daemon_threads = True
+                threading.Thread(target=server.serve_forever, name="gob-metrics", daemon=True).start()
+                _server = server
+    return _server or None
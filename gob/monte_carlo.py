@@ -0,0 +1,117 @@
+"""
+Monte Carlo fan charts for the debt sustainability simulator.
+
+Draws correlated annual paths for real GDP growth, the real interest rate
+and inflation, applies the same tourism and debt-structure adjustments as
+the deterministic "Debt Sustainability Simulator", and projects every path
+at once with the shared debt dynamics engine. gob.parallel_monte_carlo runs
+the model in batches and reduces the paths to a FanChart.
+"""
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from gob.debt_dynamics import (
+    CURRENT_DEBT,
+    PROJECTION_LENGTH,
+    floored_debt_path,
+    shock_schedule,
+)
+
+PERCENTILE_LEVELS = (5, 25, 50, 75, 95)
+DEFAULT_SEED = 2025
+
+# Correlation of annual shocks to (real growth, real interest, inflation)
+DEFAULT_CORRELATION = (
+    (1.0, -0.3, 0.3),
+    (-0.3, 1.0, 0.4),
+    (0.3, 0.4, 1.0),
+)
+
+MIN_ADJUSTED_GROWTH = 0.5  # Tourism-adjusted growth can't go below 0.5%
+
+
+@dataclass(frozen=True)
+class StochasticDebtModel:
+    """Parameters of the stochastic debt and tourism model (rates in %)."""
+
+    growth_rate: float
+    real_interest_rate: float
+    inflation_rate: float
+    primary_surplus: float
+    fixed_debt_share: float = 70.0
+    tourism_gdp_share: float = 40.0
+    tourism_sensitivity: float = 2.5
+    competitor_inflation: float = 2.5
+    shock_size: float = 0.0
+    growth_volatility: float = 1.5
+    interest_volatility: float = 0.75
+    inflation_volatility: float = 1.0
+    correlation: Tuple[Tuple[float, ...], ...] = DEFAULT_CORRELATION
+
+    def draw_rates(self, rng, n_paths):
+        """
+        Draw correlated annual rate paths.
+
+        Args:
+            rng: numpy Generator supplying the random numbers
+            n_paths: Number of paths to draw
+
+        Returns:
+            np.ndarray: Array of shape (3, n_paths, years - 1) holding
+            real growth, real interest and inflation for every projected year
+        """
+        means = np.array([self.growth_rate, self.real_interest_rate, self.inflation_rate])
+        volatilities = np.array([
+            self.growth_volatility, self.interest_volatility, self.inflation_volatility
+        ])
+        cholesky = np.linalg.cholesky(np.asarray(self.correlation))
+
+        standard = rng.standard_normal((3, n_paths, PROJECTION_LENGTH - 1))
+        correlated = np.tensordot(cholesky, standard, axes=1)
+        return (means + volatilities * correlated.T).T
+
+    def simulate(self, rng, n_paths):
+        """
+        Project debt-to-GDP paths for the 2025-2036 window.
+
+        Args:
+            rng: numpy Generator supplying the random numbers
+            n_paths: Number of paths to simulate
+
+        Returns:
+            np.ndarray: Debt paths of shape (n_paths, years)
+        """
+        growth, real_interest, inflation = self.draw_rates(rng, n_paths)
+
+        # Tourism drag from inflation above competitor destinations
+        inflation_premium = np.maximum(inflation - self.competitor_inflation, 0.0)
+        tourism_impact = -inflation_premium * self.tourism_sensitivity * (self.tourism_gdp_share / 100)
+        adjusted_growth = np.maximum(growth + tourism_impact, MIN_ADJUSTED_GROWTH)
+
+        # Only floating-rate debt reprices with inflation
+        floating_debt_share = 1 - self.fixed_debt_share / 100
+        nominal_interest = real_interest + inflation * floating_debt_share
+        nominal_growth = adjusted_growth + inflation
+
+        multiplier = 1 + (nominal_interest - nominal_growth) / 100
+        increments = shock_schedule(self.shock_size)[1:PROJECTION_LENGTH] - self.primary_surplus
+        return floored_debt_path(np.full(n_paths, CURRENT_DEBT), multiplier, increments)
+
+
+@dataclass(frozen=True)
+class FanChart:
+    """Percentile bands and target probability from a Monte Carlo run."""
+
+    years: np.ndarray
+    percentile_levels: Tuple[int, ...]
+    percentiles: np.ndarray
+    probability_reaching_target: float
+    n_paths: int
+    seed: int
+
+    def band(self, level):
+        """Debt path at one of the computed percentile levels."""
+        return self.percentiles[self.percentile_levels.index(level)]
+
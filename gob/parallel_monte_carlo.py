@@ -0,0 +1,240 @@
+"""
+Process-pool execution backend for very large Monte Carlo debt simulations.
+
+The requested number of paths is split into fixed-size batches. Every batch
+draws from its own stream spawned from one SeedSequence, and is reduced to a
+per-year histogram of debt-to-GDP ratios before it leaves the worker. Merging
+histograms is integer addition, so the result does not depend on the number
+of workers or the order batches finish in: a single-process run with the same
+seed gives bit-identical output.
+
+The dashboard uses this scheme for every Monte Carlo run, in the session's
+thread (workers=1). Process pools are only started from the command line:
+inside the threaded Streamlit server, a forked worker could inherit a lock
+held by another thread, and a spawned one would re-run the app script that
+Streamlit installs as __main__.
+
+Usage for board-level stress reports:
+
+    python -m gob.parallel_monte_carlo --paths 5000000 --workers 8 --output report.json
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+import numpy as np
+
+from gob.debt_dynamics import DEBT_FLOOR, DEBT_TARGET, HORIZON_YEARS, PROJECTION_LENGTH
+from gob.monte_carlo import (
+    DEFAULT_SEED,
+    PERCENTILE_LEVELS,
+    FanChart,
+    StochasticDebtModel,
+)
+
+DEFAULT_BATCH_SIZE = 50_000
+
+# Histogram of debt-to-GDP ratios: 0.05 pp bins from the floor up to 250%,
+# values above the range are counted in the last bin
+HISTOGRAM_RANGE = (DEBT_FLOOR, 250.0)
+HISTOGRAM_BINS = 4600
+
+
+@dataclass
+class PathHistogram:
+    """Streaming reduction of debt paths to per-year histograms."""
+
+    counts: np.ndarray
+    target_hits: int = 0
+    n_paths: int = 0
+
+    @classmethod
+    def empty(cls, n_years=PROJECTION_LENGTH):
+        """Create an accumulator with no paths."""
+        return cls(counts=np.zeros((n_years, HISTOGRAM_BINS), dtype=np.int64))
+
+    @property
+    def bin_edges(self):
+        """Edges of the histogram bins."""
+        return np.linspace(*HISTOGRAM_RANGE, HISTOGRAM_BINS + 1)
+
+    def add(self, paths, target=DEBT_TARGET):
+        """
+        Fold a batch of debt paths into the histograms.
+
+        Args:
+            paths: Debt paths of shape (n_paths, years)
+            target: Debt-to-GDP target used for the hit probability
+        """
+        low, high = HISTOGRAM_RANGE
+        width = (high - low) / HISTOGRAM_BINS
+        bins = np.clip(((paths - low) / width).astype(np.int64), 0, HISTOGRAM_BINS - 1)
+        flat = bins + np.arange(paths.shape[1]) * HISTOGRAM_BINS
+        self.counts += np.bincount(flat.ravel(), minlength=self.counts.size).reshape(self.counts.shape)
+        self.target_hits += int((paths <= target).any(axis=1).sum())
+        self.n_paths += paths.shape[0]
+
+    def merge(self, other):
+        """Add the counts of another accumulator to this one."""
+        self.counts += other.counts
+        self.target_hits += other.target_hits
+        self.n_paths += other.n_paths
+
+    def percentiles(self, levels=PERCENTILE_LEVELS):
+        """
+        Estimate percentiles per year by interpolating within histogram bins.
+
+        Args:
+            levels: Percentile levels between 0 and 100
+
+        Returns:
+            np.ndarray: Array of shape (len(levels), years)
+        """
+        edges = self.bin_edges
+        cumulative = np.cumsum(self.counts, axis=1)
+        ranks = np.asarray(levels, dtype=float) / 100 * self.n_paths
+
+        result = np.empty((len(levels), self.counts.shape[0]))
+        for year in range(self.counts.shape[0]):
+            index = np.searchsorted(cumulative[year], ranks, side='left')
+            index = np.minimum(index, HISTOGRAM_BINS - 1)
+            below = np.where(index > 0, cumulative[year][index - 1], 0)
+            in_bin = np.maximum(self.counts[year][index], 1)
+            fraction = np.clip((ranks - below) / in_bin, 0.0, 1.0)
+            result[:, year] = edges[index] + fraction * (edges[index + 1] - edges[index])
+        return result
+
+
+def simulate_batch(model, seed_sequence, n_paths):
+    """
+    Simulate one batch and reduce it to histograms (runs inside a worker).
+
+    Args:
+        model: StochasticDebtModel to simulate
+        seed_sequence: SeedSequence of this batch's independent stream
+        n_paths: Number of paths in the batch
+
+    Returns:
+        PathHistogram: Histogram of the batch
+    """
+    histogram = PathHistogram.empty()
+    histogram.add(model.simulate(np.random.default_rng(seed_sequence), n_paths))
+    return histogram
+
+
+def batch_plan(n_paths, seed, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Split a run into batches with independent spawned seed sequences.
+
+    Args:
+        n_paths: Total number of paths
+        seed: Root seed of the run
+        batch_size: Paths per batch, bounding memory per worker
+
+    Returns:
+        list: (SeedSequence, batch size) pairs
+
+    Raises:
+        ValueError: If n_paths or batch_size is below 1
+    """
+    if n_paths < 1 or batch_size < 1:
+        raise ValueError("n_paths and batch_size must be at least 1")
+    sizes = [batch_size] * (n_paths // batch_size)
+    if n_paths % batch_size:
+        sizes.append(n_paths % batch_size)
+    return list(zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes))
+
+
+def _run_batches(pool, model, plan):
+    """Histograms of every batch of a plan, in completion order."""
+    futures = [pool.submit(simulate_batch, model, seed_sequence, size) for seed_sequence, size in plan]
+    for future in as_completed(futures):
+        yield future.result()
+
+
+def run_parallel_fan_chart(model, n_paths, seed=DEFAULT_SEED, workers=None,
+                           batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Simulate a large Monte Carlo run across a process pool.
+
+    Args:
+        model: StochasticDebtModel to simulate
+        n_paths: Total number of paths
+        seed: Root seed; the same seed gives identical output for any worker count
+        workers: Number of worker processes, 1 to run in this process,
+            None for one per CPU
+        batch_size: Paths per batch
+
+    Returns:
+        FanChart: Percentile bands and probability of reaching 60% by 2036
+
+    Raises:
+        ValueError: If n_paths or batch_size is below 1
+    """
+    plan = batch_plan(n_paths, seed, batch_size)
+    total = PathHistogram.empty()
+
+    if workers == 1:
+        for seed_sequence, size in plan:
+            total.merge(simulate_batch(model, seed_sequence, size))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for histogram in _run_batches(pool, model, plan):
+                total.merge(histogram)
+
+    return FanChart(
+        years=HORIZON_YEARS[:PROJECTION_LENGTH],
+        percentile_levels=tuple(PERCENTILE_LEVELS),
+        percentiles=total.percentiles(),
+        probability_reaching_target=total.target_hits / total.n_paths,
+        n_paths=total.n_paths,
+        seed=seed,
+    )
+
+
+def main():
+    """Run a stress report from the command line and write it as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--paths', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--growth', type=float, default=3.5)
+    parser.add_argument('--real-interest', type=float, default=2.5)
+    parser.add_argument('--inflation', type=float, default=3.5)
+    parser.add_argument('--surplus', type=float, default=4.4)
+    parser.add_argument('--shock', type=float, default=0.0)
+    parser.add_argument('--output', default='-', help="Output file, '-' for stdout")
+    args = parser.parse_args()
+
+    model = StochasticDebtModel(
+        growth_rate=args.growth,
+        real_interest_rate=args.real_interest,
+        inflation_rate=args.inflation,
+        primary_surplus=args.surplus,
+        shock_size=args.shock,
+    )
+    fan_chart = run_parallel_fan_chart(model, args.paths, args.seed, args.workers, args.batch_size)
+
+    report = {
+        'n_paths': fan_chart.n_paths,
+        'seed': fan_chart.seed,
+        'probability_reaching_target': fan_chart.probability_reaching_target,
+        'years': fan_chart.years.tolist(),
+        'percentiles': {
+            str(level): fan_chart.band(level).round(4).tolist()
+            for level in fan_chart.percentile_levels
+        },
+    }
+    text = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(text)
+    else:
+        with open(args.output, 'w') as output:
+            output.write(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+"""
+Render timing and on-demand profiling for the dashboard views.
+
+Views open each section with section_header(), which renders the
+section-header block and marks a timing boundary: a section runs from its
+header to the next header, or to the end of the view. render_view times the
+whole view around it. Durations go to a bounded, process-wide RenderTimings
+store, summarized by the developer sidebar panel.
+
+Query parameters:
+
+    ?dev=1      show the developer panel with the section timings
+    ?profile=1  run the next rerun under cProfile and offer the stats file
+                for download (load it with pstats or snakeviz)
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from gob.tracing import trace_span
+
+TIMING_WINDOW = 200          # Durations kept per (view, section)
+VIEW_TOTAL = "(whole view)"
+VIEW_START = "(before first section)"
+
+DEV_PARAM = "dev"
+PROFILE_PARAM = "profile"
+_PROFILE_STATE = "_render_profile"
+
+_active = threading.local()  # Each Streamlit session reruns in its own thread
+
+
+class RenderTimings:
+    """Thread-safe rolling store of render durations per view and section."""
+
+    def __init__(self, window=TIMING_WINDOW):
+        self.window = window
+        self._durations = {}
+        self._lock = threading.Lock()
+
+    def record(self, view, section, milliseconds):
+        """Add one duration, dropping the oldest beyond the window."""
+        with self._lock:
+            durations = self._durations.get((view, section))
+            if durations is None:
+                durations = self._durations[(view, section)] = deque(maxlen=self.window)
+            durations.append(milliseconds)
+
+    def clear(self):
+        """Drop every recorded duration."""
+        with self._lock:
+            self._durations.clear()
+
+    def summary(self, view=None):
+        """
+        Summarize the recorded durations, sections in render order.
+
+        Args:
+            view: Only include this view (default: every view)
+
+        Returns:
+            pd.DataFrame: One row per (view, section) with run count, last,
+                median, 95th percentile and maximum in milliseconds
+        """
+        with self._lock:
+            items = [(key, np.array(durations)) for key, durations in self._durations.items()
+                     if view is None or key[0] == view]
+
+        return pd.DataFrame(
+            [
+                {
+                    'View': name,
+                    'Section': section,
+                    'Runs': len(durations),
+                    'Last (ms)': durations[-1],
+                    'p50 (ms)': np.percentile(durations, 50),
+                    'p95 (ms)': np.percentile(durations, 95),
+                    'Max (ms)': durations.max(),
+                }
+                for (name, section), durations in items
+            ],
+            columns=['View', 'Section', 'Runs', 'Last (ms)', 'p50 (ms)', 'p95 (ms)', 'Max (ms)'],
+        )
+
+
+RENDER_TIMINGS = RenderTimings()
+
+
+class _ViewRun:
+    """Section boundaries of the view currently rendering in this thread."""
+
+    def __init__(self, view, timings):
+        self.view = view
+        self.timings = timings
+        self.section = VIEW_START
+        self.started = time.perf_counter()
+
+    def next_section(self, section):
+        """Close the open section and start timing the next one."""
+        now = time.perf_counter()
+        milliseconds = (now - self.started) * 1000
+        self.timings.record(self.view, self.section, milliseconds)
+        trace_span(self.view, self.section, milliseconds)
+        self.section, self.started = section, now
+
+
+@contextmanager
+def timed_view(view, timings=RENDER_TIMINGS):
+    """
+    Time a view and the sections it opens with section_header().
+
+    Args:
+        view: View label, used as the timing key
+        timings: Store receiving the durations
+    """
+    run = _ViewRun(view, timings)
+    outer = getattr(_active, 'run', None)
+    _active.run = run
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        run.next_section(None)
+        milliseconds = (time.perf_counter() - start) * 1000
+        timings.record(view, VIEW_TOTAL, milliseconds)
+        trace_span(view, VIEW_TOTAL, milliseconds)
+        _active.run = outer
+
+
+def section_header(title):
+    """
+    Render a section header and start timing the section below it.
+
+    Outside a timed view (e.g. a fragment rerunning on its own) only the
+    header is rendered.
+
+    Args:
+        title: Header text (HTML allowed)
+    """
+    run = getattr(_active, 'run', None)
+    if run is not None:
+        run.next_section(title.strip())
+    st.markdown(f'<div class="section-header">{title}</div>', unsafe_allow_html=True)
+
+
+def start_profiler():
+    """
+    Start profiling this rerun if ?profile=1 is set.
+
+    Returns:
+        cProfile.Profile or None: Running profiler, to be passed to
+            developer_panel at the end of the script
+    """
+    if st.query_params.get(PROFILE_PARAM) != "1":
+        return None
+
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def _finish_profile(profiler, view):
+    """Stop the profiler and keep its stats for download in the session."""
+    import marshal
+
+    profiler.disable()
+    profiler.create_stats()
+    # Same format as Profile.dump_stats, readable by pstats.Stats
+    st.session_state[_PROFILE_STATE] = (view, marshal.dumps(profiler.stats))
+    # Profile a single rerun: the download click must not profile again
+    del st.query_params[PROFILE_PARAM]
+
+
+def developer_panel(view, profiler=None):
+    """
+    Render the developer sidebar panel when ?dev=1 is set or a profile is ready.
+
+    Args:
+        view: View label rendered in this rerun
+        profiler: Profiler returned by start_profiler, stopped here
+    """
+    if profiler is not None:
+        _finish_profile(profiler, view)
+
+    profile = st.session_state.get(_PROFILE_STATE)
+    if st.query_params.get(DEV_PARAM) != "1" and profile is None:
+        return
+
+    with st.sidebar.expander("🛠️ Developer: Render Timings", expanded=True):
+        if st.button("Reset timings"):
+            RENDER_TIMINGS.clear()
+
+        st.caption(f"Last {RENDER_TIMINGS.window} renders per section, this server process")
+        st.dataframe(RENDER_TIMINGS.summary(view).drop(columns='View').round(1),
+                     hide_index=True, use_container_width=True)
+
+        totals = RENDER_TIMINGS.summary()
+        totals = totals[totals['Section'] == VIEW_TOTAL].drop(columns='Section')
+        st.caption("Whole-view render time, every view")
+        st.dataframe(totals.round(1), hide_index=True, use_container_width=True)
+
+        if profile is not None:
+            profiled_view, stats = profile
+            st.download_button(
+                f"Download cProfile stats ({profiled_view})",
+                data=stats,
+                file_name=f"render_{profiled_view.lower().replace(' ', '_')}.prof",
+                mime="application/octet-stream",
+            )
@@ -0,0 +1,34 @@
+"""
+Launch the dashboard with its server-side services started up front.
+
+``streamlit run app.py`` only executes the app once the first browser
+session connects. This launcher starts the server-side services in the server
+process before Streamlit starts, so they are up before anyone opens the
+page: the opt-in metrics exporter (GOB_METRICS_PORT, see gob.metrics) and
+the background cache warm-up (disable with GOB_WARMUP=0, see gob.warmup).
+
+Usage (from the repository root; extra arguments go to streamlit run):
+
+    GOB_METRICS_PORT=9464 python -m gob.serve --server.port 8501
+"""
+import sys
+from pathlib import Path
+
+from gob.metrics import start_metrics_server
+from gob.warmup import start_warmup
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+
+def main():
+    """Start the server-side services, then hand over to streamlit run."""
+    from streamlit.web import cli
+
+    start_metrics_server()
+    start_warmup()
+    sys.argv = ["streamlit", "run", str(APP_PATH), *sys.argv[1:]]
+    sys.exit(cli.main())
+
+
+if __name__ == '__main__':
+    main()
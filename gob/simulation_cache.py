@@ -0,0 +1,33 @@
+"""
+Shared memoization layer for the simulator computations.
+
+Slider changes rerun the Streamlit script from the top, and users often drag
+back to values they have just looked at. The debt dynamics, tourism
+trade-off and optimal inflation results are therefore memoized in
+process-wide caches keyed on the normalized parameter tuple. Each cache is
+bounded both by entry count (least recently used entries are evicted first)
+and by age, so memory stays flat however many sessions the server handles,
+and it counts hits, misses and evictions for monitoring.
+"""
+from gob.cache import SimulationCache
+from gob.debt_dynamics import simulate_debt
+from gob.inflation import optimal_inflation, tourism_tradeoff
+
+
+# Caches shared by every session in the server process. Inflation response
+# curves are ~200 KB each against ~1 KB for a debt path, so they get their
+# own, smaller bound.
+SIMULATION_CACHE = SimulationCache(name="simulation")
+INFLATION_CACHE = SimulationCache(max_entries=256, name="inflation")
+
+cached_simulate_debt = SIMULATION_CACHE.memoize(simulate_debt)
+cached_tourism_tradeoff = SIMULATION_CACHE.memoize(tourism_tradeoff)
+cached_optimal_inflation = INFLATION_CACHE.memoize(optimal_inflation)
+
+
+def cache_stats():
+    """Counters of the shared simulation caches, keyed by cache name."""
+    return {
+        'simulation': SIMULATION_CACHE.stats(),
+        'inflation': INFLATION_CACHE.stats(),
+    }
@@ -0,0 +1,237 @@
+"""
+Versioned Arrow snapshot of the dashboard dataset.
+
+Building the dataset reads every statement table from the extraction cache
+and derives the variance and growth columns, which takes a few hundred
+milliseconds on each st.cache_data miss. The snapshot stores the finished
+frames as uncompressed Arrow IPC files, one per frame, plus a manifest with
+the scalar figures. Loading memory-maps the files, so the numeric columns are
+read-only views of pages in the OS page cache that every worker process
+shares, and load time depends on the number of frames rather than rows.
+
+manifest.json records SNAPSHOT_VERSION and the SHA-256 of every file the
+dataset is built from (the statements PDF, gob/data.py and gob/extraction),
+so the snapshot is rebuilt on the next load after any of them changes.
+
+Build (or rebuild) the snapshot with:
+
+    python -m gob.snapshot
+"""
+import argparse
+import hashlib
+import json
+import time
+from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.ipc
+
+from gob.atomic import atomic_path
+
+SNAPSHOT_VERSION = 1
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SNAPSHOT_DIR = REPO_ROOT / "data" / "dataset_snapshot"
+
+# Field metadata of object columns mixing numbers and text (e.g. Amount
+# "Not Quantified"), which Arrow cannot type; they are stored as JSON text
+_JSON_FIELD = {b"gob.encoding": b"json"}
+
+
+def code_files():
+    """Code and correction files the dataset is built with."""
+    package = REPO_ROOT / "gob"
+    code = [package / "data.py"] + sorted((package / "extraction").glob("*.py"))
+    return code + sorted((package / "extraction").glob("*.csv"))
+
+
+def source_files():
+    """Files the dataset is built from, relative to the repository root."""
+    from gob.extraction.dataset import STATEMENT_TABLES
+
+    documents = sorted({spec.document for spec in STATEMENT_TABLES})
+    return [REPO_ROOT / name for name in documents] + code_files()
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for block in iter(lambda: source.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_hashes(paths=None):
+    """SHA-256 of paths (default source_files()), keyed by path relative to the repository root."""
+    paths = source_files() if paths is None else paths
+    return {path.relative_to(REPO_ROOT).as_posix(): _file_sha256(path) for path in paths}
+
+
+def _current_sources(recorded):
+    """
+    Hashes of the sources a snapshot was built from, as they are now.
+
+    The documents are taken from the manifest rather than from gob.extraction,
+    so a dashboard cold start does not import the extraction package. Adding
+    a document changes gob/extraction/dataset.py, which is hashed anyway.
+    """
+    code = code_files()
+    names = {path.relative_to(REPO_ROOT).as_posix() for path in code}
+    documents = [REPO_ROOT / name for name in recorded if name not in names]
+    return source_hashes(documents + code)
+
+
+def _is_mixed(column):
+    return column.dtype == object and not column.map(lambda value: isinstance(value, str)).all()
+
+
+def frame_table(frame):
+    """Arrow table of a frame, with mixed-type object columns encoded as JSON text."""
+    fields = []
+    arrays = []
+    for name in frame.columns:
+        column = frame[name]
+        if _is_mixed(column):
+            fields.append(pa.field(name, pa.string(), metadata=_JSON_FIELD))
+            arrays.append(pa.array([json.dumps(value) for value in column], pa.string()))
+        else:
+            array = pa.Array.from_pandas(column)
+            fields.append(pa.field(name, array.type))
+            arrays.append(array)
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def table_frame(table):
+    """
+    Read-only frame of a snapshot table.
+
+    Numeric columns stay zero-copy views of the mapped file; the text and
+    JSON columns are built in memory and then marked read-only too, so
+    assigning into the frame raises instead of changing data other sessions
+    share.
+    """
+    frame = table.to_pandas(split_blocks=True)
+    for field in table.schema:
+        if field.metadata == _JSON_FIELD:
+            frame[field.name] = frame[field.name].map(json.loads)
+    for name in frame.columns:
+        values = np.asarray(frame[name])
+        # With split_blocks every column is its own block, the base of this view
+        if isinstance(values.base, np.ndarray):
+            values.base.setflags(write=False)
+        values.setflags(write=False)
+    return frame
+
+
+def _write_ipc(path, table):
+    # A process that mapped the old file keeps reading it until it reloads
+    with atomic_path(path) as temporary:
+        with pa.OSFile(str(temporary), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def build_snapshot(directory=SNAPSHOT_DIR):
+    """
+    Build the dataset and write it to disk.
+
+    Args:
+        directory: Output directory for the .arrow files and manifest
+
+    Returns:
+        Path: Directory the snapshot was written to
+    """
+    from gob.data import build_financial_data, build_key_metrics
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    sources = source_hashes()
+    financial_data = build_financial_data()
+
+    frames = []
+    values = {}
+    for name, value in financial_data.items():
+        if isinstance(value, dict):
+            values[name] = value
+        else:
+            _write_ipc(directory / f"{name}.arrow", frame_table(value))
+            frames.append(name)
+
+    manifest = json.dumps({
+        "version": SNAPSHOT_VERSION,
+        "sources": sources,
+        "keys": list(financial_data),
+        "frames": frames,
+        "values": values,
+        "metrics": build_key_metrics(),
+    }, indent=2)
+    with atomic_path(directory / "manifest.json") as temporary:
+        temporary.write_text(manifest)
+    return directory
+
+
+class DatasetSnapshot:
+    """Memory-mapped dashboard dataset."""
+
+    def __init__(self, directory=SNAPSHOT_DIR):
+        directory = Path(directory)
+        manifest = json.loads((directory / "manifest.json").read_text())
+        if manifest["version"] != SNAPSHOT_VERSION or manifest["sources"] != _current_sources(manifest["sources"]):
+            raise ValueError(f"Stale dataset snapshot in {directory}, rebuild it")
+
+        # Changes whenever the snapshot is rebuilt from different sources or code
+        self.version = hashlib.sha256(
+            json.dumps([manifest["version"], manifest["sources"]], sort_keys=True).encode()).hexdigest()[:16]
+        self.keys = manifest["keys"]
+        self.values = manifest["values"]
+        self.metrics = manifest["metrics"]
+        # read_all() on a memory map references the mapped pages instead of copying them
+        self.tables = {
+            name: pa.ipc.open_file(pa.memory_map(str(directory / f"{name}.arrow"), "r")).read_all()
+            for name in manifest["frames"]
+        }
+
+    @classmethod
+    def load_or_build(cls, directory=SNAPSHOT_DIR):
+        """Load the snapshot, building it first if it is missing or stale."""
+        try:
+            return cls(directory)
+        except (OSError, ValueError, KeyError, pa.ArrowInvalid):
+            build_snapshot(directory)
+            return cls(directory)
+
+    def financial_data(self):
+        """
+        The dataset in the shape load_financial_data() returns.
+
+        Returns:
+            dict: Read-only DataFrames (table_frame) and read-only figure
+                mappings by name, in build order
+        """
+        return {
+            key: table_frame(self.tables[key]) if key in self.tables else MappingProxyType(self.values[key])
+            for key in self.keys
+        }
+
+
+def main():
+    """Rebuild the snapshot and report the build and load times."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--directory', type=Path, default=SNAPSHOT_DIR, help="Snapshot directory")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    build_snapshot(args.directory)
+    built = time.perf_counter()
+    snapshot = DatasetSnapshot(args.directory)
+    snapshot.financial_data()
+    loaded = time.perf_counter()
+
+    rows = sum(table.num_rows for table in snapshot.tables.values())
+    size = sum(path.stat().st_size for path in Path(args.directory).glob("*.arrow"))
+    print(f"Wrote {len(snapshot.tables)} frames ({rows} rows, {size / 1024:.0f} KiB) to {args.directory}")
+    print(f"build {(built - start) * 1000:.0f} ms, load {(loaded - built) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
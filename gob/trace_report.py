@@ -0,0 +1,147 @@
+"""
+Latency report for the rerun trace log written by gob.tracing.
+
+Reads a trace file and its rotated backups (trace.jsonl.1, .2, ...), and
+prints rerun latency percentiles per view. It can also break the latency
+down by triggering widget, and by section from the span records.
+
+Usage (from the repository root):
+
+    python -m gob.trace_report logs/trace.jsonl
+    python -m gob.trace_report logs/trace.jsonl --sections --json latency.json
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from gob.tracing import TRACE_FILE_ENV
+
+PERCENTILES = (0.50, 0.95, 0.99)
+
+
+def trace_files(path):
+    """The trace file and its rotated backups, oldest first."""
+    path = Path(path)
+    backups = sorted(
+        (p for p in path.parent.glob(f"{path.name}.*") if p.suffix[1:].isdigit()),
+        key=lambda p: int(p.suffix[1:]), reverse=True
+    )
+    return backups + ([path] if path.exists() else [])
+
+
+def load_trace(path):
+    """
+    Load every record of a trace log, skipping lines that are not valid JSON
+    (e.g. a line cut off by a crash).
+
+    Args:
+        path: Current trace file; its rotated backups are read too
+
+    Returns:
+        pd.DataFrame: One row per record
+    """
+    records = []
+    for file in trace_files(path):
+        with open(file, encoding="utf-8") as lines:
+            for line in lines:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return pd.DataFrame.from_records(records)
+
+
+def latency_summary(frame, by):
+    """
+    Duration percentiles of frame grouped by the given columns.
+
+    Args:
+        frame: Records with a duration_ms column
+        by: Column name or list of column names to group by
+
+    Returns:
+        pd.DataFrame: count, p50, p95, p99 and max duration per group,
+            slowest p95 first
+    """
+    grouped = frame.groupby(by)['duration_ms']
+    summary = grouped.quantile(list(PERCENTILES)).unstack()
+    summary.columns = [f"p{round(q * 100)}_ms" for q in PERCENTILES]
+    summary.insert(0, 'count', grouped.size())
+    summary['max_ms'] = grouped.max()
+    return summary.sort_values('p95_ms', ascending=False)
+
+
+def rerun_summary(frame):
+    """
+    Per-view latency of whole-script and fragment reruns.
+
+    Returns:
+        pd.DataFrame: Latency percentiles with the mean payload and the
+            cache hit rate, indexed by (view, record type)
+    """
+    reruns = frame[frame['type'].isin(['rerun', 'fragment'])]
+    summary = latency_summary(reruns, ['view', 'type'])
+    grouped = reruns.groupby(['view', 'type'])
+    # payload_bytes is null when the Streamlit version hides the send queue
+    payload = pd.to_numeric(reruns['payload_bytes'], errors='coerce')
+    summary['payload_kb'] = payload.groupby([reruns['view'], reruns['type']]).mean() / 1024
+    lookups = grouped['cache_hits'].sum() + grouped['cache_misses'].sum()
+    summary['cache_hit_rate'] = grouped['cache_hits'].sum() / lookups.where(lookups > 0)
+    return summary
+
+
+def trigger_summary(frame):
+    """Latency per (view, widget that triggered the rerun)."""
+    reruns = frame[frame['type'].isin(['rerun', 'fragment'])].copy()
+    reruns['trigger'] = reruns['trigger'].map(
+        lambda keys: ", ".join(keys) if isinstance(keys, list) and keys else "(no widget change)"
+    )
+    return latency_summary(reruns, ['view', 'trigger'])
+
+
+def section_summary(frame):
+    """Latency per (view, section) from the span records."""
+    return latency_summary(frame[frame['type'] == 'span'], ['view', 'section'])
+
+
+def main():
+    """Print the latency report of a trace log."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('path', nargs='?', default=os.environ.get(TRACE_FILE_ENV),
+                        help=f"Trace file (default: ${TRACE_FILE_ENV})")
+    parser.add_argument('--triggers', action='store_true', help="Break reruns down by triggering widget")
+    parser.add_argument('--sections', action='store_true', help="Break views down by section")
+    parser.add_argument('--json', help="Write the summaries to this file")
+    args = parser.parse_args()
+
+    if not args.path:
+        parser.error(f"no trace file given and {TRACE_FILE_ENV} is not set")
+    frame = load_trace(args.path)
+    if frame.empty or 'type' not in frame:
+        sys.exit(f"No trace records in {args.path}")
+
+    summaries = {'views': rerun_summary(frame)}
+    if args.triggers:
+        summaries['triggers'] = trigger_summary(frame)
+    if args.sections and (frame['type'] == 'span').any():
+        summaries['sections'] = section_summary(frame)
+
+    with pd.option_context('display.width', 200, 'display.max_rows', None,
+                           'display.max_colwidth', 60, 'display.float_format', '{:,.1f}'.format):
+        for name, summary in summaries.items():
+            print(f"\nRerun latency by {name[:-1]} (slowest p95 first):")
+            print(summary.to_string())
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            name: summary.reset_index().to_dict(orient='records')
+            for name, summary in summaries.items()
+        }, indent=2, default=float))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+"""
+Structured trace log of dashboard reruns.
+
+Set GOB_TRACE_FILE to a path to enable it. Every script rerun, every
+fragment rerun and every timed view section is then written as one JSON
+line to a size-rotated log file. The records are serialized on the script
+thread, and file I/O happens on a background QueueListener thread. With the
+variable unset, tracing costs one attribute check per call.
+
+Record types:
+
+    rerun     whole-script rerun: view, widgets that triggered it, duration,
+              cache hits/misses and payload bytes sent to the browser (null
+              when this Streamlit version does not expose the send queue)
+    fragment  rerun of a single @st.fragment, same fields
+    span      one timed section of a view (see gob.profiling)
+
+Summarize a log with python -m gob.trace_report. Reruns are also measured
+when only the metrics exporter is enabled (GOB_METRICS_PORT, see gob.metrics),
+which receives every rerun's duration and payload.
+"""
+import atexit
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from gob.cache import thread_lookups
+from gob.metrics import metrics_enabled, observe_rerun
+
+TRACE_FILE_ENV = "GOB_TRACE_FILE"
+MAX_BYTES = 20 * 1024 * 1024   # Size of one log file before it rotates
+BACKUP_COUNT = 5               # Rotated files kept next to the current one
+
+INITIAL_LOAD = "(initial load)"
+_WIDGET_STATE = "_trace_widget_values"
+_WIDGET_TYPES = (bool, int, float, str, tuple, list, type(None))
+
+_active = threading.local()    # Rerun being traced in this script thread
+_setup_lock = threading.Lock()
+_logger = None
+
+
+def _trace_logger():
+    """Logger writing to the rotating trace file, or None when tracing is off."""
+    global _logger
+    if _logger is not None:
+        return _logger or None
+
+    with _setup_lock:
+        if _logger is None:
+            path = os.environ.get(TRACE_FILE_ENV)
+            if not path:
+                _logger = False
+            else:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    path, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8"
+                )
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                records = queue.SimpleQueue()
+                listener = logging.handlers.QueueListener(records, handler)
+                listener.start()
+                atexit.register(listener.stop)
+
+                logger = logging.getLogger("gob.trace")
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+                logger.addHandler(logging.handlers.QueueHandler(records))
+                _logger = logger
+    return _logger or None
+
+
+def tracing_enabled():
+    """True if GOB_TRACE_FILE is set."""
+    return _trace_logger() is not None
+
+
+def _write(record):
+    """Append one record to the trace log."""
+    _trace_logger().info(json.dumps(record, separators=(",", ":"), default=str))
+
+
+class _PayloadMeter:
+    """Wraps a session's enqueue function, counting the ForwardMsg bytes sent."""
+
+    def __init__(self, enqueue):
+        self.enqueue = enqueue
+        self.bytes = 0
+        self.messages = 0
+
+    def __call__(self, msg):
+        self.bytes += msg.ByteSize()
+        self.messages += 1
+        self.enqueue(msg)
+
+
+def _payload_meter(ctx):
+    """
+    Install (once per script run context) and return the payload meter.
+
+    ScriptRunContext._enqueue is private Streamlit API (tested up to the
+    version pinned in requirements.txt). Without it the payload is unknown
+    and None is returned.
+    """
+    enqueue = getattr(ctx, "_enqueue", None)
+    if enqueue is None or not callable(enqueue):
+        return None
+    if not isinstance(enqueue, _PayloadMeter):
+        enqueue = ctx._enqueue = _PayloadMeter(enqueue)
+    return enqueue
+
+
+def _widget_values():
+    """Current values of the keyed widgets in st.session_state."""
+    return {
+        key: value for key, value in st.session_state.items()
+        if not key.startswith("_") and isinstance(value, _WIDGET_TYPES)
+    }
+
+
+def _changed_widgets():
+    """
+    Keys of the widgets whose value changed since the end of the last traced run.
+
+    Only keyed widgets are visible in st.session_state, so the app and
+    view widgets carry keys. Widgets appearing for the first time (e.g. on a
+    newly selected view) are not counted as triggers.
+    """
+    previous = st.session_state.get(_WIDGET_STATE)
+    if previous is None:
+        return [INITIAL_LOAD]
+    return sorted(key for key, value in _widget_values().items() if previous.get(key, value) != value)
+
+
+class RerunTrace:
+    """Measurements of one traced rerun, started by start_trace."""
+
+    def __init__(self, kind, ctx):
+        self.kind = kind
+        self.session = ctx.session_id
+        self.trigger = _changed_widgets()
+        self.meter = _payload_meter(ctx)
+        self._bytes, self._messages = self._sent()
+        self._hits, self._misses = thread_lookups()
+        self.started = time.perf_counter()
+
+    def _sent(self):
+        """Bytes and messages sent so far, (None, None) when the payload is unknown."""
+        if self.meter is None:
+            return None, None
+        return self.meter.bytes, self.meter.messages
+
+    def finish(self, view):
+        """Report the rerun to the metrics exporter and write its record for view."""
+        duration = time.perf_counter() - self.started
+        hits, misses = thread_lookups()
+        sent, messages = self._sent()
+        payload = None if sent is None else sent - self._bytes
+        st.session_state[_WIDGET_STATE] = _widget_values()
+        observe_rerun(view, self.kind, duration, payload)
+        if not tracing_enabled():
+            return
+        _write({
+            "ts": time.time(),
+            "type": self.kind,
+            "session": self.session,
+            "view": view,
+            "trigger": self.trigger,
+            "duration_ms": round(duration * 1000, 3),
+            "cache_hits": hits - self._hits,
+            "cache_misses": misses - self._misses,
+            "payload_bytes": payload,
+            "messages": None if messages is None else messages - self._messages,
+        })
+
+
+def start_trace(kind="rerun"):
+    """
+    Start tracing the current script run.
+
+    Returns:
+        RerunTrace or None: Trace to pass to finish_trace, None when neither
+            tracing nor metrics are on or there is no script run context
+            (bare mode)
+    """
+    if not (tracing_enabled() or metrics_enabled()):
+        return None
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    trace = RerunTrace(kind, ctx)
+    _active.trace = trace
+    return trace
+
+
+def finish_trace(trace, view):
+    """Write the rerun record started by start_trace (no-op for None)."""
+    if trace is None:
+        return
+    _active.trace = None
+    trace.finish(view)
+
+
+def trace_span(view, section, milliseconds):
+    """Write a span record for a timed section of the rerun being traced."""
+    trace = getattr(_active, "trace", None)
+    if trace is None or not tracing_enabled():
+        return
+    _write({
+        "ts": time.time(),
+        "type": "span",
+        "session": trace.session,
+        "view": view,
+        "section": section,
+        "duration_ms": round(milliseconds, 3),
+    })
+
+
+def _fragment_rerun(ctx):
+    """True if the current run reruns fragments only, not the whole script."""
+    if hasattr(ctx, "fragment_ids_this_run"):
+        return bool(ctx.fragment_ids_this_run)
+    return getattr(_active, "trace", None) is None
+
+
+def traced_fragment(view):
+    """
+    Decorator making func an st.fragment whose own reruns are traced under view.
+
+    When the fragment runs as part of a full rerun it is covered by that
+    rerun's trace instead. Fragment reruns are recognised by
+    ScriptRunContext.fragment_ids_this_run; if a Streamlit release drops it,
+    any run of the fragment outside a traced full rerun counts as one.
+    Outside a script run (bare mode, e.g. the cache warmer) st.fragment would
+    skip the body, so it is run inline instead.
+
+    Args:
+        view: View label the fragment belongs to
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def traced(*args, **kwargs):
+            ctx = get_script_run_ctx()
+            if ctx is None or not _fragment_rerun(ctx):
+                return func(*args, **kwargs)
+            trace = start_trace("fragment")
+            try:
+                return func(*args, **kwargs)
+            finally:
+                finish_trace(trace, view)
+
+        fragment = st.fragment(traced)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if get_script_run_ctx(suppress_warning=True) is None:
+                return traced(*args, **kwargs)
+            return fragment(*args, **kwargs)
+        return wrapper
+    return decorator
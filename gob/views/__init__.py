@@ -0,0 +1,54 @@
+"""
+Dashboard views, one module per entry in the view selector.
+
+A view module is imported the first time it is selected and then stays in
+sys.modules, so a cold start or rerun only compiles and executes the view
+being shown. Every view module exposes render(context).
+"""
+import importlib
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from gob.profiling import timed_view
+
+# View selector label -> module in this package, in selector order
+VIEW_MODULES = {
+    "Executive Summary": "executive_summary",
+    "Revenue Analysis": "revenue_analysis",
+    "Expenditure Analysis": "expenditure_analysis",
+    "Balance Sheet": "balance_sheet",
+    "Audit Findings": "audit_findings",
+    "Debt Analysis": "debt_analysis",
+    "Debt Sustainability Simulator": "debt_sustainability_simulator",
+    "SOE Transfers": "soe_transfers",
+    "Performance Highlights": "performance_highlights",
+    "Data Quality Issues": "data_quality_issues",
+    "Story View": "story_view",
+    "BERT 2026 Risk Analysis": "bert_risk_analysis",
+    "2026 Reality Check": "reality_check_2026",
+}
+
+
+@dataclass(frozen=True)
+class ViewContext:
+    """Loaded data and sidebar options shared by every view."""
+
+    financial_data: Mapping[str, Any]  # Read-only, shared by every session (gob.data)
+    metrics: Mapping[str, Any]
+    dataset_version: str  # DatasetSnapshot.version the data was loaded from
+    currency_format: str
+    show_comparative: bool
+
+
+def render_view(view_option, context):
+    """
+    Import a view module on first use and render it, timing its sections.
+
+    Args:
+        view_option: Label selected in the sidebar view selector
+        context: ViewContext passed to the view
+    """
+    # A first selection's import time counts towards the view's first section
+    with timed_view(view_option):
+        module = importlib.import_module(f"{__name__}.{VIEW_MODULES[view_option]}")
+        module.render(context)
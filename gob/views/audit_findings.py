@@ -0,0 +1,118 @@
+"""
+Audit Findings view: adverse opinion items and material misstatements.
+"""
+import streamlit as st
+import pandas as pd
+
+from gob.cards import compliance_cards, severity_cards
+from gob.profiling import section_header
+
+
+def render(context):
+    """
+    Render the Audit Findings view.
+    
+    Args:
+        context: ViewContext with the loaded data and sidebar options
+    """
+    financial_data = context.financial_data
+    currency_format = context.currency_format
+    
+    # Audit Findings View
+    st.markdown('<div class="sub-header">Audit Findings & Material Misstatements</div>', unsafe_allow_html=True)
+    
+    # Adverse Opinion Summary
+    with st.container():
+        st.markdown("""
+        <div class="financial-card adverse-opinion">
+            <h3 style="color: #DC2626; margin-top: 0;">❌ ADVERSE AUDIT OPINION - KEY FINDINGS</h3>
+            <p><strong>Basis for Adverse Opinion (Extract from Auditor General's Report):</strong></p>
+            <p>"The total for Other Capital Assets could not be confirmed because of a difference of $719 million between the amounts reported in the financial statements compared with the corresponding figures listed in the subsidiary records. Cash and Financial Investments listed in the financial statements were overstated by $115 million and $147 million respectively. In addition, the liability for pensions and employee benefits were not included in the Statement of Financial Position and the accounts of the State-owned Entities were not consolidated into the financial statements as required by the International Public Sector Accounting Standards (IPSAS). Also, Tax Receivables of $2.43 billion and Bad Debt Expenses of $68.28 million could not be confirmed because of the absence of sufficient supporting documentation."</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Note 34 Specific Errors - FIXED with proper HTML formatting
+    narrative_amount = financial_data['note34_discrepancy']['narrative_amount']
+    table_amount = financial_data['note34_discrepancy']['table_amount']
+    difference = financial_data['note34_discrepancy']['difference']
+    difference_pct = financial_data['note34_discrepancy']['difference_pct']
+    
+    with st.container():
+        st.markdown("""
+        <div class="financial-card data-error">
+            <h4 style="color: #DC2626; margin-top: 0;">⚠️ SPECIFIC ERRORS IN NOTE 34</h4>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Create two columns for the errors
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 1. Numerical Discrepancy")
+            st.markdown(f"""
+            <div style="padding: 10px; background-color: #FEF2F2; border-radius: 5px; margin-bottom: 10px;">
+                <p><strong>Narrative states:</strong> SOE transfers = ${narrative_amount:,.0f}</p>
+                <p><strong>Table shows:</strong> SOE transfers = ${table_amount:,.0f}</p>
+                <p><strong>Difference:</strong> ${difference:,.0f} ({difference_pct:.1f}% variance)</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("### 2. Conceptual Error")
+            st.markdown(f"""
+            <div style="padding: 10px; background-color: #FFFBEB; border-radius: 5px; margin-bottom: 10px;">
+                <p><strong>Note 34 states:</strong> "Notes 8 and 10 dealt with other related party transactions which occurred during the financial year 2022-2023."</p>
+                <p><strong>Why this is WRONG:</strong></p>
+                <ul>
+                    <li><strong>Note 8:</strong> Retiring benefits (pensions) - NOT related party transactions</li>
+                    <li><strong>Note 10:</strong> Debt service costs (interest) - NOT related party transactions</li>
+                    <li>These are routine government payments to external parties, not transactions with controlled entities (SOEs)</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div style="background-color: #EFF6FF; padding: 15px; border-radius: 5px; margin-top: 10px; border-left: 4px solid #3B82F6;">
+            <p><strong>Impact:</strong> Shows fundamental misunderstanding of accounting concepts and reinforces unreliable financial reporting</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Material Misstatements
+    section_header('Material Misstatements Identified')
+    
+    st.markdown(
+        severity_cards(financial_data['adverse_opinion_items'], currency_format),
+        unsafe_allow_html=True
+    )
+    
+    # IPSAS Compliance Issues
+    section_header('IPSAS Compliance Failures')
+    
+    ipsas_issues = [
+        {
+            'Requirement': 'Consolidation of State-Owned Entities',
+            'Status': '❌ NOT COMPLIANT',
+            'Impact': 'Financial statements incomplete and misleading',
+            'Remediation': 'Require full consolidation of all SOEs'
+        },
+        {
+            'Requirement': 'Recognition of Pension Liabilities',
+            'Status': '❌ NOT COMPLIANT',
+            'Impact': 'Liabilities understated by unquantified amount',
+            'Remediation': 'Actuarial valuation and proper accounting'
+        },
+        {
+            'Requirement': 'Asset Valuation and Verification',
+            'Status': '⚠️ PARTIALLY COMPLIANT',
+            'Impact': 'Assets potentially overstated by $981M+',
+            'Remediation': 'Complete asset register reconciliation'
+        },
+        {
+            'Requirement': 'Revenue Recognition (Tax Receivables)',
+            'Status': '❌ NOT COMPLIANT',
+            'Impact': '$2.43B receivables unverified',
+            'Remediation': 'Documentation and verification procedures'
+        }
+    ]
+    
+    st.markdown(compliance_cards(pd.DataFrame(ipsas_issues)), unsafe_allow_html=True)
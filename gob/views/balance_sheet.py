@@ -0,0 +1,107 @@
+"""
+Balance Sheet view: assets, liabilities and net position.
+"""
+import streamlit as st
+import plotly.graph_objects as go
+
+from gob.cards import change_cards
+from gob.figure_cache import cached_figure
+from gob.formatting import format_currency
+from gob.profiling import section_header
+
+
+def render(context):
+    """
+    Render the Balance Sheet view.
+    
+    Args:
+        context: ViewContext with the loaded data and sidebar options
+    """
+    financial_data = context.financial_data
+    metrics = context.metrics
+    currency_format = context.currency_format
+    
+    # Balance Sheet View
+    st.markdown('<div class="sub-header">Statement of Financial Position Analysis</div>', unsafe_allow_html=True)
+    
+    # Assets vs Liabilities Overview
+    section_header('Assets vs Liabilities Overview')
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            "Total Assets", 
+            format_currency(metrics['total_assets_2023'], currency_format), 
+            f"{format_currency(metrics['total_assets_2023'] - metrics['total_assets_2022'], currency_format)}"
+        )
+    
+    with col2:
+        st.metric(
+            "Total Liabilities", 
+            format_currency(metrics['total_liabilities_2023'], currency_format), 
+            f"{format_currency(metrics['total_liabilities_2023'] - metrics['total_liabilities_2022'], currency_format)}"
+        )
+    
+    with col3:
+        net_position = metrics['total_assets_2023'] - metrics['total_liabilities_2023']
+        net_position_prev = metrics['total_assets_2022'] - metrics['total_liabilities_2022']
+        change = net_position - net_position_prev
+        
+        st.metric(
+            "Net Position", 
+            format_currency(net_position, currency_format), 
+            f"{format_currency(change, currency_format)}", 
+            delta_color="normal" if net_position >= 0 else "inverse"
+        )
+    
+    # Asset Composition
+    section_header('Asset Composition (March 31, 2023)')
+    
+    asset_data = financial_data['balance_sheet'].copy()
+    
+    # Group assets
+    current_assets = asset_data[asset_data['Category'] == 'Current Assets']['Actual_Mar_23'].values[0]
+    non_current_assets = asset_data[asset_data['Category'] == 'Non-Current Assets']['Actual_Mar_23'].values[0]
+    
+    def build_asset_distribution():
+        fig = go.Figure(data=[go.Pie(
+            labels=['Current Assets', 'Non-Current Assets'],
+            values=[current_assets, non_current_assets],
+            hole=.3,
+            marker_colors=['#3B82F6', '#1D4ED8']
+        )])
+        fig.update_layout(title='Asset Distribution')
+        return fig
+    
+    st.plotly_chart(cached_figure(__name__, 'asset_distribution', context, build_asset_distribution), use_container_width=True)
+    
+    # Key Asset Items
+    section_header('Key Asset Items')
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        key_assets = asset_data[asset_data['Category'].isin([
+            'Cash on Hand', 'Bank', 'Tax Receivables (Net)', 
+            'Investments', 'Land'
+        ])]
+        
+        st.markdown(
+            change_cards(key_assets, 'Category', 'Actual_Mar_23', 'Actual_Mar_22', currency_format),
+            unsafe_allow_html=True
+        )
+    
+    with col2:
+        # Liabilities Breakdown
+        liabilities = financial_data['liabilities_data']
+        key_liabilities = liabilities[liabilities['Category'].isin([
+            'Current Liabilities', 'Long-term Liabilities', 
+            'Government Securities', 'Loans from International Financial Institutions'
+        ])]
+        
+        st.markdown(
+            change_cards(key_liabilities, 'Category', 'Actual_Mar_23', 'Actual_Mar_22', currency_format,
+                         increase_is_good=False),
+            unsafe_allow_html=True
+        )
@@ -0,0 +1,189 @@
+"""
+Data Quality Issues view: financial reporting errors in the statements.
+"""
+import streamlit as st
+
+
+
+
+def render(context):
+    """
+    Render the Data Quality Issues view.
+    
+    Args:
+        context: ViewContext with the loaded data and sidebar options
+    """
+    financial_data = context.financial_data
+    
+    # Data Quality Issues View - FIXED with simpler HTML structure
+    st.markdown('<div class="sub-header">Data Quality Issues & Financial Reporting Errors</div>', unsafe_allow_html=True)
+    
+    # Note 34 Errors - Detailed Analysis
+    narrative_amount = financial_data['note34_discrepancy']['narrative_amount']
+    table_amount = financial_data['note34_discrepancy']['table_amount']
+    difference = financial_data['note34_discrepancy']['difference']
+    difference_pct = financial_data['note34_discrepancy']['difference_pct']
+    
+    with st.container():
+        st.markdown("""
+        <div class="financial-card data-error">
+            <h3 style="color: #DC2626; margin-top: 0;">❌ CRITICAL DATA QUALITY ISSUES IN NOTE 34</h3>
+            <p><strong>Note 34: Related Party Transactions - Contains Multiple Material Errors</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Error 1: Numerical Discrepancy
+    st.markdown("### 1. NUMERICAL DISCREPANCY - NARRATIVE VS TABLE")
+    st.markdown("**The Problem:** Note 34 narrative text contradicts the accompanying table")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="narrative-box">
+            <h5 style="color: #DC2626; margin-top: 0;">NARRATIVE TEXT</h5>
+            <p style="font-size: 1.2rem; font-weight: bold; color: #DC2626;">
+                "${narrative_amount:,.0f}"
+            </p>
+            <p><em>"The Government reporting entity recorded transfers of <strong>${narrative_amount:,.0f}</strong> to fund the operations of the SOEs..."</em></p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="table-box">
+            <h5 style="color: #3B82F6; margin-top: 0;">TABLE TOTAL</h5>
+            <p style="font-size: 1.2rem; font-weight: bold; color: #3B82F6;">
+                "${table_amount:,.0f}"
+            </p>
+            <p>Sum of all transfers in the Note 34 table</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown(f"""
+    <div class="analysis-box">
+        <h5 style="color: #D97706; margin-top: 0;">DISCREPANCY ANALYSIS</h5>
+        <p><strong>Difference:</strong> ${difference:,.0f}</p>
+        <p><strong>Percentage Variance:</strong> {difference_pct:.1f}%</p>
+        <p><strong>Impact:</strong> Which number is correct? The narrative or the table?</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Error 2: Conceptual Error
+    st.markdown("### 2. CONCEPTUAL ERROR - INCORRECT ACCOUNTING CLASSIFICATION")
+    st.markdown("**The Problem:** Note 34 incorrectly references Notes 8 and 10 as 'related party transactions'")
+    
+    st.markdown(f"""
+    <div style="margin: 15px 0; padding: 15px; border-left: 4px solid #D97706; background-color: #FFFBEB;">
+        <p><strong>Note 34 states:</strong> "Notes 8 and 10 dealt with other related party transactions which occurred during the financial year 2022-2023."</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col3, col4 = st.columns(2)
+    
+    with col3:
+        st.markdown("""
+        <div class="narrative-box">
+            <h5 style="color: #DC2626; margin-top: 0;">NOTE 8: RETIRING BENEFITS</h5>
+            <p><strong>What it is:</strong> Pension payments to former government employees</p>
+            <p><strong>Why it's NOT a related party transaction:</strong></p>
+            <ul>
+                <li>Payments to former employees</li>
+                <li>Not transactions with controlled entities (SOEs)</li>
+                <li>Routine government expenditure</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown("""
+        <div class="narrative-box">
+            <h5 style="color: #DC2626; margin-top: 0;">NOTE 10: DEBT SERVICE COSTS</h5>
+            <p><strong>What it is:</strong> Interest and loan expense payments</p>
+            <p><strong>Why it's NOT a related party transaction:</strong></p>
+            <ul>
+                <li>Payments to creditors (banks, bondholders)</li>
+                <li>Not transactions with controlled entities (SOEs)</li>
+                <li>External debt service obligations</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="border: 2px solid #10B981; padding: 15px; border-radius: 8px; background-color: #ECFDF5; margin-top: 15px;">
+        <h5 style="color: #10B981; margin-top: 0;">WHAT ARE "RELATED PARTY TRANSACTIONS"?</h5>
+        <p><strong>Correct Definition:</strong> Transactions between the government and entities it <strong>controls</strong> (State-Owned Enterprises)</p>
+        <p><strong>Examples:</strong> Transfers to SOEs, loans to SOEs, purchases from SOEs</p>
+        <p><strong>NOT Related Party Transactions:</strong> Pension payments, debt service, salaries, routine government expenditures</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Impact Analysis
+    st.markdown("### IMPACT ON FINANCIAL REPORTING RELIABILITY")
+    st.markdown("**These errors reinforce the Auditor General's Adverse Opinion:**")
+    
+    col5, col6 = st.columns(2)
+    
+    with col5:
+        # Calculate the formatted values for display
+        narrative_display = f"${narrative_amount/1e6:,.1f}M"
+        table_display = f"${table_amount/1e6:,.1f}M"
+        
+        st.markdown(f"""
+        <div class="financial-card adverse-opinion">
+            <h5 style="color: #DC2626;">1. Undermines Data Credibility</h5>
+            <ul>
+                <li>Which SOE transfer figure is correct? {narrative_display} or {table_display}?</li>
+                <li>Can any number in the financial statements be trusted?</li>
+                <li>Creates uncertainty for users of financial statements</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="financial-card adverse-opinion">
+            <h5 style="color: #DC2626;">3. Supports Adverse Audit Opinion</h5>
+            <ul>
+                <li>Demonstrates "material misstatements"</li>
+                <li>Shows "non-compliance" with accounting standards</li>
+                <li>Validates Auditor General's concerns</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col6:
+        st.markdown("""
+        <div class="financial-card adverse-opinion">
+            <h5 style="color: #DC2626;">2. Reveals Fundamental Accounting Errors</h5>
+            <ul>
+                <li>Basic accounting concepts misunderstood</li>
+                <li>Incorrect classification of transactions</li>
+                <li>Questions competency of financial reporting team</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="financial-card adverse-opinion">
+            <h5 style="color: #DC2626;">4. Raises Governance Concerns</h5>
+            <ul>
+                <li>Poor internal controls</li>
+                <li>Lack of review and verification</li>
+                <li>Weak financial management systems</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="conclusion-box">
+        <h5 style="color: #DC2626; margin-top: 0;">CONCLUSION</h5>
+        <p>The errors in Note 34 are not just minor typos - they are <strong>material misstatements</strong> that:</p>
+        <ol>
+            <li><strong>Contradict</strong> the accompanying table data</li>
+            <li><strong>Misrepresent</strong> basic accounting concepts</li>
+            <li><strong>Undermine</strong> the credibility of the entire financial report</li>
+            <li><strong>Justify</strong> the Auditor General's adverse opinion</li>
+        </ol>
+        <p><strong>Required Action:</strong> Immediate correction and explanation in next financial statements</p>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,162 @@
+"""
+Debt Analysis view: public debt structure and debt service costs.
+"""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from gob.cards import comparison_grid
+from gob.figure_cache import cached_figure
+from gob.formatting import format_currency, format_currency_array
+from gob.profiling import section_header
+
+
+def render(context):
+    """
+    Render the Debt Analysis view.
+    
+    Args:
+        context: ViewContext with the loaded data and sidebar options
+    """
+    financial_data = context.financial_data
+    metrics = context.metrics
+    currency_format = context.currency_format
+    show_comparative = context.show_comparative
+    
+    # Debt Analysis View - COMPLETELY CORRECTED
+    st.markdown('<div class="sub-header">Public Debt Analysis </div>', unsafe_allow_html=True)
+    
+    # Debt Overview
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        debt_ratio = (metrics['total_liabilities_2023'] / metrics['total_assets_2023']) * 100
+        st.metric(
+            "Total Public Debt", 
+            format_currency(metrics['total_liabilities_2023'], currency_format), 
+            f"{debt_ratio:.1f}% of Assets"
+        )
+    
+    with col2:
+        net_debt_change = metrics['net_debt_2023'] - metrics['net_debt_2022']
+        st.metric(
+            "Net Debt Position", 
+            format_currency(metrics['net_debt_2023'], currency_format), 
+            f"{format_currency(net_debt_change, currency_format)}"
+        )
+    
+    with col3:
+        debt_service_ratio = (
+            financial_data['expenditure_data'].loc[8, 'Actual_2023'] / 
+            metrics['total_revenue_2023']
+        ) * 100
+        st.metric(
+            "Debt Service to Revenue", 
+            f"{debt_service_ratio:.1f}%", 
+            f"{format_currency(financial_data['expenditure_data'].loc[8, 'Actual_2023'], currency_format)}"
+        )
+    
+    # Debt Structure Visualization
+    section_header('Public Debt Structure')
+    
+    debt_data = financial_data['debt_structure'].copy()
+    def build_debt_by_type():
+        fig = px.bar(
+            debt_data, 
+            x='Debt_Type', 
+            y='Amount_2023', 
+            title='Public Debt by Type (2023)',
+            color='Debt_Category', 
+            color_discrete_map={'Domestic': '#00267F', 'Foreign': '#DC2626'},
+            text=format_currency_array(debt_data['Amount_2023'], currency_format)
+        )
+        fig.update_layout(yaxis_title=f'Amount ({currency_format})', xaxis_title='Debt Type')
+        fig.update_xaxes(tickangle=45)
+        return fig
+    
+    st.plotly_chart(cached_figure(__name__, 'debt_by_type', context, build_debt_by_type), use_container_width=True)
+    
+    # Debt Composition - CORRECTED Calculation
+    section_header('Debt Composition Analysis ')
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # CORRECTED: Calculate domestic vs foreign debt from the debt structure
+        domestic_debt = debt_data[debt_data['Debt_Category'] == 'Domestic']['Amount_2023'].sum()
+        foreign_debt = debt_data[debt_data['Debt_Category'] == 'Foreign']['Amount_2023'].sum()
+        
+        total_debt_from_structure = domestic_debt + foreign_debt
+        
+        # CORRECTED: The total public debt from balance sheet is $14.93B
+        # The debt structure accounts for part of this, not all
+        total_public_debt = metrics['total_liabilities_2023']
+        
+        st.info(f"""
+        **Debt Composition Analysis:**
+        
+        **From Debt Structure Data:**
+        - **Domestic Debt:** {format_currency(domestic_debt, currency_format)} ({(domestic_debt/total_debt_from_structure*100):.1f}% of structured debt)
+        - **Foreign Debt:** {format_currency(foreign_debt, currency_format)} ({(foreign_debt/total_debt_from_structure*100):.1f}% of structured debt)
+        - **Total Structured Debt:** {format_currency(total_debt_from_structure, currency_format)}
+        
+        **From Balance Sheet:**
+        - **Total Public Debt:** {format_currency(total_public_debt, currency_format)}
+        
+        **Note:** The debt structure data accounts for specific debt instruments, 
+        while the total public debt includes additional liabilities not shown in the debt structure breakdown.
+        """)
+        
+        def build_domestic_vs_foreign():
+            fig = px.pie(
+                names=['Domestic Debt', 'Foreign Debt'],
+                values=[domestic_debt, foreign_debt],
+                title=f'Domestic vs Foreign Debt (Structured Debt: {format_currency(total_debt_from_structure, currency_format)})',
+                color_discrete_sequence=['#00267F', '#FFC726']
+            )
+            fig.update_traces(textposition='inside', textinfo='percent+label')
+            return fig
+        
+        st.plotly_chart(cached_figure(__name__, 'domestic_vs_foreign', context, build_domestic_vs_foreign), use_container_width=True)
+    
+    with col2:
+        # Debt Changes
+        def build_debt_changes():
+            fig = px.bar(
+                debt_data, 
+                x='Debt_Type', 
+                y='Change', 
+                title='Debt Changes (2022 to 2023)',
+                color='Change', 
+                color_continuous_scale='RdYlGn_r',
+                text=format_currency_array(debt_data['Change'], currency_format)
+            )
+            fig.update_layout(yaxis_title=f'Change ({currency_format})', xaxis_title='Debt Type')
+            fig.update_xaxes(tickangle=45)
+            return fig
+        
+        st.plotly_chart(cached_figure(__name__, 'debt_changes', context, build_debt_changes), use_container_width=True)
+    
+    # CORRECTED: Debt Service Analysis
+    section_header('Debt Service Analysis')
+    
+    debt_service = {
+        'Category': [
+            'Interest Expense - Domestic', 'Interest Expense - Foreign', 
+            'Total Interest', 'Expenses of Loans', 'Total Debt Service'
+        ],
+        'Amount_2023': [372283237, 182429845, 554713083, 13564532, 568277615],
+        'Amount_2022': [258748956, 125213222, 383962718, 7490317, 391453035]
+    }
+    
+    debt_service_df = pd.DataFrame(debt_service)
+    debt_service_df['Growth'] = debt_service_df['Amount_2023'] - debt_service_df['Amount_2022']
+    debt_service_df['Growth_Pct'] = (
+        debt_service_df['Growth'] / debt_service_df['Amount_2022']
+    ) * 100
+    
+    st.markdown(
+        comparison_grid(debt_service_df, 'Category', 'Amount_2023', 'Amount_2022', currency_format,
+                        show_previous=show_comparative),
+        unsafe_allow_html=True
+    )
@@ -0,0 +1,184 @@
+"""
+Executive Summary view: the adverse audit opinion, headline metrics and key findings.
+"""
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from gob.figure_cache import cached_figure
+from gob.formatting import format_currency, format_currency_array
+from gob.profiling import section_header
+
+
+def render(context):
+    """
+    Render the Executive Summary view.
+    
+    Args:
+        context: ViewContext with the loaded data and sidebar options
+    """
+    financial_data = context.financial_data
+    metrics = context.metrics
+    currency_format = context.currency_format
+    
+    # Executive Summary View
+    st.markdown('<div class="sub-header">Executive Summary - Adverse Audit Opinion</div>', unsafe_allow_html=True)
+    
+    # Warning about Adverse Opinion
+    with st.container():
+        st.markdown("""
+        <div class="financial-card adverse-opinion">
+            <h3 style="color: #DC2626; margin-top: 0;">⚠️ ADVERSE AUDIT OPINION ISSUED</h3>
+            <p><strong>Auditor General's Conclusion:</strong> The accompanying financial statements do <strong>NOT</strong> give a true and fair view of the financial position of the Government of Barbados as at March 31, 2023.</p>
+            <p><strong>Reason:</strong> Significant material misstatements and non-compliance with International Public Sector Accounting Standards (IPSAS).</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Data Quality Warning - FIXED: Using actual values
+    narrative_amount = financial_data['note34_discrepancy']['narrative_amount']
+    table_amount = financial_data['note34_discrepancy']['table_amount']
+    difference = financial_data['note34_discrepancy']['difference']
+    difference_pct = financial_data['note34_discrepancy']['difference_pct']
+    
+    with st.container():
+        st.markdown(f"""
+        <div class="financial-card data-error">
+            <h4 style="color: #DC2626; margin-top: 0;">⚠️ DATA QUALITY ALERT - NOTE 34 ERRORS</h4>
+            <p><strong>Critical inconsistencies found in Note 34:</strong></p>
+            <p>1. <strong>Numerical Discrepancy:</strong> Narrative states SOE transfers = ${narrative_amount:,.0f}, but table shows = ${table_amount:,.0f}</p>
+            <p>2. <strong>Conceptual Error:</strong> Incorrectly references Notes 8 (Retiring Benefits) and 10 (Debt Service) as "related party transactions"</p>
+            <p><strong>Impact:</strong> Reinforces Auditor General's adverse opinion about unreliable financial reporting</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Key Financial Metrics - CORRECTED
+    section_header('Key Financial Metrics')
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            "Total Revenue", 
+            format_currency(metrics['total_revenue_2023'], currency_format), 
+            f"{metrics['revenue_growth_pct']:.1f}% vs 2022",
+            help="Total government revenue for financial year 2022-2023"
+        )
+    
+    with col2:
+        st.metric(
+            "Total Expenditure", 
+            format_currency(metrics['total_expenditure_2023'], currency_format),
+            f"{format_currency(metrics['total_expenditure_2023'] - metrics['total_expenditure_2022'], currency_format)}",
+            help="Total government expenditure for financial year 2022-2023"
+        )
+    
+    with col3:
+        deficit_value = format_currency(abs(metrics['deficit_2023']), currency_format)
+        deficit_change = abs(metrics['deficit_2023']) - abs(metrics['deficit_2022'])
+        
+        st.metric(
+            "Consolidated Fund Deficit",
+            deficit_value,
+            f"{format_currency(deficit_change, currency_format)}",
+            delta_color="normal",
+            help="Deficit after including annex operations"
+        )
+    
+    with col4:
+        st.metric(
+            "Total Public Debt",
+            format_currency(metrics['total_liabilities_2023'], currency_format),
+            f"{format_currency(metrics['total_liabilities_2023'] - metrics['total_liabilities_2022'], currency_format)}",
+            delta_color="inverse",
+            help="Total government liabilities as at March 31, 2023"
+        )
+    
+    # Revenue vs Expenditure Chart
+    section_header('Revenue vs Expenditure Trend')
+    
+    def build_revenue_vs_expenditure():
+        trend_data = pd.DataFrame({
+            'Year': ['2022', '2023'],
+            'Revenue': [metrics['total_revenue_2022'], metrics['total_revenue_2023']],
+            'Expenditure': [metrics['total_expenditure_2022'], metrics['total_expenditure_2023']],
+            'Deficit': [abs(metrics['deficit_2022']), abs(metrics['deficit_2023'])]
+        })
+        
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            name='Revenue',
+            x=trend_data['Year'],
+            y=trend_data['Revenue'],
+            marker_color='#00267F',
+            text=format_currency_array(trend_data['Revenue'], currency_format),
+            textposition='auto'
+        ))
+        fig.add_trace(go.Bar(
+            name='Expenditure',
+            x=trend_data['Year'],
+            y=trend_data['Expenditure'],
+            marker_color='#DC2626',
+            text=format_currency_array(trend_data['Expenditure'], currency_format),
+            textposition='auto'
+        ))
+        
+        fig.update_layout(
+            barmode='group',
+            title='Revenue vs Expenditure Comparison (2022-2023)',
+            yaxis_title=f'Amount ({currency_format})',
+            height=400
+        )
+        return fig
+    
+    st.plotly_chart(cached_figure(__name__, 'revenue_vs_expenditure', context, build_revenue_vs_expenditure), use_container_width=True)
+    
+    # Critical Audit Findings
+    section_header('Critical Audit Findings Requiring Immediate Attention')
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Asset Management Issues
+        st.markdown("""
+        <div class="financial-card qualified-item">
+            <h4 style="color: #D97706; margin-top: 0;">🏛️ Asset Management Issues</h4>
+            <p><strong>$719M Discrepancy</strong> in Other Capital Assets</p>
+            <p><strong>$115M Cash Overstatement</strong> in Treasury accounts</p>
+            <p><strong>$147M Investments Overstatement</strong></p>
+            <p><strong>Fixed Asset Register</strong> not reconciled</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Revenue Recognition Issues
+        st.markdown("""
+        <div class="financial-card material-misstatement">
+            <h4 style="color: #1D4ED8; margin-top: 0;">💰 Revenue Recognition Issues</h4>
+            <p><strong>$2.43B Tax Receivables</strong> unverified</p>
+            <p><strong>$68.3M Bad Debt Expense</strong> not confirmed</p>
+            <p><strong>Historical cost issues</strong> with asset valuation</p>
+            <p><strong>Measurement uncertainty</strong> in tax accruals</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        # Financial Reporting Failures
+        st.markdown("""
+        <div class="financial-card adverse-opinion">
+            <h4 style="color: #DC2626; margin-top: 0;">📊 Financial Reporting Failures</h4>
+            <p><strong>State-Owned Entities NOT consolidated</strong> (IPSAS violation)</p>
+            <p><strong>Pension liabilities OMITTED</strong> from balance sheet</p>
+            <p><strong>No consolidated financial statements</strong></p>
+            <p><strong>Persistent failure to perform bank reconciliations (15+years)</strong> (Auditor General's Report 2024, Note 2.17).</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Performance Highlights
+        st.markdown(f"""
+        <div class="financial-card">
+            <h4 style="color: #00267F; margin-top: 0;">📈 Performance Highlights</h4>
+            <p><strong>Revenue Growth:</strong> {format_currency(metrics['revenue_growth'], currency_format)} (+{metrics['revenue_growth_pct']:.1f}%)</p>
+            <p><strong>Tax Collection:</strong> {format_currency(financial_data['financial_performance'].loc[0, 'Actual_2023'], currency_format)}</p>
+            <p><strong>Debt Service:</strong> {format_currency(financial_data['expenditure_data'].loc[8, 'Actual_2023'], currency_format)}</p>
+            <p><strong>SOE Transfers:</strong> {format_currency(metrics['total_soe_transfers'], currency_format)}</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,160 @@
+"""
+Expenditure Analysis view: expenditure composition and budget performance.
+"""
+import streamlit as st
+import plotly.express as px
+
+from gob.figure_cache import cached_figure
+from gob.formatting import format_currency, format_currency_array
+from gob.profiling import section_header
+
+
+def render(context):
+    """
+    Render the Expenditure Analysis view.
+    
+    Args:
+        context: ViewContext with the loaded data and sidebar options
+    """
+    financial_data = context.financial_data
+    metrics = context.metrics
+    currency_format = context.currency_format
+    show_comparative = context.show_comparative
+    
+    # Expenditure Analysis View
+    st.markdown('<div class="sub-header">Government Expenditure Analysis</div>', unsafe_allow_html=True)
+    
+    # Expenditure Composition
+    section_header('Expenditure Composition 2023')
+    
+    expenditure_composition = financial_data['expenditure_data'].copy()
+    def build_expenditure_composition():
+        fig = px.pie(
+            expenditure_composition, 
+            values='Actual_2023', 
+            names='Category',
+            title='Expenditure Composition by Category (2023)',
+            color_discrete_sequence=px.colors.sequential.Reds_r
+        )
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        return fig
+    
+    st.plotly_chart(cached_figure(__name__, 'expenditure_composition', context, build_expenditure_composition), use_container_width=True)
+    
+    # Major Expenditure Categories
+    section_header('Major Expenditure Categories')
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Personnel Costs
+        personnel_costs = expenditure_composition[
+            expenditure_composition['Category'].isin([
+                'Payroll and Employee Benefits', 
+                'Retiring Benefits and Allowances'
+            ])
+        ]
+        total_personnel = personnel_costs['Actual_2023'].sum()
+        
+        st.markdown(f"""
+        <div class="financial-card">
+            <h4 style="color: #00267F; margin-top: 0;">👥 Personnel Costs</h4>
+            <div class="financial-value">{format_currency(total_personnel, currency_format)}</div>
+            <div class="financial-label">Total Payroll & Benefits</div>
+            <p><strong>Payroll:</strong> {format_currency(personnel_costs.iloc[0]['Actual_2023'], currency_format)}</p>
+            <p><strong>Retiring Benefits:</strong> {format_currency(personnel_costs.iloc[1]['Actual_2023'], currency_format)}</p>
+            <p><strong>% of Total Expenditure:</strong> {(total_personnel/metrics['total_expenditure_2023']*100):.1f}%</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Grants and Transfers
+        grants = expenditure_composition[
+            expenditure_composition['Category'] == 'Grants and Other Current Transfers'
+        ]
+        
+        capital_transfers = expenditure_composition[
+            expenditure_composition['Category'] == 'Capital Transfers'
+        ]
+        
+        st.markdown(f"""
+        <div class="financial-card">
+            <h4 style="color: #00267F; margin-top: 0;">🏛️ Grants & Transfers</h4>
+            <div class="financial-value">{format_currency(grants.iloc[0]['Actual_2023'], currency_format)}</div>
+            <div class="financial-label">Current Transfers</div>
+            <p><strong>Capital Transfers:</strong> {format_currency(capital_transfers.iloc[0]['Actual_2023'], currency_format)}</p>
+            <p><strong>Total Transfers:</strong> {format_currency(grants.iloc[0]['Actual_2023'] + capital_transfers.iloc[0]['Actual_2023'], currency_format)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        # Debt Service
+        debt_service = expenditure_composition[
+            expenditure_composition['Category'] == 'Debt Service'
+        ]
+        
+        st.markdown(f"""
+        <div class="financial-card">
+            <h4 style="color: #DC2626; margin-top: 0;">💳 Debt Service</h4>
+            <div class="financial-value">{format_currency(debt_service.iloc[0]['Actual_2023'], currency_format)}</div>
+            <div class="financial-label">Interest & Loan Expenses</div>
+            <p><strong>Interest Expense:</strong> {format_currency(financial_data['expenditure_data'].iloc[8]['Actual_2023'], currency_format)}</p>
+            <p><strong>% of Revenue:</strong> {(debt_service.iloc[0]['Actual_2023']/metrics['total_revenue_2023']*100):.1f}%</p>
+            <p><strong>Year-over-Year:</strong> +{format_currency(debt_service.iloc[0]['Actual_2023'] - financial_data['expenditure_data'].iloc[8]['Actual_2022'], currency_format)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Operating Expenses
+        operating = expenditure_composition[
+            expenditure_composition['Category'].isin([
+                'Goods and Services', 
+                'Depreciation', 
+                'Bad Debt Expense'
+            ])
+        ]
+        total_operating = operating['Actual_2023'].sum()
+        
+        st.markdown(f"""
+        <div class="financial-card">
+            <h4 style="color: #00267F; margin-top: 0;">⚙️ Operating Expenses</h4>
+            <div class="financial-value">{format_currency(total_operating, currency_format)}</div>
+            <div class="financial-label">Goods, Services & Depreciation</div>
+            <p><strong>Goods & Services:</strong> {format_currency(operating.iloc[0]['Actual_2023'], currency_format)}</p>
+            <p><strong>Depreciation:</strong> {format_currency(operating.iloc[1]['Actual_2023'], currency_format)}</p>
+            <p><strong>Bad Debt Expense:</strong> {format_currency(operating.iloc[2]['Actual_2023'], currency_format)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Expenditure Performance Table
+    section_header('Expenditure Performance vs Budget')
+    
+    exp_display_df = financial_data['expenditure_data'][[
+        'Category', 'Revised_Budget_2023', 'Actual_2023', 
+        'Variance_2023', 'Variance_Pct_2023'
+    ]].copy()
+    
+    # Format the DataFrame using the currency formatting function
+    exp_display_df['Revised_Budget_2023'] = format_currency_array(exp_display_df['Revised_Budget_2023'], currency_format)
+    exp_display_df['Actual_2023'] = format_currency_array(exp_display_df['Actual_2023'], currency_format)
+    exp_display_df['Variance_2023'] = format_currency_array(exp_display_df['Variance_2023'], currency_format)
+    exp_display_df['Variance_Pct_2023'] = exp_display_df['Variance_Pct_2023'].apply(lambda x: f"{x:+.1f}%")
+    
+    # Add 2022 comparison if selected
+    if show_comparative:
+        exp_display_df['Actual_2022'] = format_currency_array(financial_data['expenditure_data']['Actual_2022'], currency_format)
+        exp_display_df['YoY_Change'] = format_currency_array(
+            financial_data['expenditure_data']['Actual_2023'] - 
+            financial_data['expenditure_data']['Actual_2022'],
+            currency_format
+        )
+        
+        exp_display_df.columns = [
+            'Expenditure Category', 'Revised Budget', 'Actual 2023', 
+            'Variance', 'Variance %', 'Actual 2022', 'YoY Change'
+        ]
+    else:
+        exp_display_df.columns = [
+            'Expenditure Category', 'Revised Budget', 'Actual 2023', 
+            'Variance', 'Variance %'
+        ]
+    
+    st.dataframe(exp_display_df, use_container_width=True, height=400)
@@ -0,0 +1,217 @@
+"""
+Performance Highlights view: key performance indicators and trends.
+"""
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from gob.figure_cache import cached_figure
+from gob.formatting import format_currency, format_currency_array
+from gob.profiling import section_header
+
+
+def render(context):
+    """
+    Render the Performance Highlights view.
+    
+    Args:
+        context: ViewContext with the loaded data and sidebar options
+    """
+    financial_data = context.financial_data
+    metrics = context.metrics
+    currency_format = context.currency_format
+    
+    # Performance Highlights View
+    st.markdown('<div class="sub-header">Performance Highlights</div>', unsafe_allow_html=True)
+    
+    # Performance Metrics Cards
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        # Revenue Growth
+        revenue_growth_color = '#10B981' if metrics['revenue_growth'] > 0 else '#DC2626'
+        
+        st.markdown(f"""
+        <div class="financial-card">
+            <div class="financial-label">Revenue Growth</div>
+            <div class="financial-value">{format_currency(metrics['revenue_growth'], currency_format)}</div>
+            <div style="color: {revenue_growth_color}; font-weight: bold;">
+                {metrics['revenue_growth_pct']:.1f}%
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        # Tax Collection
+        tax_collection = financial_data['financial_performance'].loc[0, 'Actual_2023']
+        tax_variance = financial_data['financial_performance'].loc[0, 'Variance_2023']
+        
+        st.markdown(f"""
+        <div class="financial-card">
+            <div class="financial-label">Tax Collection</div>
+            <div class="financial-value">{format_currency(tax_collection, currency_format)}</div>
+            <div style="color: #666; font-size: 0.9rem;">
+                vs Budget: {format_currency(tax_variance, currency_format)}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        # Debt Service
+        debt_service = financial_data['expenditure_data'].loc[8, 'Actual_2023']
+        debt_service_2022 = financial_data['expenditure_data'].loc[8, 'Actual_2022']
+        debt_growth = debt_service - debt_service_2022
+        debt_growth_color = '#DC2626' if debt_growth > 0 else '#10B981'
+        
+        st.markdown(f"""
+        <div class="financial-card">
+            <div class="financial-label">Debt Service</div>
+            <div class="financial-value">{format_currency(debt_service, currency_format)}</div>
+            <div style="color: {debt_growth_color}; font-weight: bold;">
+                {format_currency(debt_growth, currency_format)}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        # SOE Transfers - WITH DISCREPANCY NOTE
+        narrative_amount = financial_data['note34_discrepancy']['narrative_amount']
+        table_amount = financial_data['note34_discrepancy']['table_amount']
+        
+        st.markdown(f"""
+        <div class="financial-card">
+            <div class="financial-label">SOE Transfers</div>
+            <div class="financial-value">{format_currency(table_amount, currency_format)}</div>
+            <div style="color: #666; font-size: 0.9rem;">
+                40+ State-Owned Entities
+            </div>
+            <div style="font-size: 0.7rem; color: #DC2626; margin-top: 5px;">
+                ⚠️ Note 34 discrepancy: ${narrative_amount/1e6:,.1f}M narrative vs ${table_amount/1e6:,.1f}M table
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Detailed Performance Table with CORRECTED formatting
+    section_header('Key Performance Indicators')
+    
+    performance_data = [
+        {
+            'Metric': 'Total Revenue',
+            '2023': metrics['total_revenue_2023'],
+            '2022': metrics['total_revenue_2022'],
+            'Change': metrics['revenue_growth'],
+            'Change %': metrics['revenue_growth_pct']
+        },
+        {
+            'Metric': 'Tax Revenue',
+            '2023': financial_data['financial_performance'].loc[0, 'Actual_2023'],
+            '2022': financial_data['financial_performance'].loc[0, 'Actual_2022'],
+            'Change': (
+                financial_data['financial_performance'].loc[0, 'Actual_2023'] - 
+                financial_data['financial_performance'].loc[0, 'Actual_2022']
+            ),
+            'Change %': (
+                (financial_data['financial_performance'].loc[0, 'Actual_2023'] - 
+                 financial_data['financial_performance'].loc[0, 'Actual_2022']) / 
+                financial_data['financial_performance'].loc[0, 'Actual_2022']
+            ) * 100
+        },
+        {
+            'Metric': 'Total Expenditure',
+            '2023': metrics['total_expenditure_2023'],
+            '2022': metrics['total_expenditure_2022'],
+            'Change': metrics['total_expenditure_2023'] - metrics['total_expenditure_2022'],
+            'Change %': (
+                (metrics['total_expenditure_2023'] - metrics['total_expenditure_2022']) / 
+                metrics['total_expenditure_2022']
+            ) * 100
+        },
+        {
+            'Metric': 'Debt Service',
+            '2023': financial_data['expenditure_data'].loc[8, 'Actual_2023'],
+            '2022': financial_data['expenditure_data'].loc[8, 'Actual_2022'],
+            'Change': (
+                financial_data['expenditure_data'].loc[8, 'Actual_2023'] - 
+                financial_data['expenditure_data'].loc[8, 'Actual_2022']
+            ),
+            'Change %': (
+                (financial_data['expenditure_data'].loc[8, 'Actual_2023'] - 
+                 financial_data['expenditure_data'].loc[8, 'Actual_2022']) / 
+                financial_data['expenditure_data'].loc[8, 'Actual_2022']
+            ) * 100
+        },
+        {
+            'Metric': 'SOE Transfers (Table Value)',
+            '2023': financial_data['note34_discrepancy']['table_amount'],
+            '2022': None,  # Not provided in 2022 data
+            'Change': None,
+            'Change %': None
+        },
+        {
+            'Metric': 'SOE Transfers (Narrative)',
+            '2023': financial_data['note34_discrepancy']['narrative_amount'],
+            '2022': None,  # Not provided in 2022 data
+            'Change': None,
+            'Change %': None
+        }
+    ]
+    
+    perf_df = pd.DataFrame(performance_data)
+    
+    # Format the DataFrame for display with consistent formatting
+    display_perf_df = perf_df.copy()
+    
+    # Apply consistent currency formatting
+    for col in ['2023', '2022', 'Change']:
+        display_perf_df[col] = format_currency_array(display_perf_df[col], currency_format)
+    
+    display_perf_df['Change %'] = display_perf_df['Change %'].apply(
+        lambda x: f"{x:+.1f}%" if pd.notnull(x) else 'N/A'
+    )
+    
+    # Rename columns
+    display_perf_df.columns = [
+        'Performance Metric', '2023 Value', '2022 Value', 
+        'Change (Amount)', 'Change (%)'
+    ]
+    
+    st.dataframe(display_perf_df, use_container_width=True)
+    
+    # Performance Trends Visualization
+    section_header('Performance Trends')
+    
+    # Filter out non-numeric 2022 values for the chart
+    chart_data = perf_df[perf_df['2022'].apply(lambda x: isinstance(x, (int, float)))].copy()
+    
+    if not chart_data.empty:
+        def build_kpi_comparison():
+            fig = go.Figure()
+            
+            # Add bars for 2022 and 2023
+            fig.add_trace(go.Bar(
+                name='2022',
+                x=chart_data['Metric'],
+                y=chart_data['2022'],
+                marker_color='#3B82F6',
+                text=format_currency_array(chart_data['2022'], currency_format),
+                textposition='auto'
+            ))
+            
+            fig.add_trace(go.Bar(
+                name='2023',
+                x=chart_data['Metric'],
+                y=chart_data['2023'],
+                marker_color='#00267F',
+                text=format_currency_array(chart_data['2023'], currency_format),
+                textposition='auto'
+            ))
+            
+            fig.update_layout(
+                barmode='group',
+                title='Key Performance Indicators (2022 vs 2023)',
+                yaxis_title=f'Amount ({currency_format})',
+                height=500
+            )
+            return fig
+        
+        st.plotly_chart(cached_figure(__name__, 'kpi_comparison', context, build_kpi_comparison), use_container_width=True)
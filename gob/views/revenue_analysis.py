@@ -0,0 +1,128 @@
+"""
+Revenue Analysis view: revenue composition, tax performance and budget variance.
+"""
+import streamlit as st
+import plotly.express as px
+
+from gob.figure_cache import cached_figure
+from gob.formatting import format_currency, format_currency_array
+from gob.profiling import section_header
+
+
+def render(context):
+    """
+    Render the Revenue Analysis view.
+    
+    Args:
+        context: ViewContext with the loaded data and sidebar options
+    """
+    financial_data = context.financial_data
+    metrics = context.metrics
+    currency_format = context.currency_format
+    show_comparative = context.show_comparative
+    
+    # Revenue Analysis View
+    st.markdown('<div class="sub-header">Revenue Analysis & Tax Performance</div>', unsafe_allow_html=True)
+    
+    # Revenue Composition
+    section_header('Revenue Composition 2023')
+    
+    def build_revenue_composition():
+        revenue_composition = financial_data['financial_performance'].copy()
+        fig = px.pie(
+            revenue_composition, 
+            values='Actual_2023', 
+            names='Category',
+            title='Revenue Composition by Source (2023)',
+            color_discrete_sequence=px.colors.sequential.Blues_r
+        )
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        return fig
+    
+    st.plotly_chart(cached_figure(__name__, 'revenue_composition', context, build_revenue_composition), use_container_width=True)
+    
+    # Tax Revenue Details
+    section_header('Tax Revenue Performance')
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Top 5 Tax Revenue Sources
+        def build_top_taxes():
+            top_taxes = financial_data['tax_revenue_details'].nlargest(5, 'Actual_2023')
+            fig = px.bar(
+                top_taxes, 
+                x='Tax_Type', 
+                y='Actual_2023', 
+                title='Top 5 Tax Revenue Sources (2023)',
+                color='Growth_Pct', 
+                color_continuous_scale='Blues',
+                text=format_currency_array(top_taxes['Actual_2023'], currency_format)
+            )
+            fig.update_layout(yaxis_title=f'Amount ({currency_format})', xaxis_title='Tax Type')
+            return fig
+        
+        st.plotly_chart(cached_figure(__name__, 'top_taxes', context, build_top_taxes), use_container_width=True)
+    
+    with col2:
+        # Tax Revenue Growth
+        def build_tax_growth():
+            fig = px.bar(
+                financial_data['tax_revenue_details'], 
+                x='Tax_Type', 
+                y='Growth_Pct', 
+                title='Tax Revenue Growth (2022 to 2023)',
+                color='Growth_Pct', 
+                color_continuous_scale='RdYlGn',
+                text=[f'{x:.1f}%' for x in financial_data['tax_revenue_details']['Growth_Pct']]
+            )
+            fig.update_layout(yaxis_title='Growth Percentage (%)', xaxis_title='Tax Type')
+            return fig
+        
+        st.plotly_chart(cached_figure(__name__, 'tax_growth', context, build_tax_growth), use_container_width=True)
+    
+    # Revenue Performance Table - FIXED with correct YoY percentage for Grants
+    section_header('Revenue Performance Details')
+    
+    display_df = financial_data['financial_performance'][[
+        'Category', 'Revised_Budget_2023', 'Actual_2023', 
+        'Variance_2023', 'Variance_Pct_2023'
+    ]].copy()
+    
+    # Format the DataFrame using the currency formatting function
+    display_df['Revised_Budget_2023'] = format_currency_array(display_df['Revised_Budget_2023'], currency_format)
+    display_df['Actual_2023'] = format_currency_array(display_df['Actual_2023'], currency_format)
+    display_df['Variance_2023'] = format_currency_array(display_df['Variance_2023'], currency_format)
+    display_df['Variance_Pct_2023'] = display_df['Variance_Pct_2023'].apply(lambda x: f"{x:+.1f}%")
+    
+    # Add 2022 comparison if selected
+    if show_comparative:
+        display_df['Actual_2022'] = format_currency_array(financial_data['financial_performance']['Actual_2022'], currency_format)
+        display_df['YoY_Growth'] = format_currency_array(financial_data['financial_performance']['YoY_Growth'], currency_format)
+        # FIXED: Use the formatted percentage display column
+        display_df['YoY_Growth_Pct'] = financial_data['financial_performance']['YoY_Growth_Pct_Display']
+        
+        display_df.columns = [
+            'Revenue Category', 'Revised Budget', 'Actual 2023', 
+            'Variance', 'Variance %', 'Actual 2022', 'YoY Growth', 'YoY Growth %'
+        ]
+    else:
+        display_df.columns = [
+            'Revenue Category', 'Revised Budget', 'Actual 2023', 
+            'Variance', 'Variance %'
+        ]
+    
+    st.dataframe(display_df, use_container_width=True, height=400)
+    
+    # Tax Receivables Issue
+    section_header('⚠️ Critical Issue: Unverified Tax Receivables')
+    
+    st.warning(f"""
+    **$2.43 Billion Tax Receivables Could Not Be Verified**
+    
+    - **Amount Unverified:** {format_currency(metrics['tax_receivables_2023'], currency_format)} (as at March 31, 2023)
+    - **Year-over-Year Change:** {format_currency(metrics['tax_receivables_2023'] - metrics['tax_receivables_2022'], currency_format)}
+    - **Percentage of Total Assets:** {(metrics['tax_receivables_2023']/metrics['total_assets_2023']*100):.1f}%
+    
+    **Auditor's Note:** "Tax Receivables of $2.43 billion... could not be confirmed because of the absence of sufficient supporting documentation."
+    """)
@@ -0,0 +1,166 @@
+"""
+SOE Transfers view: transfers to state-owned enterprises and the Note 34 errors.
+"""
+import streamlit as st
+import plotly.express as px
+
+from gob.figure_cache import cached_figure
+from gob.formatting import format_currency, format_currency_array
+from gob.profiling import section_header
+
+
+def render(context):
+    """
+    Render the SOE Transfers view.
+    
+    Args:
+        context: ViewContext with the loaded data and sidebar options
+    """
+    financial_data = context.financial_data
+    currency_format = context.currency_format
+    
+    # SOE Transfers View - UPDATED WITH ERROR HIGHLIGHTING
+    st.markdown('<div class="sub-header">State-Owned Enterprise Transfers </div>', unsafe_allow_html=True)
+    
+    # Note 34 Discrepancy Warning - FIXED with actual values
+    narrative_amount = financial_data['note34_discrepancy']['narrative_amount']
+    table_amount = financial_data['note34_discrepancy']['table_amount']
+    difference = financial_data['note34_discrepancy']['difference']
+    difference_pct = financial_data['note34_discrepancy']['difference_pct']
+    
+    with st.container():
+        st.markdown(f"""
+        <div class="financial-card data-error">
+            <h4 style="color: #DC2626; margin-top: 0;">⚠️ CRITICAL DATA INCONSISTENCY IN NOTE 34</h4>
+            <p><strong>Narrative vs Table Discrepancy:</strong></p>
+            <p>• <strong>Narrative text states:</strong> "transfers of ${narrative_amount:,.0f}"</p>
+            <p>• <strong>Table shows total:</strong> ${table_amount:,.0f}</p>
+            <p>• <strong>Difference:</strong> ${difference:,.0f} ({difference_pct:.1f}% difference)</p>
+            <p><strong>Dashboard uses table values for analysis.</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+            # Total Transfers - CORRECTED: $777.9M from Note 34
+    st.markdown(f"""
+<div style="padding: 15px; background-color: #EFF6FF; border-radius: 8px; border-left: 4px solid #3B82F6; margin: 20px 0;">
+<p><strong>Total Transfers to State-Owned Entities (2022-2023):</strong><br>
+<span style="font-size: 1.5rem; font-weight: bold; color: #00267F;">{format_currency(table_amount, currency_format)}</span></p>
+
+<p style="font-size: 0.9rem; color: #666; margin-top: 10px;">
+<em>Source: Note 34 of Financial Statements - Table shows total transfers across all SOEs</em></p>
+
+<div style="margin-top: 15px; padding: 10px; background-color: #FEF2F2; border-radius: 5px; border-left: 3px solid #DC2626;">
+<p style="margin: 0; font-size: 0.95rem; color: #DC2626;">
+<strong>⚠️ Data Discrepancy:</strong> Narrative in Note 34 states 
+<span style="font-size: 1.1rem; font-weight: bold;">${narrative_amount:,.0f}</span>, 
+but table shows 
+<span style="font-size: 1.1rem; font-weight: bold;">${table_amount:,.0f}</span>
+</p>
+</div>
+</div>
+""", unsafe_allow_html=True)
+    
+    # Conceptual Error Warning
+    with st.container():
+        st.markdown("""
+        <div class="financial-card conceptual-error">
+            <h4 style="color: #D97706; margin-top: 0;">❌ CONCEPTUAL ERROR IN NOTE 34</h4>
+            <p><strong>Error:</strong> Note 34 incorrectly references Notes 8 and 10 as dealing with "related party transactions"</p>
+            <p><strong>Why it's wrong:</strong></p>
+            <ul>
+                <li><strong>Note 8:</strong> Retiring benefits (pensions) - NOT related party transactions</li>
+                <li><strong>Note 10:</strong> Debt service costs (interest) - NOT related party transactions</li>
+                <li>These are routine government payments, not transactions with controlled entities (SOEs)</li>
+            </ul>
+            <p><strong>Impact:</strong> Shows fundamental misunderstanding of accounting concepts</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # SOE Transfers Visualization - CORRECTED Top 10 with your specified entities
+    section_header('Top 10 SOE Transfers ')
+    
+    def build_top_soes():
+        top_soes = financial_data['soe_transfers'].nlargest(10, 'Total')
+        fig = px.bar(
+            top_soes, 
+            x='Entity', 
+            y='Total', 
+            title='Top 10 State-Owned Enterprise Transfers',
+            color='Total', 
+            color_continuous_scale='Blues',
+            text=format_currency_array(top_soes['Total'], currency_format)
+        )
+        fig.update_layout(
+            yaxis_title=f'Total Transfers ({currency_format})', 
+            xaxis_title='State-Owned Entity',
+            height=500
+        )
+        fig.update_xaxes(tickangle=45)
+        return fig
+    
+    st.plotly_chart(cached_figure(__name__, 'top_soes', context, build_top_soes), use_container_width=True)
+    
+    # Current vs Capital Transfers
+    section_header('Current vs Capital Transfers')
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        total_current = financial_data['soe_transfers']['Current_Transfers'].sum()
+        total_capital = financial_data['soe_transfers']['Capital_Transfers'].sum()
+        
+        def build_current_vs_capital():
+            fig = px.pie(
+                names=['Current Transfers', 'Capital Transfers'],
+                values=[total_current, total_capital],
+                title='Current vs Capital Transfers (Top 10 SOEs)',
+                color_discrete_sequence=['#3B82F6', '#1D4ED8']
+            )
+            fig.update_traces(textposition='inside', textinfo='percent+label')
+            return fig
+        
+        st.plotly_chart(cached_figure(__name__, 'current_vs_capital', context, build_current_vs_capital), use_container_width=True)
+        
+        # Display transfer breakdown
+        st.markdown(f"""
+        **Top 10 SOE Transfer Breakdown:**
+        - **Current Transfers:** {format_currency(total_current, currency_format)}
+        - **Capital Transfers:** {format_currency(total_capital, currency_format)}
+        - **Total (Top 10):** {format_currency(total_current + total_capital, currency_format)}
+        """)
+    
+    with col2:
+        # SOE Transfer Details Table
+        display_soes = financial_data['soe_transfers'].copy()
+        
+        # Format the DataFrame
+        display_soes['Current_Transfers'] = format_currency_array(display_soes['Current_Transfers'], currency_format)
+        display_soes['Capital_Transfers'] = format_currency_array(display_soes['Capital_Transfers'], currency_format)
+        display_soes['Total'] = format_currency_array(display_soes['Total'], currency_format)
+        
+        display_soes.columns = [
+            'State-Owned Entity', 'Current Transfers', 
+            'Capital Transfers', 'Total Transfers'
+        ]
+        
+        st.dataframe(display_soes, use_container_width=True, height=400)
+    
+    # Audit Issue: Non-Consolidation of SOEs - UPDATED
+    section_header('⚠️ Critical Audit Issue: SOE Non-Consolidation')
+    
+    st.error(f"""
+    **IPSAS VIOLATION: State-Owned Entities NOT Consolidated**
+    
+    **Auditor General's Finding:** "The accounts of the State-owned Entities were not consolidated into the financial statements as required by the International Public Sector Accounting Standards (IPSAS)."
+    
+    **Impact:**
+    - Financial statements are **incomplete and misleading**
+    - **{format_currency(table_amount, currency_format)} in transfers** to 40+ SOEs not properly consolidated
+    - True financial position of Government **cannot be determined**
+    - **Material misstatement** in financial reporting
+    
+    **Note:** The {format_currency(table_amount, currency_format)} represents transfers to all SOEs (not just the top 10 shown). 
+    Full consolidation of all 40+ state-owned entities is required for IPSAS compliance.
+    
+    **Required Action:** Immediate consolidation of all State-Owned Entities into government financial statements.
+    """)
@@ -0,0 +1,317 @@
+"""
+Cache warmer for freshly started dashboard servers.
+
+After a deploy the first visitor would otherwise pay for load_financial_data,
+every figure and label, the simulator lattice and the default simulator
+results. warm_caches() renders every view once for each currency format and
+comparison setting in bare mode: there is no browser session, so the
+widgets return their defaults and nothing is sent anywhere. That fills the
+same process-wide caches a real session reads from. The simulator
+fragments run inline (see gob.tracing.traced_fragment), so their
+default-slider results are warmed too.
+
+python -m gob.serve starts the warm-up in a background thread at process
+start. The WARMUP state reports when it has finished; with the metrics
+exporter enabled it is served at /ready (HTTP 503 until warm) for load
+balancer health checks. Set GOB_WARMUP=0 to skip it.
+
+Usage (from the repository root):
+
+    python -m gob.warmup                         # warm this process, report timings
+    python -m gob.warmup --wait http://127.0.0.1:9464 --timeout 120
+"""
+import argparse
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+WARMUP_ENV = "GOB_WARMUP"
+WARMUP_THREAD = "gob-warmup"
+RUNTIME_WAIT = 30.0  # Seconds to wait for the Streamlit runtime before warming anyway
+
+# Loggers that warn about every Streamlit call made outside a script run, and
+# the deprecation notices real sessions already log
+_BARE_MODE_LOGGERS = (
+    "streamlit.runtime.scriptrunner_utils.script_run_context",
+    "streamlit.runtime.state.session_state_proxy",
+    "streamlit.runtime.caching.cache_data_api",
+    "streamlit.deprecation_util",
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WarmupState:
+    """Thread-safe progress and readiness of the cache warm-up."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self.status = "idle"  # idle, pending, running, done, failed or disabled
+        self.completed = 0
+        self.total = 0
+        self.failures = []
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def ready(self):
+        """
+        True once the process can take traffic.
+
+        Covers a finished warm-up (even with failures: the caches then fill
+        lazily as before), a disabled one, and processes that never
+        requested one.
+        """
+        return self.status == "idle" or self._done.is_set()
+
+    def request(self):
+        """Move from idle to pending; False if a warm-up was already requested."""
+        with self._lock:
+            if self.status != "idle":
+                return False
+            self.status = "pending"
+            return True
+
+    def start(self, total):
+        """Mark the warm-up as running with total steps."""
+        with self._lock:
+            self.status = "running"
+            self.total = total
+            self.started_at = time.time()
+
+    def step_done(self, failure=None):
+        """Count a finished step, recording its failure message if any."""
+        with self._lock:
+            self.completed += 1
+            if failure is not None:
+                self.failures.append(failure)
+
+    def finish(self, status=None):
+        """Mark the warm-up as finished and the process as ready."""
+        with self._lock:
+            self.status = status or ("failed" if self.failures else "done")
+            self.finished_at = time.time()
+        self._done.set()
+
+    def wait(self, timeout=None):
+        """Block until the warm-up has finished; True if it has."""
+        return self._done.wait(timeout)
+
+    def snapshot(self):
+        """Current state as a JSON-serializable dict."""
+        with self._lock:
+            duration = None
+            if self.started_at is not None:
+                duration = (self.finished_at or time.time()) - self.started_at
+            return {
+                'ready': self.ready,
+                'status': self.status,
+                'completed': self.completed,
+                'total': self.total,
+                'failures': list(self.failures),
+                'duration_s': duration,
+            }
+
+
+WARMUP = WarmupState()
+
+
+class _WarmupThreadFilter(logging.Filter):
+    """Drop Streamlit's bare-mode warnings raised by the warm-up thread."""
+
+    def filter(self, record):
+        return record.threadName != WARMUP_THREAD
+
+
+def _filter_bare_mode_warnings():
+    """Keep the warm-up thread's bare-mode warnings out of the server log."""
+    warning_filter = _WarmupThreadFilter()
+    for name in _BARE_MODE_LOGGERS:
+        logging.getLogger(name).addFilter(warning_filter)
+
+
+def _render_steps(views=None, currency_formats=None, comparative=(True, False)):
+    """(view label, currency format, comparison toggle) for every render to warm."""
+    from gob.formatting import CURRENCY_FORMATS
+    from gob.views import VIEW_MODULES
+
+    return [
+        (view, currency_format, show_comparative)
+        for view in views or VIEW_MODULES
+        for currency_format in currency_formats or CURRENCY_FORMATS
+        for show_comparative in comparative
+    ]
+
+
+def warm_caches(state=WARMUP, views=None, currency_formats=None, progress=None):
+    """
+    Fill the data, figure, label and simulation caches of this process.
+
+    Views are rendered directly rather than through render_view, so warm-up
+    renders stay out of the developer panel's section timings.
+
+    Args:
+        state: WarmupState receiving progress and readiness
+        views: View labels to render (default: every view)
+        currency_formats: Currency formats to render (default: every option)
+        progress: Optional callback receiving (step, seconds, error or None)
+
+    Returns:
+        WarmupState: state, finished
+    """
+    from gob.data import calculate_key_metrics, load_financial_data, load_snapshot
+    from gob.views import VIEW_MODULES, ViewContext
+
+    steps = _render_steps(views, currency_formats)
+    state.start(total=len(steps) + 1)
+
+    def run_step(step, func):
+        start = time.perf_counter()
+        error = None
+        try:
+            func()
+        except Exception as exc:  # A broken view must not stop the warm-up
+            error = f"{step}: {type(exc).__name__}: {exc}"
+            _LOGGER.exception("Cache warm-up step failed: %s", step)
+        state.step_done(error)
+        if progress is not None:
+            progress(step, time.perf_counter() - start, error)
+
+    data = {}
+
+    def load_data():
+        data['financial_data'] = load_financial_data()
+        data['metrics'] = calculate_key_metrics()
+        data['dataset_version'] = load_snapshot().version
+
+    run_step("load_financial_data", load_data)
+
+    for view, currency_format, show_comparative in steps:
+        step = f"{view} | {currency_format} | comparative={show_comparative}"
+        if not data:
+            state.step_done(f"{step}: skipped, financial data did not load")
+            continue
+        module = importlib.import_module(f"gob.views.{VIEW_MODULES[view]}")
+        context = ViewContext(
+            financial_data=data['financial_data'],
+            metrics=data['metrics'],
+            dataset_version=data['dataset_version'],
+            currency_format=currency_format,
+            show_comparative=show_comparative,
+        )
+        run_step(step, lambda: module.render(context))
+
+    state.finish()
+    return state
+
+
+def _wait_for_runtime(timeout=RUNTIME_WAIT):
+    """Wait until the Streamlit runtime exists so the st.cache_* functions use its storage."""
+    from streamlit import runtime
+
+    deadline = time.monotonic() + timeout
+    while not runtime.exists() and time.monotonic() < deadline:
+        time.sleep(0.1)
+
+
+def _background_warmup(state):
+    """Thread target: wait for the server, then warm the caches."""
+    _wait_for_runtime()
+    start = time.perf_counter()
+    try:
+        warm_caches(state)
+    except Exception:
+        _LOGGER.exception("Cache warm-up failed")
+        state.finish("failed")
+    _LOGGER.info("Cache warm-up %s in %.1f s", state.status, time.perf_counter() - start)
+
+
+def start_warmup(state=WARMUP):
+    """
+    Start warming the caches in a background thread, once per process.
+
+    Does nothing but mark the process ready when GOB_WARMUP=0.
+
+    Returns:
+        threading.Thread or None: Warm-up thread, None if it was not started
+    """
+    if not state.request():
+        return None
+    if os.environ.get(WARMUP_ENV, "1") == "0":
+        state.finish("disabled")
+        return None
+
+    _filter_bare_mode_warnings()
+    thread = threading.Thread(target=_background_warmup, args=(state,), name=WARMUP_THREAD, daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_until_ready(url, timeout, interval=1.0):
+    """
+    Poll a server's /ready endpoint until it answers 200.
+
+    Args:
+        url: Base URL of the metrics exporter (e.g. http://127.0.0.1:9464)
+        timeout: Seconds to wait
+        interval: Seconds between polls
+
+    Returns:
+        dict or None: The ready snapshot, None on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(f"{url.rstrip('/')}/ready", timeout=interval) as response:
+                return json.loads(response.read())
+        except (urllib.error.URLError, OSError):
+            pass
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(interval)
+
+
+def main():
+    """Warm the caches in the foreground, or wait for a server to be warm."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--views', nargs='+', help="View labels to warm (default: all)")
+    parser.add_argument('--wait', metavar='URL', help="Poll URL/ready of a running server instead")
+    parser.add_argument('--timeout', type=float, default=300.0, help="Seconds --wait polls for")
+    args = parser.parse_args()
+
+    if args.wait:
+        snapshot = wait_until_ready(args.wait, args.timeout)
+        if snapshot is None:
+            print(f"{args.wait} not ready after {args.timeout:.0f} s")
+            sys.exit(1)
+        print(json.dumps(snapshot, indent=2))
+        sys.exit(0)
+
+    def progress(step, seconds, error):
+        print(f"{step:<80} {seconds * 1000:8.0f} ms{'  FAILED' if error else ''}", flush=True)
+
+    # Run in a thread named like the server's warm-up so the same log filter applies
+    _filter_bare_mode_warnings()
+    state = WarmupState()
+    thread = threading.Thread(
+        target=warm_caches, kwargs={'state': state, 'views': args.views, 'progress': progress},
+        name=WARMUP_THREAD,
+    )
+    thread.start()
+    thread.join()
+    snapshot = state.snapshot()
+    print(f"Warmed {snapshot['completed']} steps in {snapshot['duration_s']:.1f} s")
+    for failure in snapshot['failures']:
+        print(f"FAILED: {failure}")
+    sys.exit(1 if snapshot['failures'] else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from gob.cache import SimulationCache, read_only
+from gob.debt_dynamics import simulate_debt
+from gob.figure_cache import FIGURE_CACHE, cached_figure
+from gob.views import ViewContext
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_expired_entries_are_purged_on_put():
+    clock = FakeClock()
+    cache = SimulationCache(ttl=10.0, clock=clock)
+    for key in range(5):
+        cache.get_or_compute(key, lambda: key)
+
+    # None of the old keys is looked up again, they expire on the next store
+    clock.now = 11.0
+    cache.get_or_compute("new", lambda: 0)
+    assert len(cache) == 1
+    assert cache.stats().expirations == 5
+
+
+def test_purge_keeps_live_entries():
+    clock = FakeClock()
+    cache = SimulationCache(ttl=10.0, clock=clock)
+    cache.get_or_compute("old", lambda: 1)
+    clock.now = 6.0
+    cache.get_or_compute("recent", lambda: 2)
+    # A hit refreshes recency but not age
+    cache.get_or_compute("old", lambda: 3)
+
+    clock.now = 12.0
+    cache.get_or_compute("new", lambda: 4)
+    assert cache.get_or_compute("recent", lambda: None) == 2
+    assert cache.stats().expirations == 1
+    assert cache.get_or_compute("old", lambda: 5) == 5
+
+
+def test_lru_eviction():
+    cache = SimulationCache(max_entries=2)
+    for key in "abc":
+        cache.get_or_compute(key, lambda: key)
+    assert cache.stats().evictions == 1
+    assert cache.get_or_compute("a", lambda: "recomputed") == "recomputed"
+
+
+def test_cached_arrays_are_read_only():
+    cache = SimulationCache()
+    passed_in = np.arange(3.0)
+    value = cache.get_or_compute("key", lambda: {"values": passed_in})
+
+    with pytest.raises(ValueError):
+        value["values"][0] = 99.0
+    # The caller's own array is copied, not frozen
+    passed_in[0] = 99.0
+    assert cache.get_or_compute("key", lambda: None)["values"][0] == 0.0
+
+
+def test_read_only_dataclass():
+    simulation = read_only(simulate_debt(5.0, 4.0, 2.0, 2.5))
+    assert not simulation.trajectory.flags.writeable
+    assert not simulation.shocks.flags.writeable
+    np.testing.assert_array_equal(simulation.trajectory, simulate_debt(5.0, 4.0, 2.0, 2.5).trajectory)
+
+
+def test_memoize_normalizes_arguments():
+    calls = []
+    cache = SimulationCache()
+
+    @cache.memoize
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    assert double(5) == double(5.0) == double(np.float64(5.0)) == 10
+    assert len(calls) == 1
+
+
+def test_figures_are_rebuilt_for_a_new_dataset_version():
+    builds = []
+
+    def build():
+        builds.append(1)
+        return go.Figure()
+
+    FIGURE_CACHE.clear()
+    for version in ("old", "old", "new"):
+        context = ViewContext({}, {}, dataset_version=version, currency_format="Millions", show_comparative=True)
+        cached_figure("test", "figure", context, build)
+    FIGURE_CACHE.clear()
+    assert len(builds) == 2
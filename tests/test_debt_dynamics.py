@@ -0,0 +1,114 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from gob.debt_dynamics import (
+    CURRENT_DEBT,
+    HORIZON_YEARS,
+    PROJECTION_END,
+    evaluate_scenario_grid,
+    floored_debt_path,
+    required_growth_rate,
+    required_interest_rate,
+    required_primary_surplus,
+    simulate_debt,
+    solve_target_year,
+)
+
+# (interest, growth, primary surplus, shock): falling, flat, rising and floor-binding paths
+SCENARIOS = list(itertools.product((3.0, 5.5, 8.0), (1.0, 4.0, 9.5), (-1.0, 1.0, 4.4, 12.0), (0.0, 2.5)))
+
+
+def loop_path(interest_rate, growth_rate, primary_surplus, shock_size, start_debt=CURRENT_DEBT):
+    """The year-by-year loop the simulators used before the engine."""
+    path = [start_debt]
+    for year in HORIZON_YEARS[1:]:
+        change = path[-1] * (interest_rate - growth_rate) / 100 - primary_surplus
+        if shock_size and (year - 2025) % 3 == 0 and year <= PROJECTION_END:
+            change += shock_size
+        path.append(max(path[-1] + change, 20.0))
+    return np.array(path)
+
+
+@pytest.mark.parametrize("interest_rate, growth_rate, primary_surplus, shock_size", SCENARIOS)
+def test_engine_matches_the_loop(interest_rate, growth_rate, primary_surplus, shock_size):
+    expected = loop_path(interest_rate, growth_rate, primary_surplus, shock_size)
+    simulation = simulate_debt(interest_rate, growth_rate, primary_surplus, shock_size)
+    np.testing.assert_allclose(simulation.trajectory, expected, rtol=1e-10, atol=1e-9)
+
+    below = np.flatnonzero(expected <= 60.0)
+    if below.size:
+        assert simulation.target_year == HORIZON_YEARS[below[0]]
+
+
+def test_floored_debt_path_broadcasts_a_batch():
+    multipliers = np.array([0.97, 1.0, 1.04])
+    increments = np.full(10, -3.0)
+    batch = floored_debt_path(np.array([100.0, 80.0, 60.0]), multipliers[:, np.newaxis], increments)
+    for row, (start, multiplier) in enumerate(zip((100.0, 80.0, 60.0), multipliers)):
+        expected = [start]
+        for _ in range(10):
+            expected.append(max(expected[-1] * multiplier - 3.0, 20.0))
+        np.testing.assert_allclose(batch[row], expected)
+
+
+@pytest.mark.parametrize("shock_size", [0.0, 2.0])
+def test_scenario_grid_matches_simulate_debt(shock_size):
+    growth = np.array([1.0, 2.5, 4.0])
+    inflation = np.array([1.0, 3.0])
+    interest = np.array([3.0, 5.0, 8.0])
+    surpluses = np.array([1.0, 3.5, 6.0])
+    grid = evaluate_scenario_grid(growth, surpluses, interest, inflation, shock_size=shock_size)
+
+    for r, g, i, p in itertools.product(interest, growth, inflation, surpluses):
+        simulation = simulate_debt(r, g + i, p, shock_size)
+        reached_in_horizon = simulation.target_year is not None and simulation.target_year <= HORIZON_YEARS[-1]
+        expected = simulation.target_year if reached_in_horizon else -1
+        assert grid.target_year(r, g + i, p) == expected
+
+
+def first_loop_year(interest_rate, growth_rate, primary_surplus, shock_size, years=300):
+    """First calendar year the loop is at or below 60%, run far past 2050."""
+    debt = CURRENT_DEBT
+    for year in range(2025, 2025 + years):
+        if year > 2025:
+            debt += debt * (interest_rate - growth_rate) / 100 - primary_surplus
+            if shock_size and (year - 2025) % 3 == 0 and year <= PROJECTION_END:
+                debt += shock_size
+            debt = max(debt, 20.0)
+        if debt <= 60.0:
+            return year
+    return None
+
+
+@pytest.mark.parametrize("interest_rate, growth_rate, primary_surplus, shock_size", SCENARIOS)
+def test_crossing_year_brackets_the_loop(interest_rate, growth_rate, primary_surplus, shock_size):
+    expected = first_loop_year(interest_rate, growth_rate, primary_surplus, shock_size)
+    crossing = solve_target_year(interest_rate, growth_rate, primary_surplus, shock_size)
+    if expected is None:
+        assert crossing is None
+    else:
+        # The fractional crossing lies in the year the loop first reports
+        assert expected - 1 < crossing <= expected + 1e-9
+
+
+def reaches_by(year, interest_rate, growth_rate, primary_surplus, shock_size):
+    target_year = simulate_debt(interest_rate, growth_rate, primary_surplus, shock_size).target_year
+    return target_year is not None and target_year <= year
+
+
+@pytest.mark.parametrize("interest_rate, growth_rate, shock_size", list(
+    itertools.product((3.0, 6.0, 8.0), (2.0, 5.0, 7.5), (0.0, 2.5))
+))
+@pytest.mark.parametrize("year", [2030, 2036, 2045])
+def test_inverse_solvers_sit_on_the_boundary(interest_rate, growth_rate, shock_size, year):
+    surplus = float(required_primary_surplus(interest_rate, growth_rate, year, shock_size))
+    assert reaches_by(year, interest_rate, growth_rate, surplus + 1e-6, shock_size)
+    assert not reaches_by(year, interest_rate, growth_rate, surplus - 0.01, shock_size)
+
+    # With that surplus, the largest admissible interest rate is the one we started from
+    interest = float(required_interest_rate(growth_rate, surplus + 1e-6, year, shock_size))
+    assert interest == pytest.approx(interest_rate, abs=1e-4)
+    growth = float(required_growth_rate(interest_rate, surplus + 1e-6, year, shock_size))
+    assert growth == pytest.approx(growth_rate, abs=1e-4)
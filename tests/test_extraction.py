@@ -0,0 +1,124 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gob.extraction import StatementTables, pdf, statement_frames, statement_totals
+from gob.extraction.dataset import load_corrections, normalize_label
+from gob.extraction.store import extract_document, manifest_entry
+from gob.extraction.tokens import parse_amount
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+STATEMENTS = REPO_ROOT / "GOB Audited Financial Statements 2023.pdf"
+PAGES = range(20, 28)
+
+
+@pytest.fixture(scope="module")
+def serial_rows():
+    return pdf.extract_rows(STATEMENTS, PAGES, workers=1, batch_pages=1)
+
+
+def test_pool_gives_the_serial_rows(serial_rows):
+    assert pdf.extract_rows(STATEMENTS, PAGES, workers=2, batch_pages=1) == serial_rows
+
+
+def test_pools_are_recycled_without_max_tasks_per_child(serial_rows, monkeypatch):
+    # Before Python 3.11 a new pool is started every WORKER_TASKS tasks per worker
+    monkeypatch.setattr(pdf, "_POOL_RECYCLES_WORKERS", False)
+    monkeypatch.setattr(pdf, "WORKER_TASKS", 2)
+    assert pdf.extract_rows(STATEMENTS, PAGES, workers=2, batch_pages=1) == serial_rows
+
+
+def write_report(path, page_indexes):
+    """Save some pages of the statements (0-based) as a new PDF."""
+    pdfium = pytest.importorskip("pypdfium2")
+    report = pdfium.PdfDocument.new()
+    report.import_pages(pdfium.PdfDocument(str(STATEMENTS)), list(page_indexes))
+    report.save(str(path))
+
+
+def test_edited_report_reuses_unchanged_pages(tmp_path):
+    cache = tmp_path / "cache"
+    write_report(tmp_path / "report.pdf", [19, 20, 21, 22])
+    extract_document("report.pdf", tmp_path, cache)
+    assert manifest_entry("report.pdf", cache)["parsed_pages"] == 4
+
+    # One page inserted in the middle: only it is parsed, the others come from the cache
+    write_report(tmp_path / "report.pdf", [19, 20, 23, 21, 22])
+    edited = extract_document("report.pdf", tmp_path, cache)
+    assert manifest_entry("report.pdf", cache)["parsed_pages"] == 1
+    fresh = extract_document("report.pdf", tmp_path, tmp_path / "fresh", reuse_pages=False)
+    pd.testing.assert_frame_equal(edited, fresh)
+
+    # A dropped page leaves nothing to parse and its cached rows are pruned
+    write_report(tmp_path / "report.pdf", [19, 20, 21, 22])
+    extract_document("report.pdf", tmp_path, cache)
+    assert manifest_entry("report.pdf", cache)["parsed_pages"] == 0
+    assert len(list((cache / "pages").iterdir())) == 4
+
+
+@pytest.fixture(scope="module")
+def statements():
+    tables = StatementTables.load()
+    frames = statement_frames(tables)
+    totals = statement_totals(tables)
+    return tables, frames, totals
+
+
+def by_category(frame, column, key="Category"):
+    return dict(zip(frame[key], frame[column]))
+
+
+def test_every_correction_is_used(statements):
+    tables, _, _ = statements
+    corrections = load_corrections()
+    expected = {
+        (item.table, normalize_label(item.label), item.column): item.value
+        for item in corrections.itertuples()
+    }
+    used = {
+        (read.table, normalize_label(read.label), read.column): read.value
+        for read in tables.reads if read.corrected
+    }
+    assert used == expected
+
+
+def test_corrections_differ_from_the_text_layer(statements):
+    # A correction the OCR text already agrees with is stale
+    tables, _, _ = statements
+    for read in tables.reads:
+        if read.corrected and read.text is not None:
+            assert parse_amount(read.text)[0] != read.value, read
+
+
+@pytest.mark.parametrize("column", ["Actual_2023", "Actual_2022"])
+def test_taxation_cross_foots(statements, column):
+    _, frames, _ = statements
+    revenue = by_category(frames["financial_performance"], column)
+    parts = ("Goods and Services", "Income and Profits", "Property Taxes", "International Trade", "Other Taxes")
+    # The statements round every line to the dollar, so subtotals may be $1 off
+    assert abs(sum(revenue[part] for part in parts) - revenue["Taxation"]) <= 1
+
+
+@pytest.mark.parametrize("column, year", [("Actual_2023", 2023), ("Actual_2022", 2022)])
+def test_expenditure_cross_foots(statements, column, year):
+    _, frames, totals = statements
+    assert abs(frames["expenditure_data"][column].sum() - totals[f"total_expenditure_{year}"]) <= 1
+
+
+@pytest.mark.parametrize("column, year", [("Actual_Mar_23", 2023), ("Actual_Mar_22", 2022)])
+def test_balance_sheet_cross_foots(statements, column, year):
+    _, frames, totals = statements
+    assets = by_category(frames["balance_sheet"].drop_duplicates("Category"), column)
+    current = ("Cash on Hand", "Bank", "Tax Receivables (Net)", "Other Receivables (Net)", "Restricted cash")
+    assert sum(assets[item] for item in current) == assets["Financial Assets"]
+    assert assets["Land"] + assets["Other capital assets (Net)"] == assets["Non Financial Assets"]
+    assert assets["Current Assets"] + assets["Non-Current Assets"] == totals[f"total_assets_{year}"]
+
+
+def test_soe_transfers_cross_foot(statements):
+    # The frame keeps the largest entities only, so just the rows are checked
+    _, frames, _ = statements
+    soe = frames["soe_transfers"]
+    np.testing.assert_allclose(soe["Current_Transfers"] + soe["Capital_Transfers"], soe["Total"], atol=0.01)
@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from gob.formatting import CURRENCY_FORMATS, format_currency, format_currency_array
+
+AMOUNTS = [3_478_123_456.78, -110_850_000.0, 0.0, -0.0, 49_999.5, 999_950_000.0, 1e15, -1234.5]
+
+
+@pytest.mark.parametrize("format_type", CURRENCY_FORMATS)
+def test_array_labels_match_format_currency(format_type):
+    labels = format_currency_array(np.array(AMOUNTS), format_type)
+    assert list(labels) == [format_currency(value, format_type) for value in AMOUNTS]
+
+
+def test_missing_and_text_become_na():
+    values = pd.Series([1e6, None, np.nan, "Not Quantified"], index=list("abcd"), name="Amount")
+    labels = format_currency_array(values, "Millions (BBD $M)")
+    assert list(labels) == ["$1.0M", "N/A", "N/A", "N/A"]
+    assert labels.index.equals(values.index) and labels.name == "Amount"
+
+
+def test_cached_labels_can_be_changed_by_the_caller():
+    first = format_currency_array([2e6, 3e6], "Millions (BBD $M)")
+    first[0] = "changed"
+    assert list(format_currency_array([2e6, 3e6], "Millions (BBD $M)")) == ["$2.0M", "$3.0M"]
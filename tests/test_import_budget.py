@@ -0,0 +1,32 @@
+from gob.import_budget import (
+    DEFERRED_MODULES,
+    STARTUP_CALLS,
+    ImportRecord,
+    ImportReport,
+    check_budget,
+    measure_imports,
+    script_imports,
+)
+
+
+def test_startup_set_follows_app_imports():
+    modules = script_imports()
+    for module in ("streamlit", "gob.data", "gob.formatting", "gob.metrics",
+                   "gob.profiling", "gob.tracing", "gob.views"):
+        assert module in modules
+
+
+def test_deferred_module_fails_the_budget():
+    report = ImportReport(modules=("app",), records=(
+        ImportRecord("gob.data", 100, 100, 0),
+        ImportRecord("gob.lattice", 100, 100, 1),
+    ))
+    assert check_budget(report, budget_ms=1000.0) == [
+        "gob.lattice is imported at startup but should load with its view"
+    ]
+
+
+def test_cold_start_leaves_deferred_modules_alone():
+    report = measure_imports(script_imports(), calls=STARTUP_CALLS)
+    assert report.loaded("gob.snapshot")
+    assert [module for module in DEFERRED_MODULES if report.loaded(module)] == []
@@ -0,0 +1,56 @@
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from gob.debt_dynamics import PROJECTION_LENGTH, simulate_debt
+from gob.lattice import SimulatorLattice, build_lattice_tensor
+
+
+@pytest.fixture(scope="module")
+def lattice(tmp_path_factory):
+    return SimulatorLattice(build_lattice_tensor(tmp_path_factory.mktemp("lattice")))
+
+
+@pytest.mark.parametrize("interest_rate, growth_rate, primary_surplus, shock_size", list(
+    itertools.product((3.0, 5.3, 8.0), (2.0, 5.6, 12.0), (1.0, 2.4, 6.0), (0.0, 0.5, 3.1, 5.0))
+))
+def test_lattice_matches_simulate_debt(lattice, interest_rate, growth_rate, primary_surplus, shock_size):
+    cell = lattice.simulate(interest_rate, growth_rate, primary_surplus, shock_size)
+    engine = simulate_debt(interest_rate, growth_rate, primary_surplus, shock_size)
+
+    np.testing.assert_allclose(cell.trajectory, engine.trajectory[:PROJECTION_LENGTH], rtol=1e-6)
+    assert cell.target_year == engine.target_year
+    if engine.crossing_year is None:
+        assert cell.crossing_year is None
+    else:
+        assert cell.crossing_year == pytest.approx(engine.crossing_year)
+
+
+def test_off_lattice_values_are_rejected(lattice):
+    with pytest.raises(KeyError):
+        lattice.simulate(5.0, 3.0, 2.0, 0.3)
+
+
+def test_damaged_tensor_is_rebuilt(lattice, tmp_path):
+    build_lattice_tensor(tmp_path)
+    (tmp_path / "debt_path.npy").write_bytes(b"partial")
+    with pytest.raises((OSError, ValueError)):
+        SimulatorLattice(tmp_path)
+
+    rebuilt = SimulatorLattice.load_or_build(tmp_path)
+    np.testing.assert_array_equal(rebuilt.debt_path, lattice.debt_path)
+
+
+def test_concurrent_builds_keep_the_tensor_readable(lattice, tmp_path):
+    build_lattice_tensor(tmp_path)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        builds = [pool.submit(build_lattice_tensor, tmp_path) for _ in range(4)]
+        while not all(build.done() for build in builds):
+            np.testing.assert_array_equal(SimulatorLattice(tmp_path).debt_path, lattice.debt_path)
+        for build in builds:
+            build.result()
+
+    assert not list(tmp_path.glob("*.tmp"))
+    np.testing.assert_array_equal(SimulatorLattice(tmp_path).debt_path, lattice.debt_path)
@@ -0,0 +1,64 @@
+import gc
+import sys
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from gob import metrics
+
+
+@pytest.fixture(autouse=True)
+def keep_main_module():
+    # AppTest leaves its script installed as __main__, which spawned
+    # process-pool workers of later tests would then try to run
+    main = sys.modules["__main__"]
+    yield
+    sys.modules["__main__"] = main
+
+
+def session_script():
+    from gob.metrics import count_session
+
+    count_session()
+
+
+def test_each_session_is_counted_once(monkeypatch):
+    monkeypatch.setenv(metrics.METRICS_PORT_ENV, "9464")
+    before = metrics._sessions
+
+    first = AppTest.from_function(session_script)
+    first.run()
+    first.run()
+    second = AppTest.from_function(session_script)
+    second.run()
+    assert metrics._sessions == before + 2
+
+    # The count drops once a session's state is collected
+    del first
+    gc.collect()
+    assert metrics._sessions == before + 1
+
+
+def test_sessions_not_counted_when_disabled(monkeypatch):
+    monkeypatch.delenv(metrics.METRICS_PORT_ENV, raising=False)
+    before = metrics._sessions
+    AppTest.from_function(session_script).run()
+    assert metrics._sessions == before
+
+
+def test_rerun_without_payload():
+    metrics.observe_rerun("Test View", "rerun", 0.02, None)
+    metrics.observe_rerun("Test View", "rerun", 0.03, 512)
+    text = metrics.render_metrics()
+    assert 'gob_rerun_payload_bytes_total{view="Test View"} 512' in text
+    assert 'gob_rerun_duration_seconds_count{view="Test View",kind="rerun"} 2' in text
+
+
+def test_memory_gauges_without_unix_modules(monkeypatch):
+    # Windows has neither the resource module nor os.sysconf
+    monkeypatch.setitem(sys.modules, "resource", None)
+    monkeypatch.delattr(metrics.os, "sysconf")
+    text = metrics.render_metrics()
+    assert "process_max_resident_memory_bytes" not in text
+    assert "process_resident_memory_bytes" not in text
+    assert "gob_rerun_duration_seconds" in text
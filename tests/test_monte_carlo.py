@@ -0,0 +1,25 @@
+import numpy as np
+
+from gob.debt_dynamics import PROJECTION_LENGTH, simulate_debt
+from gob.monte_carlo import MIN_ADJUSTED_GROWTH, StochasticDebtModel
+
+
+def test_zero_volatility_reproduces_the_deterministic_path():
+    model = StochasticDebtModel(
+        growth_rate=3.0, real_interest_rate=2.5, inflation_rate=4.0, primary_surplus=3.5,
+        shock_size=2.0, growth_volatility=0.0, interest_volatility=0.0, inflation_volatility=0.0,
+    )
+    paths = model.simulate(np.random.default_rng(0), 5)
+
+    premium = max(model.inflation_rate - model.competitor_inflation, 0.0)
+    adjusted_growth = max(
+        model.growth_rate - premium * model.tourism_sensitivity * model.tourism_gdp_share / 100,
+        MIN_ADJUSTED_GROWTH,
+    )
+    nominal_interest = model.real_interest_rate + model.inflation_rate * (1 - model.fixed_debt_share / 100)
+    expected = simulate_debt(
+        nominal_interest, adjusted_growth + model.inflation_rate, model.primary_surplus, model.shock_size
+    ).trajectory[:PROJECTION_LENGTH]
+    for path in paths:
+        np.testing.assert_allclose(path, expected, rtol=1e-12)
+
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from gob.monte_carlo import StochasticDebtModel
+from gob.parallel_monte_carlo import run_parallel_fan_chart
+
+MODEL = StochasticDebtModel(
+    growth_rate=3.5, real_interest_rate=2.5, inflation_rate=3.5, primary_surplus=4.4, shock_size=2.0
+)
+
+
+def assert_same_fan_chart(a, b):
+    np.testing.assert_array_equal(a.percentiles, b.percentiles)
+    assert a.probability_reaching_target == b.probability_reaching_target
+    assert a.n_paths == b.n_paths
+
+
+def test_worker_count_does_not_change_the_fan_chart():
+    serial = run_parallel_fan_chart(MODEL, 60_000, seed=7, workers=1, batch_size=10_000)
+    parallel = run_parallel_fan_chart(MODEL, 60_000, seed=7, workers=4, batch_size=10_000)
+    assert_same_fan_chart(serial, parallel)
+
+
+def test_batch_results_do_not_depend_on_completion_order():
+    serial = run_parallel_fan_chart(MODEL, 30_000, seed=11, workers=1, batch_size=10_000)
+    uneven = run_parallel_fan_chart(MODEL, 30_000, seed=11, workers=3, batch_size=10_000)
+    assert_same_fan_chart(serial, uneven)
+
+
+def test_fan_chart_is_reproducible_from_its_seed():
+    a = run_parallel_fan_chart(MODEL, 20_000, seed=3, workers=1)
+    b = run_parallel_fan_chart(MODEL, 20_000, seed=3, workers=1)
+    assert_same_fan_chart(a, b)
+    # Bands are ordered from the 5th to the 95th percentile in every year
+    assert np.all(np.diff(a.percentiles, axis=0) >= 0)
+
+
+def test_seed_changes_the_draws():
+    a = run_parallel_fan_chart(MODEL, 20_000, seed=1, workers=1, batch_size=10_000)
+    b = run_parallel_fan_chart(MODEL, 20_000, seed=2, workers=1, batch_size=10_000)
+    assert not np.array_equal(a.percentiles, b.percentiles)
+
+
+@pytest.mark.parametrize("n_paths", [0, -5])
+def test_empty_run_is_rejected(n_paths):
+    with pytest.raises(ValueError):
+        run_parallel_fan_chart(MODEL, n_paths, workers=1)
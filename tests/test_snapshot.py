@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+import streamlit as st
+
+from gob.data import calculate_key_metrics, load_financial_data
+from gob.snapshot import DatasetSnapshot, table_frame
+
+
+@pytest.fixture(scope="module")
+def financial_data():
+    return load_financial_data()
+
+
+def test_dataset_is_shared_not_copied(financial_data):
+    assert load_financial_data() is financial_data
+    assert calculate_key_metrics() is calculate_key_metrics()
+
+
+def test_cold_start_maps_the_snapshot_once(monkeypatch):
+    loads = []
+    load_or_build = DatasetSnapshot.load_or_build
+    monkeypatch.setattr(DatasetSnapshot, "load_or_build", lambda: loads.append(1) or load_or_build())
+    st.cache_resource.clear()
+    try:
+        load_financial_data()
+        calculate_key_metrics()
+    finally:
+        st.cache_resource.clear()
+    assert len(loads) == 1
+
+
+def test_frames_are_read_only(financial_data):
+    frames = {key: value for key, value in financial_data.items() if isinstance(value, pd.DataFrame)}
+    assert frames
+    for frame in frames.values():
+        for name in frame.columns:
+            assert not np.asarray(frame[name]).flags.writeable, name
+        with pytest.raises(ValueError):
+            frame.iloc[0, 0] = frame.iloc[1, 0]
+
+
+def test_mappings_are_read_only(financial_data):
+    with pytest.raises(TypeError):
+        financial_data["extra"] = None
+    with pytest.raises(TypeError):
+        financial_data["note34_discrepancy"]["difference"] = 0
+
+
+def test_numeric_columns_stay_on_the_mapped_buffer(tmp_path):
+    path = tmp_path / "frame.arrow"
+    table = pa.table({"Label": ["a", "b"], "Amount": [1.5, 2.5]})
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    mapped = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+    frame = table_frame(mapped)
+    amounts = np.asarray(frame["Amount"])
+    address = mapped.column("Amount").chunk(0).buffers()[1].address
+    assert amounts.__array_interface__["data"][0] == address
+    assert list(frame["Label"]) == ["a", "b"]
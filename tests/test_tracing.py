@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from gob import tracing
+from gob.trace_report import rerun_summary
+
+
+class Message:
+    def __init__(self, size):
+        self.size = size
+
+    def ByteSize(self):
+        return self.size
+
+
+def test_payload_meter_wraps_enqueue_once():
+    sent = []
+    ctx = SimpleNamespace(_enqueue=sent.append)
+    meter = tracing._payload_meter(ctx)
+    assert tracing._payload_meter(ctx) is meter
+
+    ctx._enqueue(Message(120))
+    ctx._enqueue(Message(30))
+    assert (meter.bytes, meter.messages, len(sent)) == (150, 2, 2)
+
+
+def test_payload_unknown_without_enqueue():
+    assert tracing._payload_meter(SimpleNamespace()) is None
+
+
+@pytest.mark.parametrize("fragment_ids, expected", [(["abc"], True), ([], False)])
+def test_fragment_rerun_from_context(fragment_ids, expected):
+    assert tracing._fragment_rerun(SimpleNamespace(fragment_ids_this_run=fragment_ids)) is expected
+
+
+def test_fragment_rerun_fallback(monkeypatch):
+    ctx = SimpleNamespace()
+    monkeypatch.setattr(tracing._active, "trace", None, raising=False)
+    assert tracing._fragment_rerun(ctx)
+    monkeypatch.setattr(tracing._active, "trace", object())
+    assert not tracing._fragment_rerun(ctx)
+
+
+def test_rerun_summary_skips_unknown_payloads():
+    frame = pd.DataFrame.from_records([
+        {"type": "rerun", "view": "Debt Analysis", "duration_ms": 40.0, "payload_bytes": None,
+         "cache_hits": 3, "cache_misses": 1},
+        {"type": "rerun", "view": "Debt Analysis", "duration_ms": 60.0, "payload_bytes": 2048,
+         "cache_hits": 4, "cache_misses": 0},
+    ])
+    summary = rerun_summary(frame)
+    assert summary.loc[("Debt Analysis", "rerun"), "payload_kb"] == 2.0